@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""请求体、响应体适配器（进度、CRC、加解密）的吞吐量。
+
+对比原来逐层包装的 `_BytesAndFileAdapter` / `_FileLikeAdapter` 与单遍处理的 `_StreamAdapter` ：
+
+    * 上传：进度 + CRC，HTTP层每次读8KB；
+    * 下载：进度 + CRC，调用者每次读8KB，或者用readinto读入1MB的缓冲区；
+    * 客户端加密的下载：进度 + CRC + AES-CTR解密。
+
+用法 ::
+
+    python benchmarks/bench_adapters.py [MB]
+"""
+
+import io
+import os
+import sys
+import time
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from oss2 import utils
+
+
+_KEY = utils.random_key(32)
+_IV = utils.random_iv()
+
+
+class Body(object):
+    """模拟HTTP响应体：只支持read，长度未知。"""
+
+    def __init__(self, data):
+        self.__file = io.BytesIO(data)
+
+    def read(self, amt=None):
+        return self.__file.read(amt)
+
+
+def new_cipher():
+    cipher = utils.AESCTRCipher()
+    cipher.initialize(_KEY, _IV)
+    return cipher
+
+
+def progress(consumed, total):
+    pass
+
+
+def drain(adapter, chunk_size=8 * 1024):
+    while adapter.read(chunk_size):
+        pass
+
+
+def drain_into(adapter, buffer_size=1024 * 1024):
+    buf = bytearray(buffer_size)
+    while adapter.readinto(buf):
+        pass
+
+
+def bench(name, make_adapter, drain_func, total):
+    adapter = make_adapter()
+    start = time.time()
+    drain_func(adapter)
+    seconds = time.time() - start
+    print('{0:<50} {1:>10.2f} MB/s  {2:>8.3f} ns/byte'.format(name, total / seconds / 1024 / 1024,
+                                                               seconds / total * 1e9))
+
+
+def layered_upload(data):
+    adapter = utils._BytesAndFileAdapter(io.BytesIO(data), progress, len(data))
+    return utils._BytesAndFileAdapter(adapter, size=len(data), crc_callback=utils.Crc64())
+
+
+def fused_upload(data):
+    return utils.make_crc_adapter(utils.make_progress_adapter(io.BytesIO(data), progress))
+
+
+def layered_download(data, cipher=False):
+    adapter = utils._BytesAndFileAdapter(Body(data), progress, len(data))
+    adapter = utils._FileLikeAdapter(adapter, crc_callback=utils.Crc64())
+    if cipher:
+        adapter = utils._FileLikeAdapter(adapter, cipher_callback=partial(new_cipher().decrypt))
+    return adapter
+
+
+def fused_download(data, cipher=False):
+    adapter = utils.make_crc_adapter(utils.make_progress_adapter(Body(data), progress, len(data)))
+    if cipher:
+        adapter = utils.make_ctr_cipher_adapter(adapter, new_cipher())
+    return adapter
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    data = os.urandom(size * 1024 * 1024)
+    total = len(data)
+
+    bench('upload, layered, read(8KB)', partial(layered_upload, data), drain, total)
+    bench('upload, fused, read(8KB)', partial(fused_upload, data), drain, total)
+
+    bench('download, layered, read(8KB)', partial(layered_download, data), drain, total)
+    bench('download, fused, read(8KB)', partial(fused_download, data), drain, total)
+    bench('download, fused, readinto(1MB)', partial(fused_download, data), drain_into, total)
+
+    bench('download + decrypt, layered, read(8KB)', partial(layered_download, data, True), drain, total)
+    bench('download + decrypt, fused, read(8KB)', partial(fused_download, data, True), drain, total)
+    bench('download + decrypt, fused, readinto(1MB)', partial(fused_download, data, True), drain_into, total)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""请求签名的微基准测试。
+
+用法 ::
+
+    python benchmarks/bench_auth.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import oss2
+from oss2 import auth as oss2_auth
+
+
+_BUCKET = 'bench-bucket'
+_KEY = 'dir/sub dir/object-name~1.txt'
+
+
+def make_request():
+    return oss2.http.Request('PUT', 'http://{0}.oss-cn-hangzhou.aliyuncs.com/{1}'.format(_BUCKET, _KEY),
+                             params={'partNumber': '1', 'uploadId': '0004B9894A22E5B1888A1E29F8236E2D'},
+                             headers={'Content-Type': 'text/plain', 'Content-MD5': 'ZGVhZGJlZWY=',
+                                      'x-oss-meta-author': 'bench', 'x-oss-storage-class': 'Standard',
+                                      'date': oss2.utils.http_date()},
+                             region='cn-hangzhou', product='oss')
+
+
+def bench_sign(name, auth, number=20000):
+    def sign():
+        auth._sign_request(make_request(), _BUCKET, _KEY)
+
+    seconds = timeit.timeit(sign, number=number)
+    print('{0:<45} {1:>12.2f} us/request'.format(name, seconds / number * 1e6))
+
+
+def bench_v4_parts(number=50000):
+    seconds = timeit.timeit(lambda: oss2_auth._make_v4_signing_key('secret', '20230501', 'cn-hangzhou', 'oss'),
+                            number=number)
+    print('{0:<45} {1:>12.2f} us/op'.format('v4 signing key (4 x HMAC, uncached)', seconds / number * 1e6))
+
+    uri = '/' + _BUCKET + '/' + _KEY
+    seconds = timeit.timeit(lambda: oss2_auth._v4_uri_encode(uri, True), number=number)
+    print('{0:<45} {1:>12.2f} us/op'.format('v4 uri encode', seconds / number * 1e6))
+
+
+if __name__ == '__main__':
+    bench_sign('make_request only', oss2.AnonymousAuth())
+    bench_sign('v1 sign', oss2.Auth('fake-access-key-id', 'fake-access-key-secret'))
+    bench_sign('v2 sign', oss2.AuthV2('fake-access-key-id', 'fake-access-key-secret'))
+    bench_sign('v4 sign', oss2.AuthV4('fake-access-key-id', 'fake-access-key-secret'))
+    bench_v4_parts()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""CRC64计算及合并的微基准测试。
+
+用法 ::
+
+    python benchmarks/bench_crc64.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import oss2
+from oss2 import crc64_combine
+from oss2.utils import Crc64, calc_obj_crc_from_parts, _make_crc64_slicing8
+
+
+_POLY = Crc64._POLY
+_XOROUT = Crc64._XOROUT
+
+
+def report(name, seconds, number, unit='op'):
+    print('{0:<45} {1:>12.2f} us/{2}'.format(name, seconds / number * 1e6, unit))
+
+
+def bench_combine():
+    part_size = 8 * 1024 * 1024
+
+    def old_combine():
+        # 原来的实现：每次调用都重新计算GF(2)矩阵
+        init = crc64_combine._verifyParams(_POLY, 0, _XOROUT)[1]
+        poly = crc64_combine._bitrev(_POLY & 0xFFFFFFFFFFFFFFFF, 64)
+        return crc64_combine._combine64(poly, init, True, _XOROUT, 12345, 67890, part_size)
+
+    combine = crc64_combine.mkCombineFun(_POLY, initCrc=0, rev=True, xorOut=_XOROUT)
+
+    number = 200
+    report('combine (rebuild matrices)', timeit.timeit(old_combine, number=number), number)
+    report('combine (cached operator)', timeit.timeit(lambda: combine(12345, 67890, part_size), number=number * 100),
+           number * 100)
+
+
+def bench_parts():
+    parts = [oss2.models.PartInfo(i + 1, 'etag', size=1024 * 1024, part_crc=i + 1) for i in range(10000)]
+
+    number = 3
+    report('calc_obj_crc_from_parts, 10000 parts', timeit.timeit(lambda: calc_obj_crc_from_parts(parts), number=number),
+           number, 'call')
+
+
+def bench_update():
+    data = os.urandom(4 * 1024 * 1024)
+
+    def update():
+        crc = Crc64()
+        crc.update(data)
+
+    number = 20
+    seconds = timeit.timeit(update, number=number)
+    print('{0:<45} {1:>12.2f} MB/s'.format('Crc64.update', len(data) * number / seconds / 1024 / 1024))
+
+    crcfun = _make_crc64_slicing8(Crc64._get_template().table, _XOROUT)
+    seconds = timeit.timeit(lambda: crcfun(data, 0), number=1)
+    print('{0:<45} {1:>12.2f} MB/s'.format('slicing-by-8 (pure python)', len(data) / seconds / 1024 / 1024))
+
+    number = 10000
+    report('Crc64()', timeit.timeit(Crc64, number=number), number)
+
+
+if __name__ == '__main__':
+    bench_combine()
+    bench_parts()
+    bench_update()
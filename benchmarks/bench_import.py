@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+"""`import oss2` 的耗时，用 `python -X importtime` 在新的解释器中测量。
+
+用法 ::
+
+    python benchmarks/bench_import.py
+"""
+
+import os
+import subprocess
+import sys
+
+
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def _total_import_time(statement):
+    output = subprocess.check_output([sys.executable, '-X', 'importtime', '-c', statement],
+                                     stderr=subprocess.STDOUT, cwd=_ROOT)
+    total = 0
+    for line in output.decode('utf-8').splitlines():
+        # import time: self [us] | cumulative | imported package，包名前只有一个空格的是顶层的导入
+        fields = line.split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith('  '):
+            total += int(fields[1])
+    return total
+
+
+def import_time(statement, number=5):
+    """返回多次测量中最短的一次，扣除解释器启动时的导入，单位为微秒。"""
+    return min(_total_import_time(statement) - _total_import_time('pass') for i in range(number))
+
+
+def bench(name, statement):
+    print('{0:<40} {1:>10.1f} ms'.format(name, import_time(statement) / 1000.0))
+
+
+if __name__ == '__main__':
+    bench('import oss2', 'import oss2')
+    bench('import oss2; oss2.Bucket', 'import oss2; oss2.Bucket')
+    bench('import oss2; oss2.CryptoBucket', 'import oss2; oss2.CryptoBucket')
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+"""罗列迭代器消费罗列结果的微基准测试（不含网络和XML解析）。
+
+用法 ::
+
+    python benchmarks/bench_iterators.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import oss2
+from oss2.models import SimplifiedObjectInfo
+
+
+_MAX_KEYS = 1000
+_PAGES = 50
+
+
+class _Result(object):
+    pass
+
+
+class FakeBucket(object):
+    """每页返回max_keys个条目，其中十分之一是公共前缀。"""
+    def __init__(self, pages):
+        self.pages = pages
+
+    def list_objects(self, prefix='', delimiter='', marker='', max_keys=100, headers=None, table=None):
+        page = int(marker or 0)
+        base = 'dir/{0:04d}/'.format(page)
+
+        result = _Result()
+        result.object_list = [SimplifiedObjectInfo(base + '{0:06d}'.format(i), 1449838901, 'etag', 'Normal', 1,
+                                                   'Standard')
+                              for i in range(max_keys) if i % 10]
+        result.prefix_list = [base + '{0:06d}/'.format(i) for i in range(max_keys) if not i % 10]
+        result.is_truncated = page + 1 < self.pages
+        result.next_marker = str(page + 1)
+        return result
+
+
+def report(name, func, number=3):
+    seconds = min(timeit.repeat(func, number=1, repeat=number))
+    print('{0:<45} {1:>12.2f} us/entry'.format(name, seconds / (_MAX_KEYS * _PAGES) * 1e6))
+
+
+if __name__ == '__main__':
+    bucket = FakeBucket(_PAGES)
+
+    report('fetch only (builds pages)',
+           lambda: [bucket.list_objects(marker=str(i), max_keys=_MAX_KEYS) for i in range(_PAGES)])
+    report('ObjectIterator, max_keys=1000',
+           lambda: sum(1 for _ in oss2.ObjectIterator(bucket, max_keys=_MAX_KEYS)))
+    report('ObjectIterator.pages(), max_keys=1000',
+           lambda: sum(len(page) for page in oss2.ObjectIterator(bucket, max_keys=_MAX_KEYS).pages()))
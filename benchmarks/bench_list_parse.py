@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""罗列类响应XML解析的微基准测试。
+
+用法 ::
+
+    python benchmarks/bench_list_parse.py
+"""
+
+import io
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import oss2
+from oss2 import xml_utils
+from oss2.models import ListObjectsResult, ListObjectVersionsResult
+
+
+_CONTENTS = '''<Contents>
+    <Key>dir%2Fsub%20dir%2Fobject-{0:06d}.txt</Key>
+    <LastModified>2023-05-01T08:{1:02d}:00.000Z</LastModified>
+    <ETag>"5B3C1A2E053D763E1B002CC607C5A0FE1E"</ETag>
+    <Type>Normal</Type>
+    <Size>{0}</Size>
+    <StorageClass>Standard</StorageClass>
+    <Owner>
+      <ID>1234567890</ID>
+      <DisplayName>1234567890</DisplayName>
+    </Owner>
+  </Contents>'''
+
+_VERSION = '''<Version>
+    <Key>dir%2Fobject-{0:06d}.txt</Key>
+    <VersionId>CAEQMxiBgMC0vs6D0BYiIGJiZWRjOTRjNTg0NzQ1MTRiN2Y1OTYxMTdkYjQ0****</VersionId>
+    <IsLatest>true</IsLatest>
+    <LastModified>2023-05-01T08:{1:02d}:00.000Z</LastModified>
+    <ETag>"5B3C1A2E053D763E1B002CC607C5A0FE1E"</ETag>
+    <Type>Normal</Type>
+    <Size>{0}</Size>
+    <StorageClass>Standard</StorageClass>
+    <Owner>
+      <ID>1234567890</ID>
+      <DisplayName>1234567890</DisplayName>
+    </Owner>
+  </Version>'''
+
+
+def make_list_body(n):
+    return oss2.to_bytes('''<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult>
+  <Name>bench-bucket</Name>
+  <Prefix></Prefix>
+  <Marker></Marker>
+  <MaxKeys>{0}</MaxKeys>
+  <Delimiter></Delimiter>
+  <EncodingType>url</EncodingType>
+  <IsTruncated>true</IsTruncated>
+  <NextMarker>dir%2Fnext</NextMarker>
+  {1}
+</ListBucketResult>'''.format(n, ''.join(_CONTENTS.format(i, i % 60) for i in range(n))))
+
+
+def make_versions_body(n):
+    return oss2.to_bytes('''<?xml version="1.0" encoding="UTF-8"?>
+<ListVersionsResult>
+  <Name>bench-bucket</Name>
+  <Prefix></Prefix>
+  <KeyMarker></KeyMarker>
+  <VersionIdMarker></VersionIdMarker>
+  <MaxKeys>{0}</MaxKeys>
+  <Delimiter></Delimiter>
+  <EncodingType>url</EncodingType>
+  <IsTruncated>false</IsTruncated>
+  {1}
+</ListVersionsResult>'''.format(n, ''.join(_VERSION.format(i, i % 60) for i in range(n))))
+
+
+class _FakeResponse(object):
+    status = 200
+    request_id = ''
+
+    def __init__(self):
+        self.headers = oss2.CaseInsensitiveDict()
+
+
+def report(name, func, number):
+    seconds = timeit.timeit(func, number=number)
+    print('{0:<45} {1:>12.2f} ms/page'.format(name, seconds / number * 1e3))
+
+
+if __name__ == '__main__':
+    number = 50
+    body = make_list_body(1000)
+    report('list_objects, 1000 keys',
+           lambda: xml_utils.parse_list_objects(ListObjectsResult(_FakeResponse()), body), number)
+    report('list_objects, 1000 keys, no owner',
+           lambda: xml_utils.parse_list_objects(ListObjectsResult(_FakeResponse()), body, fetch_owner=False), number)
+    report('list_objects, 1000 keys, streamed',
+           lambda: xml_utils.parse_list_objects(ListObjectsResult(_FakeResponse()), io.BytesIO(body)), number)
+
+    body = make_versions_body(1000)
+    report('list_object_versions, 1000 versions',
+           lambda: xml_utils.parse_list_object_versions(ListObjectVersionsResult(_FakeResponse()), body), number)
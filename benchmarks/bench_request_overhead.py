@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""小文件请求在SDK内部的CPU开销（不含网络），日志级别为INFO，即缺省不输出DEBUG日志的情况。
+
+requests.Session.request被替换成直接返回一个构造好的响应。
+
+用法 ::
+
+    python benchmarks/bench_request_overhead.py
+"""
+
+import io
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import requests
+
+import oss2
+
+
+_HEADERS = {'Server': 'AliyunOSS',
+            'Date': 'Fri, 11 Dec 2015 11:40:31 GMT',
+            'Content-Type': 'text/plain',
+            'Connection': 'keep-alive',
+            'x-oss-request-id': '566AB62EB06147681C283D73',
+            'ETag': '"D80CF0E5BE2436514894D64B2BCFB2AE"',
+            'x-oss-hash-crc64ecma': '18060855795301489637',
+            'x-oss-object-type': 'Normal',
+            'x-oss-storage-class': 'Standard',
+            'Last-Modified': 'Fri, 11 Dec 2015 11:40:31 GMT'}
+
+
+def fake_request(self, method, url, **kwargs):
+    body = b'' if method in ('PUT', 'HEAD') else b'hello'
+
+    resp = requests.models.Response()
+    resp.status_code = 200
+    resp.headers = requests.structures.CaseInsensitiveDict(_HEADERS)
+    resp.headers['Content-Length'] = str(len(body))
+    resp.raw = io.BytesIO(body)
+    return resp
+
+
+def bench(name, func, number=20000):
+    seconds = timeit.timeit(func, number=number)
+    print('{0:<30} {1:>10.2f} us/request'.format(name, seconds / number * 1e6))
+
+
+if __name__ == '__main__':
+    logging.getLogger('oss2').setLevel(logging.INFO)
+    requests.Session.request = fake_request
+
+    bucket = oss2.Bucket(oss2.Auth('fake-access-key-id', 'fake-access-key-secret'),
+                         'http://oss-cn-hangzhou.aliyuncs.com', 'bench-bucket', enable_crc=False)
+
+    bench('put_object (5 bytes)', lambda: bucket.put_object('dir/object.txt', b'hello'))
+    bench('get_object (5 bytes)', lambda: bucket.get_object('dir/object.txt').read())
+    bench('head_object', lambda: bucket.head_object('dir/object.txt'))
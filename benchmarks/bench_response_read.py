@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+"""读取HTTP响应体的吞吐量。
+
+从本地HTTP服务器下载同一份数据，对比：
+
+    * 原来的读法：每次read都调用 `iter_content` 创建一个生成器；
+    * `http.Response.read` ：直接从urllib3的响应中读取；
+    * `http.Response.readinto` 读入复用的缓冲区，以及 `iter_views` 迭代memoryview。
+
+用法 ::
+
+    python benchmarks/bench_response_read.py [MB]
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from oss2 import http
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    body = b''
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def iter_content_read(resp, chunk_size):
+    while next(resp.response.iter_content(chunk_size), b''):
+        pass
+
+
+def read(resp, chunk_size):
+    while resp.read(chunk_size):
+        pass
+
+
+def readinto(resp, chunk_size):
+    buf = bytearray(chunk_size)
+    while resp.readinto(buf):
+        pass
+
+
+def iter_views(resp, chunk_size):
+    for view in resp.iter_views(chunk_size):
+        pass
+
+
+def bench(name, url, drain, chunk_size, total, number=5):
+    session = http.Session()
+    seconds = 0
+    for i in range(number):
+        resp = session.do_request(http.Request('GET', url), timeout=60)
+        start = time.time()
+        drain(resp, chunk_size)
+        seconds += time.time() - start
+    print('{0:<40} {1:>10.2f} MB/s'.format(name, total * number / seconds / 1024 / 1024))
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    Handler.body = os.urandom(size * 1024 * 1024)
+
+    server = Server(('127.0.0.1', 0), Handler)
+    t = threading.Thread(target=server.serve_forever)
+    t.daemon = True
+    t.start()
+    url = 'http://127.0.0.1:{0}/'.format(server.server_address[1])
+
+    for chunk_size in (8 * 1024, 1024 * 1024):
+        suffix = '({0}KB)'.format(chunk_size // 1024)
+        bench('iter_content per read ' + suffix, url, iter_content_read, chunk_size, len(Handler.body))
+        bench('read ' + suffix, url, read, chunk_size, len(Handler.body))
+        bench('readinto ' + suffix, url, readinto, chunk_size, len(Handler.body))
+        bench('iter_views ' + suffix, url, iter_views, chunk_size, len(Handler.body))
+
+    server.shutdown()
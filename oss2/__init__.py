@@ -1,37 +1,95 @@
 __version__ = '2.19.1'
 
-from . import models, exceptions, defaults
+import importlib
+import sys
 
-from .api import Service, Bucket
-from .auth import Auth, AuthV2, AuthV4, AnonymousAuth, StsAuth, AUTH_VERSION_1, AUTH_VERSION_2, AUTH_VERSION_4, make_auth, ProviderAuth, ProviderAuthV2, ProviderAuthV4
-from .http import Session, CaseInsensitiveDict
-from .credentials import EcsRamRoleCredentialsProvider, EcsRamRoleCredential, CredentialsProvider, StaticCredentialsProvider
+from . import exceptions, defaults
 
-from .iterators import (BucketIterator, ObjectIterator, ObjectIteratorV2,
-                        MultipartUploadIterator, ObjectUploadIterator,
-                        PartIterator, LiveChannelIterator)
+from .compat import to_bytes, to_string, to_unicode, urlparse, urlquote, urlunquote
 
 
-from .resumable import resumable_upload, resumable_download, ResumableStore, ResumableDownloadStore, determine_part_size
-from .resumable import make_upload_store, make_download_store
+# 下面的名字在第一次访问时才导入对应的模块（PEP 562），使 `import oss2` 不必加载requests、pycryptodome、
+# aliyunsdkcore以及models、xml_utils等较大的模块。冷启动敏感的场景（如函数计算）只为用到的功能付出导入的开销。
+_LAZY_IMPORTS = (
+    ('api', ('Service', 'Bucket')),
+    ('auth', ('Auth', 'AuthV2', 'AuthV4', 'AnonymousAuth', 'StsAuth', 'AUTH_VERSION_1', 'AUTH_VERSION_2',
+              'AUTH_VERSION_4', 'make_auth', 'ProviderAuth', 'ProviderAuthV2', 'ProviderAuthV4')),
+    ('http', ('Session', 'CaseInsensitiveDict')),
+    ('retry', ('RetryPolicy', 'RetryBudget')),
+    ('instrumentation', ('Instrumentation', 'RequestMetrics', 'HistogramCollector', 'CallbackInstrumentation',
+                         'set_event_sink')),
+    ('credentials', ('EcsRamRoleCredentialsProvider', 'EcsRamRoleCredential', 'CredentialsProvider',
+                     'StaticCredentialsProvider')),
 
+    ('iterators', ('BucketIterator', 'ObjectIterator', 'ObjectIteratorV2',
+                   'MultipartUploadIterator', 'ObjectUploadIterator',
+                   'PartIterator', 'LiveChannelIterator', 'ParallelObjectLister')),
+
+    ('resumable', ('resumable_upload', 'resumable_download', 'resumable_copy', 'ResumableStore',
+                   'ResumableDownloadStore', 'determine_part_size',
+                   'make_upload_store', 'make_download_store', 'StreamingMultipartUploader')),
+
+    ('utils', ('SizedFileAdapter', 'make_progress_adapter',
+               'content_type_by_name', 'is_valid_bucket_name', 'is_valid_endpoint',
+               'http_date', 'http_to_unixtime', 'iso8601_to_unixtime', 'date_to_iso8601', 'iso8601_to_date')),
+
+    ('models', ('BUCKET_ACL_PRIVATE', 'BUCKET_ACL_PUBLIC_READ', 'BUCKET_ACL_PUBLIC_READ_WRITE',
+                'SERVER_SIDE_ENCRYPTION_AES256', 'SERVER_SIDE_ENCRYPTION_KMS', 'SERVER_SIDE_ENCRYPTION_SM4',
+                'KMS_DATA_ENCRYPTION_SM4',
+                'OBJECT_ACL_DEFAULT', 'OBJECT_ACL_PRIVATE', 'OBJECT_ACL_PUBLIC_READ', 'OBJECT_ACL_PUBLIC_READ_WRITE',
+                'BUCKET_STORAGE_CLASS_STANDARD', 'BUCKET_STORAGE_CLASS_IA', 'BUCKET_STORAGE_CLASS_ARCHIVE',
+                'BUCKET_STORAGE_CLASS_COLD_ARCHIVE', 'BUCKET_STORAGE_CLASS_DEEP_COLD_ARCHIVE',
+                'BUCKET_VERSIONING_ENABLE', 'BUCKET_VERSIONING_SUSPEND',
+                'BUCKET_DATA_REDUNDANCY_TYPE_LRS', 'BUCKET_DATA_REDUNDANCY_TYPE_ZRS')),
+
+    ('crypto', ('LocalRsaProvider', 'AliKMSProvider', 'RsaProvider', 'EncryptionMaterials', 'DataKeyCache')),
+    ('crypto_bucket', ('CryptoBucket',)),
+)
+
+if sys.version_info >= (3, 5):
+    _LAZY_IMPORTS += (
+        ('async_api', ('AsyncService', 'AsyncBucket')),
+        ('async_http', ('AsyncSession', 'AsyncTransport')),
+    )
+
+_LAZY_ATTRS = dict((name, module) for module, names in _LAZY_IMPORTS for name in names)
+
+# 以 `oss2.models` 、 `oss2.utils` 等形式访问的子模块
+_SUBMODULES = frozenset(['api', 'async_api', 'async_http', 'auth', 'compat', 'crc64_combine', 'credentials', 'crypto',
+                         'crypto_bucket', 'defaults', 'exceptions', 'headers', 'http', 'instrumentation', 'iterators',
+                         'models', 'parallel', 'resumable', 'retry', 'select_params', 'select_response',
+                         'task_queue', 'utils', 'xml_utils'])
+
+
+# `from oss2 import *` 时也会按需导入
+__all__ = ['exceptions', 'defaults', 'models',
+           'to_bytes', 'to_string', 'to_unicode', 'urlparse', 'urlquote', 'urlunquote',
+           'logger', 'set_file_logger', 'set_stream_logger'] + [name for module, names in _LAZY_IMPORTS for name in names]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module('.' + module_name, __name__), name)
+        globals()[name] = value
+        return value
+
+    if name in _SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
 
-from .compat import to_bytes, to_string, to_unicode, urlparse, urlquote, urlunquote
 
-from .utils import SizedFileAdapter, make_progress_adapter
-from .utils import content_type_by_name, is_valid_bucket_name, is_valid_endpoint
-from .utils import http_date, http_to_unixtime, iso8601_to_unixtime, date_to_iso8601, iso8601_to_date
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | _SUBMODULES)
 
 
-from .models import BUCKET_ACL_PRIVATE, BUCKET_ACL_PUBLIC_READ, BUCKET_ACL_PUBLIC_READ_WRITE
-from .models import SERVER_SIDE_ENCRYPTION_AES256, SERVER_SIDE_ENCRYPTION_KMS, SERVER_SIDE_ENCRYPTION_SM4, KMS_DATA_ENCRYPTION_SM4
-from .models import OBJECT_ACL_DEFAULT, OBJECT_ACL_PRIVATE, OBJECT_ACL_PUBLIC_READ, OBJECT_ACL_PUBLIC_READ_WRITE
-from .models import BUCKET_STORAGE_CLASS_STANDARD, BUCKET_STORAGE_CLASS_IA, BUCKET_STORAGE_CLASS_ARCHIVE, BUCKET_STORAGE_CLASS_COLD_ARCHIVE, BUCKET_STORAGE_CLASS_DEEP_COLD_ARCHIVE
-from .models import BUCKET_VERSIONING_ENABLE, BUCKET_VERSIONING_SUSPEND 
-from .models import BUCKET_DATA_REDUNDANCY_TYPE_LRS, BUCKET_DATA_REDUNDANCY_TYPE_ZRS
+if sys.version_info < (3, 7):
+    # 不支持模块级的__getattr__，只能在导入时全部加载
+    for _name in _LAZY_ATTRS:
+        __getattr__(_name)
+    from . import models
 
-from .crypto import LocalRsaProvider, AliKMSProvider, RsaProvider,EncryptionMaterials
-from .crypto_bucket import CryptoBucket
 import logging
 
 logger = logging.getLogger('oss2')
@@ -189,11 +189,14 @@ from . import exceptions
 from . import defaults
 from . import models
 from . import select_params
+from . import parallel
+from . import instrumentation
 
 from .models import *
 from .compat import urlquote, urlparse, to_unicode, to_string
 from .headers import *
 from .select_params import *
+from .instrumentation import RequestMetrics, _clock
 
 import time
 import shutil
@@ -203,7 +206,8 @@ logger = logging.getLogger(__name__)
 
 class _Base(object):
     def __init__(self, auth, endpoint, is_cname, session, connect_timeout,
-                 app_name='', enable_crc=True, proxies=None, region=None, cloudbox_id= None, is_path_style=False, is_verify_object_strict=True):
+                 app_name='', enable_crc=True, proxies=None, region=None, cloudbox_id= None, is_path_style=False, is_verify_object_strict=True,
+                 retry_policy=None):
         self.auth = auth
         self.endpoint = _normalize_endpoint(endpoint.strip())
         if utils.is_valid_endpoint(self.endpoint) is not True:
@@ -222,8 +226,10 @@ class _Base(object):
         self.is_verify_object_strict = is_verify_object_strict
         if hasattr(self.auth, 'auth_version') and self.auth.auth_version() != 'v1' :
             self.is_verify_object_strict = False
+        self.retry_policy = retry_policy
 
-    def _do(self, method, bucket_name, key, **kwargs):
+    def _do(self, method, bucket_name, key, operation=None, **kwargs):
+        # operation是发起请求的公开方法名，用于埋点；没有指定时用HTTP方法代替
         key = to_string(key)
         req = http.Request(method, self._make_url(bucket_name, key),
                            app_name=self.app_name,
@@ -232,30 +238,63 @@ class _Base(object):
                            product=self.product,
                            cloudbox_id=self.cloudbox_id,
                            **kwargs)
-        self.auth._sign_request(req, bucket_name, key)
 
-        resp = self.session.do_request(req, timeout=self.timeout)
-        if resp.status // 100 != 2:
-            e = exceptions.make_exception(resp)
-            logger.info("Exception: {0}".format(e))
-            raise e
+        return self.__do_request(req, lambda: self.auth._sign_request(req, bucket_name, key), operation)
 
-        # Note that connections are only released back to the pool for reuse once all body data has been read;
-        # be sure to either set stream to False or read the content property of the Response object.
-        # For more details, please refer to http://docs.python-requests.org/en/master/user/advanced/#keep-alive.
-        content_length = models._hget(resp.headers, 'content-length', int)
-        if content_length is not None and content_length == 0:
-            resp.read()
-
-        return resp
-
-    def _do_url(self, method, sign_url, **kwargs):
+    def _do_url(self, method, sign_url, operation=None, **kwargs):
         req = http.Request(method, sign_url, app_name=self.app_name, proxies=self.proxies, **kwargs)
-        resp = self.session.do_request(req, timeout=self.timeout)
-        if resp.status // 100 != 2:
-            e = exceptions.make_exception(resp)
-            logger.info("Exception: {0}".format(e))
-            raise e
+        return self.__do_request(req, None, operation)
+
+    def __do_request(self, req, sign, operation):
+        policy = self.retry_policy
+        rewind = utils._make_rewinder(req.data) if policy is not None else None
+        budget = getattr(self.session, 'retry_budget', None)
+
+        metrics = None
+        instr = getattr(self.session, 'instrumentation', None)
+        if instr is not None:
+            metrics = req.metrics = RequestMetrics(instr, operation or req.method, req.method, req.url)
+
+        retries = 0
+        delay = None
+        while True:
+            if sign is not None:
+                if metrics is None:
+                    sign()
+                else:
+                    sign_start = _clock()
+                    sign()
+                    metrics.sign_time += _clock() - sign_start
+
+            try:
+                resp = self.session.do_request(req, timeout=self.timeout)
+                if resp.status // 100 != 2:
+                    e = exceptions.make_exception(resp)
+                    logger.info("Exception: {0}".format(e))
+                    raise e
+            except (exceptions.RequestError, exceptions.ServerError) as e:
+                if policy is None or not policy.should_retry(req, e, retries, rewind is not None, budget):
+                    if metrics is not None:
+                        metrics.error = e
+                        metrics._finish()
+                    raise
+
+                delay = policy.compute_delay(e, delay)
+                retries += 1
+                if metrics is not None:
+                    metrics.retries = retries
+                logger.info("Retry request, method: {0}, url: {1}, retries: {2}, delay: {3:.3f}s".format(
+                    req.method, req.url, retries, delay))
+                if instrumentation._event_sink is not None:
+                    instrumentation._emit('retry', method=req.method, url=req.url, retries=retries, delay=delay,
+                                          error=e.__class__.__name__)
+                time.sleep(delay)
+                rewind()
+                continue
+
+            if policy is not None:
+                policy.on_success(budget)
+            break
 
         # Note that connections are only released back to the pool for reuse once all body data has been read;
         # be sure to either set stream to False or read the content property of the Response object.
@@ -272,6 +311,13 @@ class _Base(object):
         parse_func(result, resp.read())
         return result
 
+    @staticmethod
+    def _parse_stream_result(resp, parse_func, klass, **kwargs):
+        # 把响应本身交给parse_func，边接收边解析，不必先把整个body读进内存
+        result = klass(resp)
+        parse_func(result, resp, **kwargs)
+        return result
+
 
 class Service(_Base):
     """用于Service操作的类，如罗列用户所有的Bucket。
@@ -295,6 +341,9 @@ class Service(_Base):
     :param float connect_timeout: 连接超时时间，以秒为单位。
     :param str app_name: 应用名。该参数不为空，则在User Agent中加入其值。
         注意到，最终这个字符串是要作为HTTP Header的值传输的，所以必须要遵循HTTP标准。
+
+    :param retry_policy: 重试策略。如果是None表示不重试
+    :type retry_policy: oss2.RetryPolicy
     """
 
     QOS_INFO = 'qosInfo'
@@ -314,12 +363,14 @@ class Service(_Base):
                  proxies=None,
                  region=None,
                  cloudbox_id=None,
-                 is_path_style=False):
+                 is_path_style=False,
+                 retry_policy=None):
         logger.debug("Init oss service, endpoint: {0}, connect_timeout: {1}, app_name: {2}, proxies: {3}".format(
             endpoint, connect_timeout, app_name, proxies))
         super(Service, self).__init__(auth, endpoint, False, session, connect_timeout,
                                       app_name=app_name, proxies=proxies,
-                                      region=region, cloudbox_id=cloudbox_id, is_path_style=is_path_style)
+                                      region=region, cloudbox_id=cloudbox_id, is_path_style=is_path_style,
+                                      retry_policy=retry_policy)
 
     def list_buckets(self, prefix='', marker='', max_keys=100, params=None, headers=None):
         """根据前缀罗列用户的Bucket。
@@ -345,7 +396,7 @@ class Service(_Base):
         if params is not None:
             listParam.update(params)
 
-        resp = self._do('GET', '', '', params=listParam, headers=headers)
+        resp = self._do('GET', '', '', params=listParam, headers=headers, operation='list_buckets')
         logger.debug("List buckets done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_buckets, ListBucketsResult)
 
@@ -354,7 +405,7 @@ class Service(_Base):
         :return: :class:`GetUserQosInfoResult <oss2.models.GetUserQosInfoResult>`
         """
         logger.debug("Start to get user qos info.")
-        resp = self._do('GET', '', '', params={Service.QOS_INFO: ''})
+        resp = self._do('GET', '', '', params={Service.QOS_INFO: ''}, operation='get_user_qos_info')
         logger.debug("get use qos, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_qos_info, GetUserQosInfoResult)
 
@@ -366,7 +417,7 @@ class Service(_Base):
         """
         logger.debug("Start to describe regions")
 
-        resp = self._do('GET', '', '', params={Service.REGIONS: regions})
+        resp = self._do('GET', '', '', params={Service.REGIONS: regions}, operation='describe_regions')
         logger.debug("Describe regions done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_describe_regions, DescribeRegionsResult)
@@ -397,7 +448,7 @@ class Service(_Base):
         if fwd_status:
             headers['x-oss-fwd-status'] = fwd_status
 
-        resp = self._do('POST', '', '', params={Service.WRITE_GET_OBJECT_RESPONSE: ''}, headers=headers, data=data)
+        resp = self._do('POST', '', '', params={Service.WRITE_GET_OBJECT_RESPONSE: ''}, headers=headers, data=data, operation='write_get_object_response')
         logger.debug("write get object response done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -411,7 +462,7 @@ class Service(_Base):
         """
         logger.debug("Start to list user data redundancy transition, continuation token: {0}, max keys: {1}".format(continuation_token, max_keys))
 
-        resp = self._do('GET', '', '', params={Bucket.REDUNDANCY_TRANSITION: '', 'continuation-token': continuation_token, 'max-keys': str(max_keys)})
+        resp = self._do('GET', '', '', params={Bucket.REDUNDANCY_TRANSITION: '', 'continuation-token': continuation_token, 'max-keys': str(max_keys)}, operation='list_user_data_redundancy_transition')
         logger.debug("List user data redundancy transition done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_user_data_redundancy_transition, ListUserDataRedundancyTransitionResult)
 
@@ -424,7 +475,7 @@ class Service(_Base):
         """
 
         logger.debug("Start to list bucket access point")
-        resp = self._do('GET', '', '', params={Bucket.ACCESS_POINT: '', 'max-keys': str(max_keys), 'continuation-token': continuation_token})
+        resp = self._do('GET', '', '', params={Bucket.ACCESS_POINT: '', 'max-keys': str(max_keys), 'continuation-token': continuation_token}, operation='list_access_points')
         logger.debug("query list access point done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_access_point_result, ListAccessPointResult)
 
@@ -437,7 +488,7 @@ class Service(_Base):
         logger.debug("Start to put public access block")
 
         data = xml_utils.to_put_public_access_block_request(block_public_access)
-        resp = self._do('PUT', '', '', data=data, params={Service.PUBLIC_ACCESS_BLOCK: ''})
+        resp = self._do('PUT', '', '', data=data, params={Service.PUBLIC_ACCESS_BLOCK: ''}, operation='put_public_access_block')
         logger.debug("Put public access block done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -448,7 +499,7 @@ class Service(_Base):
         """
         logger.debug("Start to get public access block")
 
-        resp = self._do('GET', '', '', params={Service.PUBLIC_ACCESS_BLOCK: ''})
+        resp = self._do('GET', '', '', params={Service.PUBLIC_ACCESS_BLOCK: ''}, operation='get_public_access_block')
         logger.debug("Get public access block done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_public_access_block_result, GetPublicAccessBlockResult)
@@ -460,7 +511,7 @@ class Service(_Base):
         """
         logger.debug("Start to delete public access block")
 
-        resp = self._do('DELETE', '', '', params={Service.PUBLIC_ACCESS_BLOCK: ''})
+        resp = self._do('DELETE', '', '', params={Service.PUBLIC_ACCESS_BLOCK: ''}, operation='delete_public_access_block')
         logger.debug("Delete public access block done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -476,7 +527,7 @@ class Service(_Base):
         """
         logger.debug("Start to list resource pools, continuation_token: {0}, max_keys: {1}".format(continuation_token, max_keys))
 
-        resp = self._do('GET', '', '', params={Service.RESOURCE_POOL: '', 'continuation-token': continuation_token, 'max-keys': str(max_keys)})
+        resp = self._do('GET', '', '', params={Service.RESOURCE_POOL: '', 'continuation-token': continuation_token, 'max-keys': str(max_keys)}, operation='list_resource_pools')
         logger.debug("List resource pools done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_resource_pools, ListResourcePoolsResult)
 
@@ -490,7 +541,7 @@ class Service(_Base):
         if not resource_pool_name:
             raise ClientError('resource_pool_name should not be empty')
 
-        resp = self._do('GET', '', '', params={Service.RESOURCE_POOL_INFO: '', Service.RESOURCE_POOL: resource_pool_name})
+        resp = self._do('GET', '', '', params={Service.RESOURCE_POOL_INFO: '', Service.RESOURCE_POOL: resource_pool_name}, operation='get_resource_pool_info')
         logger.debug("Get resource pool info done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_resource_pool_info, ResourcePoolInfoResult)
@@ -508,7 +559,7 @@ class Service(_Base):
         if not resource_pool_name:
             raise ClientError('resource_pool_name should not be empty')
 
-        resp = self._do('GET', '', '', params={Service.RESOURCE_POOL_BUCKETS: '', Service.RESOURCE_POOL: resource_pool_name, 'continuation-token': continuation_token, 'max-keys': str(max_keys)})
+        resp = self._do('GET', '', '', params={Service.RESOURCE_POOL_BUCKETS: '', Service.RESOURCE_POOL: resource_pool_name, 'continuation-token': continuation_token, 'max-keys': str(max_keys)}, operation='list_resource_pool_buckets')
         logger.debug("List resource pool buckets done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_resource_pool_buckets, ListResourcePoolBucketsResult)
 
@@ -528,7 +579,7 @@ class Service(_Base):
             raise ClientError('resource_pool_name should not be empty')
 
         data = xml_utils.to_put_qos_info(qos_configuration)
-        resp = self._do('PUT', '', '', data=data, params={Service.REQUESTER_QOS_INFO: '', Service.QOS_REQUESTER: uid, Service.RESOURCE_POOL: resource_pool_name})
+        resp = self._do('PUT', '', '', data=data, params={Service.REQUESTER_QOS_INFO: '', Service.QOS_REQUESTER: uid, Service.RESOURCE_POOL: resource_pool_name}, operation='put_resource_pool_requester_qos_info')
         logger.debug("Put resource pool requester qos info done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -543,7 +594,7 @@ class Service(_Base):
         if not resource_pool_name:
             raise ClientError('resource_pool_name should not be empty')
 
-        resp = self._do('GET', '', '', params={Service.REQUESTER_QOS_INFO: '', Service.QOS_REQUESTER: uid, Service.RESOURCE_POOL: resource_pool_name})
+        resp = self._do('GET', '', '', params={Service.REQUESTER_QOS_INFO: '', Service.QOS_REQUESTER: uid, Service.RESOURCE_POOL: resource_pool_name}, operation='get_resource_pool_requester_qos_info')
         logger.debug("Get resource pool requester qos info done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_requester_qos_info, RequesterQoSInfoResult)
@@ -561,7 +612,7 @@ class Service(_Base):
         if not resource_pool_name:
             raise ClientError('resource_pool_name should not be empty')
 
-        resp = self._do('GET', '', '', params={Service.REQUESTER_QOS_INFO: '', Service.RESOURCE_POOL: resource_pool_name, 'continuation-token': continuation_token, 'max-keys': str(max_keys)})
+        resp = self._do('GET', '', '', params={Service.REQUESTER_QOS_INFO: '', Service.RESOURCE_POOL: resource_pool_name, 'continuation-token': continuation_token, 'max-keys': str(max_keys)}, operation='list_resource_pool_requester_qos_infos')
         logger.debug("List resource pool requester qos infos done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_resource_pool_requester_qos_infos, ListResourcePoolRequesterQoSInfosResult)
 
@@ -577,7 +628,7 @@ class Service(_Base):
         if not resource_pool_name:
             raise ClientError('resource_pool_name should not be empty')
 
-        resp = self._do('DELETE', '', '', params={Service.REQUESTER_QOS_INFO: '', Service.QOS_REQUESTER: uid, Service.RESOURCE_POOL: resource_pool_name})
+        resp = self._do('DELETE', '', '', params={Service.REQUESTER_QOS_INFO: '', Service.QOS_REQUESTER: uid, Service.RESOURCE_POOL: resource_pool_name}, operation='delete_resource_pool_requester_qos_info')
         logger.debug("Delete resource pool requester qos info done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -609,6 +660,9 @@ class Bucket(_Base):
         注意到，最终这个字符串是要作为HTTP Header的值传输的，所以必须要遵循HTTP标准。
 
     :param bool is_verify_object_strict: 严格验证对象名称的标志。默认为True。
+
+    :param retry_policy: 重试策略。如果是None表示不重试
+    :type retry_policy: oss2.RetryPolicy
     """
 
     ACL = 'acl'
@@ -683,12 +737,14 @@ class Bucket(_Base):
                  region=None,
                  cloudbox_id=None,
                  is_path_style=False,
-                 is_verify_object_strict=True):
+                 is_verify_object_strict=True,
+                 retry_policy=None):
         logger.debug("Init Bucket: {0}, endpoint: {1}, isCname: {2}, connect_timeout: {3}, app_name: {4}, enabled_crc: {5}, region: {6}"
                      ", proxies: {6}".format(bucket_name, endpoint, is_cname, connect_timeout, app_name, enable_crc, proxies, region))
         super(Bucket, self).__init__(auth, endpoint, is_cname, session, connect_timeout, 
                                      app_name=app_name, enable_crc=enable_crc, proxies=proxies,
-                                     region=region, cloudbox_id=cloudbox_id, is_path_style=is_path_style, is_verify_object_strict=is_verify_object_strict)
+                                     region=region, cloudbox_id=cloudbox_id, is_path_style=is_path_style, is_verify_object_strict=is_verify_object_strict,
+                                     retry_policy=retry_policy)
 
         self.bucket_name = bucket_name.strip()
         if utils.is_valid_bucket_name(self.bucket_name) is not True:
@@ -763,7 +819,7 @@ class Bucket(_Base):
             params['playlistName'] = playlist_name
         return self.auth._sign_rtmp_url(url, self.bucket_name, channel_name, expires, params)
 
-    def list_objects(self, prefix='', delimiter='', marker='', max_keys=100, headers=None):
+    def list_objects(self, prefix='', delimiter='', marker='', max_keys=100, headers=None, table=None):
         """根据前缀罗列Bucket里的文件。
 
         :param str prefix: 只罗列文件名为该前缀的文件
@@ -774,23 +830,28 @@ class Bucket(_Base):
         :param headers: HTTP头部
         :type headers: 可以是dict，建议是oss2.CaseInsensitiveDict
 
+        :param table: 若指定，文件直接追加到该 :class:`ObjectListingTable <oss2.models.ObjectListingTable>` 中，
+            返回值的 `object_list` 为空
+
         :return: :class:`ListObjectsResult <oss2.models.ListObjectsResult>`
         """
         headers = http.CaseInsensitiveDict(headers)
-        logger.debug(
-            "Start to List objects, bucket: {0}, prefix: {1}, delimiter: {2}, marker: {3}, max-keys: {4}".format(
-                self.bucket_name, to_string(prefix), delimiter, to_string(marker), max_keys))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Start to List objects, bucket: {0}, prefix: {1}, delimiter: {2}, marker: {3}, max-keys: {4}".format(
+                    self.bucket_name, to_string(prefix), delimiter, to_string(marker), max_keys))
         resp = self.__do_bucket('GET',
                                 params={'prefix': prefix,
                                         'delimiter': delimiter,
                                         'marker': marker,
                                         'max-keys': str(max_keys),
                                         'encoding-type': 'url'}, 
-                                        headers=headers)
-        logger.debug("List objects done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
-        return self._parse_result(resp, xml_utils.parse_list_objects, ListObjectsResult)
+                                        headers=headers, operation='list_objects')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("List objects done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        return self._parse_stream_result(resp, xml_utils.parse_list_objects, ListObjectsResult, table=table)
 
-    def list_objects_v2(self, prefix='', delimiter='', continuation_token='', start_after='', fetch_owner=False, encoding_type='url', max_keys=100, headers=None):
+    def list_objects_v2(self, prefix='', delimiter='', continuation_token='', start_after='', fetch_owner=False, encoding_type='url', max_keys=100, headers=None, table=None):
         """根据前缀罗列Bucket里的文件。
 
         :param str prefix: 只罗列文件名为该前缀的文件
@@ -803,13 +864,17 @@ class Bucket(_Base):
         :param headers: HTTP头部
         :type headers: 可以是dict，建议是oss2.CaseInsensitiveDict
 
+        :param table: 若指定，文件直接追加到该 :class:`ObjectListingTable <oss2.models.ObjectListingTable>` 中，
+            返回值的 `object_list` 为空
+
         :return: :class:`ListObjectsV2Result <oss2.models.ListObjectsV2Result>`
         """
         headers = http.CaseInsensitiveDict(headers)
-        logger.debug(
-            "Start to List objects, bucket: {0}, prefix: {1}, delimiter: {2}, continuation_token: {3}, "
-            "start-after: {4}, fetch-owner: {5}, encoding_type: {6}, max-keys: {7}".format(
-                self.bucket_name, to_string(prefix), delimiter, continuation_token, start_after, fetch_owner, encoding_type, max_keys))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Start to List objects, bucket: {0}, prefix: {1}, delimiter: {2}, continuation_token: {3}, "
+                "start-after: {4}, fetch-owner: {5}, encoding_type: {6}, max-keys: {7}".format(
+                    self.bucket_name, to_string(prefix), delimiter, continuation_token, start_after, fetch_owner, encoding_type, max_keys))
         resp = self.__do_bucket('GET',
                                 params={'list-type': '2',
                                         'prefix': prefix,
@@ -819,9 +884,11 @@ class Bucket(_Base):
                                         'fetch-owner': str(fetch_owner).lower(),
                                         'max-keys': str(max_keys),
                                         'encoding-type': encoding_type},
-                                        headers=headers)
-        logger.debug("List objects V2 done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
-        return self._parse_result(resp, xml_utils.parse_list_objects_v2, ListObjectsV2Result)
+                                        headers=headers, operation='list_objects_v2')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("List objects V2 done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        return self._parse_stream_result(resp, xml_utils.parse_list_objects_v2, ListObjectsV2Result,
+                                         fetch_owner=fetch_owner, table=table)
 
     def put_object(self, key, data,
                    headers=None,
@@ -853,10 +920,12 @@ class Bucket(_Base):
         if self.enable_crc:
             data = utils.make_crc_adapter(data)
 
-        logger.debug("Start to put object, bucket: {0}, key: {1}, headers: {2}".format(self.bucket_name, to_string(key),
-                                                                                       headers))
-        resp = self.__do_object('PUT', key, data=data, headers=headers)
-        logger.debug("Put object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to put object, bucket: {0}, key: {1}, headers: {2}".format(
+                self.bucket_name, to_string(key), headers))
+        resp = self.__do_object('PUT', key, data=data, headers=headers, operation='put_object')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Put object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         result = PutObjectResult(resp)
 
         if self.enable_crc and result.crc is not None:
@@ -903,11 +972,13 @@ class Bucket(_Base):
         if self.enable_crc:
             data = utils.make_crc_adapter(data)
 
-        logger.debug("Start to put object with signed url, bucket: {0}, sign_url: {1}, headers: {2}".format(
-            self.bucket_name, sign_url, headers))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to put object with signed url, bucket: {0}, sign_url: {1}, headers: {2}".format(
+                self.bucket_name, sign_url, headers))
 
-        resp = self._do_url('PUT', sign_url, data=data, headers=headers)
-        logger.debug("Put object with url done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        resp = self._do_url('PUT', sign_url, data=data, headers=headers, operation='put_object_with_url')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Put object with url done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         result = PutObjectResult(resp)
 
         if self.enable_crc and result.crc is not None:
@@ -963,13 +1034,15 @@ class Bucket(_Base):
         if self.enable_crc and init_crc is not None:
             data = utils.make_crc_adapter(data, init_crc)
 
-        logger.debug("Start to append object, bucket: {0}, key: {1}, headers: {2}, position: {3}".format(
-            self.bucket_name, to_string(key), headers, position))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to append object, bucket: {0}, key: {1}, headers: {2}, position: {3}".format(
+                self.bucket_name, to_string(key), headers, position))
         resp = self.__do_object('POST', key,
                                 data=data,
                                 headers=headers,
-                                params={'append': '', 'position': str(position)})
-        logger.debug("Append object done, req_id: {0}, statu_code: {1}".format(resp.request_id, resp.status))
+                                params={'append': '', 'position': str(position)}, operation='append_object')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Append object done, req_id: {0}, statu_code: {1}".format(resp.request_id, resp.status))
         result = AppendObjectResult(resp)
 
         if self.enable_crc and result.crc is not None and init_crc is not None:
@@ -1018,10 +1091,12 @@ class Bucket(_Base):
         if process:
             params.update({Bucket.PROCESS: process})
 
-        logger.debug("Start to get object, bucket: {0}， key: {1}, range: {2}, headers: {3}, params: {4}".format(
-            self.bucket_name, to_string(key), range_string, headers, params))
-        resp = self.__do_object('GET', key, headers=headers, params=params)
-        logger.debug("Get object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to get object, bucket: {0}， key: {1}, range: {2}, headers: {3}, params: {4}".format(
+                self.bucket_name, to_string(key), range_string, headers, params))
+        resp = self.__do_object('GET', key, headers=headers, params=params, operation='get_object')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Get object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return GetObjectResult(resp, progress_callback, self.enable_crc)
 
@@ -1076,7 +1151,7 @@ class Bucket(_Base):
             params['x-oss-process'] = 'json/select'
 
         self.timeout = 3600
-        resp = self.__do_object('POST', key, data=body, headers=headers, params=params)
+        resp = self.__do_object('POST', key, data=body, headers=headers, params=params, operation='select_object')
         crc_enabled = False
         if select_params is not None and SelectParameters.EnablePayloadCrc in select_params:
             if str(select_params[SelectParameters.EnablePayloadCrc]).lower() == "true":
@@ -1124,6 +1199,57 @@ class Bucket(_Base):
 
             return result
 
+    def get_object_parallel(self, key,
+                            buffer=None,
+                            part_size=None,
+                            num_threads=None,
+                            stream=False,
+                            max_buffered_parts=None,
+                            progress_callback=None,
+                            headers=None,
+                            params=None):
+        """并发地分段（Range）下载一个文件到内存。
+
+        先通过HeadObject获取文件大小及ETag，再把文件分成大小为 `part_size` 的分片，由 `num_threads` 个线程并发下载。
+        每个分片的请求都带有If-Match头部，从而保证下载过程中文件没有被覆盖。开启CRC校验时，各分片的CRC合并后与服务端
+        返回的CRC比较。
+
+        用法 ::
+
+            >>> result = bucket.get_object_parallel('model.bin', num_threads=8)
+            >>> model = load_model(result.buffer)
+
+            >>> with bucket.get_object_parallel('model.bin', stream=True) as stream:
+            ...     for chunk in stream:
+            ...         process(chunk)
+
+        :param key: 文件名
+        :param buffer: 存放文件内容的缓冲区，可以是bytearray、可写的memoryview、NumPy数组等，按字节计算的长度不能小于文件大小。
+            缺省会分配一个长度等于文件大小的bytearray。 `stream` 为True时忽略该参数
+        :param part_size: 分片大小，缺省为 `oss2.defaults.multiget_part_size`
+        :param num_threads: 并发线程数，缺省为 `oss2.defaults.multiget_num_threads`
+        :param bool stream: 为True时返回按顺序读取的文件对象，而不是把整个文件下载到内存中
+        :param max_buffered_parts: `stream` 为True时，已下载但尚未读取的分片及正在下载的分片的最大总数，
+            缺省为 `num_threads` 的两倍
+
+        :param progress_callback: 用户指定的进度回调函数。参考 :ref:`progress_callback`
+
+        :param headers: HTTP头部，用于HeadObject和各分片的GetObject请求
+        :type headers: 可以是dict，建议是oss2.CaseInsensitiveDict
+
+        :param params: http 请求的查询字符串参数，如versionId
+        :type params: dict
+
+        :return: `stream` 为False时返回 :class:`GetObjectParallelResult <oss2.parallel.GetObjectParallelResult>` ，
+            否则返回 :class:`ParallelObjectStream <oss2.parallel.ParallelObjectStream>`
+
+        :raises: 如果文件不存在，则抛出 :class:`NoSuchKey <oss2.exceptions.NoSuchKey>` ；CRC不一致时抛出
+            :class:`InconsistentError <oss2.exceptions.InconsistentError>` ；还可能抛出其他异常
+        """
+        return parallel.get_object_parallel(self, key, buffer=buffer, part_size=part_size, num_threads=num_threads,
+                                            stream=stream, max_buffered_parts=max_buffered_parts,
+                                            progress_callback=progress_callback, headers=headers, params=params)
+
     def get_object_with_url(self, sign_url,
                             byte_range=None,
                             headers=None,
@@ -1148,9 +1274,10 @@ class Bucket(_Base):
         if range_string:
             headers['range'] = range_string
 
-        logger.debug("Start to get object with url, bucket: {0}, sign_url: {1}, range: {2}, headers: {3}".format(
-            self.bucket_name, sign_url, range_string, headers))
-        resp = self._do_url('GET', sign_url, headers=headers)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to get object with url, bucket: {0}, sign_url: {1}, range: {2}, headers: {3}".format(
+                self.bucket_name, sign_url, range_string, headers))
+        resp = self._do_url('GET', sign_url, headers=headers, operation='get_object_with_url')
         return GetObjectResult(resp, progress_callback, self.enable_crc)
 
     def get_object_with_url_to_file(self, sign_url,
@@ -1236,12 +1363,14 @@ class Bucket(_Base):
 
         :raises: 如果Bucket不存在或者Object不存在，则抛出 :class:`NotFound <oss2.exceptions.NotFound>`
         """
-        logger.debug("Start to head object, bucket: {0}, key: {1}, headers: {2}".format(
-            self.bucket_name, to_string(key), headers))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to head object, bucket: {0}, key: {1}, headers: {2}".format(
+                self.bucket_name, to_string(key), headers))
 
-        resp = self.__do_object('HEAD', key, headers=headers, params=params)
+        resp = self.__do_object('HEAD', key, headers=headers, params=params, operation='head_object')
 
-        logger.debug("Head object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Head object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_dummy_result, HeadObjectResult)
 
     def create_select_object_meta(self, key, select_meta_params=None, headers=None):
@@ -1281,7 +1410,7 @@ class Bucket(_Base):
             params['x-oss-process'] = 'json/meta'
 
         self.timeout = 3600
-        resp = self.__do_object('POST', key, data=body, headers=headers, params=params)
+        resp = self.__do_object('POST', key, data=body, headers=headers, params=params, operation='create_select_object_meta')
         return GetSelectObjectMetaResult(resp)
 
     def get_object_meta(self, key, params=None, headers=None):
@@ -1300,7 +1429,8 @@ class Bucket(_Base):
         :raises: 如果文件不存在，则抛出 :class:`NoSuchKey <oss2.exceptions.NoSuchKey>` ；还可能抛出其他异常
         """
         headers = http.CaseInsensitiveDict(headers)
-        logger.debug("Start to get object metadata, bucket: {0}, key: {1}".format(self.bucket_name, to_string(key)))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to get object metadata, bucket: {0}, key: {1}".format(self.bucket_name, to_string(key)))
 
         if params is None:
             params = dict()
@@ -1308,8 +1438,9 @@ class Bucket(_Base):
         if Bucket.OBJECTMETA not in params:
             params[Bucket.OBJECTMETA] = ''
 
-        resp = self.__do_object('HEAD', key, params=params, headers=headers)
-        logger.debug("Get object metadata done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        resp = self.__do_object('HEAD', key, params=params, headers=headers, operation='get_object_meta')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Get object metadata done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return GetObjectMetaResult(resp)
 
     def object_exists(self, key, headers=None):
@@ -1330,7 +1461,8 @@ class Bucket(_Base):
         # 同时, 对于head 请求，服务端会通过x-oss-err 返回 错误响应信息,
         # 考虑到兼容之前的行为，增加exceptions.NotFound 异常 当作NoSuchKey
 
-        logger.debug("Start to check if object exists, bucket: {0}, key: {1}".format(self.bucket_name, to_string(key)))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to check if object exists, bucket: {0}, key: {1}".format(self.bucket_name, to_string(key)))
         try:
             self.get_object_meta(key, headers=headers)
         except exceptions.NoSuchKey:
@@ -1366,11 +1498,13 @@ class Bucket(_Base):
         else:
             headers[OSS_COPY_OBJECT_SOURCE] = '/' + source_bucket_name + '/' + urlquote(source_key, '')
 
-        logger.debug(
-            "Start to copy object, source bucket: {0}, source key: {1}, bucket: {2}, key: {3}, headers: {4}".format(
-                source_bucket_name, to_string(source_key), self.bucket_name, to_string(target_key), headers))
-        resp = self.__do_object('PUT', target_key, headers=headers)
-        logger.debug("Copy object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Start to copy object, source bucket: {0}, source key: {1}, bucket: {2}, key: {3}, headers: {4}".format(
+                    source_bucket_name, to_string(source_key), self.bucket_name, to_string(target_key), headers))
+        resp = self.__do_object('PUT', target_key, headers=headers, operation='copy_object')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Copy object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return PutObjectResult(resp)
 
@@ -1408,8 +1542,9 @@ class Bucket(_Base):
         headers = http.CaseInsensitiveDict(headers)
 
         logger.info("Start to delete object, bucket: {0}, key: {1}".format(self.bucket_name, to_string(key)))
-        resp = self.__do_object('DELETE', key, params=params, headers=headers)
-        logger.debug("Delete object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        resp = self.__do_object('DELETE', key, params=params, headers=headers, operation='delete_object')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Delete object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
     def restore_object(self, key, params=None, headers=None, input=None):
@@ -1443,7 +1578,8 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         headers = http.CaseInsensitiveDict(headers)
-        logger.debug("Start to restore object, bucket: {0}, key: {1}".format(self.bucket_name, to_string(key)))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to restore object, bucket: {0}, key: {1}".format(self.bucket_name, to_string(key)))
 
         if params is None:
             params = dict()
@@ -1453,8 +1589,9 @@ class Bucket(_Base):
 
         data = self.__convert_data(RestoreConfiguration, xml_utils.to_put_restore_config, input)
 
-        resp = self.__do_object('POST', key, params=params, headers=headers, data=data)
-        logger.debug("Restore object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        resp = self.__do_object('POST', key, params=params, headers=headers, data=data, operation='restore_object')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Restore object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
     def put_object_acl(self, key, permission, params=None, headers=None):
@@ -1482,7 +1619,7 @@ class Bucket(_Base):
         if Bucket.ACL not in params:
             params[Bucket.ACL] = ''
 
-        resp = self.__do_object('PUT', key, params=params, headers=headers)
+        resp = self.__do_object('PUT', key, params=params, headers=headers, operation='put_object_acl')
         logger.debug("Put object acl done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -1506,7 +1643,7 @@ class Bucket(_Base):
         if Bucket.ACL not in params:
             params[Bucket.ACL] = ''
 
-        resp = self.__do_object('GET', key, params=params, headers=headers)
+        resp = self.__do_object('GET', key, params=params, headers=headers, operation='get_object_acl')
         logger.debug("Get object acl done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_object_acl, GetObjectAclResult)
 
@@ -1523,7 +1660,8 @@ class Bucket(_Base):
         if not key_list:
             raise ClientError('key_list should not be empty')
 
-        logger.debug("Start to delete objects, bucket: {0}, keys: {1}".format(self.bucket_name, key_list))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to delete objects, bucket: {0}, keys: {1}".format(self.bucket_name, key_list))
         
         data = xml_utils.to_batch_delete_objects_request(key_list, False)
 
@@ -1533,8 +1671,9 @@ class Bucket(_Base):
         resp = self.__do_bucket('POST',
                                 data=data,
                                 params={'delete': '', 'encoding-type': 'url'},
-                                headers=headers)
-        logger.debug("Delete objects done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+                                headers=headers, operation='batch_delete_objects')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Delete objects done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_batch_delete_objects, BatchDeleteObjectsResult)
 
     def delete_object_versions(self, keylist_versions, headers=None):
@@ -1560,10 +1699,50 @@ class Bucket(_Base):
         resp = self.__do_bucket('POST',
                                 data=data,
                                 params={'delete': '', 'encoding-type': 'url'},
-                                headers=headers)
+                                headers=headers, operation='delete_object_versions')
         logger.debug("Delete object versions done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_batch_delete_objects, BatchDeleteObjectsResult)
 
+    def bulk_delete(self, keys, concurrency=None, batch_size=None, progress_callback=None, headers=None):
+        """并发地批量删除大量文件。
+
+        从 `keys` 中依次取出待删除的文件，每 `batch_size` 个组成一个批量删除请求，由 `concurrency` 个线程并发发送。
+        待发送的请求数有上限，所以 `keys` 可以是列举文件的迭代器，不会一次性读入内存。
+
+        用法 ::
+
+            >>> result = bucket.bulk_delete(oss2.ObjectIteratorV2(bucket, prefix='logs/2019/'), concurrency=8)
+            >>> print(result.deleted_count, result.failed, result.throughput)
+
+        :param keys: 待删除文件的列表或迭代器。元素可以是文件名、 :class:`SimplifiedObjectInfo <oss2.models.SimplifiedObjectInfo>` 、
+            :class:`ObjectVersionInfo <oss2.models.ObjectVersionInfo>` 、 :class:`BatchDeleteObjectVersion <oss2.models.BatchDeleteObjectVersion>` 等
+        :param concurrency: 并发数，缺省为 `oss2.defaults.bulk_delete_num_threads`
+        :param batch_size: 每个批量删除请求包含的文件数，不超过1000
+        :param progress_callback: 进度回调函数，参数为已处理的文件数和None
+
+        :param headers: HTTP头部
+
+        :return: :class:`BulkDeleteResult <oss2.parallel.BulkDeleteResult>` 。某个批量删除请求失败时，该请求中的所有文件
+            记入 `failed` ，不会抛出异常
+        """
+        return parallel.bulk_delete(self, keys, concurrency=concurrency, batch_size=batch_size,
+                                    progress_callback=progress_callback, headers=headers)
+
+    def delete_prefix(self, prefix, include_versions=False, concurrency=None, progress_callback=None, headers=None):
+        """删除指定前缀的所有文件。边列举边删除，参见 :func:`bulk_delete <oss2.Bucket.bulk_delete>` 。
+
+        :param prefix: 文件名前缀，不能为空
+        :param bool include_versions: 为True时删除这些文件的所有版本（包括删除标记），否则只删除当前版本
+        :param concurrency: 并发数，缺省为 `oss2.defaults.bulk_delete_num_threads`
+        :param progress_callback: 进度回调函数，参数为已处理的文件数和None
+
+        :param headers: HTTP头部
+
+        :return: :class:`BulkDeleteResult <oss2.parallel.BulkDeleteResult>`
+        """
+        return parallel.delete_prefix(self, prefix, include_versions=include_versions, concurrency=concurrency,
+                                      progress_callback=progress_callback, headers=headers)
+
     def init_multipart_upload(self, key, headers=None, params=None):
         """初始化分片上传。
 
@@ -1584,10 +1763,12 @@ class Bucket(_Base):
             tmp_params = params.copy()
 
         tmp_params['uploads'] = ''
-        logger.debug("Start to init multipart upload, bucket: {0}, keys: {1}, headers: {2}, params: {3}".format(
-            self.bucket_name, to_string(key), headers, tmp_params))
-        resp = self.__do_object('POST', key, params=tmp_params, headers=headers)
-        logger.debug("Init multipart upload done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to init multipart upload, bucket: {0}, keys: {1}, headers: {2}, params: {3}".format(
+                self.bucket_name, to_string(key), headers, tmp_params))
+        resp = self.__do_object('POST', key, params=tmp_params, headers=headers, operation='init_multipart_upload')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Init multipart upload done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_init_multipart_upload, InitMultipartUploadResult)
 
     def upload_part(self, key, upload_id, part_number, data, progress_callback=None, headers=None):
@@ -1612,14 +1793,16 @@ class Bucket(_Base):
         if self.enable_crc:
             data = utils.make_crc_adapter(data)
 
-        logger.debug(
-            "Start to upload multipart, bucket: {0}, key: {1}, upload_id: {2}, part_number: {3}, headers: {4}".format(
-                self.bucket_name, to_string(key), upload_id, part_number, headers))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Start to upload multipart, bucket: {0}, key: {1}, upload_id: {2}, part_number: {3}, headers: {4}".format(
+                    self.bucket_name, to_string(key), upload_id, part_number, headers))
         resp = self.__do_object('PUT', key,
                                 params={'uploadId': upload_id, 'partNumber': str(part_number)},
                                 headers=headers,
-                                data=data)
-        logger.debug("Upload multipart done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+                                data=data, operation='upload_part')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Upload multipart done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         result = PutObjectResult(resp)
 
         if self.enable_crc and result.crc is not None:
@@ -1648,15 +1831,17 @@ class Bucket(_Base):
             parts = sorted(parts, key=lambda p: p.part_number)
             data = xml_utils.to_complete_upload_request(parts)
 
-        logger.debug("Start to complete multipart upload, bucket: {0}, key: {1}, upload_id: {2}, parts: {3}".format(
-            self.bucket_name, to_string(key), upload_id, data))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to complete multipart upload, bucket: {0}, key: {1}, upload_id: {2}, parts: {3}".format(
+                self.bucket_name, to_string(key), upload_id, data))
 
         resp = self.__do_object('POST', key,
                                 params={'uploadId': upload_id},
                                 data=data,
-                                headers=headers)
-        logger.debug(
-            "Complete multipart upload done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+                                headers=headers, operation='complete_multipart_upload')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Complete multipart upload done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         result = PutObjectResult(resp)
 
@@ -1684,7 +1869,7 @@ class Bucket(_Base):
         headers = http.CaseInsensitiveDict(headers)
 
         resp = self.__do_object('DELETE', key,
-                                params={'uploadId': upload_id}, headers=headers)
+                                params={'uploadId': upload_id}, headers=headers, operation='abort_multipart_upload')
         logger.debug("Abort multipart done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -1723,7 +1908,7 @@ class Bucket(_Base):
                                         'upload-id-marker': upload_id_marker,
                                         'max-uploads': str(max_uploads),
                                         'encoding-type': 'url'},
-                                        headers=headers)
+                                        headers=headers, operation='list_multipart_uploads')
         logger.debug("List multipart uploads done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_multipart_uploads, ListMultipartUploadsResult)
 
@@ -1757,10 +1942,11 @@ class Bucket(_Base):
         if range_string:
             headers[OSS_COPY_OBJECT_SOURCE_RANGE] = range_string
 
-        logger.debug("Start to upload part copy, source bucket: {0}, source key: {1}, bucket: {2}, key: {3}, range"
-                     ": {4}, upload id: {5}, part_number: {6}, headers: {7}".format(source_bucket_name,
-                    to_string(source_key),self.bucket_name,to_string(target_key),
-                    byte_range, target_upload_id,target_part_number, headers))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to upload part copy, source bucket: {0}, source key: {1}, bucket: {2}, key: {3}, range"
+                         ": {4}, upload id: {5}, part_number: {6}, headers: {7}".format(source_bucket_name,
+                        to_string(source_key),self.bucket_name,to_string(target_key),
+                        byte_range, target_upload_id,target_part_number, headers))
 
         if params is None:
             params = dict()
@@ -1769,8 +1955,9 @@ class Bucket(_Base):
         params['partNumber'] = str(target_part_number)
 
         resp = self.__do_object('PUT', target_key,
-                                params=params,headers=headers)
-        logger.debug("Upload part copy done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+                                params=params,headers=headers, operation='upload_part_copy')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Upload part copy done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return PutObjectResult(resp)
 
@@ -1789,8 +1976,9 @@ class Bucket(_Base):
 
         :return: :class:`ListPartsResult <oss2.models.ListPartsResult>`
         """
-        logger.debug("Start to list parts, bucket: {0}, key: {1}, upload_id: {2}, marker: {3}, max_parts: {4}".format(
-            self.bucket_name, to_string(key), upload_id, marker, max_parts))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Start to list parts, bucket: {0}, key: {1}, upload_id: {2}, marker: {3}, max_parts: {4}".format(
+                self.bucket_name, to_string(key), upload_id, marker, max_parts))
 
         headers = http.CaseInsensitiveDict(headers)
 
@@ -1798,8 +1986,9 @@ class Bucket(_Base):
                                 params={'uploadId': upload_id,
                                         'part-number-marker': marker,
                                         'max-parts': str(max_parts)}, 
-                                        headers=headers)
-        logger.debug("List parts done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+                                        headers=headers, operation='list_parts')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("List parts done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_parts, ListPartsResult)
 
     def put_symlink(self, target_key, symlink_key, headers=None):
@@ -1818,7 +2007,7 @@ class Bucket(_Base):
 
         logger.debug("Start to put symlink, bucket: {0}, target_key: {1}, symlink_key: {2}, headers: {3}".format(
             self.bucket_name, to_string(target_key), to_string(symlink_key), headers))
-        resp = self.__do_object('PUT', symlink_key, headers=headers, params={Bucket.SYMLINK: ''})
+        resp = self.__do_object('PUT', symlink_key, headers=headers, params={Bucket.SYMLINK: ''}, operation='put_symlink')
         logger.debug("Put symlink done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -1846,7 +2035,7 @@ class Bucket(_Base):
         if Bucket.SYMLINK not in params:
             params[Bucket.SYMLINK] = ''
 
-        resp = self.__do_object('GET', symlink_key, params=params, headers=headers)
+        resp = self.__do_object('GET', symlink_key, params=params, headers=headers, operation='get_symlink')
         logger.debug("Get symlink done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return GetSymlinkResult(resp)
 
@@ -1865,7 +2054,7 @@ class Bucket(_Base):
         data = self.__convert_data(BucketCreateConfig, xml_utils.to_put_bucket_config, input)
         logger.debug("Start to create bucket, bucket: {0}, permission: {1}, config: {2}".format(self.bucket_name,
                                                                                                 permission, data))
-        resp = self.__do_bucket('PUT', headers=headers, data=data)
+        resp = self.__do_bucket('PUT', headers=headers, data=data, operation='create_bucket')
         logger.debug("Create bucket done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -1877,7 +2066,7 @@ class Bucket(_Base):
         ":raises: 如果试图删除一个非空Bucket，则抛出 :class:`BucketNotEmpty <oss2.exceptions.BucketNotEmpty>`
         """
         logger.info("Start to delete bucket, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE')
+        resp = self.__do_bucket('DELETE', operation='delete_bucket')
         logger.debug("Delete bucket done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -1888,7 +2077,7 @@ class Bucket(_Base):
             oss2.BUCKET_ACL_PUBLIC_READ_WRITE
         """
         logger.debug("Start to put bucket acl, bucket: {0}, acl: {1}".format(self.bucket_name, permission))
-        resp = self.__do_bucket('PUT', headers={OSS_CANNED_ACL: permission}, params={Bucket.ACL: ''})
+        resp = self.__do_bucket('PUT', headers={OSS_CANNED_ACL: permission}, params={Bucket.ACL: ''}, operation='put_bucket_acl')
         logger.debug("Put bucket acl done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -1898,7 +2087,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketAclResult <oss2.models.GetBucketAclResult>`
         """
         logger.debug("Start to get bucket acl, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.ACL: ''})
+        resp = self.__do_bucket('GET', params={Bucket.ACL: ''}, operation='get_bucket_acl')
         logger.debug("Get bucket acl done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_acl, GetBucketAclResult)
 
@@ -1909,7 +2098,7 @@ class Bucket(_Base):
         """
         data = self.__convert_data(BucketCors, xml_utils.to_put_bucket_cors, input)
         logger.debug("Start to put bucket cors, bucket: {0}, cors: {1}".format(self.bucket_name, data))
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.CORS: ''})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.CORS: ''}, operation='put_bucket_cors')
         logger.debug("Put bucket cors done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -1919,14 +2108,14 @@ class Bucket(_Base):
         :return: :class:`GetBucketCorsResult <oss2.models.GetBucketCorsResult>`
         """
         logger.debug("Start to get bucket CORS, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.CORS: ''})
+        resp = self.__do_bucket('GET', params={Bucket.CORS: ''}, operation='get_bucket_cors')
         logger.debug("Get bucket CORS done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_cors, GetBucketCorsResult)
 
     def delete_bucket_cors(self):
         """删除Bucket的CORS配置。"""
         logger.debug("Start to delete bucket CORS, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.CORS: ''})
+        resp = self.__do_bucket('DELETE', params={Bucket.CORS: ''}, operation='delete_bucket_cors')
         logger.debug("Delete bucket CORS done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -1938,7 +2127,7 @@ class Bucket(_Base):
         headers = http.CaseInsensitiveDict(headers)
         data = self.__convert_data(BucketLifecycle, xml_utils.to_put_bucket_lifecycle, input)
         logger.debug("Start to put bucket lifecycle, bucket: {0}, lifecycle: {1}".format(self.bucket_name, data))
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.LIFECYCLE: ''}, headers=headers)
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.LIFECYCLE: ''}, headers=headers, operation='put_bucket_lifecycle')
         logger.debug("Put bucket lifecycle done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -1950,14 +2139,14 @@ class Bucket(_Base):
         :raises: 如果没有设置Lifecycle，则抛出 :class:`NoSuchLifecycle <oss2.exceptions.NoSuchLifecycle>`
         """
         logger.debug("Start to get bucket lifecycle, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.LIFECYCLE: ''})
+        resp = self.__do_bucket('GET', params={Bucket.LIFECYCLE: ''}, operation='get_bucket_lifecycle')
         logger.debug("Get bucket lifecycle done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_lifecycle, GetBucketLifecycleResult)
 
     def delete_bucket_lifecycle(self):
         """删除生命周期管理配置。如果Lifecycle没有设置，也返回成功。"""
         logger.debug("Start to delete bucket lifecycle, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.LIFECYCLE: ''})
+        resp = self.__do_bucket('DELETE', params={Bucket.LIFECYCLE: ''}, operation='delete_bucket_lifecycle')
         logger.debug("Delete bucket lifecycle done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -1967,7 +2156,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketLocationResult <oss2.models.GetBucketLocationResult>`
         """
         logger.debug("Start to get bucket location, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.LOCATION: ''})
+        resp = self.__do_bucket('GET', params={Bucket.LOCATION: ''}, operation='get_bucket_location')
         logger.debug("Get bucket location done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_location, GetBucketLocationResult)
 
@@ -1978,7 +2167,7 @@ class Bucket(_Base):
         """
         data = self.__convert_data(BucketLogging, xml_utils.to_put_bucket_logging, input)
         logger.debug("Start to put bucket logging, bucket: {0}, logging: {1}".format(self.bucket_name, data))
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.LOGGING: ''})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.LOGGING: ''}, operation='put_bucket_logging')
         logger.debug("Put bucket logging done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -1988,14 +2177,14 @@ class Bucket(_Base):
         :return: :class:`GetBucketLoggingResult <oss2.models.GetBucketLoggingResult>`
         """
         logger.debug("Start to get bucket logging, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.LOGGING: ''})
+        resp = self.__do_bucket('GET', params={Bucket.LOGGING: ''}, operation='get_bucket_logging')
         logger.debug("Get bucket logging done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_logging, GetBucketLoggingResult)
 
     def delete_bucket_logging(self):
         """关闭Bucket的访问日志功能。"""
         logger.debug("Start to delete bucket loggging, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.LOGGING: ''})
+        resp = self.__do_bucket('DELETE', params={Bucket.LOGGING: ''}, operation='delete_bucket_logging')
         logger.debug("Put bucket lifecycle done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2006,7 +2195,7 @@ class Bucket(_Base):
         """
         data = self.__convert_data(BucketReferer, xml_utils.to_put_bucket_referer, input)
         logger.debug("Start to put bucket referer, bucket: {0}, referer: {1}".format(self.bucket_name, to_string(data)))
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.REFERER: ''})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.REFERER: ''}, operation='put_bucket_referer')
         logger.debug("Put bucket referer done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2016,7 +2205,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketRefererResult <oss2.models.GetBucketRefererResult>`
         """
         logger.debug("Start to get bucket referer, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.REFERER: ''})
+        resp = self.__do_bucket('GET', params={Bucket.REFERER: ''}, operation='get_bucket_referer')
         logger.debug("Get bucket referer done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_referer, GetBucketRefererResult)
 
@@ -2026,7 +2215,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketStatResult <oss2.models.GetBucketStatResult>`
         """
         logger.debug("Start to get bucket stat, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.STAT: ''})
+        resp = self.__do_bucket('GET', params={Bucket.STAT: ''}, operation='get_bucket_stat')
         logger.debug("Get bucket stat done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_stat, GetBucketStatResult)
 
@@ -2036,7 +2225,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketInfoResult <oss2.models.GetBucketInfoResult>`
         """
         logger.debug("Start to get bucket info, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.BUCKET_INFO: ''})
+        resp = self.__do_bucket('GET', params={Bucket.BUCKET_INFO: ''}, operation='get_bucket_info')
         logger.debug("Get bucket info done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_info, GetBucketInfoResult)
 
@@ -2051,7 +2240,7 @@ class Bucket(_Base):
         headers['Content-MD5'] = utils.content_md5(data)
 
         logger.debug("Start to put bucket website, bucket: {0}, website: {1}".format(self.bucket_name, to_string(data)))
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.WEBSITE: ''}, headers=headers)
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.WEBSITE: ''}, headers=headers, operation='put_bucket_website')
         logger.debug("Put bucket website done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2064,7 +2253,7 @@ class Bucket(_Base):
         """
 
         logger.debug("Start to get bucket website, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.WEBSITE: ''})
+        resp = self.__do_bucket('GET', params={Bucket.WEBSITE: ''}, operation='get_bucket_website')
         logger.debug("Get bucket website done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_website, GetBucketWebsiteResult)
@@ -2072,7 +2261,7 @@ class Bucket(_Base):
     def delete_bucket_website(self):
         """关闭Bucket的静态网站托管功能。"""
         logger.debug("Start to delete bucket website, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.WEBSITE: ''})
+        resp = self.__do_bucket('DELETE', params={Bucket.WEBSITE: ''}, operation='delete_bucket_website')
         logger.debug("Delete bucket website done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2087,7 +2276,7 @@ class Bucket(_Base):
         data = self.__convert_data(LiveChannelInfo, xml_utils.to_create_live_channel, input)
         logger.debug("Start to create live-channel, bucket: {0}, channel_name: {1}, info: {2}".format(
             self.bucket_name, to_string(channel_name), to_string(data)))
-        resp = self.__do_object('PUT', channel_name, data=data, params={Bucket.LIVE: ''})
+        resp = self.__do_object('PUT', channel_name, data=data, params={Bucket.LIVE: ''}, operation='create_live_channel')
         logger.debug("Create live-channel done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_create_live_channel, CreateLiveChannelResult)
 
@@ -2098,7 +2287,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to delete live-channel, bucket: {0}, live_channel: {1}".format(
             self.bucket_name, to_string(channel_name)))
-        resp = self.__do_object('DELETE', channel_name, params={Bucket.LIVE: ''})
+        resp = self.__do_object('DELETE', channel_name, params={Bucket.LIVE: ''}, operation='delete_live_channel')
         logger.debug("Delete live-channel done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2111,7 +2300,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to get live-channel info: bucket: {0}, live_channel: {1}".format(
             self.bucket_name, to_string(channel_name)))
-        resp = self.__do_object('GET', channel_name, params={Bucket.LIVE: ''})
+        resp = self.__do_object('GET', channel_name, params={Bucket.LIVE: ''}, operation='get_live_channel')
         logger.debug("Get live-channel done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_live_channel, GetLiveChannelResult)
 
@@ -2129,7 +2318,7 @@ class Bucket(_Base):
         resp = self.__do_bucket('GET', params={Bucket.LIVE: '',
                                                'prefix': prefix,
                                                'marker': marker,
-                                               'max-keys': str(max_keys)})
+                                               'max-keys': str(max_keys)}, operation='list_live_channel')
         logger.debug("List live-channel done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_live_channel, ListLiveChannelResult)
 
@@ -2142,7 +2331,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to get live-channel stat, bucket: {0}, channel_name: {1}".format(
             self.bucket_name, to_string(channel_name)))
-        resp = self.__do_object('GET', channel_name, params={Bucket.LIVE: '', Bucket.COMP: 'stat'})
+        resp = self.__do_object('GET', channel_name, params={Bucket.LIVE: '', Bucket.COMP: 'stat'}, operation='get_live_channel_stat')
         logger.debug("Get live-channel stat done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_live_channel_stat, GetLiveChannelStatResult)
@@ -2155,7 +2344,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to put live-channel status, bucket: {0}, channel_name: {1}, status: {2}".format(
             self.bucket_name, to_string(channel_name), status))
-        resp = self.__do_object('PUT', channel_name, params={Bucket.LIVE: '', Bucket.STATUS: status})
+        resp = self.__do_object('PUT', channel_name, params={Bucket.LIVE: '', Bucket.STATUS: status}, operation='put_live_channel_status')
         logger.debug("Put live-channel status done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2168,7 +2357,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to get live-channel history, bucket: {0}, channel_name: {1}".format(
             self.bucket_name, to_string(channel_name)))
-        resp = self.__do_object('GET', channel_name, params={Bucket.LIVE: '', Bucket.COMP: 'history'})
+        resp = self.__do_object('GET', channel_name, params={Bucket.LIVE: '', Bucket.COMP: 'history'}, operation='get_live_channel_history')
         logger.debug(
             "Get live-channel history done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_live_channel_history, GetLiveChannelHistoryResult)
@@ -2186,7 +2375,7 @@ class Bucket(_Base):
                                                  end_time))
         key = channel_name + "/" + playlist_name
         resp = self.__do_object('POST', key, params={Bucket.VOD: '', 'startTime': str(start_time),
-                                                     'endTime': str(end_time)})
+                                                     'endTime': str(end_time)}, operation='post_vod_playlist')
         logger.debug("Post vod playlist done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2200,7 +2389,7 @@ class Bucket(_Base):
         logger.debug("Start to get vod playlist, bucket: {0}, channel_name: {1},  start_time: "
                      "{2}, end_time: {3}".format(self.bucket_name, to_string(channel_name),  start_time, end_time))
         resp = self.__do_object('GET', channel_name, params={Bucket.VOD: '', 'startTime': str(start_time),
-                                                     'endTime': str(end_time)})
+                                                     'endTime': str(end_time)}, operation='get_vod_playlist')
         logger.debug("get vod playlist done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         result = GetVodPlaylistResult(resp)
         return result
@@ -2220,7 +2409,7 @@ class Bucket(_Base):
         logger.debug("Start to process object, bucket: {0}, key: {1}, process: {2}".format(
             self.bucket_name, to_string(key), process))
         process_data = "%s=%s" % (Bucket.PROCESS, process)
-        resp = self.__do_object('POST', key, params={Bucket.PROCESS: ''}, headers=headers, data=process_data)
+        resp = self.__do_object('POST', key, params={Bucket.PROCESS: ''}, headers=headers, data=process_data, operation='process_object')
         logger.debug("Process object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return ProcessObjectResult(resp)
 
@@ -2251,7 +2440,7 @@ class Bucket(_Base):
         params[Bucket.TAGGING] = ""
 
         data = self.__convert_data(Tagging, xml_utils.to_put_tagging, tagging) 
-        resp = self.__do_object('PUT', key, data=data, params=params, headers=headers)
+        resp = self.__do_object('PUT', key, data=data, params=params, headers=headers, operation='put_object_tagging')
 
         return RequestResult(resp)
 
@@ -2276,7 +2465,7 @@ class Bucket(_Base):
 
         params[Bucket.TAGGING] = ""
 
-        resp = self.__do_object('GET', key, params=params, headers=headers)
+        resp = self.__do_object('GET', key, params=params, headers=headers, operation='get_object_tagging')
 
         return self._parse_result(resp, xml_utils.parse_get_tagging, GetTaggingResult)
 
@@ -2300,7 +2489,7 @@ class Bucket(_Base):
 
         params[Bucket.TAGGING] = ""
 
-        resp = self.__do_object('DELETE', key, params=params, headers=headers)
+        resp = self.__do_object('DELETE', key, params=params, headers=headers, operation='delete_object_tagging')
 
         logger.debug("Delete object tagging done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
@@ -2313,7 +2502,7 @@ class Bucket(_Base):
         data = self.__convert_data(ServerSideEncryptionRule, xml_utils.to_put_bucket_encryption, rule)
 
         logger.debug("Start to put bucket encryption, bucket: {0}, rule: {1}".format(self.bucket_name, data))
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.ENCRYPTION: ""})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.ENCRYPTION: ""}, operation='put_bucket_encryption')
         logger.debug("Put bucket encryption done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2325,14 +2514,14 @@ class Bucket(_Base):
         :raises: 如果没有设置Bucket encryption，则抛出 :class:`NoSuchServerSideEncryptionRule <oss2.exceptions.NoSuchServerSideEncryptionRule>`
         """
         logger.debug("Start to get bucket encryption, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.ENCRYPTION: ''})
+        resp = self.__do_bucket('GET', params={Bucket.ENCRYPTION: ''}, operation='get_bucket_encryption')
         logger.debug("Get bucket encryption done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_encryption, GetServerSideEncryptionResult)
 
     def delete_bucket_encryption(self):
         """删除Bucket加密配置。如果Bucket加密没有设置，也返回成功。"""
         logger.debug("Start to delete bucket encryption, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.ENCRYPTION: ''})
+        resp = self.__do_bucket('DELETE', params={Bucket.ENCRYPTION: ''}, operation='delete_bucket_encryption')
         logger.debug("Delete bucket encryption done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2352,7 +2541,7 @@ class Bucket(_Base):
         headers = http.CaseInsensitiveDict(headers)
 
         data = self.__convert_data(Tagging, xml_utils.to_put_tagging, tagging) 
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.TAGGING: ''}, headers=headers)
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.TAGGING: ''}, headers=headers, operation='put_bucket_tagging')
 
         logger.debug("Put bucket tagging done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
@@ -2367,7 +2556,7 @@ class Bucket(_Base):
         logger.debug("Start to get bucket tagging, bucket: {0}".format(
                     self.bucket_name))
         
-        resp = self.__do_bucket('GET', params={Bucket.TAGGING: ''})
+        resp = self.__do_bucket('GET', params={Bucket.TAGGING: ''}, operation='get_bucket_tagging')
 
         logger.debug("Get bucket tagging done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_tagging, GetTaggingResult)
@@ -2386,7 +2575,7 @@ class Bucket(_Base):
             params[Bucket.TAGGING] = ''
 
 
-        resp = self.__do_bucket('DELETE', params=params)
+        resp = self.__do_bucket('DELETE', params=params, operation='delete_bucket_tagging')
 
         logger.debug("Delete bucket tagging done, req_id: {0}, status_code: {1}".format(
                     resp.request_id, resp.status))
@@ -2424,11 +2613,11 @@ class Bucket(_Base):
                                         'max-keys': str(max_keys),
                                         'encoding-type': 'url',
                                         Bucket.VERSIONS: ''},
-                                        headers=headers)
+                                        headers=headers, operation='list_object_versions')
         logger.debug("List object versions done, req_id: {0}, status_code: {1}"
                 .format(resp.request_id, resp.status))
 
-        return self._parse_result(resp, xml_utils.parse_list_object_versions, ListObjectVersionsResult)
+        return self._parse_stream_result(resp, xml_utils.parse_list_object_versions, ListObjectVersionsResult)
 
     def put_bucket_versioning(self, config, headers=None):
         """
@@ -2443,7 +2632,7 @@ class Bucket(_Base):
         headers = http.CaseInsensitiveDict(headers)
         headers['Content-MD5'] = utils.content_md5(data)
 
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.VERSIONING: ''}, headers=headers)
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.VERSIONING: ''}, headers=headers, operation='put_bucket_versioning')
         logger.debug("Put bucket versiong done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2453,7 +2642,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketVersioningResult<oss2.models.GetBucketVersioningResult>` 
         """
         logger.debug("Start to get bucket versioning, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.VERSIONING: ''})
+        resp = self.__do_bucket('GET', params={Bucket.VERSIONING: ''}, operation='get_bucket_versioning')
         logger.debug("Get bucket versiong done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_versioning, GetBucketVersioningResult)
@@ -2464,7 +2653,7 @@ class Bucket(_Base):
         :param str policy: 授权策略
         """
         logger.debug("Start to put bucket policy, bucket: {0}, policy: {1}".format(self.bucket_name, policy))
-        resp = self.__do_bucket('PUT', data=policy, params={Bucket.POLICY: ''}, headers={'Content-MD5': utils.content_md5(policy)})
+        resp = self.__do_bucket('PUT', data=policy, params={Bucket.POLICY: ''}, headers={'Content-MD5': utils.content_md5(policy)}, operation='put_bucket_policy')
         logger.debug("Put bucket policy done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2476,7 +2665,7 @@ class Bucket(_Base):
         """
 
         logger.debug("Start to get bucket policy, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.POLICY:''})
+        resp = self.__do_bucket('GET', params={Bucket.POLICY:''}, operation='get_bucket_policy')
         logger.debug("Get bucket policy done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return GetBucketPolicyResult(resp)
 
@@ -2485,7 +2674,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to delete bucket policy, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.POLICY: ''})
+        resp = self.__do_bucket('DELETE', params={Bucket.POLICY: ''}, operation='delete_bucket_policy')
         logger.debug("Delete bucket policy done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2496,7 +2685,7 @@ class Bucket(_Base):
         """
         data = xml_utils.to_put_bucket_request_payment(payer)
         logger.debug("Start to put bucket request payment, bucket: {0}, payer: {1}".format(self.bucket_name, payer))
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.REQUESTPAYMENT: ''}, headers={'Content-MD5': utils.content_md5(data)})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.REQUESTPAYMENT: ''}, headers={'Content-MD5': utils.content_md5(data)}, operation='put_bucket_request_payment')
         logger.debug("Put bucket request payment done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         
         return RequestResult(resp)
@@ -2507,7 +2696,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketRequestPaymentResult <oss2.models.GetBucketRequestPaymentResult>`
         """
         logger.debug("Start to get bucket request payment, bucket: {0}.".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.REQUESTPAYMENT: ''})
+        resp = self.__do_bucket('GET', params={Bucket.REQUESTPAYMENT: ''}, operation='get_bucket_request_payment')
         logger.debug("Get bucket request payment done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_request_payment, GetBucketRequestPaymentResult)
@@ -2523,7 +2712,7 @@ class Bucket(_Base):
 
         headers = http.CaseInsensitiveDict()
         headers['Content-MD5'] = utils.content_md5(data)
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.QOS_INFO: ''}, headers=headers)
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.QOS_INFO: ''}, headers=headers, operation='put_bucket_qos_info')
         logger.debug("Get bucket qos info done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2534,7 +2723,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketQosInfoResult <oss2.models.GetBucketQosInfoResult>`
         """
         logger.debug("Start to get bucket qos info, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.QOS_INFO: ''})
+        resp = self.__do_bucket('GET', params={Bucket.QOS_INFO: ''}, operation='get_bucket_qos_info')
         logger.debug("Get bucket qos info, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_qos_info, GetBucketQosInfoResult)
@@ -2545,7 +2734,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to delete bucket qos info, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.QOS_INFO: ''})
+        resp = self.__do_bucket('DELETE', params={Bucket.QOS_INFO: ''}, operation='delete_bucket_qos_info')
         logger.debug("Delete bucket qos info done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2557,7 +2746,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to set bucket storage capacity: {0}".format(self.bucket_name))
         data = xml_utils.to_put_bucket_user_qos(user_qos)
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.USER_QOS: ''})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.USER_QOS: ''}, operation='set_bucket_storage_capacity')
         logger.debug("Set bucket storage capacity done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2568,7 +2757,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketUserQosResult <oss2.models.GetBucketUserQosResult>`
         """
         logger.debug("Start to get bucket storage capacity, bucket:{0}".format(self.bucket_name))
-        resp = self._Bucket__do_bucket('GET', params={Bucket.USER_QOS: ''})
+        resp = self._Bucket__do_bucket('GET', params={Bucket.USER_QOS: ''}, operation='get_bucket_storage_capacity')
         logger.debug("Get bucket storage capacity done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_user_qos, GetBucketUserQosResult)
@@ -2585,7 +2774,7 @@ class Bucket(_Base):
         data = xml_utils.to_put_async_fetch_task(task_config)
         headers = http.CaseInsensitiveDict()
         headers['Content-MD5'] = utils.content_md5(data)
-        resp = self._Bucket__do_bucket('POST', data=data, params={Bucket.ASYNC_FETCH: ''}, headers=headers)
+        resp = self._Bucket__do_bucket('POST', data=data, params={Bucket.ASYNC_FETCH: ''}, headers=headers, operation='put_async_fetch_task')
         logger.debug("Put async fetch task done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_put_async_fetch_task_result, PutAsyncFetchTaskResult)
@@ -2597,7 +2786,7 @@ class Bucket(_Base):
         :return: :class:`GetAsyncFetchTaskResult <oss2.models.GetAsyncFetchTaskResult>`
         """
         logger.debug("Start to get async fetch task, bucket:{0}, task_id:{1}".format(self.bucket_name, task_id))
-        resp = self._Bucket__do_bucket('GET', headers={OSS_TASK_ID: task_id}, params={Bucket.ASYNC_FETCH: ''})
+        resp = self._Bucket__do_bucket('GET', headers={OSS_TASK_ID: task_id}, params={Bucket.ASYNC_FETCH: ''}, operation='get_async_fetch_task')
         logger.debug("Put async fetch task done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_async_fetch_task_result, GetAsyncFetchTaskResult)
@@ -2613,7 +2802,7 @@ class Bucket(_Base):
 
         headers = http.CaseInsensitiveDict()
         headers['Content-MD5'] = utils.content_md5(data)
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.INVENTORY: '', Bucket.INVENTORY_CONFIG_ID:inventory_configuration.inventory_id}, headers=headers)
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.INVENTORY: '', Bucket.INVENTORY_CONFIG_ID:inventory_configuration.inventory_id}, headers=headers, operation='put_bucket_inventory_configuration')
         logger.debug("Put bucket inventory configuration done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2625,7 +2814,7 @@ class Bucket(_Base):
         :return: :class:`GetInventoryConfigurationResult <oss2.models.GetInventoryConfigurationResult>`
         """
         logger.debug("Start to get bucket inventory configuration, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.INVENTORY: '', Bucket.INVENTORY_CONFIG_ID:inventory_id})
+        resp = self.__do_bucket('GET', params={Bucket.INVENTORY: '', Bucket.INVENTORY_CONFIG_ID:inventory_id}, operation='get_bucket_inventory_configuration')
         logger.debug("Get bucket inventory cinfguration done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_inventory_configuration, GetInventoryConfigurationResult)
@@ -2641,7 +2830,7 @@ class Bucket(_Base):
         params = {Bucket.INVENTORY:''}
         if continuation_token is not None:
             params[Bucket.CONTINUATION_TOKEN] = continuation_token
-        resp = self.__do_bucket('GET', params=params)
+        resp = self.__do_bucket('GET', params=params, operation='list_bucket_inventory_configurations')
         logger.debug("List bucket inventory configuration done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_list_bucket_inventory_configurations, ListInventoryConfigurationsResult)
@@ -2653,7 +2842,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to delete bucket inventory configuration, bucket: {0}, configuration id: {1}.".format(self.bucket_name, inventory_id))
-        resp = self.__do_bucket('DELETE', params={Bucket.INVENTORY:'', Bucket.INVENTORY_CONFIG_ID:inventory_id})
+        resp = self.__do_bucket('DELETE', params={Bucket.INVENTORY:'', Bucket.INVENTORY_CONFIG_ID:inventory_id}, operation='delete_bucket_inventory_configuration')
         logger.debug("Delete bucket inventory configuration, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2670,7 +2859,7 @@ class Bucket(_Base):
         data = xml_utils.to_put_init_bucket_worm(retention_period_days)
         headers = http.CaseInsensitiveDict()
         headers['Content-MD5'] = utils.content_md5(data)
-        resp = self.__do_bucket('POST', data=data, params={Bucket.WORM: ''}, headers=headers)
+        resp = self.__do_bucket('POST', data=data, params={Bucket.WORM: ''}, headers=headers, operation='init_bucket_worm')
         logger.debug("init bucket worm done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         result = InitBucketWormResult(resp)
@@ -2684,7 +2873,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to abort bucket worm, bucket: {0}.".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.WORM: ''})
+        resp = self.__do_bucket('DELETE', params={Bucket.WORM: ''}, operation='abort_bucket_worm')
         logger.debug("abort bucket worm done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2696,7 +2885,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to complete bucket worm, bucket: {0}, worm_id: {1}.".format(self.bucket_name, worm_id))
-        resp = self.__do_bucket('POST', params={Bucket.WORM_ID: worm_id})
+        resp = self.__do_bucket('POST', params={Bucket.WORM_ID: worm_id}, operation='complete_bucket_worm')
         logger.debug("complete bucket worm done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2713,7 +2902,7 @@ class Bucket(_Base):
         headers['Content-MD5'] = utils.content_md5(data)
         logger.debug("Start to extend bucket worm, bucket: {0}, worm_id: {1}, retention_period_days."
                      .format(self.bucket_name, worm_id, retention_period_days))
-        resp = self.__do_bucket('POST', data=data, params={Bucket.WORM_ID: worm_id, Bucket.WORM_EXTEND: ''}, headers=headers)
+        resp = self.__do_bucket('POST', data=data, params={Bucket.WORM_ID: worm_id, Bucket.WORM_EXTEND: ''}, headers=headers, operation='extend_bucket_worm')
         logger.debug("extend bucket worm done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2724,7 +2913,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketWormResult <oss2.models.GetBucketWormResult>`
         """
         logger.debug("Start to get bucket worm, bucket: {0}.".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.WORM: ''})
+        resp = self.__do_bucket('GET', params={Bucket.WORM: ''}, operation='get_bucket_worm')
         logger.debug("get bucket worm done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_worm_result, GetBucketWormResult)
@@ -2739,7 +2928,7 @@ class Bucket(_Base):
         data = xml_utils.to_put_bucket_replication(rule)
         headers = http.CaseInsensitiveDict()
         headers['Content-MD5'] = utils.content_md5(data)
-        resp = self.__do_bucket('POST', data=data, params={Bucket.REPLICATION: '', 'comp': 'add'}, headers=headers)
+        resp = self.__do_bucket('POST', data=data, params={Bucket.REPLICATION: '', 'comp': 'add'}, headers=headers, operation='put_bucket_replication')
         logger.debug("Put bucket replication done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2750,7 +2939,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketReplicationResult <oss2.models.GetBucketReplicationResult>`
         """
         logger.debug("Start to get bucket replication: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.REPLICATION: ''})
+        resp = self.__do_bucket('GET', params={Bucket.REPLICATION: ''}, operation='get_bucket_replication')
         logger.debug("Get bucket replication done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_replication_result, GetBucketReplicationResult)
@@ -2765,7 +2954,7 @@ class Bucket(_Base):
         data = xml_utils.to_delete_bucket_replication(rule_id)
         headers = http.CaseInsensitiveDict()
         headers['Content-MD5'] = utils.content_md5(data)
-        resp = self.__do_bucket('POST', data=data, params={Bucket.REPLICATION: '', 'comp': 'delete'}, headers=headers)
+        resp = self.__do_bucket('POST', data=data, params={Bucket.REPLICATION: '', 'comp': 'delete'}, headers=headers, operation='delete_bucket_replication')
         logger.debug("Delete bucket replication done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2776,7 +2965,7 @@ class Bucket(_Base):
         :return: :class:`ReplicationLocation <oss2.models.GetBucketReplicationLocationResult>`
         """
         logger.debug("Start to get bucket replication location: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET',  params={Bucket.REPLICATION_LOCATION: ''})
+        resp = self.__do_bucket('GET',  params={Bucket.REPLICATION_LOCATION: ''}, operation='get_bucket_replication_location')
         logger.debug("Get bucket replication location done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_replication_location_result, GetBucketReplicationLocationResult)
@@ -2788,7 +2977,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketReplicationProgressResult <oss2.models.GetBucketReplicationProgressResult>`
         """
         logger.debug("Start to get bucket replication progress: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET',  params={Bucket.REPLICATION_PROGRESS: '', 'rule-id': rule_id})
+        resp = self.__do_bucket('GET',  params={Bucket.REPLICATION_PROGRESS: '', 'rule-id': rule_id}, operation='get_bucket_replication_progress')
         logger.debug("Get bucket replication progress done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_replication_progress_result, GetBucketReplicationProgressResult)
@@ -2802,7 +2991,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to get bucket config, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={config: ''})
+        resp = self.__do_bucket('GET', params={config: ''}, operation='get_bucket_config')
         logger.debug("Get bucket config done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return resp
 
@@ -2817,7 +3006,7 @@ class Bucket(_Base):
         data = xml_utils.to_put_bucket_transfer_acceleration(enabled)
         headers = http.CaseInsensitiveDict()
         headers['Content-MD5'] = utils.content_md5(data)
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.TRANSFER_ACCELERATION: ''}, headers=headers)
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.TRANSFER_ACCELERATION: ''}, headers=headers, operation='put_bucket_transfer_acceleration')
         logger.debug("bucket transfer acceleration done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -2828,7 +3017,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketTransferAccelerationResult <oss2.models.GetBucketTransferAccelerationResult>`
         """
         logger.debug("Start to get bucket transfer acceleration: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.TRANSFER_ACCELERATION: ''})
+        resp = self.__do_bucket('GET', params={Bucket.TRANSFER_ACCELERATION: ''}, operation='get_bucket_transfer_acceleration')
         logger.debug("Get bucket transfer acceleration done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_transfer_acceleration_result, GetBucketTransferAccelerationResult)
@@ -2841,7 +3030,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to create bucket cname token, bucket: {0}.".format(self.bucket_name))
         data = xml_utils.to_bucket_cname_configuration(domain)
-        resp = self.__do_bucket('POST', data=data, params={Bucket.CNAME: '', Bucket.COMP: 'token'})
+        resp = self.__do_bucket('POST', data=data, params={Bucket.CNAME: '', Bucket.COMP: 'token'}, operation='create_bucket_cname_token')
         logger.debug("bucket cname token done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_create_bucket_cname_token, CreateBucketCnameTokenResult)
 
@@ -2852,7 +3041,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketCnameTokenResult <oss2.models.GetBucketCnameTokenResult>`
         """
         logger.debug("Start to get bucket cname: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.CNAME: domain, Bucket.COMP: 'token'})
+        resp = self.__do_bucket('GET', params={Bucket.CNAME: domain, Bucket.COMP: 'token'}, operation='get_bucket_cname_token')
         logger.debug("Get bucket cname done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_cname_token, GetBucketCnameTokenResult)
 
@@ -2864,7 +3053,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to add bucket cname, bucket: {0}.".format(self.bucket_name))
         data = xml_utils.to_bucket_cname_configuration(input.domain, input.cert)
-        resp = self.__do_bucket('POST', data=data, params={Bucket.CNAME: '', Bucket.COMP: 'add'})
+        resp = self.__do_bucket('POST', data=data, params={Bucket.CNAME: '', Bucket.COMP: 'add'}, operation='put_bucket_cname')
         logger.debug("bucket cname done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2875,7 +3064,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to do query list bucket cname: {0}".format(self.bucket_name))
 
-        resp = self.__do_bucket('GET', params={Bucket.CNAME: ''})
+        resp = self.__do_bucket('GET', params={Bucket.CNAME: ''}, operation='list_bucket_cname')
         logger.debug("query list bucket cname done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_bucket_cname, ListBucketCnameResult)
 
@@ -2887,7 +3076,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to delete bucket cname: {0}".format(self.bucket_name))
         data = xml_utils.to_bucket_cname_configuration(domain)
-        resp = self.__do_bucket('POST', data=data, params={Bucket.CNAME: '', Bucket.COMP: 'delete'})
+        resp = self.__do_bucket('POST', data=data, params={Bucket.CNAME: '', Bucket.COMP: 'delete'}, operation='delete_bucket_cname')
         logger.debug("delete bucket cname done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2897,7 +3086,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to bucket meta query, bucket: {0}.".format(self.bucket_name))
-        resp = self.__do_bucket('POST', params={Bucket.META_QUERY: '', 'comp': 'add'})
+        resp = self.__do_bucket('POST', params={Bucket.META_QUERY: '', 'comp': 'add'}, operation='open_bucket_meta_query')
         logger.debug("bucket meta query done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2907,7 +3096,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketMetaQueryResult <oss2.models.GetBucketMetaQueryResult>`
         """
         logger.debug("Start to get bucket meta query: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.META_QUERY: ''})
+        resp = self.__do_bucket('GET', params={Bucket.META_QUERY: ''}, operation='get_bucket_meta_query_status')
         logger.debug("Get bucket meta query done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_meta_query_result, GetBucketMetaQueryResult)
 
@@ -2920,7 +3109,7 @@ class Bucket(_Base):
         logger.debug("Start to do bucket meta query: {0}".format(self.bucket_name))
 
         data = self.__convert_data(MetaQuery, xml_utils.to_do_bucket_meta_query_request, do_meta_query_request)
-        resp = self.__do_bucket('POST', data=data, params={Bucket.META_QUERY: '', Bucket.COMP: 'query'})
+        resp = self.__do_bucket('POST', data=data, params={Bucket.META_QUERY: '', Bucket.COMP: 'query'}, operation='do_bucket_meta_query')
         logger.debug("do bucket meta query done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_do_bucket_meta_query_result, DoBucketMetaQueryResult)
 
@@ -2930,7 +3119,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to close bucket meta query: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('POST', params={Bucket.META_QUERY: '', Bucket.COMP: 'delete'})
+        resp = self.__do_bucket('POST', params={Bucket.META_QUERY: '', Bucket.COMP: 'delete'}, operation='close_bucket_meta_query')
         logger.debug("bucket meta query done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2942,7 +3131,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to put bucket access monitor, bucket: {0}.".format(self.bucket_name))
         data = xml_utils.to_put_bucket_access_monitor(status)
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.ACCESS_MONITOR: ''})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.ACCESS_MONITOR: ''}, operation='put_bucket_access_monitor')
         logger.debug("bucket access monitor done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2953,7 +3142,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to get bucket access monitor: {0}".format(self.bucket_name))
 
-        resp = self.__do_bucket('GET', params={Bucket.ACCESS_MONITOR: ''})
+        resp = self.__do_bucket('GET', params={Bucket.ACCESS_MONITOR: ''}, operation='get_bucket_access_monitor')
         logger.debug("query list bucket cname done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_access_monitor_result, GetBucketAccessMonitorResult)
 
@@ -2963,7 +3152,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketResourceGroupResult <oss2.models.GetBucketResourceGroupResult>`
         """
         logger.debug("Start to get bucket resource group: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.RESOURCE_GROUP: ''})
+        resp = self.__do_bucket('GET', params={Bucket.RESOURCE_GROUP: ''}, operation='get_bucket_resource_group')
         logger.debug("Get bucket resource group done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_resource_group_result, GetBucketResourceGroupResult)
@@ -2976,7 +3165,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to put bucket resource group, bucket: {0}.".format(self.bucket_name))
         data = xml_utils.to_put_bucket_resource_group(resourceGroupId)
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.RESOURCE_GROUP: ''})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.RESOURCE_GROUP: ''}, operation='put_bucket_resource_group')
         logger.debug("bucket resource group done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -2990,7 +3179,7 @@ class Bucket(_Base):
         logger.debug("Start to put bucket style, bucket: {0}.".format(self.bucket_name))
 
         data = xml_utils.to_put_bucket_style(content)
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.STYLE: '', Bucket.STYLE_NAME: styleName})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.STYLE: '', Bucket.STYLE_NAME: styleName}, operation='put_bucket_style')
         logger.debug("bucket style done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -3002,7 +3191,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to get bucket style: {0}".format(self.bucket_name))
 
-        resp = self.__do_bucket('GET', params={Bucket.STYLE: '', Bucket.STYLE_NAME: styleName})
+        resp = self.__do_bucket('GET', params={Bucket.STYLE: '', Bucket.STYLE_NAME: styleName}, operation='get_bucket_style')
         logger.debug("Get bucket style done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_bucket_style_result, GetBucketStyleResult)
@@ -3014,7 +3203,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to list bucket style: {0}".format(self.bucket_name))
 
-        resp = self.__do_bucket('GET', params={Bucket.STYLE: ''})
+        resp = self.__do_bucket('GET', params={Bucket.STYLE: ''}, operation='list_bucket_style')
         logger.debug("query list bucket style done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_bucket_style, ListBucketStyleResult)
 
@@ -3026,7 +3215,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to delete bucket style: {0}".format(self.bucket_name))
 
-        resp = self.__do_bucket('DELETE', params={Bucket.STYLE: '', Bucket.STYLE_NAME: styleName})
+        resp = self.__do_bucket('DELETE', params={Bucket.STYLE: '', Bucket.STYLE_NAME: styleName}, operation='delete_bucket_style')
         logger.debug("delete bucket style done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -3045,7 +3234,7 @@ class Bucket(_Base):
         logger.debug("Start to async process object, bucket: {0}, key: {1}, process: {2}".format(
             self.bucket_name, to_string(key), process))
         process_data = "%s=%s" % (Bucket.ASYNC_PROCESS, process)
-        resp = self.__do_object('POST', key, params={Bucket.ASYNC_PROCESS: ''}, headers=headers, data=process_data)
+        resp = self.__do_object('POST', key, params={Bucket.ASYNC_PROCESS: ''}, headers=headers, data=process_data, operation='async_process_object')
         logger.debug("Async process object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_async_process_object, AsyncProcessObject)
 
@@ -3056,7 +3245,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to put bucket callback policy, bucket: {0}, callback policy: {1}".format(self.bucket_name, callbackPolicy))
         data = xml_utils.to_do_bucket_callback_policy_request(callbackPolicy)
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.POLICY: '', Bucket.COMP: Bucket.CALLBACK})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.POLICY: '', Bucket.COMP: Bucket.CALLBACK}, operation='put_bucket_callback_policy')
         logger.debug("Put bucket callback policy done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -3067,7 +3256,7 @@ class Bucket(_Base):
         """
 
         logger.debug("Start to get bucket callback policy, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.POLICY: '', Bucket.COMP: Bucket.CALLBACK})
+        resp = self.__do_bucket('GET', params={Bucket.POLICY: '', Bucket.COMP: Bucket.CALLBACK}, operation='get_bucket_callback_policy')
         logger.debug("Get bucket callback policy done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_callback_policy_result, CallbackPolicyResult)
 
@@ -3076,7 +3265,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to delete bucket callback policy, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.POLICY: '', Bucket.COMP: Bucket.CALLBACK})
+        resp = self.__do_bucket('DELETE', params={Bucket.POLICY: '', Bucket.COMP: Bucket.CALLBACK}, operation='delete_bucket_callback_policy')
         logger.debug("Delete bucket callback policy done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -3087,7 +3276,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to put bucket archive direct read, bucket: {0}, enabled: {1}".format(self.bucket_name, enabled))
         data = xml_utils.to_put_bucket_archive_direct_read(enabled)
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.ARCHIVE_DIRECT_READ: ''})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.ARCHIVE_DIRECT_READ: ''}, operation='put_bucket_archive_direct_read')
         logger.debug("bucket archive direct read done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -3097,7 +3286,7 @@ class Bucket(_Base):
         """
 
         logger.debug("Start to get bucket archive direct read, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.ARCHIVE_DIRECT_READ: ''})
+        resp = self.__do_bucket('GET', params={Bucket.ARCHIVE_DIRECT_READ: ''}, operation='get_bucket_archive_direct_read')
         logger.debug("Get bucket archive direct read done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_archive_direct_read, GetBucketArchiveDirectReadResult)
 
@@ -3107,7 +3296,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to put bucket https config, bucket: {0}, https config: {1}".format(self.bucket_name, httpsConfig))
         data = xml_utils.to_do_bucket_https_config_request(httpsConfig)
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.HTTPS_CONFIG: ''})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.HTTPS_CONFIG: ''}, operation='put_bucket_https_config')
         logger.debug("Put bucket https config done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -3119,7 +3308,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to create bucket data redundancy transition, bucket: {0}, target type: {1}".format(self.bucket_name, targetType))
 
-        resp = self.__do_bucket('POST', params={Bucket.REDUNDANCY_TRANSITION: '', Bucket.TARGET_REDUNDANCY_TYPE: targetType})
+        resp = self.__do_bucket('POST', params={Bucket.REDUNDANCY_TRANSITION: '', Bucket.TARGET_REDUNDANCY_TYPE: targetType}, operation='create_bucket_data_redundancy_transition')
         logger.debug("Create bucket data redundancy transition done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_create_data_redundancy_transition_result, CreateDataRedundancyTransitionResult)
@@ -3130,7 +3319,7 @@ class Bucket(_Base):
         """
 
         logger.debug("Start to get bucket data redundancy transition, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.REDUNDANCY_TRANSITION: '', Bucket.REDUNDANCY_TRANSITION_TASK_ID: taskId})
+        resp = self.__do_bucket('GET', params={Bucket.REDUNDANCY_TRANSITION: '', Bucket.REDUNDANCY_TRANSITION_TASK_ID: taskId}, operation='get_bucket_data_redundancy_transition')
         logger.debug("Get bucket data redundancy transition done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_data_redundancy_transition, DataRedundancyTransitionInfoResult)
 
@@ -3139,7 +3328,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to delete bucket data redundancy transition, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.REDUNDANCY_TRANSITION: '', Bucket.REDUNDANCY_TRANSITION_TASK_ID: taskId})
+        resp = self.__do_bucket('DELETE', params={Bucket.REDUNDANCY_TRANSITION: '', Bucket.REDUNDANCY_TRANSITION_TASK_ID: taskId}, operation='delete_bucket_data_redundancy_transition')
         logger.debug("Delete bucket data redundancy transition done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -3148,7 +3337,7 @@ class Bucket(_Base):
         :return: :class:`HttpsConfigResult <oss2.models.HttpsConfigResult>`
         """
         logger.debug("Start to get bucket https config, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.HTTPS_CONFIG: ''})
+        resp = self.__do_bucket('GET', params={Bucket.HTTPS_CONFIG: ''}, operation='get_bucket_https_config')
         logger.debug("Get bucket https config done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_bucket_https_config, HttpsConfigResult)
 
@@ -3160,7 +3349,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to do query list bucket data redundancy transition: {0}".format(self.bucket_name))
 
-        resp = self.__do_bucket('GET', params={Bucket.REDUNDANCY_TRANSITION: ''})
+        resp = self.__do_bucket('GET', params={Bucket.REDUNDANCY_TRANSITION: ''}, operation='list_bucket_data_redundancy_transition')
         logger.debug("query list bucket data redundancy transition done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_bucket_data_redundancy_transition, ListBucketDataRedundancyTransitionResult)
 
@@ -3171,7 +3360,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to create access point, bucket: {0}".format(self.bucket_name))
         data = xml_utils.to_do_create_access_point_request(accessPoint)
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.ACCESS_POINT: ''})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.ACCESS_POINT: ''}, operation='create_access_point')
         logger.debug("Create access point done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_create_access_point_result, CreateAccessPointResult)
 
@@ -3184,7 +3373,7 @@ class Bucket(_Base):
         logger.debug("Start to get access point, bucket: {0}".format(self.bucket_name))
         headers = http.CaseInsensitiveDict()
         headers['x-oss-access-point-name'] = accessPointName
-        resp = self.__do_bucket('GET', params={Bucket.ACCESS_POINT: ''}, headers=headers)
+        resp = self.__do_bucket('GET', params={Bucket.ACCESS_POINT: ''}, headers=headers, operation='get_access_point')
         logger.debug("Get access point done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_get_access_point_result, GetAccessPointResult)
 
@@ -3196,7 +3385,7 @@ class Bucket(_Base):
         logger.debug("Start to delete access point, bucket: {0}".format(self.bucket_name))
         headers = http.CaseInsensitiveDict()
         headers['x-oss-access-point-name'] = accessPointName
-        resp = self.__do_bucket('DELETE', params={Bucket.ACCESS_POINT: ''}, headers=headers)
+        resp = self.__do_bucket('DELETE', params={Bucket.ACCESS_POINT: ''}, headers=headers, operation='delete_access_point')
         logger.debug("Delete access point done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -3208,7 +3397,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to list bucket access point: {0}".format(self.bucket_name))
 
-        resp = self.__do_bucket('GET', params={Bucket.ACCESS_POINT: '', 'max-keys': str(max_keys), 'continuation-token': continuation_token})
+        resp = self.__do_bucket('GET', params={Bucket.ACCESS_POINT: '', 'max-keys': str(max_keys), 'continuation-token': continuation_token}, operation='list_bucket_access_points')
         logger.debug("query list bucket access point done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_access_point_result, ListAccessPointResult)
 
@@ -3222,7 +3411,7 @@ class Bucket(_Base):
         logger.debug("Start to put access point policy, bucket: {0}, accessPointPolicy: {1}".format(self.bucket_name, accessPointPolicy))
         headers = http.CaseInsensitiveDict()
         headers['x-oss-access-point-name'] = accessPointName
-        resp = self.__do_bucket('PUT', data=accessPointPolicy, params={Bucket.ACCESS_POINT_POLICY: ''}, headers=headers)
+        resp = self.__do_bucket('PUT', data=accessPointPolicy, params={Bucket.ACCESS_POINT_POLICY: ''}, headers=headers, operation='put_access_point_policy')
         logger.debug("Create access point policy done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -3235,7 +3424,7 @@ class Bucket(_Base):
         logger.debug("Start to get access point policy, bucket: {0}".format(self.bucket_name))
         headers = http.CaseInsensitiveDict()
         headers['x-oss-access-point-name'] = accessPointName
-        resp = self.__do_bucket('GET', params={Bucket.ACCESS_POINT_POLICY: ''}, headers=headers)
+        resp = self.__do_bucket('GET', params={Bucket.ACCESS_POINT_POLICY: ''}, headers=headers, operation='get_access_point_policy')
         logger.debug("Get access point policy done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return GetAccessPointPolicyResult(resp)
 
@@ -3247,7 +3436,7 @@ class Bucket(_Base):
         logger.debug("Start to delete access point policy, bucket: {0}".format(self.bucket_name))
         headers = http.CaseInsensitiveDict()
         headers['x-oss-access-point-name'] = accessPointName
-        resp = self.__do_bucket('DELETE', params={Bucket.ACCESS_POINT_POLICY: ''}, headers=headers)
+        resp = self.__do_bucket('DELETE', params={Bucket.ACCESS_POINT_POLICY: ''}, headers=headers, operation='delete_access_point_policy')
         logger.debug("Delete access point policy done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -3261,7 +3450,7 @@ class Bucket(_Base):
                      .format(self.bucket_name, block_public_access))
         data = xml_utils.to_put_public_access_block_request(block_public_access)
 
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.PUBLIC_ACCESS_BLOCK: ''})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.PUBLIC_ACCESS_BLOCK: ''}, operation='put_bucket_public_access_block')
         logger.debug("bucket public access block done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -3272,7 +3461,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketPublicAccessBlockResult <oss2.models.GetBucketPublicAccessBlockResult>`
         """
         logger.debug("Start to get bucket public access block: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('GET', params={Bucket.PUBLIC_ACCESS_BLOCK: ''})
+        resp = self.__do_bucket('GET', params={Bucket.PUBLIC_ACCESS_BLOCK: ''}, operation='get_bucket_public_access_block')
         logger.debug("Get bucket public access block done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_public_access_block_result, GetBucketPublicAccessBlockResult)
@@ -3282,7 +3471,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to delete bucket public access block, bucket: {0}".format(self.bucket_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.PUBLIC_ACCESS_BLOCK: ''})
+        resp = self.__do_bucket('DELETE', params={Bucket.PUBLIC_ACCESS_BLOCK: ''}, operation='delete_bucket_public_access_block')
         logger.debug("Delete bucket public access block done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -3296,7 +3485,7 @@ class Bucket(_Base):
                      .format(self.bucket_name, access_point_name, block_public_access))
         data = xml_utils.to_put_public_access_block_request(block_public_access)
 
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.PUBLIC_ACCESS_BLOCK: '', Bucket.OSS_ACCESS_POINT_NAME: access_point_name})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.PUBLIC_ACCESS_BLOCK: '', Bucket.OSS_ACCESS_POINT_NAME: access_point_name}, operation='put_access_point_public_access_block')
         logger.debug("access point public access block done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -3307,7 +3496,7 @@ class Bucket(_Base):
         :return: :class:`GetBucketPublicAccessBlockResult <oss2.models.GetBucketPublicAccessBlockResult>`
         """
         logger.debug("Start to get access point public access block: {0}, access point name: {1}.".format(self.bucket_name, access_point_name))
-        resp = self.__do_bucket('GET', params={Bucket.PUBLIC_ACCESS_BLOCK: '', Bucket.OSS_ACCESS_POINT_NAME: access_point_name})
+        resp = self.__do_bucket('GET', params={Bucket.PUBLIC_ACCESS_BLOCK: '', Bucket.OSS_ACCESS_POINT_NAME: access_point_name}, operation='get_access_point_public_access_block')
         logger.debug("Get access point public access block done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_public_access_block_result, GetBucketPublicAccessBlockResult)
@@ -3317,7 +3506,7 @@ class Bucket(_Base):
         :return: :class:`RequestResult <oss2.models.RequestResult>`
         """
         logger.debug("Start to delete access point public access block, bucket: {0}, access point name: {1}.".format(self.bucket_name, access_point_name))
-        resp = self.__do_bucket('DELETE', params={Bucket.PUBLIC_ACCESS_BLOCK: '', Bucket.OSS_ACCESS_POINT_NAME: access_point_name})
+        resp = self.__do_bucket('DELETE', params={Bucket.PUBLIC_ACCESS_BLOCK: '', Bucket.OSS_ACCESS_POINT_NAME: access_point_name}, operation='delete_access_point_public_access_block')
         logger.debug("Delete access point public access block done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
@@ -3337,7 +3526,7 @@ class Bucket(_Base):
 
         data = xml_utils.to_put_qos_info(qos_configuration)
 
-        resp = self.__do_bucket('PUT', data=data, params={Bucket.REQUESTER_QOS_INFO: '', Bucket.QOS_REQUESTER: uid})
+        resp = self.__do_bucket('PUT', data=data, params={Bucket.REQUESTER_QOS_INFO: '', Bucket.QOS_REQUESTER: uid}, operation='put_bucket_requester_qos_info')
         logger.debug("put bucket requester qos info done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return RequestResult(resp)
@@ -3351,7 +3540,7 @@ class Bucket(_Base):
         if not uid:
             raise ClientError('uid should not be empty')
 
-        resp = self.__do_bucket('GET', params={Bucket.REQUESTER_QOS_INFO: '', Bucket.QOS_REQUESTER: uid})
+        resp = self.__do_bucket('GET', params={Bucket.REQUESTER_QOS_INFO: '', Bucket.QOS_REQUESTER: uid}, operation='get_bucket_requester_qos_info')
         logger.debug("Get bucket requester qos info, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return self._parse_result(resp, xml_utils.parse_get_requester_qos_info, RequesterQoSInfoResult)
@@ -3366,7 +3555,7 @@ class Bucket(_Base):
         """
         logger.debug("Start to do query list bucket requester qos infos: {0}".format(self.bucket_name))
 
-        resp = self.__do_bucket('GET', params={Bucket.REQUESTER_QOS_INFO: '', 'continuation-token': continuation_token, 'max-keys': str(max_keys)})
+        resp = self.__do_bucket('GET', params={Bucket.REQUESTER_QOS_INFO: '', 'continuation-token': continuation_token, 'max-keys': str(max_keys)}, operation='list_bucket_requester_qos_infos')
         logger.debug("query list bucket requester qos infos done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return self._parse_result(resp, xml_utils.parse_list_bucket_requester_qos_infos, ListBucketRequesterQoSInfosResult)
 
@@ -3379,7 +3568,7 @@ class Bucket(_Base):
         if not uid:
             raise ClientError('uid should not be empty')
 
-        resp = self.__do_bucket('DELETE', params={Bucket.REQUESTER_QOS_INFO: '', Bucket.QOS_REQUESTER: uid})
+        resp = self.__do_bucket('DELETE', params={Bucket.REQUESTER_QOS_INFO: '', Bucket.QOS_REQUESTER: uid}, operation='delete_bucket_requester_qos_info')
         logger.debug("Delete bucket requester qos info done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
         return RequestResult(resp)
 
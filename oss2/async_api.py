@@ -0,0 +1,536 @@
+# -*- coding: utf-8 -*-
+
+"""
+oss2.async_api
+~~~~~~~~~~~~~~
+
+基于asyncio的OSS客户端。:class:`AsyncService` 和 :class:`AsyncBucket` 与 :class:`Service <oss2.Service>` 、
+:class:`Bucket <oss2.Bucket>` 使用相同的签名、异常和返回值类型，只是方法均为协程，需要用 `await` 调用。
+
+用法 ::
+
+    >>> import asyncio
+    >>> import oss2
+    >>> async def main():
+    ...     auth = oss2.Auth('your-access-key-id', 'your-access-key-secret')
+    ...     async with oss2.AsyncBucket(auth, 'http://oss-cn-hangzhou.aliyuncs.com', 'your-bucket') as bucket:
+    ...         await bucket.put_object('readme.txt', b'content of the object')
+    ...         result = await bucket.get_object('readme.txt')
+    ...         async for chunk in result:
+    ...             print(chunk)
+    >>> asyncio.run(main())
+
+上传数据 `data` 除了可以是 :mod:`oss2.api` 中说明的类型，还可以是异步迭代器（如异步生成器），此时通过Chunked Encoding传输。
+
+该模块要求Python 3.5及以上版本。
+"""
+
+import logging
+
+from . import xml_utils
+from . import http
+from . import utils
+from . import exceptions
+from . import models
+
+from .api import _Base, Bucket, _make_range_string
+from .async_http import AsyncSession, BufferedResponse
+from .models import *
+from .compat import urlquote, to_string
+from .headers import *
+
+logger = logging.getLogger(__name__)
+
+
+class _AsyncBase(_Base):
+    def __init__(self, auth, endpoint, is_cname, session, connect_timeout, **kwargs):
+        super(_AsyncBase, self).__init__(auth, endpoint, is_cname, session or AsyncSession(), connect_timeout,
+                                         **kwargs)
+
+    async def _do(self, method, bucket_name, key, **kwargs):
+        key = to_string(key)
+        req = http.Request(method, self._make_url(bucket_name, key),
+                           app_name=self.app_name,
+                           proxies=self.proxies,
+                           region=self.region,
+                           product=self.product,
+                           cloudbox_id=self.cloudbox_id,
+                           **kwargs)
+        self.auth._sign_request(req, bucket_name, key)
+
+        resp = await self.session.do_request(req, timeout=self.timeout)
+        if resp.status // 100 != 2:
+            e = exceptions.make_exception(BufferedResponse(resp, await resp.read(4096)))
+            logger.info("Exception: {0}".format(e))
+            raise e
+
+        # 同requests一样，只有读完响应体，连接才会被放回连接池
+        content_length = models._hget(resp.headers, 'content-length', int)
+        if content_length is not None and content_length == 0:
+            await resp.read()
+
+        return resp
+
+    @staticmethod
+    async def _parse_result(resp, parse_func, klass):
+        resp = BufferedResponse(resp, await resp.read())
+        result = klass(resp)
+        parse_func(result, resp.read())
+        return result
+
+    async def close(self):
+        """关闭会话，释放连接。"""
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncService(_AsyncBase):
+    """用于Service操作的异步类，参数同 :class:`Service <oss2.Service>` 。
+
+    :param session: 会话。如果是None表示新开会话，非None则复用传入的会话
+    :type session: oss2.AsyncSession
+    """
+
+    def __init__(self, auth, endpoint,
+                 session=None,
+                 connect_timeout=None,
+                 app_name='',
+                 proxies=None,
+                 region=None,
+                 cloudbox_id=None,
+                 is_path_style=False):
+        logger.debug("Init async oss service, endpoint: {0}, connect_timeout: {1}, app_name: {2}, proxies: {3}".format(
+            endpoint, connect_timeout, app_name, proxies))
+        super(AsyncService, self).__init__(auth, endpoint, False, session, connect_timeout,
+                                           app_name=app_name, proxies=proxies,
+                                           region=region, cloudbox_id=cloudbox_id, is_path_style=is_path_style)
+
+    async def list_buckets(self, prefix='', marker='', max_keys=100, params=None, headers=None):
+        """根据前缀罗列用户的Bucket。参见 :func:`Service.list_buckets <oss2.Service.list_buckets>` 。
+
+        :return: 罗列的结果
+        :rtype: oss2.models.ListBucketsResult
+        """
+        logger.debug("Start to list buckets, prefix: {0}, marker: {1}, max-keys: {2}".format(prefix, marker, max_keys))
+
+        list_params = {'prefix': prefix, 'marker': marker, 'max-keys': str(max_keys)}
+        if params is not None:
+            list_params.update(params)
+
+        resp = await self._do('GET', '', '', params=list_params, headers=http.CaseInsensitiveDict(headers))
+        logger.debug("List buckets done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        return await self._parse_result(resp, xml_utils.parse_list_buckets, ListBucketsResult)
+
+
+class AsyncBucket(_AsyncBase):
+    """用于Object操作的异步类，参数同 :class:`Bucket <oss2.Bucket>` 。
+
+    :param session: 会话。如果是None表示新开会话，非None则复用传入的会话。多个AsyncBucket可以共享同一个会话。
+    :type session: oss2.AsyncSession
+    """
+
+    def __init__(self, auth, endpoint, bucket_name,
+                 is_cname=False,
+                 session=None,
+                 connect_timeout=None,
+                 app_name='',
+                 enable_crc=True,
+                 proxies=None,
+                 region=None,
+                 cloudbox_id=None,
+                 is_path_style=False,
+                 is_verify_object_strict=True):
+        logger.debug("Init AsyncBucket: {0}, endpoint: {1}, isCname: {2}, connect_timeout: {3}, app_name: {4}, "
+                     "enabled_crc: {5}, region: {6}".format(bucket_name, endpoint, is_cname, connect_timeout,
+                                                            app_name, enable_crc, region))
+        super(AsyncBucket, self).__init__(auth, endpoint, is_cname, session, connect_timeout,
+                                          app_name=app_name, enable_crc=enable_crc, proxies=proxies,
+                                          region=region, cloudbox_id=cloudbox_id, is_path_style=is_path_style,
+                                          is_verify_object_strict=is_verify_object_strict)
+
+        self.bucket_name = bucket_name.strip()
+        if utils.is_valid_bucket_name(self.bucket_name) is not True:
+            raise ClientError("The bucket_name is invalid, please check it.")
+
+    async def list_objects(self, prefix='', delimiter='', marker='', max_keys=100, headers=None):
+        """根据前缀罗列Bucket里的文件。参见 :func:`Bucket.list_objects <oss2.Bucket.list_objects>` 。
+
+        :return: :class:`ListObjectsResult <oss2.models.ListObjectsResult>`
+        """
+        logger.debug(
+            "Start to List objects, bucket: {0}, prefix: {1}, delimiter: {2}, marker: {3}, max-keys: {4}".format(
+                self.bucket_name, to_string(prefix), delimiter, to_string(marker), max_keys))
+        resp = await self.__do_bucket('GET',
+                                      params={'prefix': prefix,
+                                              'delimiter': delimiter,
+                                              'marker': marker,
+                                              'max-keys': str(max_keys),
+                                              'encoding-type': 'url'},
+                                      headers=http.CaseInsensitiveDict(headers))
+        logger.debug("List objects done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        return await self._parse_result(resp, xml_utils.parse_list_objects, ListObjectsResult)
+
+    async def list_objects_v2(self, prefix='', delimiter='', continuation_token='', start_after='',
+                              fetch_owner=False, encoding_type='url', max_keys=100, headers=None):
+        """根据前缀罗列Bucket里的文件。参见 :func:`Bucket.list_objects_v2 <oss2.Bucket.list_objects_v2>` 。
+
+        :return: :class:`ListObjectsV2Result <oss2.models.ListObjectsV2Result>`
+        """
+        logger.debug(
+            "Start to List objects, bucket: {0}, prefix: {1}, delimiter: {2}, continuation_token: {3}, "
+            "start-after: {4}, fetch-owner: {5}, encoding_type: {6}, max-keys: {7}".format(
+                self.bucket_name, to_string(prefix), delimiter, continuation_token, start_after, fetch_owner,
+                encoding_type, max_keys))
+        resp = await self.__do_bucket('GET',
+                                      params={'list-type': '2',
+                                              'prefix': prefix,
+                                              'delimiter': delimiter,
+                                              'continuation-token': continuation_token,
+                                              'start-after': start_after,
+                                              'fetch-owner': str(fetch_owner).lower(),
+                                              'max-keys': str(max_keys),
+                                              'encoding-type': encoding_type},
+                                      headers=http.CaseInsensitiveDict(headers))
+        logger.debug("List objects V2 done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        return await self._parse_result(resp, xml_utils.parse_list_objects_v2, ListObjectsV2Result)
+
+    async def put_object(self, key, data, headers=None, progress_callback=None):
+        """上传一个普通文件。参见 :func:`Bucket.put_object <oss2.Bucket.put_object>` 。
+
+        :param data: 待上传的内容。
+        :type data: bytes，str，file-like object，可迭代对象或异步迭代器
+
+        :return: :class:`PutObjectResult <oss2.models.PutObjectResult>`
+        """
+        headers = utils.set_content_type(http.CaseInsensitiveDict(headers), key)
+        data = _make_upload_adapter(data, progress_callback, self.enable_crc)
+
+        logger.debug("Start to put object, bucket: {0}, key: {1}, headers: {2}".format(
+            self.bucket_name, to_string(key), headers))
+        resp = await self.__do_object('PUT', key, data=data, headers=headers)
+        logger.debug("Put object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        result = PutObjectResult(resp)
+
+        if self.enable_crc and result.crc is not None:
+            utils.check_crc('put object', data.crc, result.crc, result.request_id)
+
+        return result
+
+    async def get_object(self, key, byte_range=None, headers=None, progress_callback=None, process=None,
+                         params=None):
+        """下载一个文件。参见 :func:`Bucket.get_object <oss2.Bucket.get_object>` 。
+
+        用法 ::
+
+            >>> result = await bucket.get_object('readme.txt')
+            >>> content = await result.read()
+
+        :return: :class:`AsyncGetObjectResult`
+        """
+        headers = http.CaseInsensitiveDict(headers)
+
+        range_string = _make_range_string(byte_range)
+        if range_string:
+            headers['range'] = range_string
+
+        params = {} if params is None else params
+        if process:
+            params.update({Bucket.PROCESS: process})
+
+        logger.debug("Start to get object, bucket: {0}, key: {1}, range: {2}, headers: {3}, params: {4}".format(
+            self.bucket_name, to_string(key), range_string, headers, params))
+        resp = await self.__do_object('GET', key, headers=headers, params=params)
+        logger.debug("Get object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+
+        return AsyncGetObjectResult(resp, progress_callback, self.enable_crc)
+
+    async def head_object(self, key, headers=None, params=None):
+        """获取文件元信息。参见 :func:`Bucket.head_object <oss2.Bucket.head_object>` 。
+
+        :return: :class:`HeadObjectResult <oss2.models.HeadObjectResult>`
+        """
+        logger.debug("Start to head object, bucket: {0}, key: {1}, headers: {2}".format(
+            self.bucket_name, to_string(key), headers))
+        resp = await self.__do_object('HEAD', key, headers=headers, params=params)
+        logger.debug("Head object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        return await self._parse_result(resp, xml_utils.parse_dummy_result, HeadObjectResult)
+
+    async def get_object_meta(self, key, params=None, headers=None):
+        """获取文件基本元信息。参见 :func:`Bucket.get_object_meta <oss2.Bucket.get_object_meta>` 。
+
+        :return: :class:`GetObjectMetaResult <oss2.models.GetObjectMetaResult>`
+        """
+        logger.debug("Start to get object metadata, bucket: {0}, key: {1}".format(self.bucket_name, to_string(key)))
+
+        params = dict(params or {})
+        if Bucket.OBJECTMETA not in params:
+            params[Bucket.OBJECTMETA] = ''
+
+        resp = await self.__do_object('HEAD', key, params=params, headers=http.CaseInsensitiveDict(headers))
+        logger.debug("Get object metadata done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        return GetObjectMetaResult(resp)
+
+    async def object_exists(self, key, headers=None):
+        """如果文件存在就返回True，否则返回False。如果Bucket不存在，或是发生其他错误，则抛出异常。"""
+        logger.debug("Start to check if object exists, bucket: {0}, key: {1}".format(self.bucket_name, to_string(key)))
+        try:
+            await self.get_object_meta(key, headers=headers)
+        except exceptions.NoSuchKey:
+            return False
+        except exceptions.NoSuchBucket:
+            raise
+        except exceptions.NotFound:
+            return False
+
+        return True
+
+    async def copy_object(self, source_bucket_name, source_key, target_key, headers=None, params=None):
+        """拷贝一个文件到当前Bucket。参见 :func:`Bucket.copy_object <oss2.Bucket.copy_object>` 。
+
+        :return: :class:`PutObjectResult <oss2.models.PutObjectResult>`
+        """
+        headers = http.CaseInsensitiveDict(headers)
+
+        if params and Bucket.VERSIONID in params:
+            headers[OSS_COPY_OBJECT_SOURCE] = '/' + source_bucket_name + \
+                '/' + urlquote(source_key, '') + '?versionId=' + params[Bucket.VERSIONID]
+        else:
+            headers[OSS_COPY_OBJECT_SOURCE] = '/' + source_bucket_name + '/' + urlquote(source_key, '')
+
+        logger.debug(
+            "Start to copy object, source bucket: {0}, source key: {1}, bucket: {2}, key: {3}, headers: {4}".format(
+                source_bucket_name, to_string(source_key), self.bucket_name, to_string(target_key), headers))
+        resp = await self.__do_object('PUT', target_key, headers=headers)
+        logger.debug("Copy object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+
+        return await self._parse_result(resp, xml_utils.parse_dummy_result, PutObjectResult)
+
+    async def delete_object(self, key, params=None, headers=None):
+        """删除一个文件。
+
+        :return: :class:`RequestResult <oss2.models.RequestResult>`
+        """
+        logger.info("Start to delete object, bucket: {0}, key: {1}".format(self.bucket_name, to_string(key)))
+        resp = await self.__do_object('DELETE', key, params=params, headers=http.CaseInsensitiveDict(headers))
+        logger.debug("Delete object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        return RequestResult(resp)
+
+    async def batch_delete_objects(self, key_list, headers=None):
+        """批量删除文件。参见 :func:`Bucket.batch_delete_objects <oss2.Bucket.batch_delete_objects>` 。
+
+        :return: :class:`BatchDeleteObjectsResult <oss2.models.BatchDeleteObjectsResult>`
+        """
+        if not key_list:
+            raise ClientError('key_list should not be empty')
+
+        logger.debug("Start to delete objects, bucket: {0}, keys: {1}".format(self.bucket_name, key_list))
+
+        data = xml_utils.to_batch_delete_objects_request(key_list, False)
+
+        headers = http.CaseInsensitiveDict(headers)
+        headers['Content-MD5'] = utils.content_md5(data)
+
+        resp = await self.__do_bucket('POST',
+                                      data=data,
+                                      params={'delete': '', 'encoding-type': 'url'},
+                                      headers=headers)
+        logger.debug("Delete objects done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        return await self._parse_result(resp, xml_utils.parse_batch_delete_objects, BatchDeleteObjectsResult)
+
+    async def init_multipart_upload(self, key, headers=None, params=None):
+        """初始化分片上传。
+
+        :return: :class:`InitMultipartUploadResult <oss2.models.InitMultipartUploadResult>`
+        """
+        headers = utils.set_content_type(http.CaseInsensitiveDict(headers), key)
+
+        tmp_params = dict(params or {})
+        tmp_params['uploads'] = ''
+
+        logger.debug("Start to init multipart upload, bucket: {0}, keys: {1}, headers: {2}, params: {3}".format(
+            self.bucket_name, to_string(key), headers, tmp_params))
+        resp = await self.__do_object('POST', key, params=tmp_params, headers=headers)
+        logger.debug("Init multipart upload done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        return await self._parse_result(resp, xml_utils.parse_init_multipart_upload, InitMultipartUploadResult)
+
+    async def upload_part(self, key, upload_id, part_number, data, progress_callback=None, headers=None):
+        """上传一个分片。
+
+        :return: :class:`PutObjectResult <oss2.models.PutObjectResult>`
+        """
+        headers = http.CaseInsensitiveDict(headers)
+        data = _make_upload_adapter(data, progress_callback, self.enable_crc)
+
+        logger.debug(
+            "Start to upload multipart, bucket: {0}, key: {1}, upload_id: {2}, part_number: {3}, headers: {4}".format(
+                self.bucket_name, to_string(key), upload_id, part_number, headers))
+        resp = await self.__do_object('PUT', key,
+                                      params={'uploadId': upload_id, 'partNumber': str(part_number)},
+                                      headers=headers,
+                                      data=data)
+        logger.debug("Upload multipart done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        result = PutObjectResult(resp)
+
+        if self.enable_crc and result.crc is not None:
+            utils.check_crc('upload part', data.crc, result.crc, result.request_id)
+
+        return result
+
+    async def complete_multipart_upload(self, key, upload_id, parts, headers=None):
+        """完成分片上传，创建文件。
+
+        :return: :class:`PutObjectResult <oss2.models.PutObjectResult>`
+        """
+        headers = http.CaseInsensitiveDict(headers)
+
+        data = None
+        if parts is not None:
+            parts = sorted(parts, key=lambda p: p.part_number)
+            data = xml_utils.to_complete_upload_request(parts)
+
+        logger.debug("Start to complete multipart upload, bucket: {0}, key: {1}, upload_id: {2}, parts: {3}".format(
+            self.bucket_name, to_string(key), upload_id, data))
+        resp = await self.__do_object('POST', key, params={'uploadId': upload_id}, data=data, headers=headers)
+        logger.debug(
+            "Complete multipart upload done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+
+        result = await self._parse_result(resp, xml_utils.parse_dummy_result, PutObjectResult)
+
+        if self.enable_crc and parts is not None:
+            object_crc = utils.calc_obj_crc_from_parts(parts)
+            utils.check_crc('multipart upload', object_crc, result.crc, result.request_id)
+
+        return result
+
+    async def abort_multipart_upload(self, key, upload_id, headers=None):
+        """取消分片上传。
+
+        :return: :class:`RequestResult <oss2.models.RequestResult>`
+        """
+        logger.debug("Start to abort multipart upload, bucket: {0}, key: {1}, upload_id: {2}".format(
+            self.bucket_name, to_string(key), upload_id))
+        resp = await self.__do_object('DELETE', key, params={'uploadId': upload_id},
+                                      headers=http.CaseInsensitiveDict(headers))
+        logger.debug("Abort multipart done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
+        return RequestResult(resp)
+
+    async def __do_object(self, method, key, **kwargs):
+        if not self.bucket_name:
+            raise ClientError("Bucket name should not be null or empty.")
+        if not key:
+            raise ClientError("key should not be null or empty.")
+        return await self._do(method, self.bucket_name, key, **kwargs)
+
+    async def __do_bucket(self, method, **kwargs):
+        return await self._do(method, self.bucket_name, '', **kwargs)
+
+
+class AsyncGetObjectResult(HeadObjectResult):
+    """:func:`AsyncBucket.get_object` 的返回值。通过 `await read()` 或 `async for` 读取响应体。
+
+    开启CRC校验时，读到Content-Length个字节（长度未知时读到空）后会与服务端返回的CRC64比较，不一致则抛出 :class:`InconsistentError <oss2.exceptions.InconsistentError>` 。
+    """
+
+    def __init__(self, resp, progress_callback=None, crc_enabled=False):
+        super(AsyncGetObjectResult, self).__init__(resp)
+        self.__progress_callback = progress_callback
+        self.__crc = utils.Crc64() if crc_enabled else None
+        self.__offset = 0
+        self.__verified = False
+
+        self.content_range = models._hget(resp.headers, 'Content-Range')
+
+    async def read(self, amt=None):
+        content = await self.resp.read(amt)
+        self.__consume(content)
+        return content
+
+    async def close(self):
+        await self.resp.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        content = await self.read(http._CHUNK_SIZE)
+        if not content:
+            raise StopAsyncIteration
+        return content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def client_crc(self):
+        if self.__crc is not None:
+            return self.__crc.crc
+        else:
+            return None
+
+    def __consume(self, content):
+        if content:
+            self.__offset += len(content)
+            if self.__crc is not None:
+                self.__crc.update(content)
+            utils._invoke_progress_callback(self.__progress_callback, self.__offset, self.content_length)
+
+        # 读够Content-Length个字节就校验，调用者不必再多读一次空
+        if not content or (self.content_length is not None and self.__offset >= self.content_length):
+            self.__verify()
+
+    def __verify(self):
+        if self.__verified:
+            return
+        self.__verified = True
+
+        if self.__crc is not None and not self.content_range:
+            utils.check_crc('get object', self.__crc.crc, self.server_crc, self.request_id)
+
+
+def _make_upload_adapter(data, progress_callback, crc_enabled):
+    if hasattr(data, '__aiter__'):
+        return _AsyncIterableAdapter(data, progress_callback, utils.Crc64() if crc_enabled else None)
+
+    if progress_callback:
+        data = utils.make_progress_adapter(data, progress_callback)
+
+    if crc_enabled:
+        data = utils.make_crc_adapter(data)
+
+    return data
+
+
+class _AsyncIterableAdapter(object):
+    def __init__(self, data, progress_callback=None, crc_callback=None):
+        self.iter = data.__aiter__()
+        self.progress_callback = progress_callback
+        self.crc_callback = crc_callback
+        self.offset = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        utils._invoke_progress_callback(self.progress_callback, self.offset, None)
+
+        content = await self.iter.__anext__()
+        self.offset += len(content)
+
+        utils._invoke_crc_callback(self.crc_callback, content)
+
+        return content
+
+    @property
+    def crc(self):
+        if self.crc_callback:
+            return self.crc_callback.crc
+        else:
+            return None
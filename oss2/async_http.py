@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+"""
+oss2.async_http
+~~~~~~~~~~~~~~~
+
+异步HTTP通信层，供 :class:`AsyncBucket <oss2.AsyncBucket>` 和 :class:`AsyncService <oss2.AsyncService>` 使用。
+
+`AsyncSession` 把请求交给一个可替换的异步传输层（transport）发送。缺省的传输层 `AiohttpTransport` 基于aiohttp，
+使用者也可以实现 `AsyncTransport` 接口，接入其他异步HTTP库。请求签名仍然使用 :class:`oss2.http.Request` 。
+
+该模块要求Python 3.5及以上版本。
+"""
+
+import asyncio
+import io
+import logging
+
+from . import defaults
+from .compat import to_bytes
+from .exceptions import ClientError, RequestError
+from .http import CaseInsensitiveDict
+from .utils import _get_data_size
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 8 * 1024
+
+
+class AsyncTransport(object):
+    """异步传输层接口。
+
+    `send` 是一个协程，返回的对象需要具有 `status` 、 `headers` 两个属性，以及 `read(amt=None)` 和 `close()` 两个协程。
+    `read` 读到结尾时返回空的bytes。
+    """
+
+    async def send(self, req, timeout):
+        raise NotImplementedError    # pragma: no cover
+
+    async def close(self):
+        pass
+
+
+class AiohttpTransport(AsyncTransport):
+    """基于aiohttp的异步传输层。
+
+    :param int pool_size: 连接池大小，缺省为 `oss2.defaults.connection_pool_size`
+    :param session: 已有的 `aiohttp.ClientSession` 。如果是None则在第一次发送请求时创建。
+    """
+
+    def __init__(self, pool_size=None, session=None):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ClientError('AiohttpTransport requires aiohttp, please install it or provide another transport')
+
+        self.__aiohttp = aiohttp
+        self.__pool_size = pool_size or defaults.connection_pool_size
+        self.__session = session
+
+    def __get_session(self):
+        if self.__session is None:
+            connector = self.__aiohttp.TCPConnector(limit=self.__pool_size)
+            self.__session = self.__aiohttp.ClientSession(connector=connector, auto_decompress=False)
+        return self.__session
+
+    async def send(self, req, timeout):
+        session = self.__get_session()
+
+        headers = dict((k, v) for k, v in req.headers.items() if v is not None)
+        params = dict((k, v if v is not None else '') for k, v in req.params.items())
+
+        proxy = None
+        if req.proxies:
+            proxy = req.proxies.get(req.url.split(':', 1)[0])
+
+        try:
+            resp = await session.request(req.method, req.url,
+                                         data=_make_async_body(req.data, headers),
+                                         params=params,
+                                         headers=headers,
+                                         proxy=proxy,
+                                         skip_auto_headers=('Accept-Encoding',),
+                                         timeout=self.__aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout))
+        except (self.__aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise RequestError(e)
+
+        return _AiohttpResponse(resp, self.__aiohttp)
+
+    async def close(self):
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+
+class _AiohttpResponse(object):
+    def __init__(self, resp, aiohttp):
+        self.__resp = resp
+        self.__aiohttp = aiohttp
+        self.status = resp.status
+        self.headers = resp.headers
+
+    async def read(self, amt=None):
+        try:
+            if amt is None:
+                return await self.__resp.read()
+            return await self.__resp.content.read(amt)
+        except (self.__aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise RequestError(e)
+
+    async def close(self):
+        self.__resp.release()
+
+
+def _make_async_body(data, headers):
+    """把请求体转换为aiohttp能够处理的形式：bytes原样返回；file-like object及同步迭代器转换为异步迭代器；
+    异步迭代器原样返回。若能够确定长度，则设置Content-Length，避免使用Chunked Encoding。"""
+    if data is None or isinstance(data, bytes):
+        return data
+
+    if 'Content-Length' not in headers:
+        size = _get_data_size(data)
+        if size is not None:
+            headers['Content-Length'] = str(size)
+
+    if hasattr(data, '__aiter__'):
+        return data
+
+    if hasattr(data, 'read'):
+        return _FileIterator(data)
+
+    if hasattr(data, '__iter__'):
+        return _SyncIterator(data)
+
+    raise ClientError('{0} is not a file object, nor an iterator'.format(data.__class__.__name__))
+
+
+# Python 3.5不支持异步生成器，这里用实现了__aiter__、__anext__的类
+class _FileIterator(object):
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        chunk = self.fileobj.read(_CHUNK_SIZE)
+        if not chunk:
+            raise StopAsyncIteration
+        return to_bytes(chunk)
+
+
+class _SyncIterator(object):
+    def __init__(self, iterable):
+        self.iter = iter(iterable)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return to_bytes(next(self.iter))
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class AsyncSession(object):
+    """属于同一个AsyncSession的请求共享同一个传输层，如有可能也会重用HTTP连接。
+
+    :param int pool_size: 连接池大小，仅对缺省的 `AiohttpTransport` 有效
+    :param transport: 异步传输层，需要实现 `AsyncTransport` 接口。如果是None则使用 `AiohttpTransport`
+    """
+
+    def __init__(self, pool_size=None, transport=None):
+        self.transport = transport or AiohttpTransport(pool_size)
+
+    async def do_request(self, req, timeout):
+        logger.debug("Send async request, method: {0}, url: {1}, params: {2}, headers: {3}, timeout: {4}".format(
+            req.method, req.url, req.params, req.headers, timeout))
+        return AsyncResponse(await self.transport.send(req, timeout))
+
+    async def close(self):
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncResponse(object):
+    def __init__(self, response):
+        self.response = response
+        self.status = response.status
+        self.headers = CaseInsensitiveDict(response.headers)
+        self.request_id = self.headers.get('x-oss-request-id', '')
+        self.__all_read = False
+
+        logger.debug("Get async response headers, req-id: {0}, status: {1}, headers: {2}".format(
+            self.request_id, self.status, self.headers))
+
+    async def read(self, amt=None):
+        if self.__all_read:
+            return b''
+
+        if amt is None:
+            content_list = []
+            while True:
+                chunk = await self.response.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                content_list.append(chunk)
+
+            self.__all_read = True
+            return b''.join(content_list)
+
+        content = await self.response.read(amt)
+        if not content:
+            self.__all_read = True
+        return content
+
+    async def close(self):
+        await self.response.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        content = await self.read(_CHUNK_SIZE)
+        if not content:
+            raise StopAsyncIteration
+        return content
+
+
+class BufferedResponse(object):
+    """已经读取到内存中的响应。用来复用只支持同步 `read` 的解析函数，如 `exceptions.make_exception` 及 `xml_utils` 。"""
+
+    def __init__(self, resp, body):
+        self.response = resp
+        self.status = resp.status
+        self.headers = resp.headers
+        self.request_id = resp.request_id
+        self.__body = io.BytesIO(body)
+
+    def read(self, amt=None):
+        return self.__body.read(amt)
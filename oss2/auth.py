@@ -2,6 +2,7 @@
 
 import hmac
 import hashlib
+import threading
 import time
 from datetime import datetime
 from . import utils
@@ -125,44 +126,13 @@ class ProviderAuth(AuthBase):
         return req.url + '?' + '&'.join(_param_to_quoted_query(k, v) for k, v in req.params.items())
 
     def __make_signature(self, req, bucket_name, key, credentials):
-        if is_py2:
-            string_to_sign = self.__get_string_to_sign(req, bucket_name, key)
-        else:
-            string_to_sign = self.__get_bytes_to_sign(req, bucket_name, key)
+        bytes_to_sign = self.__get_bytes_to_sign(req, bucket_name, key)
 
-        logger.debug('Make signature: string to be signed = {0}'.format(string_to_sign))
+        logger.debug('Make signature: string to be signed = {0}'.format(bytes_to_sign))
 
-        h = hmac.new(to_bytes(credentials.get_access_key_secret()), to_bytes(string_to_sign), hashlib.sha1)
+        h = hmac.new(to_bytes(credentials.get_access_key_secret()), bytes_to_sign, hashlib.sha1)
         return utils.b64encode_as_string(h.digest())
 
-    def __get_string_to_sign(self, req, bucket_name, key):
-        resource_string = self.__get_resource_string(req, bucket_name, key)
-        headers_string = self.__get_headers_string(req)
-
-        content_md5 = req.headers.get('content-md5', '')
-        content_type = req.headers.get('content-type', '')
-        date = req.headers.get('x-oss-date', '') or req.headers.get('date', '')
-        return '\n'.join([req.method,
-                          content_md5,
-                          content_type,
-                          date,
-                          headers_string + resource_string])
-
-    def __get_headers_string(self, req):
-        headers = req.headers
-        canon_headers = []
-        for k, v in headers.items():
-            lower_key = k.lower()
-            if lower_key.startswith('x-oss-'):
-                canon_headers.append((lower_key, v))
-
-        canon_headers.sort(key=lambda x: x[0])
-
-        if canon_headers:
-            return '\n'.join(k + ':' + v for k, v in canon_headers) + '\n'
-        else:
-            return ''
-
     def __get_resource_string(self, req, bucket_name, key):
         if not bucket_name:
             return '/' + self.__get_subresource_string(req.params)
@@ -173,52 +143,43 @@ class ProviderAuth(AuthBase):
         if not params:
             return ''
 
-        subresource_params = []
-        for key, value in params.items():
-            if key in self._subresource_key_set:
-                subresource_params.append((key, value))
-
-        subresource_params.sort(key=lambda e: e[0])
+        subresource_key_set = self._subresource_key_set
+        subresource_params = sorted((k, v) for k, v in params.items() if k in subresource_key_set)
 
         if subresource_params:
-            return '?' + '&'.join(self.__param_to_query(k, v) for k, v in subresource_params)
+            return '?' + '&'.join(k + '=' + v if v else k for k, v in subresource_params)
         else:
             return ''
 
-    def __param_to_query(self, k, v):
-        if v:
-            return k + '=' + v
-        else:
-            return k
-
     def __get_bytes_to_sign(self, req, bucket_name, key):
-        resource_bytes = self.__get_resource_string(req, bucket_name, key).encode('utf-8')
-        headers_bytes = self.__get_headers_bytes(req)
-
-        content_md5 = req.headers.get('content-md5', '').encode('utf-8')
-        content_type = req.headers.get('content-type', '').encode('utf-8')
-        date = req.headers.get('x-oss-date', '').encode('utf-8') or req.headers.get('date', '').encode('utf-8')
-        return b'\n'.join([req.method.encode('utf-8'),
-                          content_md5,
-                          content_type,
-                          date,
-                          headers_bytes + resource_bytes])
-
-    def __get_headers_bytes(self, req):
-        headers = req.headers
-        canon_headers = []
-        for k, v in headers.items():
-            lower_key = k.lower()
-            if lower_key.startswith('x-oss-'):
-                canon_headers.append((lower_key, v))
+        """一次遍历headers得到待签名的bytes。"""
+        content_md5 = ''
+        content_type = ''
+        date = ''
+        oss_date = ''
+        oss_headers = []
+
+        for k, v in _lower_items(req.headers):
+            if k.startswith('x-oss-'):
+                oss_headers.append((k, v))
+                if k == 'x-oss-date':
+                    oss_date = v
+            elif k == 'content-md5':
+                content_md5 = v
+            elif k == 'content-type':
+                content_type = v
+            elif k == 'date':
+                date = v
+
+        oss_headers.sort(key=lambda x: x[0])
+
+        return b'\n'.join([to_bytes(req.method),
+                           to_bytes(content_md5),
+                           to_bytes(content_type),
+                           to_bytes(oss_date or date),
+                           b''.join(to_bytes(k) + b':' + to_bytes(v) + b'\n' for k, v in oss_headers) +
+                           to_bytes(self.__get_resource_string(req, bucket_name, key))])
 
-        canon_headers.sort(key=lambda x: x[0])
-
-        if canon_headers:
-            return b'\n'.join(to_bytes(k) + b':' + to_bytes(v) for k, v in canon_headers) + b'\n'
-        else:
-            return b''
-    
     def auth_version(self):
         return AUTH_VERSION_1        
 
@@ -286,6 +247,14 @@ class StsAuth(object):
 
 
 
+def _lower_items(headers):
+    """返回(小写的header名, 值)。requests的CaseInsensitiveDict已经保存了小写的header名，不必再逐个转换。"""
+    lower_items = getattr(headers, 'lower_items', None)
+    if lower_items is not None:
+        return lower_items()
+    return ((k.lower(), v) for k, v in headers.items())
+
+
 def _param_to_quoted_query(k, v):
     if v:
         return urlquote(k, '') + '=' + urlquote(v, '')
@@ -294,22 +263,8 @@ def _param_to_quoted_query(k, v):
 
 
 def v2_uri_encode(raw_text):
-    raw_text = to_bytes(raw_text)
-
-    res = ''
-    for b in raw_text:
-        if isinstance(b, int):
-            c = chr(b)
-        else:
-            c = b
-
-        if (c >= 'A' and c <= 'Z') or (c >= 'a' and c <= 'z')\
-            or (c >= '0' and c <= '9') or c in ['_', '-', '~', '.']:
-            res += c
-        else:
-            res += "%{0:02X}".format(ord(c))
-
-    return res
+    """除字母、数字及 `_-~.` 外全部按 %XX 转义。"""
+    return urlquote(to_bytes(raw_text), safe='_-~.')
 
 
 _DEFAULT_ADDITIONAL_HEADERS = set(['range',
@@ -390,116 +345,68 @@ class ProviderAuthV2(AuthBase):
         return req.url + '?' + '&'.join(_param_to_quoted_query(k, v) for k, v in req.params.items())
 
     def __make_signature(self, req, bucket_name, key, additional_headers, credentials):
-        if is_py2:
-            string_to_sign = self.__get_string_to_sign(req, bucket_name, key, additional_headers)
-        else:
-            string_to_sign = self.__get_bytes_to_sign(req, bucket_name, key, additional_headers)
+        bytes_to_sign = self.__get_bytes_to_sign(req, bucket_name, key, additional_headers)
 
-        logger.debug('Make signature: string to be signed = {0}'.format(string_to_sign))
+        logger.debug('Make signature: string to be signed = {0}'.format(bytes_to_sign))
 
-        h = hmac.new(to_bytes(credentials.get_access_key_secret()), to_bytes(string_to_sign), hashlib.sha256)
+        h = hmac.new(to_bytes(credentials.get_access_key_secret()), bytes_to_sign, hashlib.sha256)
         return utils.b64encode_as_string(h.digest())
 
     def __get_additional_headers(self, req, in_additional_headers):
         # we add a header into additional_headers only if it is already in req's headers.
 
         additional_headers = set(h.lower() for h in in_additional_headers)
-        keys_in_header = set(k.lower() for k in req.headers.keys())
+        keys_in_header = set(k for k, v in _lower_items(req.headers))
 
         return additional_headers & keys_in_header
 
-    def __get_string_to_sign(self, req, bucket_name, key, additional_header_list):
-        verb = req.method
-        content_md5 = req.headers.get('content-md5', '')
-        content_type = req.headers.get('content-type', '')
-        date = req.headers.get('date', '')
-
-        canonicalized_oss_headers = self.__get_canonicalized_oss_headers(req, additional_header_list)
-        additional_headers = ';'.join(sorted(additional_header_list))
-        canonicalized_resource = self.__get_resource_string(req, bucket_name, key)
-
-        return verb + '\n' +\
-            content_md5 + '\n' +\
-            content_type + '\n' +\
-            date + '\n' +\
-            canonicalized_oss_headers +\
-            additional_headers + '\n' +\
-            canonicalized_resource
-
     def __get_resource_string(self, req, bucket_name, key):
         if bucket_name:
             encoded_uri = v2_uri_encode('/' + bucket_name + '/' + key)
         else:
-            encoded_uri = v2_uri_encode('/')
+            encoded_uri = '%2F'
 
-        logger.info('encoded_uri={0} key={1}'.format(encoded_uri, key))
+        logger.debug('encoded_uri={0} key={1}'.format(encoded_uri, key))
 
         return encoded_uri + self.__get_canonalized_query_string(req)
 
     def __get_canonalized_query_string(self, req):
-        encoded_params = {}
-        for param, value in req.params.items():
-            encoded_params[v2_uri_encode(param)] = v2_uri_encode(value)
-
-        if not encoded_params:
+        if not req.params:
             return ''
 
-        sorted_params = sorted(encoded_params.items(), key=lambda e: e[0])
-        return '?' + '&'.join(self.__param_to_query(k, v) for k, v in sorted_params)
+        encoded_params = sorted((v2_uri_encode(k), v2_uri_encode(v)) for k, v in req.params.items())
+        return '?' + '&'.join(k + '=' + v if v else k for k, v in encoded_params)
 
-    def __param_to_query(self, k, v):
-        if v:
-            return k + '=' + v
-        else:
-            return k
+    def __get_bytes_to_sign(self, req, bucket_name, key, additional_header_list):
+        """一次遍历headers得到待签名的bytes。
 
-    def __get_canonicalized_oss_headers(self, req, additional_headers):
-        """
-        :param additional_headers: 小写的headers列表, 并且这些headers都不以'x-oss-'为前缀.
+        :param additional_header_list: 小写的headers列表, 并且这些headers都不以'x-oss-'为前缀.
         """
+        content_md5 = ''
+        content_type = ''
+        date = ''
         canon_headers = []
 
-        for k, v in req.headers.items():
-            lower_key = k.lower()
-            if lower_key.startswith('x-oss-') or lower_key in additional_headers:
-                canon_headers.append((lower_key, v))
+        for k, v in _lower_items(req.headers):
+            if k.startswith('x-oss-') or k in additional_header_list:
+                canon_headers.append((k, v))
 
-        canon_headers.sort(key=lambda x: x[0])
-
-        return ''.join(v[0] + ':' + v[1] + '\n' for v in canon_headers)
-
-    def __get_bytes_to_sign(self, req, bucket_name, key, additional_header_list):
-        verb = req.method.encode('utf-8')
-        content_md5 = req.headers.get('content-md5', '').encode('utf-8')
-        content_type = req.headers.get('content-type', '').encode('utf-8')
-        date = req.headers.get('date', '').encode('utf-8')
-
-        canonicalized_oss_headers = self.__get_canonicalized_oss_headers_bytes(req, additional_header_list)
-        additional_headers = ';'.join(sorted(additional_header_list)).encode('utf-8')
-        canonicalized_resource = self.__get_resource_string(req, bucket_name, key).encode('utf-8')
-
-        return verb + b'\n' +\
-            content_md5 + b'\n' +\
-            content_type + b'\n' +\
-            date + b'\n' +\
-            canonicalized_oss_headers +\
-            additional_headers + b'\n' +\
-            canonicalized_resource
-
-    def __get_canonicalized_oss_headers_bytes(self, req, additional_headers):
-        """
-        :param additional_headers: 小写的headers列表, 并且这些headers都不以'x-oss-'为前缀.
-        """
-        canon_headers = []
-
-        for k, v in req.headers.items():
-            lower_key = k.lower()
-            if lower_key.startswith('x-oss-') or lower_key in additional_headers:
-                canon_headers.append((lower_key, v))
+            if k == 'content-md5':
+                content_md5 = v
+            elif k == 'content-type':
+                content_type = v
+            elif k == 'date':
+                date = v
 
         canon_headers.sort(key=lambda x: x[0])
 
-        return b''.join(to_bytes(v[0]) + b':' + to_bytes(v[1]) + b'\n' for v in canon_headers)
+        return b'\n'.join([to_bytes(req.method),
+                           to_bytes(content_md5),
+                           to_bytes(content_type),
+                           to_bytes(date),
+                           b''.join(to_bytes(k) + b':' + to_bytes(v) + b'\n' for k, v in canon_headers) +
+                           to_bytes(';'.join(sorted(additional_header_list))),
+                           to_bytes(self.__get_resource_string(req, bucket_name, key))])
 
     def auth_version(self):
         return AUTH_VERSION_2
@@ -520,6 +427,28 @@ class ProviderAuthV4(AuthBase):
     1. v4 签名规则引入了scope概念，SignToString(待签名串) 和 SigningKey （签名密钥）都需要包含 region信息
     2. 资源路径里的 / 不做转义。   query里的 / 需要转义为 %2F
     """
+    def __init__(self, credentials_provider):
+        super(ProviderAuthV4, self).__init__(credentials_provider)
+
+        # 签名密钥只与AccessKeySecret、日期、region、product有关，缓存起来避免每个请求都计算四次HMAC。
+        # AccessKeySecret变化（如STS凭证轮换）时清空缓存
+        self.__signing_keys = {}
+        self.__signing_secret = None
+        self.__signing_lock = threading.Lock()
+
+    def __getstate__(self):
+        # 锁不能被pickle，签名密钥缓存也不需要带到别的进程
+        state = self.__dict__.copy()
+        for name in ('_ProviderAuthV4__signing_keys', '_ProviderAuthV4__signing_secret', '_ProviderAuthV4__signing_lock'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__signing_keys = {}
+        self.__signing_secret = None
+        self.__signing_lock = threading.Lock()
+
     def _sign_request(self, req, bucket_name, key, in_additional_headers=None):
         """把authorization放入req的header里面
 
@@ -626,11 +555,16 @@ class ProviderAuthV4(AuthBase):
         return headers
 
     def __get_canonical_uri(self, bucket_name, key):
-        if bucket_name:
-            encoded_uri = '/' + bucket_name + '/' + key
-        else:
-            encoded_uri = '/'
-        return self.__v4_uri_encode(encoded_uri, True)
+        if not bucket_name:
+            return '/'
+
+        # 热点文件的canonical uri会被反复计算，用LRU缓存
+        cache_key = (bucket_name, key)
+        encoded_uri = _v4_canonical_uri_cache.get(cache_key)
+        if encoded_uri is None:
+            encoded_uri = self.__v4_uri_encode('/' + bucket_name + '/' + key, True)
+            _v4_canonical_uri_cache.put(cache_key, encoded_uri)
+        return encoded_uri
 
     def __param_to_query(self, k, v):
         if v:
@@ -664,8 +598,7 @@ class ProviderAuthV4(AuthBase):
 
     def __get_canonical_headers(self, req, additional_headers):
         canon_headers = []
-        for k, v in req.headers.items():
-            lower_key = k.lower()
+        for lower_key, v in _lower_items(req.headers):
             if self.__is_sign_header(lower_key, additional_headers):
                 canon_headers.append((lower_key, v))
         canon_headers.sort(key=lambda x: x[0])
@@ -673,8 +606,7 @@ class ProviderAuthV4(AuthBase):
     
     def __get_canonical_headers_bytes(self, req, additional_headers):
         canon_headers = []
-        for k, v in req.headers.items():
-            lower_key = k.lower()
+        for lower_key, v in _lower_items(req.headers):
             if self.__is_sign_header(lower_key, additional_headers):
                 canon_headers.append((lower_key, v))
         canon_headers.sort(key=lambda x: x[0])
@@ -731,36 +663,55 @@ class ProviderAuthV4(AuthBase):
 
     def __get_signing_key(self, req, credentials, date_time):
         date = date_time[:8]
-        key_secret = 'aliyun_v4'+credentials.get_access_key_secret()
-        signing_date = hmac.new(to_bytes(key_secret), to_bytes(date), hashlib.sha256)
-        signing_region = hmac.new(signing_date.digest(), to_bytes(self.__get_region(req)), hashlib.sha256)
-        signing_product = hmac.new(signing_region.digest(), to_bytes(self.__get_product(req)), hashlib.sha256)
-        signing_key = hmac.new(signing_product.digest(), to_bytes('aliyun_v4_request'), hashlib.sha256)
-        return signing_key.digest()
+        secret = credentials.get_access_key_secret()
+        cache_key = (date, self.__get_region(req), self.__get_product(req))
 
-    def __v4_uri_encode(self, raw_text, ignoreSlashes):
-        raw_text = to_bytes(raw_text)
+        with self.__signing_lock:
+            if secret != self.__signing_secret:
+                self.__signing_keys.clear()
+                self.__signing_secret = secret
+
+            signing_key = self.__signing_keys.get(cache_key)
+            if signing_key is not None:
+                return signing_key
+
+        signing_key = _make_v4_signing_key(secret, *cache_key)
 
-        res = ''
-        for b in raw_text:
-            if isinstance(b, int):
-                c = chr(b)
-            else:
-                c = b
+        with self.__signing_lock:
+            if secret == self.__signing_secret:
+                if len(self.__signing_keys) >= _V4_SIGNING_KEY_CACHE_SIZE:
+                    self.__signing_keys.clear()
+                self.__signing_keys[cache_key] = signing_key
 
-            if (c >= 'A' and c <= 'Z') or (c >= 'a' and c <= 'z')\
-                or (c >= '0' and c <= '9') or c in ['_', '-', '~', '.']:
-                res += c
-            elif ignoreSlashes is True and  c == '/':
-                res += c
-            else:
-                res += "%{0:02X}".format(ord(c))
+        return signing_key
 
-        return res
+    def __v4_uri_encode(self, raw_text, ignoreSlashes):
+        return _v4_uri_encode(raw_text, ignoreSlashes)
 
     def auth_version(self):
         return AUTH_VERSION_4
 
+_V4_SIGNING_KEY_CACHE_SIZE = 64
+
+_v4_canonical_uri_cache = utils._LruCache(1024)
+
+
+def _make_v4_signing_key(secret, date, region, product):
+    signing_date = hmac.new(to_bytes('aliyun_v4' + secret), to_bytes(date), hashlib.sha256)
+    signing_region = hmac.new(signing_date.digest(), to_bytes(region), hashlib.sha256)
+    signing_product = hmac.new(signing_region.digest(), to_bytes(product), hashlib.sha256)
+    signing_key = hmac.new(signing_product.digest(), to_bytes('aliyun_v4_request'), hashlib.sha256)
+    return signing_key.digest()
+
+
+def _v4_uri_encode(raw_text, ignore_slashes):
+    """除字母、数字及 `_-~.` 外全部按 %XX 转义， `ignore_slashes` 为True时 `/` 也不转义。
+
+    urlquote内部对每个字节查表转义，比逐个字符拼接快得多。
+    """
+    return urlquote(to_bytes(raw_text), safe='_-~./' if ignore_slashes else '_-~.')
+
+
 class AuthV4(ProviderAuthV4):
     """签名版本4，与版本2的区别在：
     1. v4 签名规则引入了scope概念，SignToString(待签名串) 和 SigningKey （签名密钥）都需要包含 region信息
@@ -1,4 +1,5 @@
 import sys
+import threading
 
 #-----------------------------------------------------------------------------
 # Some code below reference to crcmod which base on python2 version
@@ -46,17 +47,129 @@ def mkCombineFun(poly, initCrc=~long(0), rev=True, xorOut=0):
         poly = long(poly) & mask
 
 
-    if sizeBits == 64:
-        fun = _combine64
-    else:
+    if sizeBits != 64:
         raise NotImplemented
 
+    combiner = _get_combiner(poly, rev)
+    init = initCrc
+
     def combine_fun(crc1, crc2, len2):
-        return fun(poly, initCrc ^ xorOut, rev, xorOut, crc1, crc2, len2)
+        if len2 == 0:
+            return crc1
+        return combiner.shift(crc1 ^ init, len2) ^ crc2
 
     return combine_fun
 
 
+#-----------------------------------------------------------------------------
+# 基于缓存的CRC64合并。
+#
+# 合并crc1与crc2，相当于把crc1经过len2个0字节的运算后再与crc2异或，该运算是GF(2)上的一个64x64的线性变换。
+# _combine64每次调用都要从1个bit的变换开始反复平方矩阵，计算量与log(len2)成正比，且每次平方都需要64次矩阵乘向量。
+#
+# _Combiner对每个多项式只计算一次2^k个0字节对应的变换，并把变换展开为8张256项的查找表，应用一次变换只需要8次查表；
+# 对同一个len2（例如分片上传时大小相同的分片），还会缓存合成后的变换，此时一次合并只需要8次查表。
+
+_MAX_CACHED_LENGTHS = 64
+
+
+class _Combiner(object):
+    def __init__(self, poly, rev):
+        odd = [0] * GF2_DIM
+        if rev:
+            odd[0] = poly
+            row = 1
+            for n in xrange(1, GF2_DIM):
+                odd[n] = row
+                row <<= 1
+        else:
+            row = 2
+            for n in xrange(0, GF2_DIM - 1):
+                odd[n] = row
+                row <<= 1
+            odd[GF2_DIM - 1] = poly
+
+        # 1个0字节（8个0 bit）对应的变换
+        mat = odd
+        for i in xrange(3):
+            square = [0] * GF2_DIM
+            gf2_matrix_square(square, mat)
+            mat = square
+
+        self.__last_power = mat
+        self.__power_tables = [_make_tables(mat)]
+        self.__length_tables = {}
+        self.__lock = threading.Lock()
+
+    def shift(self, crc, length):
+        """对crc应用length个0字节对应的变换。"""
+        tables = self.__length_tables.get(length)
+        if tables is not None:
+            return _apply_tables(tables, crc)
+
+        with self.__lock:
+            self.__ensure_powers(length.bit_length())
+
+            # 通过对64个单位向量应用变换，得到合成后的矩阵，进而得到查找表
+            columns = [self.__shift_by_powers(long(1) << n, length) for n in xrange(GF2_DIM)]
+            tables = _make_tables(columns)
+
+            if len(self.__length_tables) >= _MAX_CACHED_LENGTHS:
+                self.__length_tables.clear()
+            self.__length_tables[length] = tables
+
+        return _apply_tables(tables, crc)
+
+    def __shift_by_powers(self, crc, length):
+        k = 0
+        while length:
+            if length & 1:
+                crc = _apply_tables(self.__power_tables[k], crc)
+            length >>= 1
+            k += 1
+        return crc
+
+    def __ensure_powers(self, count):
+        while len(self.__power_tables) < count:
+            square = [0] * GF2_DIM
+            gf2_matrix_square(square, self.__last_power)
+            self.__last_power = square
+            self.__power_tables.append(_make_tables(square))
+
+
+def _make_tables(mat):
+    """把矩阵展开为8张表，第i张表的第b项为矩阵乘以 (b << 8*i) 的结果。"""
+    tables = []
+    for i in xrange(8):
+        columns = mat[i * 8:(i + 1) * 8]
+        table = [0] * 256
+        for b in xrange(1, 256):
+            low = b & -b
+            table[b] = table[b ^ low] ^ columns[low.bit_length() - 1]
+        tables.append(table)
+    return tables
+
+
+def _apply_tables(tables, crc):
+    t0, t1, t2, t3, t4, t5, t6, t7 = tables
+    return (t0[crc & 0xff] ^ t1[(crc >> 8) & 0xff] ^ t2[(crc >> 16) & 0xff] ^ t3[(crc >> 24) & 0xff] ^
+            t4[(crc >> 32) & 0xff] ^ t5[(crc >> 40) & 0xff] ^ t6[(crc >> 48) & 0xff] ^ t7[(crc >> 56) & 0xff])
+
+
+_combiners = {}
+_combiners_lock = threading.Lock()
+
+
+def _get_combiner(poly, rev):
+    key = (poly, rev)
+    with _combiners_lock:
+        combiner = _combiners.get(key)
+        if combiner is None:
+            combiner = _Combiner(poly, rev)
+            _combiners[key] = combiner
+        return combiner
+
+
 #-----------------------------------------------------------------------------
 # The below code implemented crc64 combine logic, the algorithm reference to aliyun-oss-ruby-sdk
 # See more details please visist:
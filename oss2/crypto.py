@@ -7,25 +7,25 @@ oss2.encryption
 该模块包含了客户端加解密相关的函数和类。
 """
 import abc
+import collections
 import hashlib
 import json
 import os
 import copy
 import logging
 import struct
+import threading
+import time
 from functools import partial
 
 import six
 from Crypto.Cipher import PKCS1_OAEP, PKCS1_v1_5
 from Crypto.PublicKey import RSA
-from aliyunsdkcore import client
-from aliyunsdkcore.acs_exception.exceptions import ServerException, ClientException
-from aliyunsdkcore.http import format_type, method_type
-from aliyunsdkkms.request.v20160120 import GenerateDataKeyRequest, DecryptRequest, EncryptRequest
 
 from . import models
 from . import headers
 from . import utils
+from . import defaults
 from .utils import b64decode_from_string, b64encode_as_string
 from .compat import to_bytes, to_unicode
 from .exceptions import ClientError, OpenApiFormatError, OpenApiServerError
@@ -59,10 +59,86 @@ class EncryptionMaterials(object):
             self.desc[key] = descriptions[key]
 
 
+class DataKeyCache(object):
+    """已解密的数据密钥（及IV）的缓存，线程安全。
+
+    以加密后的密钥为键，缓存解密（unwrap）后的结果。这样分片上传的每个分片、范围下载的每个请求就不必都做一次
+    RSA私钥运算或者KMS调用。缓存按LRU淘汰，最多 `max_size` 项；每项最多保留 `ttl` 秒。
+
+    :param int max_size: 最多缓存的项数，缺省为 `defaults.data_key_cache_size`
+    :param float ttl: 每项的最长缓存时间（秒），缺省为 `defaults.data_key_cache_ttl`
+    :param bool zeroise: 为True时，淘汰或者清空缓存时把缓存中的密钥覆写为0
+    """
+
+    def __init__(self, max_size=None, ttl=None, zeroise=False):
+        self.max_size = defaults.get(max_size, defaults.data_key_cache_size)
+        self.ttl = defaults.get(ttl, defaults.data_key_cache_ttl)
+        self.zeroise = zeroise
+
+        #: 命中次数
+        self.hits = 0
+
+        #: 未命中次数
+        self.misses = 0
+
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, key):
+        """返回缓存的值，没有或者已经过期时返回None。"""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] < time.time():
+                self.__evict(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            # 移到末尾，按LRU淘汰
+            del self.__entries[key]
+            self.__entries[key] = entry
+
+        value = entry[1]
+        return bytes(value) if isinstance(value, bytearray) else value
+
+    def put(self, key, value):
+        if self.zeroise and isinstance(value, bytes):
+            # bytes不可修改，存成bytearray才能在淘汰时覆写
+            value = bytearray(value)
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__evict(key)
+            self.__entries[key] = (time.time() + self.ttl, value)
+
+            while len(self.__entries) > self.max_size:
+                self.__evict(next(iter(self.__entries)))
+
+    def clear(self):
+        """清空缓存。"""
+        with self.__lock:
+            for key in list(self.__entries):
+                self.__evict(key)
+
+    def __evict(self, key):
+        value = self.__entries.pop(key)[1]
+        if self.zeroise and isinstance(value, bytearray):
+            value[:] = b'\x00' * len(value)
+
+
 @six.add_metaclass(abc.ABCMeta)
 class BaseCryptoProvider(object):
     """CryptoProvider 基类，提供基础的数据加密解密adapter
 
+    解密后的数据密钥缓存在 `data_key_cache` 中（参见 :class:`DataKeyCache` ），可以替换成自定义参数的缓存，
+    设为None则不缓存。
+
     """
 
     def __init__(self, cipher, mat_desc=None):
@@ -73,6 +149,7 @@ class BaseCryptoProvider(object):
         self.wrap_alg = None
         self.mat_desc = None
         self.encryption_materials_dict = {}
+        self.data_key_cache = DataKeyCache()
         if mat_desc:
             if isinstance(mat_desc, dict):
                 self.mat_desc = mat_desc
@@ -88,10 +165,15 @@ class BaseCryptoProvider(object):
 
     @staticmethod
     def make_encrypt_adapter(stream, cipher):
+        # CTR模式可以按偏移批量加解密，不必按调用者读取的大小逐块处理
+        if isinstance(cipher, utils.AESCTRCipher):
+            return utils.make_ctr_cipher_adapter(stream, cipher)
         return utils.make_cipher_adapter(stream, partial(cipher.encrypt))
 
     @staticmethod
     def make_decrypt_adapter(stream, cipher, discard=0):
+        if isinstance(cipher, utils.AESCTRCipher):
+            return utils.make_ctr_cipher_adapter(stream, cipher, discard)
         return utils.make_cipher_adapter(stream, partial(cipher.decrypt), discard)
 
     @abc.abstractmethod
@@ -106,6 +188,25 @@ class BaseCryptoProvider(object):
     def reset_encryption_materials(self, encryption_materials):
         pass
 
+    def _unwrap_key(self, encrypted_key):
+        return self.__unwrap('key', self.decrypt_encrypted_key, encrypted_key)
+
+    def _unwrap_iv(self, encrypted_iv, *args):
+        return self.__unwrap('iv', self.decrypt_encrypted_iv, encrypted_iv, *args)
+
+    def __unwrap(self, kind, decrypt, encrypted, *args):
+        # 自定义的provider可能没有调用基类的__init__
+        cache = getattr(self, 'data_key_cache', None)
+        if cache is None:
+            return decrypt(encrypted, *args)
+
+        key = (self.wrap_alg, kind, encrypted) + args
+        plain = cache.get(key)
+        if plain is None:
+            plain = decrypt(encrypted, *args)
+            cache.put(key, plain)
+        return plain
+
     def adjust_range(self, start, end):
         return self.cipher.adjust_range(start, end)
 
@@ -259,8 +360,10 @@ class RsaProvider(BaseCryptoProvider):
             raise ClientError(str(e))
 
     def reset_encryption_materials(self, encryption_materials):
-        return RsaProvider(encryption_materials.key_pair, encryption_materials.passphrase, self.cipher,
-                           encryption_materials.desc)
+        provider = RsaProvider(encryption_materials.key_pair, encryption_materials.passphrase, self.cipher,
+                               encryption_materials.desc)
+        provider.data_key_cache = self.data_key_cache
+        return provider
 
     def create_content_material(self):
         plain_key = self.get_key()
@@ -312,6 +415,9 @@ class AliKMSProvider(BaseCryptoProvider):
         self.custom_master_key_id = cmk_id
         self.sts_token = sts_token
         self.context = '{"x-passphrase":"' + passphrase + '"}' if passphrase else ''
+
+        # KMS SDK导入较慢，只在用到时才导入
+        from aliyunsdkcore import client
         self.kms_client = client.AcsClient(access_key_id, access_key_secret, region)
 
     def get_key(self):
@@ -348,6 +454,9 @@ class AliKMSProvider(BaseCryptoProvider):
         return content_crypto_material
 
     def __generate_data_key(self):
+        from aliyunsdkcore.http import format_type, method_type
+        from aliyunsdkkms.request.v20160120 import GenerateDataKeyRequest
+
         req = GenerateDataKeyRequest.GenerateDataKeyRequest()
 
         req.set_accept_format(format_type.JSON)
@@ -365,6 +474,9 @@ class AliKMSProvider(BaseCryptoProvider):
         return b64decode_from_string(resp['Plaintext']), resp['CiphertextBlob']
 
     def __encrypt_data(self, data):
+        from aliyunsdkcore.http import format_type, method_type
+        from aliyunsdkkms.request.v20160120 import EncryptRequest
+
         req = EncryptRequest.EncryptRequest()
 
         req.set_accept_format(format_type.JSON)
@@ -380,6 +492,9 @@ class AliKMSProvider(BaseCryptoProvider):
         return resp['CiphertextBlob']
 
     def __decrypt_data(self, data):
+        from aliyunsdkcore.http import format_type, method_type
+        from aliyunsdkkms.request.v20160120 import DecryptRequest
+
         req = DecryptRequest.DecryptRequest()
 
         req.set_accept_format(format_type.JSON)
@@ -393,6 +508,7 @@ class AliKMSProvider(BaseCryptoProvider):
         return resp['Plaintext']
 
     def __do(self, req):
+        from aliyunsdkcore.acs_exception.exceptions import ServerException, ClientException
 
         try:
             body = self.kms_client.do_action_with_exception(req)
@@ -45,6 +45,8 @@ class CryptoBucket(Bucket):
 
     :param bool enable_crc: 如果开启crc校验则设为True；反之，则为False
 
+    :param retry_policy: 重试策略。如果是None表示不重试
+    :type retry_policy: oss2.RetryPolicy
     """
 
     def __init__(self, auth, endpoint, bucket_name, crypto_provider,
@@ -56,7 +58,8 @@ class CryptoBucket(Bucket):
                  proxies=None,
                  region=None,
                  cloudbox_id=None,
-                 is_path_style=False
+                 is_path_style=False,
+                 retry_policy=None
                  ):
 
         if not isinstance(crypto_provider, BaseCryptoProvider):
@@ -64,7 +67,8 @@ class CryptoBucket(Bucket):
 
         logger.debug("Init CryptoBucket: {0}".format(bucket_name))
         super(CryptoBucket, self).__init__(auth, endpoint, bucket_name, is_cname, session, connect_timeout, app_name,
-                                           enable_crc, proxies=proxies, region=region, cloudbox_id=cloudbox_id, is_path_style= is_path_style)
+                                           enable_crc, proxies=proxies, region=region, cloudbox_id=cloudbox_id, is_path_style= is_path_style,
+                                           retry_policy=retry_policy)
 
         self.crypto_provider = crypto_provider
         self.upload_contexts = {}
@@ -189,12 +193,16 @@ class CryptoBucket(Bucket):
         logger.debug(
             "Start to get object from CryptoBucket: {0}, key: {1}, range: {2}, headers: {3}, params: {4}".format(
                 self.bucket_name, to_string(key), range_string, headers, params))
-        resp = self._do('GET', self.bucket_name, key, headers=headers, params=params)
+        resp = self._do('GET', self.bucket_name, key, headers=headers, params=params, operation='get_object')
         logger.debug("Get object done, req_id: {0}, status_code: {1}".format(resp.request_id, resp.status))
 
         return GetObjectResult(resp, progress_callback, self.enable_crc, crypto_provider=self.crypto_provider,
                                discard=discard)
 
+    def get_object_parallel(self, key, buffer=None, part_size=None, num_threads=None, stream=False,
+                            max_buffered_parts=None, progress_callback=None, headers=None, params=None):
+        raise ClientError("The operation is not support for CryptoBucket now")
+
     def get_object_with_url(self, sign_url,
                             byte_range=None,
                             headers=None,
@@ -241,7 +249,7 @@ class CryptoBucket(Bucket):
         logger.debug(
             "Start to get object with url from CryptoBucket: {0}, sign_url: {1}, range: {2}, headers: {3}".format(
                 self.bucket_name, sign_url, range_string, headers))
-        resp = self._do_url('GET', sign_url, headers=headers)
+        resp = self._do_url('GET', sign_url, headers=headers, operation='get_object_with_url')
         return GetObjectResult(resp, progress_callback, self.enable_crc,
                                crypto_provider=self.crypto_provider, discard=discard)
 
@@ -326,8 +334,8 @@ class CryptoBucket(Bucket):
 
         headers = content_crypto_material.to_object_meta(headers, context)
 
-        plain_key = self.crypto_provider.decrypt_encrypted_key(content_crypto_material.encrypted_key)
-        plain_iv = self.crypto_provider.decrypt_encrypted_iv(content_crypto_material.encrypted_iv)
+        plain_key = self.crypto_provider._unwrap_key(content_crypto_material.encrypted_key)
+        plain_iv = self.crypto_provider._unwrap_iv(content_crypto_material.encrypted_iv)
 
         offset = context.part_size * (part_number - 1)
         counter = self.crypto_provider.cipher.calc_offset(offset)
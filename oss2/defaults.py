@@ -8,6 +8,8 @@ oss2.defaults
 
 """
 
+import os
+
 
 def get(value, default_value):
     if value is None:
@@ -37,9 +39,30 @@ max_part_count = 10000
 #: 最小分片大小
 min_part_size = 100 * 1024
 
-#: 每个Session连接池大小
+#: 每个Session连接池大小。并发接口（如断点续传、并行下载）会按其线程数自动扩大连接池
 connection_pool_size = 10
 
+#: 连接池中空闲连接的最长保留时间（秒）。应小于服务端的keep-alive超时，避免复用已被服务端关闭的连接
+connection_idle_timeout = 30
+
+#: 客户端加密时，缓存的已解密数据密钥（及IV）的最大个数
+data_key_cache_size = 1024
+
+#: 客户端加密时，已解密数据密钥（及IV）的缓存时间（秒）
+data_key_cache_ttl = 300
+
+#: 迭代读取响应体（如 `GetObjectResult` ）时每块的缺省字节数，可以通过各对象的 `chunk_size` 属性单独设置
+read_chunk_size = 8 * 1024
+
+#: 客户端加密（AES-CTR）时，每次批量读入并加解密的字节数
+cipher_batch_size = 1024 * 1024
+
+#: 客户端加密（AES-CTR）时，加解密一段数据最多使用的线程数，为1时不使用线程池。缺省不超过CPU核数
+cipher_num_threads = min(4, getattr(os, 'cpu_count', lambda: None)() or 1)
+
+#: 客户端加密（AES-CTR）时，拆分给每个线程的最少字节数，数据小于该值的两倍时不拆分
+cipher_parallel_part_size = 256 * 1024
+
 
 #: 对于断点下载，如果OSS文件大小大于该值就进行并行下载（multiget）
 multiget_threshold = 100 * 1024 * 1024
@@ -49,3 +72,6 @@ multiget_num_threads = 4
 
 #: 并行下载（multiget）的缺省分片大小
 multiget_part_size = 10 * 1024 * 1024
+
+#: 批量删除（bulk_delete）缺省并发数
+bulk_delete_num_threads = 4
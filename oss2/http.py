@@ -9,14 +9,22 @@ oss2.http
 """
 
 import platform
+import threading
+import time
+import functools
 
 import requests
 from requests.structures import CaseInsensitiveDict
+from requests.packages.urllib3 import connectionpool
+from requests.packages.urllib3 import exceptions as urllib3_exceptions
 
 from . import __version__, defaults
 from .compat import to_bytes
 from .exceptions import RequestError
-from .utils import file_object_remaining_bytes, SizedFileAdapter
+from .retry import RetryBudget
+from . import instrumentation
+from .instrumentation import _body_size, _clock
+from .utils import file_object_remaining_bytes, SizedFileAdapter, _byte_view, _iter_views
 
 import logging
 
@@ -27,33 +35,312 @@ logger = logging.getLogger(__name__)
 
 
 class Session(object):
-    """属于同一个Session的请求共享一组连接池，如有可能也会重用HTTP连接。"""
+    """属于同一个Session的请求共享一组连接池，如有可能也会重用HTTP连接。
 
-    def __init__(self, pool_size=None, adapter=None):
+    同一个Session上的请求还共享一个重试预算 `retry_budget` ，参见 :class:`RetryPolicy <oss2.RetryPolicy>` 。
+
+    没有指定 `pool_size` 时，连接池大小从 `defaults.connection_pool_size` 开始，断点续传、并行下载、批量删除等
+    并发接口会通过 :func:`ensure_pool_size` 把它扩大到各自的线程数，避免线程数大于连接池时反复新建、丢弃连接。
+
+    :param int pool_size: 连接池大小。指定后不再自动扩大
+    :param adapter: 自定义的requests HTTPAdapter。指定后 `pool_size` 、 `idle_timeout` 不起作用，也没有连接池统计
+    :param retry_budget: 重试预算
+    :param idle_timeout: 空闲连接的最长保留时间（秒），超过后在下次取用前关闭并重建。缺省为
+        `defaults.connection_idle_timeout` ，为0表示不限制
+    :param instrumentation: 请求埋点，参见 :class:`Instrumentation <oss2.Instrumentation>` 。缺省为None，不做埋点
+    """
+
+    def __init__(self, pool_size=None, adapter=None, retry_budget=None, idle_timeout=None, instrumentation=None):
         self.session = requests.Session()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.instrumentation = instrumentation
+
+        #: 当前的连接池大小
+        self.pool_size = pool_size or defaults.connection_pool_size
+
+        self.__auto_size = pool_size is None and adapter is None
+        self.__lock = threading.Lock()
 
-        psize = pool_size or defaults.connection_pool_size
         if adapter is None:
-            self.session.mount('http://', requests.adapters.HTTPAdapter(pool_connections=psize, pool_maxsize=psize))
-            self.session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=psize, pool_maxsize=psize))
+            idle_timeout = defaults.get(idle_timeout, defaults.connection_idle_timeout)
+            self.__adapters = [_PoolAdapter(self.pool_size, idle_timeout), _PoolAdapter(self.pool_size, idle_timeout)]
+            self.session.mount('http://', self.__adapters[0])
+            self.session.mount('https://', self.__adapters[1])
         else:
+            self.__adapters = []
             self.session.mount('http://', adapter)
             self.session.mount('https://', adapter)
 
+    def ensure_pool_size(self, size):
+        """确保连接池至少能容纳 `size` 个连接，已经建立的连接池也会被扩大。
+
+        构造时指定了 `pool_size` 或 `adapter` 时不做任何事。
+        """
+        if not self.__auto_size or size <= self.pool_size:
+            return
+
+        with self.__lock:
+            if size <= self.pool_size:
+                return
+
+            logger.debug("Grow connection pool, from: {0}, to: {1}".format(self.pool_size, size))
+            self.pool_size = size
+            for adapter in self.__adapters:
+                adapter.resize(size)
+
+    def __getstate__(self):
+        # 锁不能被pickle，例如把Bucket传给multiprocessing的子进程时
+        state = self.__dict__.copy()
+        del state['_Session__lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def pool_stats(self):
+        """返回各个主机的连接池统计，形如 ``{'https://bucket.oss-cn-hangzhou.aliyuncs.com:443': stats}`` 。
+
+        其中stats是一个dict，包括：
+            - in_use：正被请求占用的连接数（流式读取的响应在读完或关闭之前一直占用连接）
+            - idle：池中可复用的空闲连接数
+            - created：累计新建的连接数
+            - discarded：累计丢弃的连接数，包括出错的、空闲超时的、以及因连接池已满而无法放回的连接
+            - maxsize：连接池大小
+        """
+        stats = {}
+        for adapter in self.__adapters:
+            stats.update(adapter.pool_stats())
+        return stats
+
+    def prewarm(self, url, count):
+        """预先与 `url` 所在的主机建立 `count` 个连接并放入连接池，避免首批请求承担建连（及TLS握手）的延时。
+
+        不经过代理。建连失败不抛出异常，返回实际建立的连接数。
+
+        :param str url: 目标地址，如 `bucket.endpoint` 或 ``'https://bucket-name.oss-cn-hangzhou.aliyuncs.com'``
+        :param int count: 连接数，超过连接池大小时会先扩大连接池
+        """
+        self.ensure_pool_size(count)
+
+        adapter = self.session.get_adapter(url)
+        if not isinstance(adapter, _PoolAdapter):
+            return 0
+
+        # 与发送请求时一样合并环境变量中的证书设置，否则会落到另一个连接池
+        settings = self.session.merge_environment_settings(url, {}, None, None, None)
+        return adapter.prewarm(url, count, settings['verify'], settings['cert'])
+
     def do_request(self, req, timeout):
-        try:
+        metrics = getattr(req, 'metrics', None)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Send request, method: {0}, url: {1}, params: {2}, headers: {3}, timeout: {4}, proxies: {5}".format(
                 req.method, req.url, req.params, req.headers, timeout, req.proxies))
-            return Response(self.session.request(req.method, req.url,
-                                                 data=req.data,
-                                                 params=req.params,
-                                                 headers=req.headers,
-                                                 stream=True,
-                                                 timeout=timeout,
-                                                 proxies=req.proxies))
+        if instrumentation._event_sink is not None:
+            instrumentation._emit('send_request', method=req.method, url=req.url, params=req.params,
+                                  headers=dict(req.headers), timeout=timeout)
+
+        try:
+            if metrics is None:
+                return Response(self.session.request(req.method, req.url,
+                                                     data=req.data,
+                                                     params=req.params,
+                                                     headers=req.headers,
+                                                     stream=True,
+                                                     timeout=timeout,
+                                                     proxies=req.proxies))
+
+            metrics.bytes_sent = _body_size(req.data, req.headers)
+            send_start = _clock()
+            resp = self.session.request(req.method, req.url,
+                                        data=req.data,
+                                        params=req.params,
+                                        headers=req.headers,
+                                        stream=True,
+                                        timeout=timeout,
+                                        proxies=req.proxies)
         except requests.RequestException as e:
             raise RequestError(e)
 
+        metrics._on_headers(send_start, resp.status_code, resp.headers.get('x-oss-request-id', ''))
+        if resp.status_code // 100 != 2:
+            # 失败的请求由调用者在放弃重试时结束统计
+            return Response(resp)
+
+        if req.method == 'HEAD' or resp.status_code in (204, 304):
+            # 没有响应体
+            metrics._finish()
+            return Response(resp)
+
+        return Response(resp, metrics)
+
+
+def _ensure_pool_size(session, size):
+    # 用户可能传入了自己实现的Session
+    ensure = getattr(session, 'ensure_pool_size', None)
+    if ensure is not None:
+        ensure(size)
+
+
+class _PoolStatsMixin(object):
+    """给urllib3的连接池加上统计，以及空闲连接的超时丢弃。"""
+    def _init_stats(self, idle_timeout):
+        self.idle_timeout = idle_timeout
+        self.stats_lock = threading.Lock()
+        self.num_in_use = 0
+        self.num_created = 0
+        self.num_discarded = 0
+
+    def _new_conn(self):
+        conn = super(_PoolStatsMixin, self)._new_conn()
+        with self.stats_lock:
+            self.num_created += 1
+        return conn
+
+    def _get_conn(self, timeout=None):
+        conn = super(_PoolStatsMixin, self)._get_conn(timeout=timeout)
+
+        last_used = getattr(conn, '_oss_last_used', None)
+        if self.idle_timeout and last_used is not None and conn.sock is not None and \
+                time.time() - last_used > self.idle_timeout:
+            # 服务端可能已经关闭了该连接，直接复用会在发送请求时遇到RST。关闭后连接对象会在使用时重新建连
+            logger.debug("Close idle connection, host: {0}, idle: {1:.1f}s".format(self.host, time.time() - last_used))
+            conn.close()
+            with self.stats_lock:
+                self.num_discarded += 1
+
+        with self.stats_lock:
+            self.num_in_use += 1
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._oss_last_used = time.time()
+
+        super(_PoolStatsMixin, self)._put_conn(conn)
+
+        with self.stats_lock:
+            self.num_in_use -= 1
+            # 出错的连接以None放回；连接池已满时连接被关闭
+            if conn is None or conn.sock is None:
+                self.num_discarded += 1
+
+    def _pool_queue(self):
+        # urllib3把空闲连接放在一个queue.Queue（LifoQueue）中。这是urllib3的内部实现，
+        # 找不到需要的属性时返回None，此时不扩容，也不统计空闲连接
+        q = getattr(self, 'pool', None)
+        if q is None or not all(hasattr(q, name) for name in ('mutex', 'queue', 'maxsize', 'not_empty')):
+            return None
+        return q
+
+    def resize(self, maxsize):
+        q = self._pool_queue()
+        if q is None:
+            return
+
+        with q.mutex:
+            if maxsize > q.maxsize:
+                # 与urllib3初始化连接池的方式相同，用None占位；放在底部，使已有的连接优先被复用
+                # urllib3 2.x的队列是list，1.x是deque
+                fill = [None] * (maxsize - q.maxsize)
+                if isinstance(q.queue, list):
+                    q.queue[0:0] = fill
+                elif hasattr(q.queue, 'extendleft'):
+                    q.queue.extendleft(fill)
+                else:
+                    return
+                q.maxsize = maxsize
+                q.not_empty.notify_all()
+
+    def get_stats(self):
+        idle = 0
+        q = self._pool_queue()
+        if q is not None:
+            with q.mutex:
+                idle = sum(1 for conn in q.queue if conn is not None and conn.sock is not None)
+
+        with self.stats_lock:
+            return {'in_use': self.num_in_use,
+                    'idle': idle,
+                    'created': self.num_created,
+                    'discarded': self.num_discarded,
+                    'maxsize': q.maxsize if q is not None else 0}
+
+
+class _HTTPConnectionPool(_PoolStatsMixin, connectionpool.HTTPConnectionPool):
+    def __init__(self, *args, **kwargs):
+        idle_timeout = kwargs.pop('idle_timeout', 0)
+        connectionpool.HTTPConnectionPool.__init__(self, *args, **kwargs)
+        self._init_stats(idle_timeout)
+
+
+class _HTTPSConnectionPool(_PoolStatsMixin, connectionpool.HTTPSConnectionPool):
+    def __init__(self, *args, **kwargs):
+        idle_timeout = kwargs.pop('idle_timeout', 0)
+        connectionpool.HTTPSConnectionPool.__init__(self, *args, **kwargs)
+        self._init_stats(idle_timeout)
+
+
+class _PoolAdapter(requests.adapters.HTTPAdapter):
+    # HTTPAdapter只pickle __attrs__中的属性，unpickle时再调用init_poolmanager
+    __attrs__ = requests.adapters.HTTPAdapter.__attrs__ + ['idle_timeout']
+
+    def __init__(self, pool_size, idle_timeout):
+        self.idle_timeout = idle_timeout
+        super(_PoolAdapter, self).__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(_PoolAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': functools.partial(_HTTPConnectionPool, idle_timeout=self.idle_timeout),
+            'https': functools.partial(_HTTPSConnectionPool, idle_timeout=self.idle_timeout)
+        }
+
+    def __pools(self):
+        # 已建立的连接池保存在urllib3 RecentlyUsedContainer的内部属性中，找不到时跳过已建立的连接池
+        pools = getattr(self.poolmanager, 'pools', None)
+        lock = getattr(pools, 'lock', None)
+        container = getattr(pools, '_container', None)
+        if lock is None or container is None:
+            return []
+
+        with lock:
+            return [pool for pool in container.values() if isinstance(pool, _PoolStatsMixin)]
+
+    def resize(self, maxsize):
+        self._pool_maxsize = maxsize
+        pool_kw = getattr(self.poolmanager, 'connection_pool_kw', None)
+        if pool_kw is not None:
+            pool_kw['maxsize'] = maxsize
+        for pool in self.__pools():
+            pool.resize(maxsize)
+
+    def pool_stats(self):
+        return dict(('{0}://{1}:{2}'.format(pool.scheme, pool.host, pool.port), pool.get_stats())
+                    for pool in self.__pools())
+
+    def prewarm(self, url, count, verify, cert):
+        if hasattr(self, 'get_connection_with_tls_context'):
+            pool = self.get_connection_with_tls_context(requests.Request('GET', url).prepare(), verify, cert=cert)
+        else:
+            pool = self.get_connection(url)
+
+        # 先把连接全部取出再放回，否则取到的总是同一个连接
+        conns = []
+        try:
+            for i in range(count):
+                conn = pool._get_conn()
+                conns.append(conn)
+                if conn.sock is None:
+                    conn.connect()
+        except Exception as e:
+            logger.warning("Prewarm connection failed, url: {0}, error: {1}".format(url, e))
+        finally:
+            for conn in conns:
+                pool._put_conn(conn)
+
+        return sum(1 for conn in conns if conn.sock is not None)
+
 
 class Request(object):
     def __init__(self, method, url,
@@ -74,6 +361,9 @@ class Request(object):
         self.product = product
         self.cloudbox_id = cloudbox_id
 
+        #: 请求的度量数据，启用了埋点时由 :class:`Bucket <oss2.Bucket>` 等设置
+        self.metrics = None
+
         if not isinstance(headers, CaseInsensitiveDict):
             self.headers = CaseInsensitiveDict(headers)
         else:
@@ -89,20 +379,36 @@ class Request(object):
             else:
                 self.headers['User-Agent'] = USER_AGENT
 
-        logger.debug("Init request, method: {0}, url: {1}, params: {2}, headers: {3}".format(method, url, params,
-                                                                                             headers))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Init request, method: {0}, url: {1}, params: {2}, headers: {3}".format(method, url, params,
+                                                                                                 headers))
 
 
 _CHUNK_SIZE = 8 * 1024
 
 
 class Response(object):
-    def __init__(self, response):
+    """HTTP响应。响应体可以用read、readinto读取，也可以迭代。
+
+    迭代时每块的大小由 `chunk_size` 属性决定，缺省为 `defaults.read_chunk_size` 。
+    """
+
+    def __init__(self, response, metrics=None):
         self.response = response
         self.status = response.status_code
         self.headers = response.headers
         self.request_id = response.headers.get('x-oss-request-id', '')
 
+        #: 迭代时每块的字节数
+        self.chunk_size = defaults.read_chunk_size
+
+        # urllib3的响应可以直接读取指定的字节数，不必每次read都创建一个iter_content生成器
+        raw = getattr(response, 'raw', None)
+        self.__raw = raw if hasattr(raw, 'stream') else None
+        # urllib3 1.x解压时可能返回多于amt的数据，多出的部分留给下次读
+        self.__pending = b''
+        self.__pending_offset = 0
+
         # When a response contains no body, iter_content() cannot
         # be run twice (requests.exceptions.StreamConsumedError will be raised).
         # For details of the issue, please see issue #82
@@ -114,30 +420,114 @@ class Response(object):
         # we try to avoid depends on details of self.response.raw.
         self.__all_read = False
 
-        logger.debug("Get response headers, req-id:{0}, status: {1}, headers: {2}".format(self.request_id, self.status,
-                                                                                          self.headers))
+        # 启用了埋点时统计接收的字节数，读完响应体时结束统计
+        self.__metrics = metrics
+        if metrics is not None:
+            self.__content_length = _content_length(self.headers)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Get response headers, req-id:{0}, status: {1}, headers: {2}".format(
+                self.request_id, self.status, self.headers))
+        if instrumentation._event_sink is not None:
+            instrumentation._emit('response_headers', request_id=self.request_id, status=self.status,
+                                  headers=dict(self.headers))
 
     def read(self, amt=None):
-        if self.__all_read:
+        if self.__all_read or amt == 0:
             return b''
 
-        if amt is None:
-            content_list = []
-            for chunk in self.response.iter_content(_CHUNK_SIZE):
-                content_list.append(chunk)
-            content = b''.join(content_list)
+        if self.__raw is not None:
+            content = self.__read_raw(amt)
+        elif amt is None:
+            content = b''.join(self.response.iter_content(self.chunk_size))
+        else:
+            content = next(self.response.iter_content(amt), b'')
 
+        eof = amt is None or not content
+        if eof:
             self.__all_read = True
-            return content
-        else:
-            try:
-                return next(self.response.iter_content(amt))
-            except StopIteration:
-                self.__all_read = True
-                return b''
+            self.response._content_consumed = True
+        if self.__metrics is not None:
+            self.__record(len(content), eof)
+        return content
+
+    def readinto(self, b):
+        """读取响应体到 `b` （bytearray、memoryview、NumPy数组等可写的缓冲区）中，返回读到的字节数，为0表示已经读完。"""
+        view = _byte_view(b)
+        content = self.read(len(view))
+        view[:len(content)] = content
+        return len(content)
 
     def __iter__(self):
-        return self.response.iter_content(_CHUNK_SIZE)
+        while True:
+            content = self.read(self.chunk_size)
+            if not content:
+                return
+            yield content
+
+    def iter_views(self, chunk_size=None):
+        """迭代响应体，每次返回同一个缓冲区的memoryview，避免为每块数据分配新的bytes。
+
+        返回的memoryview在下一次迭代时会被覆盖，需要保留的数据应当自行拷贝。
+
+        :param int chunk_size: 缓冲区大小，缺省为 `chunk_size` 属性的值
+        """
+        return _iter_views(self.readinto, chunk_size or self.chunk_size)
+
+    def __read_raw(self, amt):
+        if self.__pending:
+            offset = self.__pending_offset
+            if amt is None or offset + amt >= len(self.__pending):
+                content = self.__pending[offset:]
+                self.__pending = b''
+                self.__pending_offset = 0
+                if amt is None:
+                    content += self.__read_decoded(None)
+            else:
+                content = self.__pending[offset:offset + amt]
+                self.__pending_offset += amt
+            return content
+
+        content = self.__read_decoded(amt)
+        if amt is not None and len(content) > amt:
+            self.__pending = content
+            self.__pending_offset = amt
+            content = content[:amt]
+        return content
+
+    def __read_decoded(self, amt):
+        # 与iter_content相同：按Content-Encoding解压，并把urllib3的异常转换成requests的异常。
+        # urllib3 1.x读取压缩的响应体时，读到的几个字节可能还不够解压出数据而返回空，此时需要继续读，直到连接上的数据读完
+        try:
+            content = self.__raw.read(amt, decode_content=True)
+            while not content and amt is not None and not self.__raw.closed:
+                content = self.__raw.read(amt, decode_content=True)
+            return content
+        except urllib3_exceptions.ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        except urllib3_exceptions.DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e)
+        except urllib3_exceptions.ReadTimeoutError as e:
+            raise requests.exceptions.ConnectionError(e)
+        except urllib3_exceptions.SSLError as e:
+            raise requests.exceptions.SSLError(e)
+
+    def __record(self, size, eof):
+        metrics = self.__metrics
+        if metrics is None:
+            return
+
+        metrics.bytes_received += size
+        if eof or (self.__content_length is not None and metrics.bytes_received >= self.__content_length):
+            self.__metrics = None
+            metrics._finish()
+
+
+def _content_length(headers):
+    try:
+        return int(headers['content-length'])
+    except (KeyError, ValueError):
+        return None
 
 
 # requests对于具有fileno()方法的file object，会用fileno()的返回值作为Content-Length。
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+
+"""
+oss2.instrumentation
+~~~~~~~~~~~~~~~~~~~~
+
+请求级别的埋点。
+
+给 :class:`Session <oss2.Session>` 传入 `instrumentation` 参数后，每个请求结束时SDK会调用
+:func:`Instrumentation.on_request_end` ，传入一个 :class:`RequestMetrics` ，包括：
+
+    * 操作名（如 `put_object` 、 `get_object` ）、HTTP方法、URL；
+    * 签名耗时、首字节时间（从开始发送请求到收到响应头）、响应体传输耗时、总耗时；
+    * 发送和接收的字节数、HTTP状态码、请求ID、重试次数以及最终的异常。
+
+"请求结束"是指响应体被读完（GetObject等流式接口需要调用者读完数据），或者请求最终失败。
+没有读完响应体的请求不会被统计。
+
+缺省不做任何埋点，请求路径上也没有额外的开销。
+
+用法 ::
+
+    >>> import oss2
+    >>> collector = oss2.HistogramCollector()
+    >>> session = oss2.Session(instrumentation=collector)
+    >>> bucket = oss2.Bucket(auth, 'http://oss-cn-hangzhou.aliyuncs.com', 'your-bucket', session=session)
+    >>> bucket.put_object('a.txt', 'hello')
+    >>> collector.percentile('put_object', 99)
+    0.0213...
+"""
+
+import math
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+if hasattr(time, 'perf_counter'):
+    _clock = time.perf_counter
+else:
+    _clock = time.time
+
+
+_event_sink = None
+
+
+def set_event_sink(sink):
+    """设置结构化事件的接收者，为None表示不再发送事件。
+
+    与DEBUG日志不同，事件以dict的形式给出，便于直接写入日志系统或者做统计。目前的事件有：
+
+        - send_request：发送请求，字段包括method、url、params、headers、timeout
+        - response_headers：收到响应头，字段包括request_id、status、headers
+        - retry：重试请求，字段包括method、url、retries、delay、error
+        - part_uploaded、part_copied：断点续传上传、拷贝完一个分片，字段包括bucket、key、upload_id、part_number、etag、size
+        - part_downloaded：断点续传下载完一个分片，字段包括bucket、key、part_number、start、end
+
+    `sink` 在发出事件的线程中同步调用，抛出的异常会被忽略。
+
+    :param sink: 形如 ``sink(event, fields)`` 的函数，event是事件名，fields是dict
+    """
+    global _event_sink
+    _event_sink = sink
+
+
+def _emit(event, **fields):
+    # 调用者在热点路径上应该先判断 `_event_sink` 是否为None，避免构造参数
+    sink = _event_sink
+    if sink is None:
+        return
+
+    try:
+        sink(event, fields)
+    except Exception as e:
+        logger.warning("Event sink failed, event: {0}, error: {1}".format(event, e))
+
+
+class Instrumentation(object):
+    """埋点接口，缺省实现什么也不做。
+
+    `on_request_end` 在发起请求的线程中同步调用，应当尽快返回；抛出的异常会被忽略。
+    """
+
+    def on_request_end(self, metrics):
+        """请求结束时调用。
+
+        :param metrics: :class:`RequestMetrics`
+        """
+        pass
+
+
+class RequestMetrics(object):
+    """一次请求（包括重试）的度量数据。时间均以秒为单位。
+
+    :param str operation: 操作名，即发起请求的Bucket/Service方法名，如 `put_object`
+    :param str method: HTTP方法
+    :param str url: 请求URL，不包括查询参数
+    :param float start_time: 开始时间，UNIX时间戳
+    :param float sign_time: 签名耗时，重试时累加
+    :param float ttfb: 最后一次尝试从开始发送请求到收到响应头的时间
+    :param float transfer_time: 收到响应头之后读完响应体的时间
+    :param float total_time: 从开始到结束的总耗时，包括重试等待的时间
+    :param int bytes_sent: 最后一次尝试发送的请求体字节数，无法预先知道长度的请求体为None
+    :param int bytes_received: 读到的响应体字节数
+    :param int status: HTTP状态码，没有收到响应时为None
+    :param str request_id: 请求ID
+    :param int retries: 重试次数
+    :param error: 请求最终失败时的异常，成功时为None
+    """
+
+    __slots__ = ('operation', 'method', 'url', 'start_time', 'sign_time', 'ttfb', 'transfer_time', 'total_time',
+                 'bytes_sent', 'bytes_received', 'status', 'request_id', 'retries', 'error',
+                 '_instrumentation', '_start', '_headers_at', '_finished')
+
+    def __init__(self, instrumentation, operation, method, url):
+        self.operation = operation
+        self.method = method
+        self.url = url
+        self.start_time = time.time()
+        self.sign_time = 0.0
+        self.ttfb = None
+        self.transfer_time = None
+        self.total_time = None
+        self.bytes_sent = None
+        self.bytes_received = 0
+        self.status = None
+        self.request_id = ''
+        self.retries = 0
+        self.error = None
+
+        self._instrumentation = instrumentation
+        self._start = _clock()
+        self._headers_at = None
+        self._finished = False
+
+    def as_dict(self):
+        """转换成只包含基本类型的dict，便于导出到日志、监控系统等。"""
+        return {'operation': self.operation,
+                'method': self.method,
+                'url': self.url,
+                'start_time': self.start_time,
+                'sign_time': self.sign_time,
+                'ttfb': self.ttfb,
+                'transfer_time': self.transfer_time,
+                'total_time': self.total_time,
+                'bytes_sent': self.bytes_sent,
+                'bytes_received': self.bytes_received,
+                'status': self.status,
+                'request_id': self.request_id,
+                'retries': self.retries,
+                'error': None if self.error is None else self.error.__class__.__name__}
+
+    def _on_headers(self, send_start, status, request_id):
+        self._headers_at = _clock()
+        self.ttfb = self._headers_at - send_start
+        self.status = status
+        self.request_id = request_id
+
+    def _finish(self):
+        if self._finished:
+            return
+        self._finished = True
+
+        now = _clock()
+        if self._headers_at is not None:
+            self.transfer_time = now - self._headers_at
+        self.total_time = now - self._start
+
+        try:
+            self._instrumentation.on_request_end(self)
+        except Exception as e:
+            logger.warning("Instrumentation failed, operation: {0}, error: {1}".format(self.operation, e))
+
+
+class CallbackInstrumentation(Instrumentation):
+    """每个请求结束时以 :func:`RequestMetrics.as_dict` 的结果调用 `callback` ，用于对接外部的监控系统。
+
+    :param callback: 形如 ``callback(dict)`` 的函数
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def on_request_end(self, metrics):
+        self.callback(metrics.as_dict())
+
+
+# 直方图的桶按指数划分：最小10us，相邻两个桶的边界相差5%，最大约1000秒，相对误差不超过5%
+_HISTOGRAM_MIN = 1e-5
+_HISTOGRAM_GROWTH = math.log(1.05)
+_HISTOGRAM_BUCKETS = int(math.log(1000 / _HISTOGRAM_MIN) / _HISTOGRAM_GROWTH) + 2
+
+
+def _bucket_index(value):
+    if value <= _HISTOGRAM_MIN:
+        return 0
+    return min(int(math.log(value / _HISTOGRAM_MIN) / _HISTOGRAM_GROWTH) + 1, _HISTOGRAM_BUCKETS - 1)
+
+
+def _bucket_value(index):
+    # 桶的上边界
+    return _HISTOGRAM_MIN * math.exp(index * _HISTOGRAM_GROWTH)
+
+
+class _Histogram(object):
+    __slots__ = ('counts', 'count')
+
+    def __init__(self):
+        self.counts = [0] * _HISTOGRAM_BUCKETS
+        self.count = 0
+
+    def add(self, value):
+        self.counts[_bucket_index(value)] += 1
+        self.count += 1
+
+    def percentile(self, q):
+        if self.count == 0:
+            return None
+
+        rank = max(1, int(math.ceil(self.count * q / 100.0)))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return _bucket_value(index)
+
+
+class _OperationStats(object):
+    def __init__(self):
+        self.histograms = dict((field, _Histogram()) for field in HistogramCollector.TIMINGS)
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class HistogramCollector(Instrumentation):
+    """在进程内按操作名统计耗时分布，线程安全。
+
+    每种耗时用固定大小的指数直方图记录，内存占用与请求数无关，百分位数的相对误差不超过5%。
+
+    用法 ::
+
+        >>> collector = oss2.HistogramCollector()
+        >>> session = oss2.Session(instrumentation=collector)
+        ...
+        >>> collector.summary()
+        {'get_object': {'count': 100, 'errors': 0, 'p50': 0.012, 'p99': 0.085, ...}, ...}
+    """
+
+    #: 统计的耗时字段
+    TIMINGS = ('total_time', 'ttfb', 'transfer_time', 'sign_time')
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__stats = {}
+
+    def on_request_end(self, metrics):
+        with self.__lock:
+            stats = self.__stats.get(metrics.operation)
+            if stats is None:
+                stats = self.__stats[metrics.operation] = _OperationStats()
+
+            for field in self.TIMINGS:
+                value = getattr(metrics, field)
+                if value is not None:
+                    stats.histograms[field].add(value)
+
+            if metrics.error is not None:
+                stats.errors += 1
+            stats.retries += metrics.retries
+            stats.bytes_sent += metrics.bytes_sent or 0
+            stats.bytes_received += metrics.bytes_received
+
+    def operations(self):
+        """返回已经统计到的操作名列表。"""
+        with self.__lock:
+            return list(self.__stats)
+
+    def percentile(self, operation, q, timing='total_time'):
+        """返回某个操作的耗时百分位数（秒），没有数据时返回None。
+
+        :param str operation: 操作名
+        :param float q: 百分位，如50、99
+        :param str timing: 耗时字段，参见 `TIMINGS`
+        """
+        with self.__lock:
+            stats = self.__stats.get(operation)
+            if stats is None:
+                return None
+            return stats.histograms[timing].percentile(q)
+
+    def summary(self):
+        """返回各个操作的统计，形如 ``{'get_object': stats}`` 。
+
+        其中stats是一个dict，包括：
+            - count：请求数
+            - errors：最终失败的请求数
+            - retries：累计重试次数
+            - bytes_sent、bytes_received：累计发送、接收的字节数
+            - p50、p99：总耗时的百分位数
+            - ttfb_p50、ttfb_p99：首字节时间的百分位数
+        """
+        with self.__lock:
+            result = {}
+            for operation, stats in self.__stats.items():
+                total = stats.histograms['total_time']
+                ttfb = stats.histograms['ttfb']
+                result[operation] = {'count': total.count,
+                                     'errors': stats.errors,
+                                     'retries': stats.retries,
+                                     'bytes_sent': stats.bytes_sent,
+                                     'bytes_received': stats.bytes_received,
+                                     'p50': total.percentile(50),
+                                     'p99': total.percentile(99),
+                                     'ttfb_p50': ttfb.percentile(50),
+                                     'ttfb_p99': ttfb.percentile(99)}
+            return result
+
+    def reset(self):
+        """清空统计数据。"""
+        with self.__lock:
+            self.__stats = {}
+
+
+def _body_size(data, headers):
+    if data is None:
+        return 0
+    if hasattr(data, '__len__'):
+        return len(data)
+
+    # SizedFileAdapter等适配器用len属性表示长度，与requests的处理方式相同
+    size = getattr(data, 'len', None)
+    if size is None:
+        size = headers.get('Content-Length')
+    try:
+        return int(size)
+    except (TypeError, ValueError):
+        return None
@@ -7,21 +7,42 @@ oss2.iterators
 该模块包含了一些易于使用的迭代器，可以用来遍历Bucket、文件、分片上传等。
 """
 
-from .models import MultipartUploadInfo, SimplifiedObjectInfo
+import sys
+import copy
+import time
+import threading
+import logging
+import collections
+
+from .models import MultipartUploadInfo, SimplifiedObjectInfo, ObjectListingTable
 from .exceptions import ServerError
+from .compat import to_string
 
-from . import defaults, http
+from . import defaults, http, utils
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+logger = logging.getLogger(__name__)
 
 
 class _BaseIterator(object):
-    def __init__(self, marker, max_retries):
+    def __init__(self, marker, max_retries, prefetch=0):
         self.is_truncated = True
         self.next_marker = marker
 
         max_retries = defaults.get(max_retries, defaults.request_retries)
         self.max_retries = max_retries if max_retries > 0 else 1
 
-        self.entries = []
+        self.entries = collections.deque()
+
+        #: 后台预取的页数，0表示不预取
+        self.prefetch = prefetch
+        self.__prefetch_queue = None
+        self.__prefetch_stop = None
+        self.__prefetch_error = None
 
     def _fetch(self):
         raise NotImplemented    # pragma: no cover
@@ -32,7 +53,7 @@ class _BaseIterator(object):
     def __next__(self):
         while True:
             if self.entries:
-                return self.entries.pop(0)
+                return self.entries.popleft()
 
             if not self.is_truncated:
                 raise StopIteration
@@ -42,7 +63,27 @@ class _BaseIterator(object):
     def next(self):
         return self.__next__()
 
+    def pages(self):
+        """按页遍历：每次返回一次罗列请求得到的全部条目（list），适合批量处理的场景。
+
+        与逐个迭代共享进度：已经取回但尚未迭代的条目作为第一页返回。
+        """
+        while True:
+            if self.entries:
+                page = list(self.entries)
+                self.entries = collections.deque()
+                yield page
+
+            if not self.is_truncated:
+                return
+
+            self.fetch_with_retry()
+
     def fetch_with_retry(self):
+        if self.prefetch > 0:
+            self.__take_prefetched()
+            return
+
         for i in range(self.max_retries):
             try:
                 self.is_truncated, self.next_marker = self._fetch()
@@ -53,7 +94,65 @@ class _BaseIterator(object):
                 if i == self.max_retries - 1:
                     raise
             else:
+                # _fetch()返回的是list，转成deque使得逐个取出是O(1)的
+                self.entries = collections.deque(self.entries)
+                return
+
+    def close(self):
+        """停止后台预取。未开启预取或已经遍历完毕时无需调用。"""
+        stop = getattr(self, '_BaseIterator__prefetch_stop', None)
+        if stop is not None:
+            stop.set()
+
+    def __del__(self):
+        self.close()
+
+    def __take_prefetched(self):
+        if self.__prefetch_error is not None:
+            raise self.__prefetch_error
+
+        if self.__prefetch_queue is None:
+            # 后台线程在迭代器的一个浅拷贝上罗列，不会改动本对象的状态；线程也不引用本对象，
+            # 本对象被回收时可以通过__del__通知线程退出
+            fetcher = copy.copy(self)
+            fetcher.prefetch = 0
+            fetcher.entries = collections.deque()
+
+            self.__prefetch_queue = queue.Queue(self.prefetch)
+            self.__prefetch_stop = threading.Event()
+
+            t = threading.Thread(target=_prefetch_pages, args=(fetcher, self.__prefetch_queue, self.__prefetch_stop))
+            t.daemon = True
+            t.start()
+
+        page = self.__prefetch_queue.get()
+        if isinstance(page, BaseException):
+            # 出错之后后台线程已经退出，之后再取下一页时抛出同样的异常
+            self.__prefetch_error = page
+            raise page
+
+        self.entries, self.is_truncated, self.next_marker = page
+
+
+def _prefetch_pages(fetcher, q, stop):
+    def put(item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    try:
+        while fetcher.is_truncated:
+            fetcher.fetch_with_retry()
+            if not put((fetcher.entries, fetcher.is_truncated, fetcher.next_marker)):
                 return
+    except Exception as e:
+        logger.debug("Prefetch list page failed, marker: {0}, error: {1}".format(to_string(fetcher.next_marker), e))
+        put(e)
 
 
 class BucketIterator(_BaseIterator):
@@ -65,9 +164,10 @@ class BucketIterator(_BaseIterator):
     :param prefix: 只列举匹配该前缀的Bucket
     :param marker: 分页符。只列举Bucket名字典序在此之后的Bucket
     :param max_keys: 每次调用 `list_buckets` 时的max_keys参数。注意迭代器返回的数目可能会大于该值。
+    :param int prefetch: 后台预取的页数。缺省为0，不预取；大于0时由后台线程提前罗列后续各页，最多缓存prefetch页
     """
-    def __init__(self, service, prefix='', marker='', max_keys=100, max_retries=None):
-        super(BucketIterator, self).__init__(marker, max_retries)
+    def __init__(self, service, prefix='', marker='', max_keys=100, max_retries=None, prefetch=0):
+        super(BucketIterator, self).__init__(marker, max_retries, prefetch)
         self.service = service
         self.prefix = prefix
         self.max_keys = max_keys
@@ -95,28 +195,43 @@ class ObjectIterator(_BaseIterator):
 
     :param headers: HTTP头部
     :type headers: 可以是dict，建议是oss2.CaseInsensitiveDict
+
+    :param int prefetch: 后台预取的页数。缺省为0，不预取；大于0时由后台线程提前罗列后续各页，最多缓存prefetch页
     """
-    def __init__(self, bucket, prefix='', delimiter='', marker='', max_keys=100, max_retries=None, headers=None):
-        super(ObjectIterator, self).__init__(marker, max_retries)
+    def __init__(self, bucket, prefix='', delimiter='', marker='', max_keys=100, max_retries=None, headers=None,
+                 prefetch=0):
+        super(ObjectIterator, self).__init__(marker, max_retries, prefetch)
 
         self.bucket = bucket
         self.prefix = prefix
         self.delimiter = delimiter
         self.max_keys = max_keys
         self.headers = http.CaseInsensitiveDict(headers)
+        self._table = None
 
     def _fetch(self):
         result = self.bucket.list_objects(prefix=self.prefix,
                                           delimiter=self.delimiter,
                                           marker=self.next_marker,
                                           max_keys=self.max_keys,
-                                          headers=self.headers)
-        self.entries = result.object_list + [SimplifiedObjectInfo(prefix, None, None, None, None, None)
-                                             for prefix in result.prefix_list]
-        self.entries.sort(key=lambda obj: obj.key)
+                                          headers=self.headers,
+                                          table=self._table)
+        self.entries = _merge_prefixes(result.object_list,
+                                       [SimplifiedObjectInfo(prefix, None, None, None, None, None)
+                                        for prefix in result.prefix_list])
 
         return result.is_truncated, result.next_marker
 
+    def fill_table(self, table=None):
+        """把尚未迭代的文件全部填入 :class:`ObjectListingTable <oss2.models.ObjectListingTable>` 并返回该table。
+
+        罗列结果由解析器直接写入table，不生成 `SimplifiedObjectInfo` 对象，适合罗列海量文件。公共前缀存入
+        `table.prefix_list` 。
+
+        :param table: 追加到已有的table；为None时新建一个
+        """
+        return _fill_object_table(self, table)
+
 class ObjectIteratorV2(_BaseIterator):
     """遍历Bucket里文件的迭代器。
 
@@ -132,10 +247,12 @@ class ObjectIteratorV2(_BaseIterator):
 
     :param headers: HTTP头部
     :type headers: 可以是dict，建议是oss2.CaseInsensitiveDict
+
+    :param int prefetch: 后台预取的页数。缺省为0，不预取；大于0时由后台线程提前罗列后续各页，最多缓存prefetch页
     """
 
-    def __init__(self, bucket, prefix='', delimiter='', continuation_token='', start_after='', fetch_owner = False, encoding_type = 'url', max_keys=100, max_retries=None, headers=None):
-        super(ObjectIteratorV2, self).__init__(continuation_token, max_retries)
+    def __init__(self, bucket, prefix='', delimiter='', continuation_token='', start_after='', fetch_owner = False, encoding_type = 'url', max_keys=100, max_retries=None, headers=None, prefetch=0):
+        super(ObjectIteratorV2, self).__init__(continuation_token, max_retries, prefetch)
 
         self.bucket = bucket
         self.prefix = prefix
@@ -145,6 +262,7 @@ class ObjectIteratorV2(_BaseIterator):
         self.encoding_type = encoding_type
         self.max_keys = max_keys
         self.headers = http.CaseInsensitiveDict(headers)
+        self._table = None
 
     def _fetch(self):
         result = self.bucket.list_objects_v2(prefix=self.prefix,
@@ -154,13 +272,39 @@ class ObjectIteratorV2(_BaseIterator):
                                           fetch_owner=self.fetch_owner,
                                           encoding_type=self.encoding_type,
                                           max_keys=self.max_keys,
-                                          headers=self.headers)
-        self.entries = result.object_list + [SimplifiedObjectInfo(prefix, None, None, None, None, None)
-                                             for prefix in result.prefix_list]
-        self.entries.sort(key=lambda obj: obj.key)
+                                          headers=self.headers,
+                                          table=self._table)
+        self.entries = _merge_prefixes(result.object_list,
+                                       [SimplifiedObjectInfo(prefix, None, None, None, None, None)
+                                        for prefix in result.prefix_list])
 
         return result.is_truncated, result.next_continuation_token
 
+    def fill_table(self, table=None):
+        """同 :func:`ObjectIterator.fill_table <oss2.ObjectIterator.fill_table>` 。"""
+        return _fill_object_table(self, table)
+
+def _fill_object_table(iterator, table):
+    if table is None:
+        table = ObjectListingTable()
+
+    table.extend(iterator.entries)
+    iterator.entries = collections.deque()
+
+    iterator._table = table
+    try:
+        while iterator.is_truncated:
+            iterator.fetch_with_retry()
+
+            # 文件已经由解析器写入table，entries里只剩公共前缀
+            table.extend(iterator.entries)
+            iterator.entries = collections.deque()
+    finally:
+        iterator._table = None
+
+    return table
+
+
 class MultipartUploadIterator(_BaseIterator):
     """遍历Bucket里未完成的分片上传。
 
@@ -176,11 +320,13 @@ class MultipartUploadIterator(_BaseIterator):
 
     :param headers: HTTP头部
     :type headers: 可以是dict，建议是oss2.CaseInsensitiveDict
+
+    :param int prefetch: 后台预取的页数。缺省为0，不预取；大于0时由后台线程提前罗列后续各页，最多缓存prefetch页
     """
     def __init__(self, bucket,
                  prefix='', delimiter='', key_marker='', upload_id_marker='',
-                 max_uploads=1000, max_retries=None, headers=None):
-        super(MultipartUploadIterator, self).__init__(key_marker, max_retries)
+                 max_uploads=1000, max_retries=None, headers=None, prefetch=0):
+        super(MultipartUploadIterator, self).__init__(key_marker, max_retries, prefetch)
 
         self.bucket = bucket
         self.prefix = prefix
@@ -196,8 +342,8 @@ class MultipartUploadIterator(_BaseIterator):
                                                     upload_id_marker=self.next_upload_id_marker,
                                                     max_uploads=self.max_uploads,
                                                     headers=self.headers)
-        self.entries = result.upload_list + [MultipartUploadInfo(prefix, None, None) for prefix in result.prefix_list]
-        self.entries.sort(key=lambda u: u.key)
+        self.entries = _merge_prefixes(result.upload_list,
+                                       [MultipartUploadInfo(prefix, None, None) for prefix in result.prefix_list])
 
         self.next_upload_id_marker = result.next_upload_id_marker
         return result.is_truncated, result.next_key_marker
@@ -215,9 +361,11 @@ class ObjectUploadIterator(_BaseIterator):
 
     :param headers: HTTP头部
     :type headers: 可以是dict，建议是oss2.CaseInsensitiveDict
+
+    :param int prefetch: 后台预取的页数。缺省为0，不预取；大于0时由后台线程提前罗列后续各页，最多缓存prefetch页
     """
-    def __init__(self, bucket, key, max_uploads=1000, max_retries=None, headers=None):
-        super(ObjectUploadIterator, self).__init__('', max_retries)
+    def __init__(self, bucket, key, max_uploads=1000, max_retries=None, headers=None, prefetch=0):
+        super(ObjectUploadIterator, self).__init__('', max_retries, prefetch)
         self.bucket = bucket
         self.key = key
         self.next_upload_id_marker = ''
@@ -256,10 +404,12 @@ class PartIterator(_BaseIterator):
 
     :param headers: HTTP头部
     :type headers: 可以是dict，建议是oss2.CaseInsensitiveDict
+
+    :param int prefetch: 后台预取的页数。缺省为0，不预取；大于0时由后台线程提前罗列后续各页，最多缓存prefetch页
     """
     def __init__(self, bucket, key, upload_id,
-                 marker='0', max_parts=1000, max_retries=None, headers=None):
-        super(PartIterator, self).__init__(marker, max_retries)
+                 marker='0', max_parts=1000, max_retries=None, headers=None, prefetch=0):
+        super(PartIterator, self).__init__(marker, max_retries, prefetch)
 
         self.bucket = bucket
         self.key = key
@@ -286,9 +436,10 @@ class LiveChannelIterator(_BaseIterator):
     :param prefix: 只列举匹配该前缀的文件
     :param marker: 分页符
     :param max_keys: 每次调用 `list_live_channel` 时的max_keys参数。注意迭代器返回的数目可能会大于该值。
+    :param int prefetch: 后台预取的页数。缺省为0，不预取；大于0时由后台线程提前罗列后续各页，最多缓存prefetch页
     """
-    def __init__(self, bucket, prefix='', marker='', max_keys=100, max_retries=None):
-        super(LiveChannelIterator, self).__init__(marker, max_retries)
+    def __init__(self, bucket, prefix='', marker='', max_keys=100, max_retries=None, prefetch=0):
+        super(LiveChannelIterator, self).__init__(marker, max_retries, prefetch)
 
         self.bucket = bucket
         self.prefix = prefix
@@ -302,3 +453,286 @@ class LiveChannelIterator(_BaseIterator):
 
         return result.is_truncated, result.next_marker
 
+
+
+class ParallelObjectLister(object):
+    """并发列举文件的迭代器，用于列举文件数量巨大的Bucket。
+
+    先把待列举的key空间切分成若干互不相交的分片，再由 `concurrency` 个线程并发地对各分片调用 `list_objects_v2` 。切分方式：
+
+        * 按目录：缺省方式。先用 `delimiter` 列举 `prefix` 下的一级目录，每个目录作为一个分片，直接位于 `prefix` 下的
+          文件作为一个单独的分片；
+        * 按key范围：指定了 `pivots` 时，以这些key为分界点，把key空间切分为 ( '', pivots[0] ]、( pivots[0], pivots[1] ]、
+          ……、( pivots[-1], +∞ ) 这些区间。适用于没有目录结构的扁平key空间。
+
+    每次迭代返回 :class:`SimplifiedObjectInfo <oss2.models.SimplifiedObjectInfo>` 对象（不包括公共前缀）。
+    `ordered` 为True时按key的字典序返回，否则按各分片返回的先后顺序返回，吞吐量更高。
+
+    指定 `store` 后，列举的进度（每个分片已返回的最后一个key）会定期保存，中断后用相同的参数重新列举时会从断点继续。
+    断点是以页为单位记录的，所以断点附近的少量文件可能会被重复返回。全部列举完成后断点信息被删除。
+
+    :param bucket: :class:`Bucket <oss2.Bucket>` 对象
+    :param prefix: 只列举匹配该前缀的文件
+    :param delimiter: 按目录切分时使用的目录分隔符
+    :param pivots: 按key范围切分时的分界点
+    :param int concurrency: 并发线程数
+    :param bool ordered: 是否按key的字典序返回
+    :param max_keys: 每次调用 `list_objects_v2` 时的max_keys参数
+    :param max_buffered_pages: 每个分片（ `ordered` 为False时为每个线程）最多缓存的页数
+    :param store: 保存断点信息的对象，如 :class:`ResumableStore <oss2.ResumableStore>`
+    :param store_key: 断点信息在 `store` 中的key，缺省根据Bucket名、 `prefix` 及 `pivots` 生成
+    :param bool fetch_owner: 是否获取文件的owner信息
+
+    :param headers: HTTP头部
+    :type headers: 可以是dict，建议是oss2.CaseInsensitiveDict
+    """
+    def __init__(self, bucket, prefix='', delimiter='/', pivots=None, concurrency=8, ordered=True,
+                 max_keys=1000, max_buffered_pages=2, store=None, store_key=None, fetch_owner=False, headers=None):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.delimiter = delimiter
+        self.pivots = sorted(pivots) if pivots is not None else None
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.max_keys = max_keys
+        self.max_buffered_pages = max_buffered_pages
+        self.store = store
+        self.store_key = store_key or _make_list_store_key(bucket.bucket_name, prefix, self.pivots)
+        self.fetch_owner = fetch_owner
+        self.headers = http.CaseInsensitiveDict(headers)
+
+        #: 各分片的状态，每个分片是一个dict，包括prefix、delimiter、start_after、end、done
+        self.shards = None
+
+        self.__lock = threading.Lock()
+        self.__pending = None
+        self.__next_shard = 0
+        self.__stopped = False
+        self.__exc_info = None
+        self.__last_saved = 0
+
+    def __iter__(self):
+        return self.__generate()
+
+    def __generate(self):
+        self.__load_shards()
+
+        self.__pending = [i for i, shard in enumerate(self.shards) if not shard['done']]
+        logger.debug("Start to list objects parallel, bucket: {0}, prefix: {1}, shards: {2}, pending: {3}".format(
+            self.bucket.bucket_name, to_string(self.prefix), len(self.shards), len(self.__pending)))
+
+        if self.ordered:
+            queues = dict((i, queue.Queue(self.max_buffered_pages)) for i in self.__pending)
+            # 有序时读取方可能同时等待直接位于prefix下的文件和某个目录分片，至少需要两个线程
+            num_threads = max(self.concurrency, 2)
+        else:
+            queues = queue.Queue(self.max_buffered_pages * self.concurrency)
+            num_threads = self.concurrency
+
+        http._ensure_pool_size(self.bucket.session, num_threads)
+        for i in range(min(num_threads, len(self.__pending))):
+            t = threading.Thread(target=self.__worker, args=(queues,))
+            t.daemon = True
+            t.start()
+
+        try:
+            if self.ordered:
+                for entry in self.__iter_ordered(queues):
+                    yield entry
+            else:
+                for entry in self.__iter_unordered(queues):
+                    yield entry
+        finally:
+            self.__stopped = True
+            if self.store is not None and self.__exc_info is None and all(s['done'] for s in self.shards):
+                self.store.delete(self.store_key)
+            else:
+                self.__save(force=True)
+
+    def __iter_ordered(self, queues):
+        leaves = [i for i in self.__pending if self.shards[i]['delimiter']]
+        others = [i for i in self.__pending if not self.shards[i]['delimiter']]
+
+        def iter_shards(indexes):
+            for i in indexes:
+                for entry in self.__iter_pages(queues[i], 1):
+                    yield entry
+
+        # 按目录切分时，各目录分片的key范围互不相交且与分片顺序一致，只需再与直接位于prefix下的文件归并
+        return _merge_by_key(iter_shards(leaves), iter_shards(others))
+
+    def __iter_unordered(self, queues):
+        return self.__iter_pages(queues, len(self.__pending))
+
+    def __iter_pages(self, q, num_shards):
+        while num_shards > 0:
+            index, entries, last = self.__get(q)
+
+            for entry in entries:
+                yield entry
+
+            self.__page_done(index, entries, last)
+            if last:
+                num_shards -= 1
+
+    def __page_done(self, index, entries, last):
+        shard = self.shards[index]
+        if entries:
+            shard['start_after'] = entries[-1].key
+        if last:
+            shard['done'] = True
+
+        self.__save()
+
+    def __get(self, q):
+        while True:
+            try:
+                return q.get(timeout=1)
+            except queue.Empty:
+                if self.__exc_info is not None:
+                    raise self.__exc_info[1]
+
+    def __put(self, q, item):
+        while not self.__stopped:
+            try:
+                q.put(item, timeout=1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def __worker(self, queues):
+        try:
+            while not self.__stopped:
+                with self.__lock:
+                    if self.__next_shard >= len(self.__pending):
+                        return
+                    index = self.__pending[self.__next_shard]
+                    self.__next_shard += 1
+
+                if not self.__list_shard(index, queues[index] if self.ordered else queues):
+                    return
+        except:
+            logger.error("List shard failed, bucket: {0}, error: {1}".format(self.bucket.bucket_name, sys.exc_info()[1]))
+            self.__exc_info = sys.exc_info()
+            self.__stopped = True
+
+    def __list_shard(self, index, q):
+        shard = self.shards[index]
+        start_after = shard['start_after']
+        end = shard['end']
+        token = ''
+
+        while True:
+            result = self.bucket.list_objects_v2(prefix=shard['prefix'],
+                                                 delimiter=shard['delimiter'],
+                                                 continuation_token=token,
+                                                 start_after='' if token else start_after,
+                                                 fetch_owner=self.fetch_owner,
+                                                 max_keys=self.max_keys,
+                                                 headers=self.headers)
+            entries = result.object_list
+            last = not result.is_truncated
+
+            if end is not None and entries and entries[-1].key >= end:
+                entries = [e for e in entries if e.key <= end]
+                last = True
+
+            if not self.__put(q, (index, entries, last)):
+                return False
+
+            if last:
+                return True
+
+            token = result.next_continuation_token
+
+    def __load_shards(self):
+        if self.store is not None:
+            record = self.store.get(self.store_key)
+            if record and record.get('bucket') == self.bucket.bucket_name and record.get('prefix') == self.prefix:
+                logger.debug("Resume listing from record, key: {0}".format(self.store_key))
+                self.shards = record['shards']
+                return
+
+        if self.pivots is not None:
+            bounds = [''] + self.pivots + [None]
+            self.shards = [_make_list_shard(self.prefix, '', bounds[i], bounds[i + 1])
+                           for i in range(len(bounds) - 1)]
+        else:
+            self.shards = [_make_list_shard(self.prefix, self.delimiter, '', None)]
+            self.shards.extend(_make_list_shard(p, '', '', None) for p in self.__discover_prefixes())
+
+        self.__save(force=True)
+
+    def __discover_prefixes(self):
+        prefixes = []
+        token = ''
+
+        while True:
+            result = self.bucket.list_objects_v2(prefix=self.prefix,
+                                                 delimiter=self.delimiter,
+                                                 continuation_token=token,
+                                                 max_keys=self.max_keys,
+                                                 headers=self.headers)
+            prefixes.extend(result.prefix_list)
+
+            if not result.is_truncated:
+                return sorted(prefixes)
+            token = result.next_continuation_token
+
+    def __save(self, force=False):
+        if self.store is None:
+            return
+
+        now = time.time()
+        if not force and now - self.__last_saved < _LIST_CHECKPOINT_INTERVAL:
+            return
+
+        self.store.put(self.store_key, {'op_type': 'ParallelList',
+                                        'bucket': self.bucket.bucket_name,
+                                        'prefix': self.prefix,
+                                        'shards': self.shards})
+        self.__last_saved = now
+
+
+_LIST_CHECKPOINT_INTERVAL = 5
+
+
+def _make_list_shard(prefix, delimiter, start_after, end):
+    return {'prefix': prefix, 'delimiter': delimiter, 'start_after': start_after, 'end': end, 'done': False}
+
+
+def _make_list_store_key(bucket_name, prefix, pivots):
+    return 'list--' + utils.md5_string('oss://{0}/{1}?pivots={2}'.format(bucket_name, to_string(prefix), pivots))
+
+
+def _merge_prefixes(entries, prefixes):
+    # 服务端返回的文件列表和公共前缀列表各自已按key排好序，归并即可，不必整体重新排序
+    if not prefixes:
+        return entries
+    if not entries:
+        return prefixes
+
+    return list(_merge_by_key(iter(entries), iter(prefixes)))
+
+
+def _merge_by_key(a, b):
+    x = next(a, None)
+    y = next(b, None)
+
+    while x is not None and y is not None:
+        if x.key <= y.key:
+            yield x
+            x = next(a, None)
+        else:
+            yield y
+            y = next(b, None)
+
+    while x is not None:
+        yield x
+        x = next(a, None)
+
+    while y is not None:
+        yield y
+        y = next(b, None)
@@ -7,11 +7,15 @@ oss2.models
 该模块包含Python SDK API接口所需要的输入参数以及返回值类型。
 """
 from . import utils
+from . import defaults
 from .utils import http_to_unixtime, make_progress_adapter, make_crc_adapter, b64encode_as_string, b64decode_from_string
+from .utils import _readinto, _iter_views
 from .exceptions import ClientError, InconsistentError
 from .compat import urlunquote, to_string, urlquote
 from .select_response import SelectResponseAdapter
 from .headers import *
+import array
+import binascii
 import json
 import logging
 import copy
@@ -33,6 +37,8 @@ class PartInfo(object):
     :param int last_modified: 该分片最后修改的时间戳，类型为int。参考 :ref:`unix_time`
     :param int part_crc: 该分片的crc64值
     """
+    __slots__ = ('part_number', 'etag', 'size', 'last_modified', 'part_crc')
+
     def __init__(self, part_number, etag, size=None, last_modified=None, part_crc=None):
         self.part_number = part_number
         self.etag = etag
@@ -245,6 +251,9 @@ class GetObjectResult(HeadObjectResult):
         self.__crc_enabled = crc_enabled
         self.__crypto_provider = crypto_provider
 
+        #: 迭代时每块的字节数
+        self.chunk_size = defaults.read_chunk_size
+
         self.content_range = _hget(resp.headers, 'Content-Range')
         if self.content_range:
             byte_range = self._parse_range_str(self.content_range)
@@ -276,15 +285,14 @@ class GetObjectResult(HeadObjectResult):
                         raise ClientError(
                             'There is no encryption materials match the material description of the object')
 
-                plain_key = crypto_provider.decrypt_encrypted_key(content_crypto_material.encrypted_key)
+                plain_key = crypto_provider._unwrap_key(content_crypto_material.encrypted_key)
                 if content_crypto_material.deprecated:
                     if content_crypto_material.wrap_alg == KMS_ALI_WRAP_ALGORITHM:
-                        plain_counter = int(
-                            crypto_provider.decrypt_encrypted_iv(content_crypto_material.encrypted_iv, True))
+                        plain_counter = int(crypto_provider._unwrap_iv(content_crypto_material.encrypted_iv, True))
                     else:
-                        plain_counter = int(crypto_provider.decrypt_encrypted_iv(content_crypto_material.encrypted_iv))
+                        plain_counter = int(crypto_provider._unwrap_iv(content_crypto_material.encrypted_iv))
                 else:
-                    plain_iv = crypto_provider.decrypt_encrypted_iv(content_crypto_material.encrypted_iv)
+                    plain_iv = crypto_provider._unwrap_iv(content_crypto_material.encrypted_iv)
 
                 offset = 0
                 if self.content_range:
@@ -312,11 +320,28 @@ class GetObjectResult(HeadObjectResult):
     def read(self, amt=None):
         return self.stream.read(amt)
 
+    def readinto(self, b):
+        """读取文件内容到 `b` （bytearray、memoryview、NumPy数组等可写的缓冲区）中，返回读到的字节数，为0表示已经读完。"""
+        return _readinto(self.stream, b)
+
+    def iter_views(self, chunk_size=None):
+        """迭代文件内容，每次返回同一个缓冲区的memoryview，避免为每块数据分配新的bytes。
+
+        返回的memoryview在下一次迭代时会被覆盖，需要保留的数据应当自行拷贝。
+
+        :param int chunk_size: 缓冲区大小，缺省为 `chunk_size` 属性的值
+        """
+        return _iter_views(self.readinto, chunk_size or self.chunk_size)
+
     def close(self):
         self.resp.response.close()
 
     def __iter__(self):
-        return iter(self.stream)
+        while True:
+            content = self.read(self.chunk_size)
+            if not content:
+                return
+            yield content
 
     def __enter__(self):
         return self
@@ -340,6 +365,26 @@ class SelectObjectResult(HeadObjectResult):
     def read(self):
         return self.select_resp.read()
 
+    def readinto(self, b):
+        """读取查询结果到 `b` 中，返回读到的字节数，为0表示已经读完。"""
+        return self.select_resp.readinto(b)
+
+    def iter_views(self, chunk_size=None):
+        """迭代查询结果，每次返回同一个缓冲区的memoryview。返回的memoryview在下一次迭代时会被覆盖。
+
+        :param int chunk_size: 缓冲区大小，缺省为 `chunk_size` 属性的值
+        """
+        return _iter_views(self.readinto, chunk_size or self.chunk_size)
+
+    @property
+    def chunk_size(self):
+        """每次从网络读取的字节数，缺省为 `defaults.read_chunk_size` 。"""
+        return self.resp.chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, value):
+        self.resp.chunk_size = value
+
     def close(self):
         self.resp.response.close()
         
@@ -457,6 +502,8 @@ class ListObjectsV2Result(RequestResult):
 
 
 class SimplifiedObjectInfo(object):
+    __slots__ = ('key', 'last_modified', 'etag', 'type', 'size', 'storage_class', 'owner', 'restore_info')
+
     def __init__(self, key, last_modified, etag, type, size, storage_class, owner=None, restore_info=None):
         #: 文件名，或公共前缀名。
         self.key = key
@@ -488,6 +535,125 @@ class SimplifiedObjectInfo(object):
         return self.last_modified is None
 
 
+try:
+    array.array('q')
+    _INT64_TYPECODE = 'q'
+except ValueError:
+    # 老版本Python的array不支持'q'，用double存储，2^53以内的整数可以精确表示
+    _INT64_TYPECODE = 'd'
+
+
+class _EtagColumn(object):
+    """ETag列。普通ETag是32位大写十六进制串，按16字节二进制紧凑存放；其他形式（如分片上传的 `xxx-N` ）单独保存。"""
+    def __init__(self):
+        self.__data = bytearray()
+        self.__others = {}
+
+    def append(self, etag):
+        if len(etag) == 32 and etag.upper() == etag:
+            try:
+                self.__data += binascii.unhexlify(etag)
+                return
+            except (TypeError, ValueError):
+                pass
+
+        self.__others[len(self)] = etag
+        self.__data += b'\0' * 16
+
+    def __len__(self):
+        return len(self.__data) // 16
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('etag index out of range')
+
+        if i in self.__others:
+            return self.__others[i]
+
+        return to_string(binascii.hexlify(bytes(self.__data[i * 16:i * 16 + 16]))).upper()
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class ObjectListingTable(object):
+    """按列存储的文件列表，用于罗列海量文件（如清单类扫描）时节省内存。
+
+    每个文件不再对应一个 :class:`SimplifiedObjectInfo` 对象，而是把各字段分别存入并行的数组：文件大小和最后修改时间
+    用 `array.array` 紧凑存储，ETag按二进制存储；文件类型和存储类型的取值很少，相同的值共享同一个字符串对象。
+
+    可以通过 :func:`ObjectIterator.fill_table <oss2.ObjectIterator.fill_table>` 、
+    :func:`ObjectIteratorV2.fill_table <oss2.ObjectIteratorV2.fill_table>` 或者 `list_objects` 、
+    `list_objects_v2` 的 `table` 参数直接填充，不会生成中间的 `SimplifiedObjectInfo` 对象。
+
+    用法 ::
+
+        >>> table = oss2.ObjectIteratorV2(bucket, prefix='logs/').fill_table()
+        >>> total_size = sum(table.sizes)
+        >>> for key, size in zip(table.keys, table.sizes):
+        ...     print(key, size)
+
+    注意：不保存Owner和RestoreInfo。
+    """
+    def __init__(self):
+        #: 文件名列表
+        self.keys = []
+
+        #: 文件最后修改时间列表，类型为 `array.array`
+        self.last_modified = array.array(_INT64_TYPECODE)
+
+        #: HTTP ETag列表，只支持下标访问和迭代
+        self.etags = _EtagColumn()
+
+        #: 文件类型列表
+        self.types = []
+
+        #: 文件大小列表，类型为 `array.array`
+        self.sizes = array.array(_INT64_TYPECODE)
+
+        #: 文件存储类型列表
+        self.storage_classes = []
+
+        #: 公共前缀列表，类型为str列表。
+        self.prefix_list = []
+
+        self.__strings = {}
+
+    def __intern(self, value):
+        return self.__strings.setdefault(value, value)
+
+    def append(self, key, last_modified, etag, type, size, storage_class):
+        self.keys.append(key)
+        self.last_modified.append(last_modified)
+        self.etags.append(etag)
+        self.types.append(self.__intern(type))
+        self.sizes.append(size)
+        self.storage_classes.append(self.__intern(storage_class))
+
+    def extend(self, object_list):
+        """追加一组 :class:`SimplifiedObjectInfo` ；公共前缀（ `is_prefix()` 为True）追加到 `prefix_list` 。"""
+        for obj in object_list:
+            if obj.is_prefix():
+                self.prefix_list.append(obj.key)
+            else:
+                self.append(obj.key, obj.last_modified, obj.etag, obj.type, obj.size, obj.storage_class)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, i):
+        """返回第i个文件对应的 :class:`SimplifiedObjectInfo` 。"""
+        return SimplifiedObjectInfo(self.keys[i], int(self.last_modified[i]), self.etags[i], self.types[i],
+                                    int(self.sizes[i]), self.storage_classes[i])
+
+    def __iter__(self):
+        for i in range(len(self.keys)):
+            yield self[i]
+
+
 OBJECT_ACL_DEFAULT = 'default'
 OBJECT_ACL_PRIVATE = 'private'
 OBJECT_ACL_PUBLIC_READ = 'public-read'
@@ -1630,6 +1796,8 @@ class ListObjectVersionsResult(RequestResult):
         self.common_prefix = []
 
 class DeleteMarkerInfo(object):
+    __slots__ = ('key', 'versionid', 'is_latest', 'last_modified', 'owner')
+
     def __init__(self):
         self.key = ''
         self.versionid = ''
@@ -1638,6 +1806,9 @@ class DeleteMarkerInfo(object):
         self.owner = Owner('', '')
 
 class ObjectVersionInfo(object):
+    __slots__ = ('key', 'versionid', 'is_latest', 'last_modified', 'owner', 'type', 'storage_class', 'size', 'etag',
+                 'restore_info')
+
     def __init__(self):
         self.key = ''
         self.versionid = ''
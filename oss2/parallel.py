@@ -0,0 +1,516 @@
+# -*- coding: utf-8 -*-
+
+"""
+oss2.parallel
+~~~~~~~~~~~~~
+
+该模块包含并发执行的批量操作：
+
+    * 并发分段（Range）下载到内存。参见 :func:`Bucket.get_object_parallel <oss2.Bucket.get_object_parallel>` ；
+    * 并发批量删除。参见 :func:`Bucket.bulk_delete <oss2.Bucket.bulk_delete>` 及
+      :func:`Bucket.delete_prefix <oss2.Bucket.delete_prefix>` 。
+"""
+
+import threading
+import sys
+import time
+import logging
+
+from . import utils
+from . import http
+from . import defaults
+from .models import HeadObjectResult, PartInfo, BatchDeleteObjectVersion, BatchDeleteObjectVersionList
+from .exceptions import ClientError, InconsistentError, OssError
+from .compat import to_string
+from .headers import IF_MATCH
+from .task_queue import TaskQueue
+from .iterators import ObjectIteratorV2
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+logger = logging.getLogger(__name__)
+
+
+class GetObjectParallelResult(HeadObjectResult):
+    """:func:`Bucket.get_object_parallel <oss2.Bucket.get_object_parallel>` 下载到内存时的返回值。
+
+    除了HeadObject返回的元信息外，还包括 `buffer` ，即存放文件内容的缓冲区，以及客户端计算的 `client_crc` 。
+    """
+
+    def __init__(self, resp, buffer, client_crc):
+        super(GetObjectParallelResult, self).__init__(resp)
+
+        #: 文件内容。如果调用者没有指定，则是长度等于文件大小的bytearray
+        self.buffer = buffer
+
+        #: 各分片CRC合并得到的文件CRC，没有开启CRC校验时为None
+        self.client_crc = client_crc
+
+
+class _ParallelGetter(object):
+    """并发下载的公共部分：按分片发起带If-Match的Range GET，统计进度，合并分片CRC。"""
+
+    def __init__(self, bucket, key, head_result, part_size, num_threads, progress_callback, headers, params):
+        self.bucket = bucket
+        self.key = key
+        self.size = head_result.content_length
+        self.etag = head_result.etag
+        self.server_crc = head_result.server_crc
+
+        self.part_size = part_size
+        self.num_threads = num_threads
+        self.progress_callback = progress_callback
+        self.headers = headers
+        self.params = params
+
+        self.parts = _split_to_ranges(self.size, part_size)
+
+        self.__progress_lock = threading.Lock()
+        self.__consumed = 0
+
+    def get_part(self, index):
+        start, end = self.parts[index]
+
+        headers = http.CaseInsensitiveDict(self.headers)
+        headers[IF_MATCH] = self.etag
+
+        return self.bucket.get_object(self.key, byte_range=(start, end - 1), headers=headers, params=self.params)
+
+    def report_progress(self, size):
+        with self.__progress_lock:
+            self.__consumed += size
+            consumed = self.__consumed
+        utils._invoke_progress_callback(self.progress_callback, consumed, self.size)
+
+    def check_crc(self, client_crc):
+        utils.check_crc('get object parallel', client_crc, self.server_crc, None)
+
+
+class _BufferGetter(_ParallelGetter):
+    def __init__(self, bucket, key, head_result, buffer, part_size, num_threads, progress_callback, headers, params):
+        super(_BufferGetter, self).__init__(bucket, key, head_result, part_size, num_threads, progress_callback,
+                                            headers, params)
+        self.__view = utils._byte_view(buffer)
+        self.__part_crcs = [None] * len(self.parts)
+
+    def run(self):
+        http._ensure_pool_size(self.bucket.session, self.num_threads)
+        q = TaskQueue(self.__producer, [self.__consumer] * min(self.num_threads, max(len(self.parts), 1)))
+        q.run()
+
+        if not self.bucket.enable_crc:
+            return None
+
+        parts = [PartInfo(i + 1, None, size=end - start, part_crc=self.__part_crcs[i])
+                 for i, (start, end) in enumerate(self.parts)]
+        client_crc = utils.calc_obj_crc_from_parts(parts)
+        self.check_crc(client_crc)
+
+        return client_crc
+
+    def __producer(self, q):
+        for index in range(len(self.parts)):
+            q.put(index)
+
+    def __consumer(self, q):
+        while q.ok():
+            index = q.get()
+            if index is None:
+                break
+
+            self.__get_part(index)
+
+    def __get_part(self, index):
+        start, end = self.parts[index]
+
+        result = self.get_part(index)
+        utils._copy_to_buffer(result, self.__view[start:end], request_id=result.request_id)
+
+        self.__part_crcs[index] = result.client_crc
+        self.report_progress(end - start)
+
+        logger.debug("Get part done, key: {0}, range: {1}-{2}, req_id: {3}".format(
+            to_string(self.key), start, end - 1, result.request_id))
+
+
+class ParallelObjectStream(HeadObjectResult):
+    """:func:`Bucket.get_object_parallel <oss2.Bucket.get_object_parallel>` 以流的方式返回的文件对象。
+
+    后台线程并发下载各个分片，读取时按顺序返回。已经下载但还没有被读取的分片以及正在下载的分片总数不超过
+    `max_buffered_parts` ，因此占用的内存不超过 `max_buffered_parts * part_size` 。读到文件结尾时校验CRC。
+
+    使用完毕后应调用 `close` （或使用with语句），以便在没有读完时停止后台线程。
+    """
+
+    def __init__(self, resp, getter, max_buffered_parts):
+        super(ParallelObjectStream, self).__init__(resp)
+
+        #: 已读取部分的CRC，读到文件结尾后即为整个文件的CRC。没有开启CRC校验时为None
+        self.client_crc = 0 if getter.bucket.enable_crc else None
+
+        self.__getter = getter
+        self.__crc64 = utils.Crc64()
+        self.__num_parts = len(getter.parts)
+
+        self.__cond = threading.Condition()
+        self.__window = threading.Semaphore(max_buffered_parts)
+        self.__ready = {}
+        self.__next_to_get = 0
+        self.__next_to_read = 0
+        self.__exc_info = None
+        self.__closed = False
+
+        self.__current = b''
+        self.__offset = 0
+
+        http._ensure_pool_size(getter.bucket.session, getter.num_threads)
+        self.__threads = []
+        for i in range(min(getter.num_threads, self.__num_parts)):
+            t = threading.Thread(target=self.__worker)
+            t.daemon = True
+            t.start()
+            self.__threads.append(t)
+
+    def read(self, amt=None):
+        if amt is not None and amt < 0:
+            amt = None
+
+        chunks = []
+        while amt is None or amt > 0:
+            if self.__offset >= len(self.__current):
+                if not self.__next_part():
+                    break
+
+            end = len(self.__current) if amt is None else min(len(self.__current), self.__offset + amt)
+            chunk = self.__current[self.__offset:end]
+            self.__offset = end
+            chunks.append(chunk)
+
+            if amt is not None:
+                amt -= len(chunk)
+
+        return b''.join(chunks)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.__offset >= len(self.__current) and not self.__next_part():
+            raise StopIteration
+
+        chunk = self.__current[self.__offset:]
+        self.__offset = len(self.__current)
+        return chunk
+
+    next = __next__
+
+    def close(self):
+        with self.__cond:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__ready.clear()
+            self.__cond.notify_all()
+
+        # 唤醒等待窗口的线程，让其退出
+        for t in self.__threads:
+            self.__window.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __next_part(self):
+        if self.__next_to_read >= self.__num_parts:
+            return False
+
+        with self.__cond:
+            while self.__next_to_read not in self.__ready:
+                if self.__exc_info is not None:
+                    raise self.__exc_info[1]
+                if self.__closed:
+                    raise ClientError('The stream has been closed')
+                self.__cond.wait(1)
+
+            content, part_crc = self.__ready.pop(self.__next_to_read)
+
+        self.__window.release()
+
+        self.__current = content
+        self.__offset = 0
+        self.__next_to_read += 1
+
+        if self.client_crc is not None:
+            self.client_crc = self.__crc64.combine(self.client_crc, part_crc, len(content))
+
+        if self.__next_to_read == self.__num_parts:
+            self.close()
+            self.__getter.check_crc(self.client_crc)
+
+        return True
+
+    def __worker(self):
+        try:
+            while True:
+                self.__window.acquire()
+
+                with self.__cond:
+                    if self.__closed or self.__exc_info is not None or self.__next_to_get >= self.__num_parts:
+                        return
+                    index = self.__next_to_get
+                    self.__next_to_get += 1
+
+                content, part_crc = self.__get_part(index)
+
+                with self.__cond:
+                    if self.__closed:
+                        return
+                    self.__ready[index] = (content, part_crc)
+                    self.__cond.notify_all()
+        except:
+            with self.__cond:
+                if self.__exc_info is None:
+                    self.__exc_info = sys.exc_info()
+                self.__cond.notify_all()
+
+    def __get_part(self, index):
+        start, end = self.__getter.parts[index]
+
+        result = self.__getter.get_part(index)
+        content = result.read()
+        if len(content) != end - start:
+            raise InconsistentError("IncompleteRead from source", result.request_id)
+
+        self.__getter.report_progress(end - start)
+        return content, result.client_crc
+
+
+def get_object_parallel(bucket, key, buffer=None, part_size=None, num_threads=None, stream=False,
+                        max_buffered_parts=None, progress_callback=None, headers=None, params=None):
+    part_size = defaults.get(part_size, defaults.multiget_part_size)
+    num_threads = defaults.get(num_threads, defaults.multiget_num_threads)
+
+    head_result = bucket.head_object(key, headers=headers, params=params)
+    size = head_result.content_length
+
+    if not stream:
+        if buffer is None:
+            buffer = bytearray(size)
+        elif len(utils._byte_view(buffer)) < size:
+            raise ClientError('The buffer is too small, buffer size: {0}, object size: {1}'.format(
+                len(utils._byte_view(buffer)), size))
+
+    max_buffered_parts = max(max_buffered_parts or num_threads * 2, num_threads)
+    getter_args = (bucket, key, head_result)
+    getter_kwargs = dict(part_size=part_size, num_threads=num_threads, progress_callback=progress_callback,
+                         headers=headers, params=params)
+
+    logger.debug("Start to get object parallel, bucket: {0}, key: {1}, size: {2}, part_size: {3}, num_threads: {4}, "
+                 "stream: {5}".format(bucket.bucket_name, to_string(key), size, part_size, num_threads, stream))
+
+    if stream:
+        return ParallelObjectStream(head_result.resp, _ParallelGetter(*getter_args, **getter_kwargs),
+                                    max_buffered_parts)
+
+    client_crc = _BufferGetter(*getter_args, buffer=buffer, **getter_kwargs).run()
+    return GetObjectParallelResult(head_result.resp, buffer, client_crc)
+
+
+def _split_to_ranges(size, part_size):
+    return [(start, min(start + part_size, size)) for start in range(0, size, part_size)]
+
+
+#: 一次批量删除请求最多包含的文件数
+BATCH_DELETE_MAX_KEYS = 1000
+
+
+class BulkDeleteResult(object):
+    """:func:`Bucket.bulk_delete <oss2.Bucket.bulk_delete>` 的返回值。"""
+
+    def __init__(self):
+        #: 成功删除的文件（版本）数
+        self.deleted_count = 0
+
+        #: 删除失败的文件列表，每个元素是(key, versionid, error)三元组。没有指定版本时versionid为None，
+        #: error是请求的异常，或者服务端没有确认删除时为None
+        self.failed = []
+
+        #: 发送的批量删除请求数
+        self.batch_count = 0
+
+        #: 耗时，以秒为单位
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self):
+        """每秒删除的文件数"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.deleted_count / self.elapsed
+
+
+class _BulkDeleter(object):
+    def __init__(self, bucket, concurrency, batch_size, progress_callback, headers):
+        self.bucket = bucket
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.progress_callback = progress_callback
+        self.headers = headers
+
+        self.result = BulkDeleteResult()
+
+        self.__queue = queue.Queue(concurrency * 2)
+        self.__lock = threading.Lock()
+        self.__exc_info = None
+
+    def run(self, keys):
+        start_time = time.time()
+
+        http._ensure_pool_size(self.bucket.session, self.concurrency)
+        threads = []
+        for i in range(self.concurrency):
+            t = threading.Thread(target=self.__consumer)
+            t.daemon = True
+            t.start()
+            threads.append(t)
+
+        try:
+            batch = []
+            for item in keys:
+                batch.append(_to_delete_item(item))
+                if len(batch) >= self.batch_size:
+                    self.__put(batch)
+                    batch = []
+
+            if batch:
+                self.__put(batch)
+        finally:
+            for t in threads:
+                self.__put(None)
+            for t in threads:
+                t.join()
+
+        self.result.elapsed = time.time() - start_time
+
+        if self.__exc_info:
+            raise self.__exc_info[1]
+
+        logger.debug("Bulk delete done, bucket: {0}, deleted: {1}, failed: {2}, batches: {3}, elapsed: {4:.3f}s, "
+                     "throughput: {5:.1f} keys/s".format(self.bucket.bucket_name, self.result.deleted_count,
+                                                         len(self.result.failed), self.result.batch_count,
+                                                         self.result.elapsed, self.result.throughput))
+        return self.result
+
+    def __put(self, batch):
+        # 队列有界，消费者跟不上时阻塞生产者（即遍历key的迭代器）
+        while True:
+            try:
+                self.__queue.put(batch, timeout=1)
+                return
+            except queue.Full:
+                if self.__exc_info is not None and batch is not None:
+                    raise self.__exc_info[1]
+
+    def __consumer(self):
+        while True:
+            batch = self.__queue.get()
+            if batch is None:
+                return
+
+            if self.__exc_info is not None:
+                continue
+
+            try:
+                deleted, failed = self.__delete_batch(batch)
+            except:
+                self.__exc_info = sys.exc_info()
+                continue
+
+            with self.__lock:
+                self.result.deleted_count += deleted
+                self.result.failed.extend(failed)
+                self.result.batch_count += 1
+                processed = self.result.deleted_count + len(self.result.failed)
+
+            utils._invoke_progress_callback(self.progress_callback, processed, None)
+
+    def __delete_batch(self, batch):
+        versioned = any(versionid is not None for key, versionid in batch)
+
+        try:
+            if versioned:
+                version_list = BatchDeleteObjectVersionList([BatchDeleteObjectVersion(key, versionid)
+                                                             for key, versionid in batch])
+                result = self.bucket.delete_object_versions(version_list, headers=self.headers)
+            else:
+                result = self.bucket.batch_delete_objects([key for key, versionid in batch], headers=self.headers)
+        except OssError as e:
+            logger.warning("Batch delete failed, bucket: {0}, keys: {1}, error: {2}".format(
+                self.bucket.bucket_name, len(batch), e))
+            return 0, [(key, versionid, e) for key, versionid in batch]
+
+        if versioned:
+            done = set((v.key, v.versionid) for v in result.delete_versions)
+            failed = [(key, versionid, None) for key, versionid in batch if (key, versionid or '') not in done]
+        else:
+            done = set(result.deleted_keys)
+            failed = [(key, versionid, None) for key, versionid in batch if key not in done]
+
+        return len(batch) - len(failed), failed
+
+
+def bulk_delete(bucket, keys, concurrency=None, batch_size=None, progress_callback=None, headers=None):
+    concurrency = defaults.get(concurrency, defaults.bulk_delete_num_threads)
+    batch_size = min(defaults.get(batch_size, BATCH_DELETE_MAX_KEYS), BATCH_DELETE_MAX_KEYS)
+
+    logger.debug("Start to bulk delete, bucket: {0}, concurrency: {1}, batch_size: {2}".format(
+        bucket.bucket_name, concurrency, batch_size))
+    return _BulkDeleter(bucket, max(concurrency, 1), batch_size, progress_callback, headers).run(keys)
+
+
+def delete_prefix(bucket, prefix, include_versions=False, concurrency=None, progress_callback=None, headers=None):
+    if not prefix:
+        raise ClientError('prefix should not be empty')
+
+    if include_versions:
+        keys = _iter_object_versions(bucket, prefix, headers)
+    else:
+        keys = ObjectIteratorV2(bucket, prefix=prefix, max_keys=BATCH_DELETE_MAX_KEYS, headers=headers)
+
+    return bulk_delete(bucket, keys, concurrency=concurrency, progress_callback=progress_callback, headers=headers)
+
+
+def _iter_object_versions(bucket, prefix, headers):
+    key_marker = ''
+    versionid_marker = ''
+
+    while True:
+        result = bucket.list_object_versions(prefix=prefix, key_marker=key_marker, versionid_marker=versionid_marker,
+                                             max_keys=BATCH_DELETE_MAX_KEYS, headers=headers)
+        for info in result.versions:
+            yield info
+        for info in result.delete_marker:
+            yield info
+
+        if not result.is_truncated:
+            return
+
+        key_marker = result.next_key_marker
+        versionid_marker = result.next_versionid_marker
+
+
+def _to_delete_item(item):
+    """把待删除的元素转换为(key, versionid)。元素可以是文件名、带key属性的对象（如 `SimplifiedObjectInfo` ），
+    或者带key和versionid属性的对象（如 `ObjectVersionInfo` 、 `BatchDeleteObjectVersion` ）。"""
+    if isinstance(item, (str, type(u''), bytes)):
+        return to_string(item), None
+
+    if getattr(item, 'is_prefix', None) is not None and item.is_prefix():
+        raise ClientError('Can not delete a common prefix: {0}'.format(item.key))
+
+    return item.key, getattr(item, 'versionid', None) or None
@@ -7,6 +7,7 @@ oss2.resumable
 该模块包含了断点续传相关的函数和类。
 """
 
+import io
 import os
 
 from . import utils
@@ -16,16 +17,17 @@ from . import exceptions
 from . import defaults
 from . import http
 from . import models
-from .crypto_bucket import CryptoBucket
+from . import instrumentation
 from . import Bucket
 from .iterators import PartIterator
 
 from .models import PartInfo
-from .compat import json, stringify, to_unicode, to_string
+from .compat import json, stringify, to_unicode, to_string, to_bytes
 from .task_queue import TaskQueue
 from .headers import *
 
 import functools
+import sys
 import threading
 import random
 import string
@@ -53,7 +55,8 @@ def resumable_upload(bucket, key, filename,
     且目标文件名没有变化时，会根据本地保存的信息，从断点开始上传。
 
     使用该函数应注意如下细节：
-        #. 如果使用CryptoBucket，函数会退化为普通上传
+        #. 如果使用CryptoBucket，分片大小会向上对齐到加密块大小，各分片并发加密上传；加密信息保存在断点信息中，
+           续传时沿用同一个数据密钥
 
     :param bucket: :class:`Bucket <oss2.Bucket>` 或者 ：:class:`CryptoBucket <oss2.CryptoBucket>` 对象
     :param key: 上传到用户空间的文件名
@@ -123,7 +126,7 @@ def resumable_download(bucket, key, filename,
         #. 对同样的源文件、目标文件，避免多个程序（线程）同时调用该函数。因为断点信息会在磁盘上互相覆盖，或临时文件名会冲突。
         #. 避免使用太小的范围（分片），即 `part_size` 不宜过小，建议大于或等于 `oss2.defaults.multiget_part_size` 。
         #. 如果目标文件已经存在，那么该函数会覆盖此文件。
-        #. 如果使用CryptoBucket，函数会退化为普通下载
+        #. 如果使用CryptoBucket，分片大小会向上对齐到加密块大小，各分片并发下载、解密
 
 
     :param bucket: :class:`Bucket <oss2.Bucket>` 或者 ：:class:`CryptoBucket <oss2.CryptoBucket>` 对象
@@ -165,8 +168,85 @@ def resumable_download(bucket, key, filename,
                                   headers=valid_headers)
 
 
+def resumable_copy(src_bucket, src_key, dst_bucket, dst_key,
+                   store=None,
+                   headers=None,
+                   multipart_threshold=None,
+                   part_size=None,
+                   progress_callback=None,
+                   num_threads=None,
+                   params=None):
+    """断点拷贝。把 `src_bucket` 里的 `src_key` 拷贝为 `dst_bucket` 里的 `dst_key` ，数据不经过客户端。
+
+    文件长度大于或等于 `multipart_threshold` 时，按照 :func:`determine_part_size` 计算的分片大小，通过
+    :func:`Bucket.upload_part_copy <oss2.Bucket.upload_part_copy>` 并发拷贝各个分片，并在本地磁盘保存已经完成的分片信息。
+    如果拷贝中断，下次拷贝同样的源文件和目标文件时，只会拷贝缺失的分片。拷贝完成后，会用各分片的CRC64计算目标文件的CRC64，
+    并与源文件的CRC64比较。
+
+    使用该函数应注意如下细节：
+        #. 如果源文件在两次拷贝之间发生了变化（ETag、长度或最后修改时间不同），则从头开始拷贝；
+        #. 如果没有指定 `headers` ，则沿用源文件的Content-Type及用户自定义元信息；
+        #. 对 `dst_bucket` 及 `src_bucket` 都需要有读权限，对 `dst_bucket` 需要有写权限。
+
+    :param src_bucket: 源文件所在的 :class:`Bucket <oss2.Bucket>` 对象
+    :param src_key: 源文件名
+    :param dst_bucket: 目标文件所在的 :class:`Bucket <oss2.Bucket>` 对象
+    :param dst_key: 目标文件名
+    :param store: 用来保存断点信息的持久存储，参见 :class:`ResumableStore` 的接口。如不指定，则使用 `ResumableStore` 。
+
+    :param headers: HTTP头部
+        # 调用外部函数copy_object 或 init_multipart_upload传递完整headers
+        # 调用外部函数upload_part_copy目前只传递OSS_REQUEST_PAYER
+        # 调用外部函数complete_multipart_upload目前只传递OSS_REQUEST_PAYER, OSS_OBJECT_ACL
+    :type headers: 可以是dict，建议是oss2.CaseInsensitiveDict
+
+    :param multipart_threshold: 文件长度大于该值时，则用分片拷贝。
+    :param part_size: 指定分片拷贝的每个分片的大小。如不指定，则自动计算。
+    :param progress_callback: 拷贝进度回调函数。参见 :ref:`progress_callback` 。
+    :param num_threads: 并发拷贝的线程数，如不指定则使用 `oss2.defaults.multipart_num_threads` 。
+
+    :param dict params: 可以传入versionId拷贝源文件的指定版本
+
+    :return: :class:`PutObjectResult <oss2.models.PutObjectResult>`
+    """
+    logger.debug("Start to resumable copy, source bucket: {0}, source key: {1}, bucket: {2}, key: {3}, headers: {4}, "
+                 "multipart_threshold: {5}, part_size: {6}, num_threads: {7}".format(
+                  src_bucket.bucket_name, to_string(src_key), dst_bucket.bucket_name, to_string(dst_key), headers,
+                  multipart_threshold, part_size, num_threads))
+    multipart_threshold = defaults.get(multipart_threshold, defaults.multipart_threshold)
+
+    head_params = _populate_valid_params(params, [Bucket.VERSIONID])
+    head_headers = _populate_valid_headers(headers, [OSS_REQUEST_PAYER])
+    result = src_bucket.head_object(src_key, params=head_params, headers=head_headers)
+
+    logger.debug("The size of object to copy is: {0}, multipart_threshold: {1}".format(result.content_length,
+                                                                                       multipart_threshold))
+    if result.content_length >= multipart_threshold:
+        if headers is None:
+            headers = http.CaseInsensitiveDict()
+            if result.content_type:
+                headers['Content-Type'] = result.content_type
+            for k, v in result.headers.items():
+                if k.lower().startswith(OSS_USER_METADATA_PREFIX):
+                    headers[k] = v
+
+        copier = _ResumableCopier(src_bucket, src_key, dst_bucket, dst_key, _ObjectInfo.make(result),
+                                  store=store,
+                                  headers=headers,
+                                  part_size=part_size,
+                                  progress_callback=progress_callback,
+                                  num_threads=num_threads,
+                                  params=head_params)
+        return copier.copy(result.server_crc)
+    else:
+        return dst_bucket.copy_object(src_bucket.bucket_name, src_key, dst_key, headers=headers, params=head_params)
+
+
 _MAX_MULTIGET_PART_COUNT = 100000
 
+# 断点下载时每个线程的读写缓冲区大小
+_MULTIGET_BUFFER_SIZE = 1024 * 1024
+
 
 def determine_part_size(total_size,
                         preferred_size=None):
@@ -209,6 +289,19 @@ def _split_to_parts(total_size, part_size):
 
     return parts
 
+
+def _align_part_size(cipher, part_size):
+    if cipher.is_block_aligned(part_size):
+        return part_size
+    return (part_size // cipher.block_size_len + 1) * cipher.block_size_len
+
+
+def _is_crypto_bucket(bucket):
+    # crypto_bucket模块没有导入时bucket不可能是CryptoBucket，不必为了这个判断导入pycryptodome和KMS SDK
+    module = sys.modules.get('oss2.crypto_bucket')
+    return module is not None and isinstance(bucket, module.CryptoBucket)
+
+
 def _populate_valid_headers(headers=None, valid_keys=None):
     """构建只包含有效keys的http header
 
@@ -360,8 +453,12 @@ class _ResumableDownloader(_ResumableOperation):
         self.__op = 'ResumableDownload'
         self.__part_size = defaults.get(part_size, defaults.multiget_part_size)
         self.__part_size = _determine_part_size_internal(self.size, self.__part_size, _MAX_MULTIGET_PART_COUNT)
+        if _is_crypto_bucket(bucket):
+            # 分片与加密块对齐时，每个分片都从块的边界开始解密，不必多下载、再丢弃前一个块中的数据
+            self.__part_size = _align_part_size(bucket.crypto_provider.cipher, self.__part_size)
 
         self.__tmp_file = None
+        self.__file = None
         self.__num_threads = defaults.get(num_threads, defaults.multiget_num_threads)
         self.__finished_parts = None
         self.__finished_size = None
@@ -383,9 +480,14 @@ class _ResumableDownloader(_ResumableOperation):
         # create tmp file if it is does not exist
         open(self.__tmp_file, 'a').close()
 
-        q = TaskQueue(functools.partial(self.__producer, parts_to_download=parts_to_download),
-                      [self.__consumer] * self.__num_threads)
-        q.run()
+        # 预先分配空间，所有线程共用一个文件描述符，按位置写入各自的分片
+        with utils._SharedFile(self.__tmp_file, writable=True) as f:
+            f.preallocate(self.size)
+            self.__file = f
+            http._ensure_pool_size(self.bucket.session, self.__num_threads)
+            q = TaskQueue(functools.partial(self.__producer, parts_to_download=parts_to_download),
+                          [self.__consumer] * self.__num_threads)
+            q.run()
 
         if self.bucket.enable_crc:
             parts = sorted(self.__finished_parts, key=lambda p: p.part_number)
@@ -402,31 +504,36 @@ class _ResumableDownloader(_ResumableOperation):
             q.put(part)
 
     def __consumer(self, q):
+        # 每个线程使用一个缓冲区，在各个分片之间重复使用
+        buf = bytearray(min(_MULTIGET_BUFFER_SIZE, self.__part_size))
+
         while q.ok():
             part = q.get()
             if part is None:
                 break
 
-            self.__download_part(part)
+            self.__download_part(part, buf)
 
-    def __download_part(self, part):
+    def __download_part(self, part, buf):
         self._report_progress(self.__finished_size)
 
-        with open(self.__tmp_file, 'rb+') as f:
-            f.seek(part.start, os.SEEK_SET)
-
-            headers = _populate_valid_headers(self.__headers, [OSS_REQUEST_PAYER, OSS_TRAFFIC_LIMIT])
-            if headers is None:
-                headers = http.CaseInsensitiveDict()
-            headers[IF_MATCH] = self.objectInfo.etag
-            headers[IF_UNMODIFIED_SINCE] = utils.http_date(self.objectInfo.mtime)
+        headers = _populate_valid_headers(self.__headers, [OSS_REQUEST_PAYER, OSS_TRAFFIC_LIMIT])
+        if headers is None:
+            headers = http.CaseInsensitiveDict()
+        headers[IF_MATCH] = self.objectInfo.etag
+        headers[IF_UNMODIFIED_SINCE] = utils.http_date(self.objectInfo.mtime)
 
-            result = self.bucket.get_object(self.key, byte_range=(part.start, part.end - 1), headers=headers, params=self.__params)
-            utils.copyfileobj_and_verify(result, f, part.end - part.start, request_id=result.request_id)
+        result = self.bucket.get_object(self.key, byte_range=(part.start, part.end - 1), headers=headers, params=self.__params)
+        utils._copy_to_shared_file(result, self.__file, part.start, part.end - part.start, buf,
+                                   request_id=result.request_id)
 
         part.part_crc = result.client_crc
-        logger.debug("down part success, add part info to record, part_number: {0}, start: {1}, end: {2}".format(
-            part.part_number, part.start, part.end))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("down part success, add part info to record, part_number: {0}, start: {1}, end: {2}".format(
+                part.part_number, part.start, part.end))
+        if instrumentation._event_sink is not None:
+            instrumentation._emit('part_downloaded', bucket=self.bucket.bucket_name, key=self.key,
+                                  part_number=part.part_number, start=part.start, end=part.end)
 
         self.__finish_part(part)
 
@@ -558,6 +665,8 @@ class _ResumableUploader(_ResumableOperation):
 
         self.__params = params
 
+        self.__file = None
+
         # protect below fields
         self.__lock = threading.Lock()
         self.__record = None
@@ -567,7 +676,7 @@ class _ResumableUploader(_ResumableOperation):
         self.__record_upload_context = False
         self.__upload_context = None
 
-        if isinstance(self.bucket, CryptoBucket):
+        if _is_crypto_bucket(self.bucket):
             self.__encryption = True
             self.__record_upload_context = True
 
@@ -581,9 +690,13 @@ class _ResumableUploader(_ResumableOperation):
         parts_to_upload = sorted(parts_to_upload, key=lambda p: p.part_number)
         logger.debug("Parts need to upload: {0}".format(parts_to_upload))
 
-        q = TaskQueue(functools.partial(self.__producer, parts_to_upload=parts_to_upload),
-                      [self.__consumer] * self.__num_threads)
-        q.run()
+        # 所有线程共用一个文件描述符，按位置读取各自的分片
+        with utils._SharedFile(self.filename) as f:
+            self.__file = f
+            http._ensure_pool_size(self.bucket.session, self.__num_threads)
+            q = TaskQueue(functools.partial(self.__producer, parts_to_upload=parts_to_upload),
+                          [self.__consumer] * self.__num_threads)
+            q.run()
 
         self._report_progress(self.size)
 
@@ -606,22 +719,26 @@ class _ResumableUploader(_ResumableOperation):
             self.__upload_part(part)
 
     def __upload_part(self, part):
-        with open(to_unicode(self.filename), 'rb') as f:
-            self._report_progress(self.__finished_size)
+        self._report_progress(self.__finished_size)
 
-            f.seek(part.start, os.SEEK_SET)
-            headers = _populate_valid_headers(self.__headers, [OSS_REQUEST_PAYER, OSS_TRAFFIC_LIMIT])
-            if self.__encryption:
-                result = self.bucket.upload_part(self.key, self.__upload_id, part.part_number,
-                                                 utils.SizedFileAdapter(f, part.size), headers=headers,
-                                                 upload_context=self.__upload_context)
-            else:
-                result = self.bucket.upload_part(self.key, self.__upload_id, part.part_number,
-                                                 utils.SizedFileAdapter(f, part.size), headers=headers)
+        data = utils._FilePart(self.__file, part.start, part.size)
+        headers = _populate_valid_headers(self.__headers, [OSS_REQUEST_PAYER, OSS_TRAFFIC_LIMIT])
+        if self.__encryption:
+            result = self.bucket.upload_part(self.key, self.__upload_id, part.part_number,
+                                             data, headers=headers,
+                                             upload_context=self.__upload_context)
+        else:
+            result = self.bucket.upload_part(self.key, self.__upload_id, part.part_number,
+                                             data, headers=headers)
 
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Upload part success, add part info to record, part_number: {0}, etag: {1}, size: {2}".format(
                 part.part_number, result.etag, part.size))
-            self.__finish_part(PartInfo(part.part_number, result.etag, size=part.size, part_crc=result.crc))
+        if instrumentation._event_sink is not None:
+            instrumentation._emit('part_uploaded', bucket=self.bucket.bucket_name, key=self.key,
+                                  upload_id=self.__upload_id, part_number=part.part_number, etag=result.etag,
+                                  size=part.size)
+        self.__finish_part(PartInfo(part.part_number, result.etag, size=part.size, part_crc=result.crc))
 
     def __finish_part(self, part_info):
         with self.__lock:
@@ -650,6 +767,9 @@ class _ResumableUploader(_ResumableOperation):
         if not record:
             params = _populate_valid_params(self.__params, [Bucket.SEQUENTIAL])
             part_size = determine_part_size(self.size, self.__part_size)
+            if self.__encryption:
+                # 分片与加密块对齐，每个分片才能按自己的偏移计算CTR计数器，从而并发加密
+                part_size = self.bucket.crypto_provider.cipher.determine_part_size(self.size, part_size)
             logger.debug("Upload File size: {0}, User-specify part_size: {1}, Calculated part_size: {2}".format(
                 self.size, self.__part_size, part_size))
             if self.__encryption:
@@ -774,6 +894,474 @@ class _ResumableUploader(_ResumableOperation):
         return True
 
 
+class _ResumableCopier(object):
+    """以断点续传方式拷贝文件。
+
+    :param src_bucket: 源文件所在的 :class:`Bucket <oss2.Bucket>` 对象
+    :param src_key: 源文件名
+    :param dst_bucket: 目标文件所在的 :class:`Bucket <oss2.Bucket>` 对象
+    :param dst_key: 目标文件名
+    :param objectInfo: 源文件的长度、ETag及最后修改时间
+    :param store: 用来保存进度的持久化存储
+    :param headers: 传给 `init_multipart_upload` 的HTTP头部
+    :param part_size: 分片大小。优先使用用户提供的值。如果用户没有指定，那么对于新拷贝，计算出一个合理值；对于老的拷贝，采用记录中的
+        分片大小。
+    :param progress_callback: 拷贝进度回调函数。参见 :ref:`progress_callback` 。
+    :param params: 源文件的versionId
+    """
+
+    def __init__(self, src_bucket, src_key, dst_bucket, dst_key, objectInfo,
+                 store=None,
+                 headers=None,
+                 part_size=None,
+                 progress_callback=None,
+                 num_threads=None,
+                 params=None):
+        self.src_bucket = src_bucket
+        self.src_key = to_string(src_key)
+        self.bucket = dst_bucket
+        self.key = to_string(dst_key)
+        self.objectInfo = objectInfo
+        self.size = objectInfo.size
+
+        self.__op = 'ResumableCopy'
+        self.__store = store or ResumableStore()
+        self.__headers = headers
+        self.__params = params
+        self.__part_size = defaults.get(part_size, defaults.part_size)
+        self.__num_threads = defaults.get(num_threads, defaults.multipart_num_threads)
+        self.__progress_callback = progress_callback
+
+        self.__version_id = params.get(Bucket.VERSIONID) if params else None
+        if self.__version_id is None:
+            src_path = 'oss://{0}/{1}'.format(src_bucket.bucket_name, self.src_key)
+        else:
+            src_path = 'oss://{0}/{1}?versionid={2}'.format(src_bucket.bucket_name, self.src_key, self.__version_id)
+        self.__record_key = self.__store.make_store_key(dst_bucket.bucket_name, self.key, src_path)
+
+        self.__upload_id = None
+
+        # protect below fields
+        self.__lock = threading.Lock()
+        self.__record = None
+        self.__finished_size = 0
+        self.__finished_parts = None
+
+        logger.debug("Init _ResumableCopier, record_key: {0}, part_size: {1}, num_thread: {2}".format(
+            self.__record_key, self.__part_size, self.__num_threads))
+
+    def copy(self, server_crc=None):
+        self.__load_record()
+
+        parts_to_copy = self.__get_parts_to_copy(self.__finished_parts)
+        parts_to_copy = sorted(parts_to_copy, key=lambda p: p.part_number)
+        logger.debug("Parts need to copy: {0}".format(parts_to_copy))
+
+        http._ensure_pool_size(self.bucket.session, self.__num_threads)
+        q = TaskQueue(functools.partial(self.__producer, parts_to_copy=parts_to_copy),
+                      [self.__consumer] * self.__num_threads)
+        q.run()
+
+        self.__report_progress(self.size)
+
+        headers = _populate_valid_headers(self.__headers, [OSS_REQUEST_PAYER, OSS_OBJECT_ACL])
+        result = self.bucket.complete_multipart_upload(self.key, self.__upload_id, self.__finished_parts,
+                                                       headers=headers)
+        self.__store.delete(self.__record_key)
+
+        if self.bucket.enable_crc:
+            object_crc = utils.calc_obj_crc_from_parts(sorted(self.__finished_parts, key=lambda p: p.part_number))
+            utils.check_crc('resumable copy', object_crc, server_crc, result.request_id)
+
+        return result
+
+    def __producer(self, q, parts_to_copy=None):
+        for part in parts_to_copy:
+            q.put(part)
+
+    def __consumer(self, q):
+        while True:
+            part = q.get()
+            if part is None:
+                break
+
+            self.__copy_part(part)
+
+    def __copy_part(self, part):
+        self.__report_progress(self.__finished_size)
+
+        headers = _populate_valid_headers(self.__headers, [OSS_REQUEST_PAYER])
+        params = dict(self.__params) if self.__params else None
+        result = self.bucket.upload_part_copy(self.src_bucket.bucket_name, self.src_key, (part.start, part.end - 1),
+                                              self.key, self.__upload_id, part.part_number,
+                                              headers=headers, params=params)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Copy part success, add part info to record, part_number: {0}, etag: {1}, size: {2}".format(
+                part.part_number, result.etag, part.size))
+        if instrumentation._event_sink is not None:
+            instrumentation._emit('part_copied', bucket=self.bucket.bucket_name, key=self.key,
+                                  upload_id=self.__upload_id, part_number=part.part_number, etag=result.etag,
+                                  size=part.size)
+        self.__finish_part(PartInfo(part.part_number, result.etag, size=part.size, part_crc=result.crc))
+
+    def __finish_part(self, part_info):
+        with self.__lock:
+            self.__finished_parts.append(part_info)
+            self.__finished_size += part_info.size
+
+            self.__record['part_crcs'][str(part_info.part_number)] = part_info.part_crc
+            self.__store.put(self.__record_key, self.__record)
+
+    def __report_progress(self, consumed_size):
+        if self.__progress_callback:
+            with self.__lock:
+                self.__progress_callback(consumed_size, self.size)
+
+    def __load_record(self):
+        record = self.__store.get(self.__record_key)
+        logger.debug("Load record return {0}".format(record))
+
+        if record and not self.__is_record_sane(record):
+            logger.warn("The content of record is invalid, delete the record")
+            self.__store.delete(self.__record_key)
+            record = None
+
+        if record and self.__is_source_changed(record):
+            logger.warn("Source object: {0} has been changed, delete the record".format(self.src_key))
+            self.__store.delete(self.__record_key)
+            record = None
+
+        if record and not self.__upload_exists(record['upload_id']):
+            logger.warn('Multipart upload: {0} does not exist, delete the record'.format(record['upload_id']))
+            self.__store.delete(self.__record_key)
+            record = None
+
+        if not record:
+            part_size = determine_part_size(self.size, self.__part_size)
+            logger.debug("Copy object size: {0}, User-specify part_size: {1}, Calculated part_size: {2}".format(
+                self.size, self.__part_size, part_size))
+            upload_id = self.bucket.init_multipart_upload(self.key, self.__headers).upload_id
+
+            record = {'op_type': self.__op, 'upload_id': upload_id, 'src_bucket': self.src_bucket.bucket_name,
+                      'src_key': self.src_key, 'size': self.size, 'mtime': self.objectInfo.mtime,
+                      'etag': self.objectInfo.etag, 'bucket': self.bucket.bucket_name, 'key': self.key,
+                      'part_size': part_size, 'part_crcs': {}}
+
+            logger.debug('Add new record, bucket: {0}, key: {1}, upload_id: {2}, part_size: {3}'.format(
+                self.bucket.bucket_name, self.key, upload_id, part_size))
+
+            self.__store.put(self.__record_key, record)
+
+        self.__record = record
+        self.__part_size = self.__record['part_size']
+        self.__upload_id = self.__record['upload_id']
+
+        self.__finished_parts = self.__get_finished_parts()
+        self.__finished_size = sum(p.size for p in self.__finished_parts)
+
+    def __get_finished_parts(self):
+        parts = []
+        part_crcs = self.__record['part_crcs']
+
+        valid_headers = _populate_valid_headers(self.__headers, [OSS_REQUEST_PAYER])
+        for part in PartIterator(self.bucket, self.key, self.__upload_id, headers=valid_headers):
+            part.part_crc = part_crcs.get(str(part.part_number))
+            parts.append(part)
+
+        return parts
+
+    def __upload_exists(self, upload_id):
+        try:
+            valid_headers = _populate_valid_headers(self.__headers, [OSS_REQUEST_PAYER])
+            list(iterators.PartIterator(self.bucket, self.key, upload_id, '0', max_parts=1, headers=valid_headers))
+        except exceptions.NoSuchUpload:
+            return False
+        else:
+            return True
+
+    def __is_source_changed(self, record):
+        return (record['size'] != self.size or record['mtime'] != self.objectInfo.mtime
+                or record['etag'] != self.objectInfo.etag)
+
+    def __get_parts_to_copy(self, parts_copied):
+        all_parts = _split_to_parts(self.size, self.__part_size)
+        if not parts_copied:
+            return all_parts
+
+        all_parts_map = dict((p.part_number, p) for p in all_parts)
+
+        for copied in parts_copied:
+            if copied.part_number in all_parts_map:
+                del all_parts_map[copied.part_number]
+
+        return all_parts_map.values()
+
+    def __is_record_sane(self, record):
+        try:
+            if record['op_type'] != self.__op:
+                logger.error('op_type invalid, op_type in record:{0} is invalid'.format(record['op_type']))
+                return False
+
+            for key in ('upload_id', 'src_bucket', 'src_key', 'etag', 'bucket', 'key'):
+                if not isinstance(record[key], str):
+                    logger.error('Type Error, {0} in record is not a string type: {1}'.format(key, record[key]))
+                    return False
+
+            for key in ('size', 'part_size', 'mtime'):
+                if not isinstance(record[key], int):
+                    logger.error('Type Error, {0} in record is not an integer type: {1}'.format(key, record[key]))
+                    return False
+
+            if not isinstance(record['part_crcs'], dict):
+                logger.error('Type Error, part_crcs in record is not a dict type: {0}'.format(record['part_crcs']))
+                return False
+
+        except KeyError as e:
+            logger.error('Key not found: {0}'.format(e.args))
+            return False
+
+        return True
+
+
+class StreamingMultipartUploader(object):
+    """以分片上传的方式，并发上传长度未知、不能seek的数据流，如管道、socket或生成器。
+
+    数据流被切分为长度为 `part_size` 的分片，由 `num_threads` 个线程并发调用 `upload_part` 上传。内存中最多同时存在
+    `num_threads` 个分片，即内存占用不超过 `num_threads` × `part_size` 。读取数据的同时增量计算整个文件的CRC64，
+    上传完成后与OSS返回的CRC64比较。
+
+    因为数据流无法回读，所以不支持断点续传：上传出错时会取消分片上传并抛出异常。如果数据流长度小于 `part_size` ，则直接调用
+    `put_object` 上传。
+
+    用法 ::
+
+        >>> import subprocess
+        >>> proc = subprocess.Popen(['tar', 'cf', '-', 'data'], stdout=subprocess.PIPE)
+        >>> uploader = oss2.StreamingMultipartUploader(bucket, 'data.tar', num_threads=4)
+        >>> result = uploader.upload(proc.stdout)
+
+    :param bucket: :class:`Bucket <oss2.Bucket>` 对象，不支持 :class:`CryptoBucket <oss2.CryptoBucket>`
+    :param key: 上传到用户空间的文件名
+    :param headers: HTTP头部
+        # 调用外部函数put_object 或 init_multipart_upload传递完整headers
+        # 调用外部函数uplpad_part目前只传递OSS_REQUEST_PAYER, OSS_TRAFFIC_LIMIT
+        # 调用外部函数complete_multipart_upload目前只传递OSS_REQUEST_PAYER, OSS_OBJECT_ACL
+    :type headers: 可以是dict，建议是oss2.CaseInsensitiveDict
+    :param part_size: 分片大小，如不指定则使用 `oss2.defaults.part_size` 。文件最大为 `part_size` × `oss2.defaults.max_part_count` 。
+    :param num_threads: 并发上传的线程数，如不指定则使用 `oss2.defaults.multipart_num_threads` 。
+    :param progress_callback: 上传进度回调函数，总字节数参数总是为None。参见 :ref:`progress_callback` 。
+    :param params: HTTP请求参数，只有'sequential'会被传递到init_multipart_upload中。
+    :type params: dict
+    """
+
+    def __init__(self, bucket, key,
+                 headers=None,
+                 part_size=None,
+                 num_threads=None,
+                 progress_callback=None,
+                 params=None):
+        if _is_crypto_bucket(bucket):
+            raise exceptions.ClientError('StreamingMultipartUploader does not support CryptoBucket')
+
+        self.bucket = bucket
+        self.key = to_string(key)
+
+        self.__headers = headers
+        self.__params = params
+        self.__part_size = max(defaults.get(part_size, defaults.part_size), defaults.min_part_size)
+        self.__num_threads = defaults.get(num_threads, defaults.multipart_num_threads)
+        self.__progress_callback = progress_callback
+
+        # 每个分片在读取前申请一个槽位，上传完成后释放，从而限制内存中的分片个数
+        self.__slots = threading.Semaphore(self.__num_threads)
+
+        # protect below fields
+        self.__lock = threading.Lock()
+        self.__upload_id = None
+        self.__finished_parts = []
+        self.__finished_size = 0
+        self.__error = None
+
+        self.__crc = None
+
+        logger.debug("Init StreamingMultipartUploader, bucket: {0}, key: {1}, part_size: {2}, num_thread: {3}".format(
+            bucket.bucket_name, self.key, self.__part_size, self.__num_threads))
+
+    @property
+    def crc(self):
+        """已经读取的数据的CRC64，开启CRC校验时有效。"""
+        if self.__crc is not None:
+            return self.__crc.crc
+        else:
+            return None
+
+    def upload(self, data):
+        """上传数据流。
+
+        :param data: 待上传的数据
+        :type data: file-like object（只要支持read即可）或者可迭代对象
+
+        :return: :class:`PutObjectResult <oss2.models.PutObjectResult>`
+        """
+        reader = _StreamPartReader(data)
+        self.__crc = utils.Crc64() if self.bucket.enable_crc else None
+
+        first = reader.read(self.__part_size)
+        self.__update_crc(first)
+        if len(first) < self.__part_size:
+            logger.debug("Stream is shorter than part size, put object directly, size: {0}".format(len(first)))
+            return self.bucket.put_object(self.key, first, headers=self.__headers,
+                                          progress_callback=self.__progress_callback)
+
+        params = _populate_valid_params(self.__params, [Bucket.SEQUENTIAL])
+        self.__upload_id = self.bucket.init_multipart_upload(self.key, self.__headers, params).upload_id
+        logger.debug("Init multipart upload for stream, upload_id: {0}".format(self.__upload_id))
+
+        try:
+            self.__slots.acquire()
+            http._ensure_pool_size(self.bucket.session, self.__num_threads)
+            q = TaskQueue(functools.partial(self.__producer, reader=reader, first=first),
+                          [self.__consumer] * self.__num_threads)
+            q.run()
+
+            if self.__error is not None:
+                raise self.__error
+
+            headers = _populate_valid_headers(self.__headers, [OSS_REQUEST_PAYER, OSS_OBJECT_ACL])
+            result = self.bucket.complete_multipart_upload(self.key, self.__upload_id, self.__finished_parts,
+                                                           headers=headers)
+        except:
+            logger.warning("Streaming upload failed, abort multipart upload: {0}".format(self.__upload_id))
+            self.__abort()
+            raise
+
+        utils.check_crc('streaming multipart upload', self.crc, result.crc, result.request_id)
+        return result
+
+    def __producer(self, q, reader=None, first=None):
+        # 第一个分片的槽位已经在upload中申请
+        part_number = 1
+        content = first
+        while True:
+            q.put((part_number, content))
+
+            if len(content) < self.__part_size:
+                break
+
+            self.__slots.acquire()
+            if self.__error is not None:
+                self.__slots.release()
+                break
+
+            content = reader.read(self.__part_size)
+            if not content:
+                self.__slots.release()
+                break
+
+            part_number += 1
+            if part_number > defaults.max_part_count:
+                self.__slots.release()
+                raise exceptions.ClientError('The stream is too large, part count exceeds {0}, '
+                                             'please increase part_size'.format(defaults.max_part_count))
+
+            self.__update_crc(content)
+
+    def __consumer(self, q):
+        while True:
+            item = q.get()
+            if item is None:
+                break
+
+            try:
+                if self.__error is None:
+                    self.__upload_part(*item)
+            except Exception as e:
+                with self.__lock:
+                    if self.__error is None:
+                        self.__error = e
+            finally:
+                self.__slots.release()
+
+    def __upload_part(self, part_number, content):
+        headers = _populate_valid_headers(self.__headers, [OSS_REQUEST_PAYER, OSS_TRAFFIC_LIMIT])
+        result = self.bucket.upload_part(self.key, self.__upload_id, part_number, content, headers=headers)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Upload part success, part_number: {0}, etag: {1}, size: {2}".format(
+                part_number, result.etag, len(content)))
+        if instrumentation._event_sink is not None:
+            instrumentation._emit('part_uploaded', bucket=self.bucket.bucket_name, key=self.key,
+                                  upload_id=self.__upload_id, part_number=part_number, etag=result.etag,
+                                  size=len(content))
+        with self.__lock:
+            self.__finished_parts.append(PartInfo(part_number, result.etag, size=len(content), part_crc=result.crc))
+            self.__finished_size += len(content)
+            if self.__progress_callback:
+                self.__progress_callback(self.__finished_size, None)
+
+    def __update_crc(self, content):
+        if self.__crc is not None:
+            self.__crc.update(content)
+
+    def __abort(self):
+        try:
+            headers = _populate_valid_headers(self.__headers, [OSS_REQUEST_PAYER])
+            self.bucket.abort_multipart_upload(self.key, self.__upload_id, headers=headers)
+        except exceptions.OssError as e:
+            logger.warning("Abort multipart upload failed, upload_id: {0}, error: {1}".format(self.__upload_id, e))
+
+
+class _StreamPartReader(object):
+    """从file-like object或可迭代对象中读取指定长度的数据，除非到达结尾，否则返回的长度总是等于指定长度。"""
+
+    def __init__(self, data):
+        data = to_bytes(data)
+
+        if isinstance(data, bytes):
+            self.__read = _make_bytes_reader(data)
+        elif hasattr(data, 'read'):
+            self.__read = data.read
+        elif hasattr(data, '__iter__'):
+            self.__read = _make_iter_reader(iter(data))
+        else:
+            raise exceptions.ClientError('{0} is not a file object, nor an iterator'.format(data.__class__.__name__))
+
+    def read(self, size):
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = to_bytes(self.__read(remaining))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+
+        return b''.join(chunks)
+
+
+def _make_bytes_reader(data):
+    stream = io.BytesIO(data)
+    return stream.read
+
+
+def _make_iter_reader(it):
+    pending = [b'']
+
+    def read(size):
+        content = pending[0]
+        while not content:
+            try:
+                content = to_bytes(next(it))
+            except StopIteration:
+                return b''
+
+        pending[0] = content[size:]
+        return content[:size]
+
+    return read
+
+
 _UPLOAD_TEMP_DIR = '.py-oss-upload'
 _DOWNLOAD_TEMP_DIR = '.py-oss-download'
 
@@ -791,7 +1379,8 @@ class _ResumableStoreBase(object):
     def get(self, key):
         pathname = self.__path(key)
 
-        logger.debug('ResumableStoreBase: get key: {0} from file path: {1}'.format(key, pathname))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('ResumableStoreBase: get key: {0} from file path: {1}'.format(key, pathname))
 
         if not os.path.exists(pathname):
             logger.debug("file {0} is not exist".format(pathname))
@@ -815,7 +1404,8 @@ class _ResumableStoreBase(object):
         with open(to_unicode(pathname), 'w') as f:
             json.dump(value, f)
 
-        logger.debug('ResumableStoreBase: put key: {0} to file path: {1}, value: {2}'.format(key, pathname, value))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('ResumableStoreBase: put key: {0} to file path: {1}, value: {2}'.format(key, pathname, value))
 
     def delete(self, key):
         pathname = self.__path(key)
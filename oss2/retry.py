@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+"""
+oss2.retry
+~~~~~~~~~~
+
+请求重试策略。
+
+给 :class:`Bucket <oss2.Bucket>` 或 :class:`Service <oss2.Service>` 传入 `retry_policy` 参数后，遇到网络错误、
+5xx错误（包括503限流）时，SDK会自动重试请求：
+
+    * 只有幂等的请求才会重试。GET、HEAD、PUT、DELETE、OPTIONS是幂等的；POST只有批量删除、解冻等少数操作是幂等的；
+    * 两次重试之间的等待时间采用decorrelated jitter算法计算，如果服务端返回了Retry-After，则至少等待该时间；
+    * 同一个 :class:`Session <oss2.Session>` 上的所有重试共享一个令牌桶形式的重试预算（ :class:`RetryBudget` ），
+      预算耗尽后不再重试，避免在服务端限流时客户端的重试加剧拥塞；
+    * 请求体必须能够回绕（bytes、可以seek的文件对象等），否则不会重试。
+
+用法 ::
+
+    >>> import oss2
+    >>> auth = oss2.Auth('your-access-key-id', 'your-access-key-secret')
+    >>> bucket = oss2.Bucket(auth, 'http://oss-cn-hangzhou.aliyuncs.com', 'your-bucket',
+    ...                      retry_policy=oss2.RetryPolicy(max_retries=5))
+"""
+
+import random
+import threading
+import time
+import logging
+
+import requests
+
+from . import defaults
+from . import utils
+from .exceptions import RequestError, ServerError
+
+logger = logging.getLogger(__name__)
+
+
+_IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'])
+
+# 这些子资源对应的POST请求可以安全地重复执行
+_IDEMPOTENT_POST_SUBRESOURCES = frozenset(['delete', 'restore', 'x-oss-process'])
+
+
+class RetryBudget(object):
+    """令牌桶形式的重试预算，线程安全。
+
+    每次重试消耗 `retry_cost` 个令牌（超时错误消耗 `timeout_cost` 个），每个请求成功后返还 `success_refund` 个令牌，
+    令牌数不超过 `capacity` 。令牌不足时不再重试。
+
+    :param int capacity: 令牌桶容量
+    :param int retry_cost: 普通错误每次重试消耗的令牌数
+    :param int timeout_cost: 超时错误每次重试消耗的令牌数
+    :param int success_refund: 请求成功时返还的令牌数
+    """
+
+    def __init__(self, capacity=500, retry_cost=5, timeout_cost=10, success_refund=1):
+        self.capacity = capacity
+        self.retry_cost = retry_cost
+        self.timeout_cost = timeout_cost
+        self.success_refund = success_refund
+
+        self.__tokens = capacity
+        self.__lock = threading.Lock()
+
+    @property
+    def available(self):
+        """当前剩余的令牌数"""
+        return self.__tokens
+
+    def acquire(self, is_timeout=False):
+        """为一次重试申请令牌。成功返回True，令牌不足返回False。"""
+        cost = self.timeout_cost if is_timeout else self.retry_cost
+        with self.__lock:
+            if self.__tokens < cost:
+                return False
+            self.__tokens -= cost
+            return True
+
+    def release(self):
+        """请求成功后返还令牌。"""
+        with self.__lock:
+            self.__tokens = min(self.capacity, self.__tokens + self.success_refund)
+
+    def __getstate__(self):
+        # 锁不能被pickle，例如把Bucket传给multiprocessing的子进程时
+        state = self.__dict__.copy()
+        del state['_RetryBudget__lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+
+class RetryPolicy(object):
+    """请求重试策略。
+
+    :param int max_retries: 最大重试次数（不包括第一次请求），缺省为 `oss2.defaults.request_retries`
+    :param float base_delay: 退避的最小等待时间，以秒为单位
+    :param float max_delay: 退避的最大等待时间，以秒为单位。服务端返回的Retry-After也不会超过该值
+    :param budget: 重试预算。如果是None，则使用所在 :class:`Session <oss2.Session>` 的 `retry_budget`
+    :type budget: :class:`RetryBudget`
+    :param retryable_status: 需要重试的HTTP状态码
+    :param bool retry_non_idempotent: 为True时非幂等请求也会重试，可能导致请求被执行多次
+    """
+
+    def __init__(self, max_retries=None,
+                 base_delay=0.1,
+                 max_delay=20.0,
+                 budget=None,
+                 retryable_status=(500, 502, 503, 504),
+                 retry_non_idempotent=False):
+        self.max_retries = defaults.get(max_retries, defaults.request_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retryable_status = frozenset(retryable_status)
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def is_idempotent(self, req):
+        """判断请求是否幂等。"""
+        if req.method in _IDEMPOTENT_METHODS:
+            return True
+        if req.method == 'POST':
+            return any(k in _IDEMPOTENT_POST_SUBRESOURCES for k in req.params)
+        return False
+
+    def is_retryable_error(self, e):
+        """判断错误本身是否值得重试：网络错误，或者状态码属于 `retryable_status` 的服务端错误。"""
+        if isinstance(e, RequestError):
+            return True
+        if isinstance(e, ServerError):
+            return e.status in self.retryable_status
+        return False
+
+    def should_retry(self, req, e, retries, rewindable, budget=None):
+        """决定是否重试。
+
+        :param req: 出错的请求
+        :type req: oss2.http.Request
+        :param e: 本次请求的异常
+        :param int retries: 已经重试的次数
+        :param bool rewindable: 请求体能否回绕
+        :param budget: 没有指定 `self.budget` 时使用的重试预算
+
+        :return: True表示需要重试
+        """
+        if retries >= self.max_retries or not rewindable:
+            return False
+
+        if not self.is_retryable_error(e):
+            return False
+
+        if not self.retry_non_idempotent and not self.is_idempotent(req):
+            return False
+
+        budget = self.budget or budget
+        if budget is not None and not budget.acquire(_is_timeout(e)):
+            logger.warning("Retry budget exhausted, give up retrying. {0}".format(e))
+            return False
+
+        return True
+
+    def compute_delay(self, e, prev_delay=None):
+        """计算下一次重试前的等待时间（decorrelated jitter）。
+
+        :param e: 本次请求的异常
+        :param prev_delay: 上一次的等待时间，第一次重试时为None
+        """
+        prev_delay = prev_delay or self.base_delay
+        delay = min(self.max_delay, random.uniform(self.base_delay, prev_delay * 3))
+
+        retry_after = _get_retry_after(e)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+
+        return delay
+
+    def on_success(self, budget=None):
+        budget = self.budget or budget
+        if budget is not None:
+            budget.release()
+
+
+def _is_timeout(e):
+    return isinstance(getattr(e, 'exception', None), requests.exceptions.Timeout)
+
+
+def _get_retry_after(e):
+    headers = getattr(e, 'headers', None)
+    if not headers:
+        return None
+
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, utils.http_to_unixtime(value) - time.time())
+    except ValueError:
+        return None
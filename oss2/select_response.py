@@ -66,16 +66,35 @@ class SelectResponseAdapter(object):
        self.splits = 0
        self.rows = 0
        self.columns = 0
+       # readinto没有读完的一块数据
+       self.unread = b''
+       self.unread_offset = 0
 
     def read(self):
-        if self.finished:
+        if self.finished and not self.unread:
             return b''
         
-        content=b''
-        for data in self:
-            content += data
-        
-        return content
+        return b''.join(self)
+
+    def readinto(self, b):
+        view = utils._byte_view(b)
+        if len(view) == 0:
+            return 0
+
+        if not self.unread:
+            try:
+                self.unread = self.next()
+            except StopIteration:
+                return 0
+            self.unread_offset = 0
+
+        n = min(len(view), len(self.unread) - self.unread_offset)
+        view[:n] = self.unread[self.unread_offset:self.unread_offset + n]
+        self.unread_offset += n
+        if self.unread_offset == len(self.unread):
+            self.unread = b''
+            self.unread_offset = 0
+        return n
     
     def __iter__(self):
         return self
@@ -84,6 +103,12 @@ class SelectResponseAdapter(object):
         return self.next()
     
     def next(self):
+        if self.unread:
+            data = self.unread[self.unread_offset:]
+            self.unread = b''
+            self.unread_offset = 0
+            return data
+
         if self.output_raw_data == True:
              data = next(self.resp_content_iter) 
              if len(data) != 0:
@@ -105,7 +130,7 @@ class SelectResponseAdapter(object):
         raise StopIteration
 
     def read_raw(self, amt):
-        ret = b''
+        ret = []
         read_count = 0
         while amt > 0 and self.finished == 0:
             size = len(self.raw_buffer)
@@ -120,18 +145,18 @@ class SelectResponseAdapter(object):
                 data = self.raw_buffer[self.raw_buffer_offset:self.raw_buffer_offset + amt]
                 data_size = len(data)
                 self.raw_buffer_offset += data_size
-                ret += data
+                ret.append(data)
                 read_count += data_size
                 amt -= data_size
             else:
                 data = self.raw_buffer[self.raw_buffer_offset:]
                 data_len = len(data)
-                ret += data
+                ret.append(data)
                 read_count += data_len
                 amt -= data_len 
                 self.raw_buffer = b''
         
-        return ret
+        return b''.join(ret)
 
     def read_next_frame(self):
         frame_type = bytearray(self.read_raw(4))
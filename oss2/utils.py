@@ -28,13 +28,10 @@ import sys
 import random
 import abc, six
 import struct
-
-from Crypto.Cipher import AES
-from Crypto import Random
-from Crypto.Util import Counter
+import collections
 
 from .crc64_combine import mkCombineFun
-from .compat import to_string, to_bytes, urlparse
+from .compat import to_string, to_bytes, to_unicode, urlparse
 from .exceptions import ClientError, InconsistentError, RequestError, OpenApiFormatError
 from . import defaults
 
@@ -188,6 +185,127 @@ class SizedFileAdapter(object):
         return self.size
 
 
+class _SharedFile(object):
+    """可以在多个线程之间共享的文件。通过 `pread` 、 `pwrite` 按位置读写，不改变也不依赖文件的当前位置，因此多个线程可以
+    共用一个文件描述符。不支持 `os.pread` 、 `os.pwrite` 的平台上（如Windows）退化为加锁后seek、read或write。
+
+    :param filename: 文件名
+    :param bool writable: 为True时以读写方式打开，此时文件必须已经存在
+    """
+
+    def __init__(self, filename, writable=False):
+        self.fileobj = open(to_unicode(filename), 'rb+' if writable else 'rb')
+        self.__fd = self.fileobj.fileno()
+        self.__lock = None if (_pread and _pwrite) else threading.Lock()
+
+    def pread(self, size, offset):
+        if self.__lock is not None:
+            with self.__lock:
+                self.fileobj.seek(offset, os.SEEK_SET)
+                return self.fileobj.read(size)
+
+        content = _pread(self.__fd, size, offset)
+        if len(content) == size or not content:
+            return content
+
+        # 普通文件只有读到结尾时才会返回较少的数据，这里保险起见继续读取
+        chunks = [content]
+        while size > len(content):
+            size -= len(content)
+            offset += len(content)
+            content = _pread(self.__fd, size, offset)
+            if not content:
+                break
+            chunks.append(content)
+        return b''.join(chunks)
+
+    def pwrite(self, data, offset):
+        """把 `data` （bytes或memoryview等）全部写入到 `offset` 处。"""
+        if self.__lock is not None:
+            with self.__lock:
+                self.fileobj.seek(offset, os.SEEK_SET)
+                self.fileobj.write(data)
+                self.fileobj.flush()
+            return
+
+        data = memoryview(data)
+        while data:
+            written = _pwrite(self.__fd, data, offset)
+            data = data[written:]
+            offset += written
+
+    def preallocate(self, size):
+        """把文件的空间预先分配到 `size` 字节，从而减少并发写入时的文件系统碎片和元数据更新。已有的内容不受影响。"""
+        if os.fstat(self.__fd).st_size >= size:
+            return
+
+        if _posix_fallocate is not None:
+            try:
+                _posix_fallocate(self.__fd, 0, size)
+                return
+            except OSError as e:
+                logger.debug("posix_fallocate is not supported, fall back to truncate: {0}".format(e))
+
+        self.fileobj.truncate(size)
+
+    def close(self):
+        self.fileobj.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+_pread = getattr(os, 'pread', None)
+_pwrite = getattr(os, 'pwrite', None)
+_posix_fallocate = getattr(os, 'posix_fallocate', None)
+
+
+class _FilePart(object):
+    """:class:`_SharedFile` 中从 `offset` 开始、长度为 `size` 的一段，可以像普通文件对象一样读取及seek。"""
+
+    def __init__(self, shared_file, offset, size):
+        self.shared_file = shared_file
+        self.offset = offset
+        self.size = size
+        self.__pos = 0
+
+    @property
+    def len(self):
+        return self.size - self.__pos
+
+    def read(self, amt=None):
+        if self.__pos >= self.size:
+            return b''
+
+        if amt is None or amt < 0:
+            amt = self.size - self.__pos
+        else:
+            amt = min(amt, self.size - self.__pos)
+
+        content = self.shared_file.pread(amt, self.offset + self.__pos)
+        self.__pos += len(content)
+        return content
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_SET:
+            pos = offset
+        elif whence == os.SEEK_CUR:
+            pos = self.__pos + offset
+        elif whence == os.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ClientError('invalid whence: {0}'.format(whence))
+
+        self.__pos = max(0, min(pos, self.size))
+        return self.__pos
+
+    def tell(self):
+        return self.__pos
+
+
 def how_many(m, n):
     return (m + n - 1) // n
 
@@ -219,6 +337,66 @@ def _get_data_size(data):
     return None
 
 
+def _make_rewinder(data):
+    """记录请求体 `data` 当前的读取状态，返回一个把 `data` 恢复到该状态的函数，供重试时使用。
+
+    bytes、可以seek的文件对象，以及包装它们的适配器（同时恢复CRC）可以回绕；迭代器、不能seek的文件对象，
+    以及带有加密回调的适配器不能回绕，此时返回None。AES-CTR按偏移加密，所以 :class:`_StreamAdapter` 即使加密也可以回绕。
+    """
+    if data is None or isinstance(data, (bytes, str)):
+        return lambda: None
+
+    if isinstance(data, _StreamAdapter):
+        if data.crc_callback is not None and not isinstance(data.crc_callback, Crc64):
+            return None
+
+        inner = _make_rewinder(data.data)
+        if inner is None:
+            return None
+        return data._make_rewinder(inner)
+
+    if isinstance(data, SizedFileAdapter):
+        inner = _make_rewinder(data.file_object)
+        if inner is None:
+            return None
+        offset = data.offset
+
+        def rewind():
+            inner()
+            data.offset = offset
+        return rewind
+
+    if isinstance(data, (_BytesAndFileAdapter, _FileLikeAdapter)):
+        if data.cipher_callback is not None:
+            return None
+        if data.crc_callback is not None and not isinstance(data.crc_callback, Crc64):
+            return None
+
+        inner = _make_rewinder(data.data if isinstance(data, _BytesAndFileAdapter) else data.fileobj)
+        if inner is None:
+            return None
+
+        state = dict((k, v) for k, v in vars(data).items() if k in ('offset', 'read_all', 'discard'))
+        crc = data.crc_callback.crc64.copy() if data.crc_callback is not None else None
+
+        def rewind():
+            inner()
+            for k, v in state.items():
+                setattr(data, k, v)
+            if crc is not None:
+                data.crc_callback.crc64 = crc.copy()
+        return rewind
+
+    if hasattr(data, 'seek') and hasattr(data, 'tell'):
+        try:
+            position = data.tell()
+        except (IOError, OSError):
+            return None
+        return lambda: data.seek(position, os.SEEK_SET)
+
+    return None
+
+
 _CHUNK_SIZE = 8 * 1024
 
 
@@ -234,18 +412,13 @@ def make_progress_adapter(data, progress_callback, size=None):
     """
     data = to_bytes(data)
 
-    if size is None:
-        size = _get_data_size(data)
+    if _can_merge(data, 'progress_callback') and (size is None or size == data.size):
+        data.progress_callback = progress_callback
+        return data
 
-    if size is None:
-        if hasattr(data, 'read'):
-            return _FileLikeAdapter(data, progress_callback)
-        elif hasattr(data, '__iter__'):
-            return _IterableAdapter(data, progress_callback)
-        else:
-            raise ClientError('{0} is not a file object, nor an iterator'.format(data.__class__.__name__))
-    else:
-        return _BytesAndFileAdapter(data, progress_callback, size)
+    adapter = _make_stream_adapter(data, size)
+    adapter.progress_callback = progress_callback
+    return adapter
 
 
 def make_crc_adapter(data, init_crc=0, discard=0):
@@ -260,21 +433,16 @@ def make_crc_adapter(data, init_crc=0, discard=0):
     """
     data = to_bytes(data)
 
-    # bytes or file object
-    if _has_data_size_attr(data):
-        if discard:
-            raise ClientError('Bytes of file object adapter does not support discard bytes')
-        return _BytesAndFileAdapter(data, size=_get_data_size(data), crc_callback=Crc64(init_crc))
-    # file-like object
-    elif hasattr(data, 'read'):
-        return _FileLikeAdapter(data, crc_callback=Crc64(init_crc), discard=discard)
-    # iterator
-    elif hasattr(data, '__iter__'):
-        if discard:
-            raise ClientError('Iterator adapter does not support discard bytes')
-        return _IterableAdapter(data, crc_callback=Crc64(init_crc))
+    if _can_merge(data, 'crc_callback') and data.discard in (0, discard):
+        # 已经有加密处理时（上传），CRC按加密之后的数据计算
+        data.crc_after_cipher = data.cipher is not None
+        adapter = data
     else:
-        raise ClientError('{0} is not a file object, nor an iterator'.format(data.__class__.__name__))
+        adapter = _make_stream_adapter(data)
+
+    adapter.crc_callback = Crc64(init_crc)
+    adapter.discard = discard
+    return adapter
 
 
 def calc_obj_crc_from_parts(parts, init_crc=0):
@@ -316,6 +484,79 @@ def make_cipher_adapter(data, cipher_callback, discard=0):
         raise ClientError('{0} is not a file object'.format(data.__class__.__name__))
 
 
+def make_ctr_cipher_adapter(data, cipher, discard=0):
+    """返回一个适配器，在读取 `data` 时用AES-CTR进行加解密。
+
+    与 :func:`make_cipher_adapter` 不同，加解密的粒度与调用者每次读取的大小无关：数据按 `defaults.cipher_batch_size`
+    批量读入可复用的缓冲区，加解密后再按需返回，较大的批次还会拆给多个线程并发处理。
+    如果 `data` 是 :func:`make_progress_adapter` 、 :func:`make_crc_adapter` 返回的适配器，加解密会合并到其中。
+
+    :param data: 可以是bytes、file object或iterable
+    :param cipher: 已经初始化的 :class:`AESCTRCipher`
+    :param discard: 读取时需要丢弃的字节
+
+    :return: 能够进行加解密的适配器
+    """
+    data = to_bytes(data)
+
+    # 已经有CRC处理时（下载），CRC仍按解密之前的数据计算
+    if _can_merge(data, 'cipher') and data.discard in (0, discard):
+        adapter = data
+    else:
+        adapter = _make_stream_adapter(data)
+
+    adapter.cipher = cipher
+    adapter.discard = discard
+    return adapter
+
+
+def _make_stream_adapter(data, size=None):
+    if size is None:
+        size = _get_data_size(data)
+
+    if size is None and not hasattr(data, 'read') and not hasattr(data, '__iter__'):
+        raise ClientError('{0} is not a file object, nor an iterator'.format(data.__class__.__name__))
+
+    return _StreamAdapter(data, size)
+
+
+def _can_merge(data, attr):
+    # 还没有开始读取、且没有设置 `attr` 的流适配器，可以直接合并新的处理，不必再包一层
+    return isinstance(data, _StreamAdapter) and data.offset == 0 and getattr(data, attr) is None
+
+
+def _byte_view(b):
+    # NumPy数组等对象的memoryview可能不是按字节的，转换成按字节的一维视图
+    view = memoryview(b)
+    if (view.format != 'B' or view.ndim != 1) and hasattr(view, 'cast'):
+        view = view.cast('B')
+    return view
+
+
+def _readinto(fileobj, b):
+    # fileobj不支持readinto时，读入len(b)个字节再拷贝到b中
+    view = _byte_view(b)
+    readinto = getattr(fileobj, 'readinto', None)
+    if readinto is not None:
+        return readinto(view)
+
+    content = fileobj.read(len(view))
+    if not content:
+        return 0
+    view[:len(content)] = content
+    return len(content)
+
+
+def _iter_views(readinto, chunk_size):
+    # 反复读入同一个缓冲区，依次返回其中有效部分的memoryview
+    view = memoryview(bytearray(chunk_size))
+    while True:
+        n = readinto(view)
+        if not n:
+            return
+        yield view[:n]
+
+
 def check_crc(operation, client_crc, oss_crc, request_id):
     if client_crc is not None and oss_crc is not None and client_crc != oss_crc:
         e = InconsistentError("InconsistentError: req_id: {0}, operation: {1}, CRC checksum of client: {2} is mismatch "
@@ -524,15 +765,287 @@ class _BytesAndFileAdapter(object):
             return None
 
 
+class _StreamAdapter(object):
+    """单遍处理的流适配器：从 `data` 读入一块数据后，在同一块内存上统计进度、计算CRC及加解密。
+
+    由 :func:`make_progress_adapter` 、 :func:`make_crc_adapter` 及 :func:`make_ctr_cipher_adapter` 创建。对这种适配器
+    再调用上述函数时，不会再包一层，而是把相应的处理合并进来，因此无论组合了几种处理，每块数据都只读取、遍历一次。
+
+    不加解密时，数据直接读入调用者的缓冲区（readinto）或原样返回；加解密时按 `defaults.cipher_batch_size` 批量处理。
+    CRC按数据在网络上传输的形式计算，与逐层包装时相同：先加密后计算CRC的是上传，先计算CRC后解密的是下载。
+
+    :param data: bytes、file object或iterable
+    :param int size: 最多从 `data` 读取的字节数，为None表示读到结束为止
+    :param progress_callback: 进度回调函数
+    :param crc_callback: :class:`Crc64` 对象
+    :param cipher: 已经初始化的 :class:`AESCTRCipher` 对象
+    :param int discard: 开头需要丢弃的字节数。这部分不计入CRC；加解密时也不返回给调用者
+    """
+
+    def __init__(self, data, size=None, progress_callback=None, crc_callback=None, cipher=None, discard=0):
+        self.data = data
+        self.size = size
+        self.progress_callback = progress_callback
+        self.crc_callback = crc_callback
+        self.cipher = cipher
+        self.discard = discard
+
+        # 为True时对加解密之后的数据计算CRC
+        self.crc_after_cipher = False
+
+        # 已经从data读取的字节数，也是下一块数据在密钥流中的位置
+        self.offset = 0
+        self.read_all = False
+
+        self.__buffer = None
+        self.__start = 0
+        self.__end = 0
+
+        self.__bytes = memoryview(data) if isinstance(data, bytes) else None
+        self.__iter = None
+        self.__pending = None
+
+    @property
+    def len(self):
+        # 长度未知时与没有len属性一样，参见 _has_data_size_attr
+        if self.size is None:
+            raise AttributeError('len')
+        return self.size
+
+    @property
+    def crc(self):
+        if self.crc_callback:
+            return self.crc_callback.crc
+        return getattr(self.data, 'crc', None)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    def next(self):
+        content = self.read(_CHUNK_SIZE)
+
+        if content:
+            return content
+        else:
+            raise StopIteration
+
+    def read(self, amt=None):
+        if amt is None or amt < 0:
+            amt = None
+
+        if self.cipher is None:
+            return self.__read_plain(amt)
+
+        chunks = []
+        remaining = sys.maxsize if amt is None else amt
+        while remaining > 0:
+            if self.__start == self.__end and not self.__fill_buffer():
+                break
+
+            n = min(remaining, self.__end - self.__start)
+            chunks.append(memoryview(self.__buffer)[self.__start:self.__start + n].tobytes())
+            self.__start += n
+            remaining -= n
+
+        if len(chunks) == 1:
+            return chunks[0]
+        return b''.join(chunks)
+
+    def readinto(self, b):
+        view = _byte_view(b)
+
+        if self.cipher is None:
+            return self.__fill(view)[0]
+
+        if self.__start == self.__end and len(view) >= defaults.cipher_batch_size:
+            # 调用者的缓冲区足够大，直接在其中加解密，不经过内部缓冲区
+            while True:
+                n, skip = self.__fill(view)
+                if skip < n or n == 0:
+                    break
+            if skip:
+                view[:n - skip] = view[skip:n].tobytes()
+            return n - skip
+
+        n = 0
+        while n < len(view):
+            if self.__start == self.__end and not self.__fill_buffer():
+                break
+
+            m = min(len(view) - n, self.__end - self.__start)
+            view[n:n + m] = memoryview(self.__buffer)[self.__start:self.__start + m]
+            self.__start += m
+            n += m
+        return n
+
+    def __read_plain(self, amt):
+        if self.size is not None:
+            remaining = self.size - self.offset
+            amt = remaining if amt is None else min(amt, remaining)
+        if amt == 0:
+            return b''
+
+        if self.__bytes is not None:
+            end = len(self.__bytes) if amt is None else self.offset + amt
+            content = self.__bytes[self.offset:end].tobytes()
+        elif hasattr(self.data, 'read'):
+            content = self.data.read(amt)
+        else:
+            content = self.__next_chunk(amt)
+
+        if not content:
+            self.read_all = True
+            return b''
+
+        self.__process(memoryview(content), None)
+        return content
+
+    def __fill_buffer(self):
+        # 读入一批数据到内部缓冲区，返回是否还有数据
+        if self.__buffer is None:
+            self.__buffer = bytearray(defaults.cipher_batch_size)
+
+        view = memoryview(self.__buffer)
+        while True:
+            n, skip = self.__fill(view)
+            if n == 0:
+                return False
+            if skip < n:
+                self.__start, self.__end = skip, n
+                return True
+
+    def __fill(self, view):
+        # 读入数据到view并处理，返回读入的字节数及开头需要丢弃的字节数
+        amt = len(view)
+        if self.size is not None:
+            amt = min(amt, self.size - self.offset)
+
+        if self.__bytes is not None:
+            n = max(0, min(amt, len(self.__bytes) - self.offset))
+            src, dst = self.__bytes[self.offset:self.offset + n], view[:n]
+        else:
+            n = self.__read_into(view[:amt])
+            src = dst = view[:n]
+
+        if n == 0:
+            self.read_all = True
+            return 0, 0
+
+        return n, self.__process(src, dst)
+
+    def __process(self, src, dst):
+        # 统计进度、计算CRC，并把src加解密到dst中；dst为None表示不加解密。返回开头需要丢弃的字节数
+        n = len(src)
+        offset = self.offset
+        self.offset += n
+        skip = min(n, max(0, self.discard - offset))
+
+        crc_after_cipher = self.cipher is not None and self.crc_after_cipher
+        if self.crc_callback is not None and not crc_after_cipher:
+            self.crc_callback(src[skip:])
+
+        if self.cipher is not None:
+            self.cipher.crypt_into(src, dst, offset)
+            if self.crc_callback is not None and crc_after_cipher:
+                self.crc_callback(dst[skip:])
+        elif dst is not None and src is not dst:
+            dst[:] = src
+
+        _invoke_progress_callback(self.progress_callback, self.offset, self.size)
+
+        return skip if self.cipher is not None else 0
+
+    def __read_into(self, view):
+        readinto = getattr(self.data, 'readinto', None)
+
+        n = 0
+        while n < len(view):
+            if readinto is not None:
+                got = readinto(view[n:])
+                if not got:
+                    break
+            else:
+                content = self.__read_chunk(len(view) - n)
+                if not content:
+                    break
+                got = len(content)
+                view[n:n + got] = content
+            n += got
+        return n
+
+    def __read_chunk(self, amt):
+        if hasattr(self.data, 'read'):
+            return self.data.read(amt)
+        return self.__next_chunk(amt)
+
+    def __next_chunk(self, amt):
+        if self.__pending is None:
+            if self.__iter is None:
+                self.__iter = iter(self.data)
+            try:
+                self.__pending = to_bytes(next(self.__iter))
+            except StopIteration:
+                return None
+
+        if amt is None:
+            amt = len(self.__pending)
+        content, self.__pending = self.__pending[:amt], self.__pending[amt:] or None
+        return content
+
+    def _make_rewinder(self, inner):
+        # 只有还没有读入数据的适配器才能回绕：CTR按偏移加解密，回到开头即可；CRC从当时的值重新计算
+        if self.offset or self.__start != self.__end or self.__pending is not None:
+            return None
+
+        crc = self.crc_callback.crc64.copy() if self.crc_callback is not None else None
+
+        def rewind():
+            inner()
+            self.offset = 0
+            self.read_all = False
+            self.__start = self.__end = 0
+            if crc is not None:
+                self.crc_callback.crc64 = crc.copy()
+        return rewind
+
+
 class Crc64(object):
 
     _POLY = 0x142F0E1EBA9EA3693
     _XOROUT = 0XFFFFFFFFFFFFFFFF
-    
+    _MASK = 0XFFFFFFFFFFFFFFFF
+
+    # 所有实例共用一个crcmod.Crc模板，避免每次创建实例时重新生成查找表
+    _template = None
+    _template_lock = threading.Lock()
+
     def __init__(self, init_crc=0):
-        self.crc64 = crcmod.Crc(self._POLY, initCrc=init_crc, rev=True, xorOut=self._XOROUT)
+        self.crc64 = self._get_template().new()
+        if init_crc:
+            self.crc64.initCrc = self.crc64.crcValue = init_crc & self._MASK
+
+        self.init_crc = init_crc
+        self.__combine_fun = None
+
+    @classmethod
+    def _get_template(cls):
+        if cls._template is None:
+            with cls._template_lock:
+                if cls._template is None:
+                    template = crcmod.Crc(cls._POLY, initCrc=0, rev=True, xorOut=cls._XOROUT)
+                    if not _CRCMOD_EXTENSION:
+                        template._crc = _make_crc64_slicing8(template.table, cls._XOROUT)
+                    cls._template = template
+        return cls._template
 
-        self.crc64_combineFun = mkCombineFun(self._POLY, initCrc=init_crc, rev=True, xorOut=self._XOROUT)
+    @property
+    def crc64_combineFun(self):
+        if self.__combine_fun is None:
+            self.__combine_fun = mkCombineFun(self._POLY, initCrc=self.init_crc, rev=True, xorOut=self._XOROUT)
+        return self.__combine_fun
 
     def __call__(self, data):
         self.update(data)
@@ -547,6 +1060,49 @@ class Crc64(object):
     def crc(self):
         return self.crc64.crcValue
 
+try:
+    from crcmod import _crcfunext
+    _CRCMOD_EXTENSION = True
+except ImportError:
+    _CRCMOD_EXTENSION = False
+
+
+_SLICING_SEGMENT_SIZE = 64 * 1024
+
+
+def _make_crc64_slicing8(table, xor_out):
+    """crcmod没有C扩展时，其纯Python实现每个字节需要一次循环。这里用slicing-by-8算法代替：每次循环处理8个字节。
+
+    返回的函数与crcmod的约定一致，即参数及返回值都是异或过 `xor_out` 的CRC。
+    """
+    tables = [list(table)]
+    for k in range(1, 8):
+        prev = tables[k - 1]
+        tables.append([(prev[i] >> 8) ^ table[prev[i] & 0xff] for i in range(256)])
+    t0, t1, t2, t3, t4, t5, t6, t7 = tables
+
+    def crcfun(data, crc):
+        crc ^= xor_out
+
+        data = memoryview(to_bytes(data))
+        size = len(data)
+        aligned = size - size % 8
+
+        for start in range(0, aligned, _SLICING_SEGMENT_SIZE):
+            segment = data[start:min(start + _SLICING_SEGMENT_SIZE, aligned)]
+            for word in struct.unpack('<{0}Q'.format(len(segment) // 8), segment.tobytes()):
+                crc ^= word
+                crc = (t7[crc & 0xff] ^ t6[(crc >> 8) & 0xff] ^ t5[(crc >> 16) & 0xff] ^ t4[(crc >> 24) & 0xff] ^
+                       t3[(crc >> 32) & 0xff] ^ t2[(crc >> 40) & 0xff] ^ t1[(crc >> 48) & 0xff] ^ t0[crc >> 56])
+
+        for b in bytearray(data[aligned:].tobytes()):
+            crc = t0[(crc ^ b) & 0xff] ^ (crc >> 8)
+
+        return crc ^ xor_out
+
+    return crcfun
+
+
 class Crc32(object):
     _POLY = 0x104C11DB7
     _XOROUT = 0xFFFFFFFF
@@ -643,6 +1199,8 @@ class AESCTRCipher(AESCipher):
         super(AESCTRCipher, self).__init__()
         self.alg = AES_CTR
         self.__cipher = None
+        self.__key = None
+        self.__counter = None
 
     def get_key(self):
         return random_key(self.key_len)
@@ -655,8 +1213,14 @@ class AESCTRCipher(AESCipher):
         self.initial_by_counter(key, counter)
 
     def initial_by_counter(self, key, counter):
+        # pycryptodome只在客户端加密时才用到，在使用时才导入
+        from Crypto.Cipher import AES
+        from Crypto.Util import Counter
+
         ctr = Counter.new(self.block_size_len_in_bits, initial_value=counter)
         self.__cipher = AES.new(key, AES.MODE_CTR, counter=ctr)
+        self.__key = key
+        self.__counter = counter
 
     def encrypt(self, raw):
         return self.__cipher.encrypt(raw)
@@ -664,6 +1228,48 @@ class AESCTRCipher(AESCipher):
     def decrypt(self, enc):
         return self.__cipher.encrypt(enc)
 
+    def crypt_into(self, data, output, offset):
+        """从初始化位置之后的第 `offset` 个字节开始加密 `data` （CTR模式下解密与加密相同），结果写入 `output` 。
+
+        与 `encrypt` 、 `decrypt` 不同，该方法不依赖也不改变顺序加解密的状态：CTR模式下任意位置的密钥流都可以直接算出，
+        因此数据较大时会拆成几段，交给线程池并发处理，参见 `defaults.cipher_num_threads` 。
+
+        :param data: bytes、bytearray或memoryview
+        :param output: 可写的bytearray或memoryview，长度与 `data` 相同，可以与 `data` 是同一块内存
+        :param int offset: 字节偏移，不必与加密块对齐
+        """
+        if self.__key is None:
+            raise ClientError('AESCTRCipher is not initialized')
+
+        size = len(data)
+        count = min(defaults.cipher_num_threads, size // defaults.cipher_parallel_part_size)
+        if count <= 1:
+            self.__crypt_range(data, output, offset)
+            return
+
+        data = memoryview(data)
+        output = memoryview(output)
+        step = how_many(size, count)
+        _get_cipher_pool().map(lambda start: self.__crypt_range(data[start:start + step],
+                                                                output[start:start + step], offset + start),
+                               range(0, size, step))
+
+    def __crypt_range(self, data, output, offset):
+        from Crypto.Cipher import AES
+        from Crypto.Util import Counter
+
+        block, skip = divmod(offset, self.block_size_len)
+        ctr = Counter.new(self.block_size_len_in_bits, initial_value=self.__counter + block)
+        cipher = AES.new(self.__key, AES.MODE_CTR, counter=ctr)
+        if skip:
+            cipher.encrypt(b'\0' * skip)
+
+        try:
+            cipher.encrypt(data, output=output)
+        except TypeError:
+            # pycryptodome 3.7之前不支持output参数
+            output[:] = cipher.encrypt(bytes(data))
+
     def adjust_range(self, start, end):
         if start:
             if end:
@@ -706,11 +1312,42 @@ class AESCTRCipher(AESCipher):
         return part_size
 
 
+_cipher_pool = None
+_cipher_pool_pid = None
+_cipher_pool_lock = threading.Lock()
+
+
+def _reset_cipher_pool():
+    # fork出的子进程中没有父进程线程池的工作线程，继承下来的线程池和锁都不能再用
+    global _cipher_pool, _cipher_pool_pid, _cipher_pool_lock
+    _cipher_pool = None
+    _cipher_pool_pid = None
+    _cipher_pool_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_cipher_pool)
+
+
+def _get_cipher_pool():
+    global _cipher_pool, _cipher_pool_pid
+
+    with _cipher_pool_lock:
+        # 不支持register_at_fork时，靠进程号判断是否在fork出的子进程中
+        if _cipher_pool is None or _cipher_pool_pid != os.getpid():
+            from multiprocessing.pool import ThreadPool
+            _cipher_pool = ThreadPool(defaults.cipher_num_threads)
+            _cipher_pool_pid = os.getpid()
+        return _cipher_pool
+
+
 def random_key(key_len):
+    from Crypto import Random
     return Random.new().read(key_len)
 
 
 def random_iv():
+    from Crypto import Random
     iv = Random.new().read(16)
     safe_iv = iv[0:8] + struct.pack(">L", 0) + iv[12:]
     return safe_iv
@@ -762,7 +1399,20 @@ def http_date(timeval=None):
     """返回符合HTTP标准的GMT时间字符串，用strftime的格式表示就是"%a, %d %b %Y %H:%M:%S GMT"。
     但不能使用strftime，因为strftime的结果是和locale相关的。
     """
-    return formatdate(timeval, usegmt=True)
+    if timeval is not None:
+        return formatdate(timeval, usegmt=True)
+
+    # 每个请求都要生成Date头部，同一秒内的结果相同，缓存起来
+    global _http_date_cache
+    now = int(time.time())
+    cached = _http_date_cache
+    if cached[0] != now:
+        cached = (now, formatdate(now, usegmt=True))
+        _http_date_cache = cached
+    return cached[1]
+
+
+_http_date_cache = (None, None)
 
 
 def http_to_unixtime(time_string):
@@ -844,6 +1494,89 @@ def force_rename(src, dst):
             raise
 
 
+def _copy_to_shared_file(fsrc, shared_file, offset, expected_len, buf, request_id=''):
+    """把 `fsrc` 的内容写入 `shared_file` 从 `offset` 开始的位置，并验证长度。
+
+    `buf` 是可以重复使用的bytearray。`fsrc` 支持readinto时直接读入 `buf` ，否则每次读取 `len(buf)` 字节。
+    """
+    view = memoryview(buf)
+    readinto = getattr(fsrc, 'readinto', None)
+
+    num_read = 0
+    while True:
+        if readinto is not None:
+            n = readinto(view)
+            chunk = view[:n]
+        else:
+            chunk = fsrc.read(len(buf))
+            n = len(chunk)
+
+        if not n:
+            break
+
+        shared_file.pwrite(chunk, offset + num_read)
+        num_read += n
+
+    if num_read != expected_len:
+        raise InconsistentError("IncompleteRead from source", request_id)
+
+
+class _LruCache(object):
+    """线程安全的LRU缓存，最多保存 `capacity` 项。"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.__items = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        """返回缓存的值，不存在时返回None。"""
+        with self.__lock:
+            value = self.__items.pop(key, None)
+            if value is not None:
+                self.__items[key] = value
+            return value
+
+    def put(self, key, value):
+        with self.__lock:
+            self.__items.pop(key, None)
+            self.__items[key] = value
+            if len(self.__items) > self.capacity:
+                self.__items.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__items.clear()
+
+    def __len__(self):
+        return len(self.__items)
+
+
+def _copy_to_buffer(fsrc, view, request_id=''):
+    """把 `fsrc` 的内容读入memoryview `view` ，读取的长度必须恰好等于 `view` 的长度。"""
+    readinto = getattr(fsrc, 'readinto', None)
+    expected_len = len(view)
+
+    num_read = 0
+    while num_read < expected_len:
+        if readinto is not None:
+            n = readinto(view[num_read:])
+        else:
+            chunk = fsrc.read(min(expected_len - num_read, _COPY_CHUNK_SIZE))
+            n = len(chunk)
+            view[num_read:num_read + n] = chunk
+
+        if not n:
+            break
+        num_read += n
+
+    if num_read != expected_len or fsrc.read(1):
+        raise InconsistentError("IncompleteRead from source", request_id)
+
+
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
 def copyfileobj_and_verify(fsrc, fdst, expected_len,
                            chunk_size=16*1024,
                            request_id=''):
@@ -11,6 +11,7 @@ XML处理相关。
     - to_开头的函数：用来生成发往服务器端的XML
 
 """
+import io
 import logging
 import xml.etree.ElementTree as ElementTree
 import json
@@ -90,7 +91,7 @@ from .models import (SimplifiedObjectInfo,
 
 from .select_params import (SelectJsonTypes, SelectParameters)
 
-from .compat import urlunquote, to_unicode, to_string
+from .compat import urlunquote, to_unicode, to_string, to_bytes
 from .utils import iso8601_to_unixtime, date_to_iso8601, iso8601_to_date
 from . import utils
 import base64
@@ -167,59 +168,168 @@ def _add_text_child(parent, tag, text):
 def _add_node_child(parent, tag):
     return ElementTree.SubElement(parent, tag)
 
-def parse_list_objects(result, body):
-    root = ElementTree.fromstring(body)
-    url_encoded = _is_url_encoding(root)
+def _iter_list_nodes(body, tags):
+    """流式解析罗列类（ListObjects、ListObjectVersions等）的响应。
+
+    `body` 可以是bytes，也可以是带read(amt)方法的file-like对象（如HTTP响应），后者会边读取边解析。
+    每当tag属于 `tags` 的节点解析完毕就返回该节点，调用者处理完之后节点即被清空，不在树上累积；最后返回根节点，
+    用于读取IsTruncated等其他字段。
+    """
+    if hasattr(body, 'read'):
+        source = body
+    else:
+        source = io.BytesIO(to_bytes(body))
+
+    node = None
+    for _, node in ElementTree.iterparse(source):
+        if node.tag in tags:
+            yield node
+            node.clear()
+
+    yield node
+
+
+def _node_fields(node):
+    """一次遍历取出node下一层子节点的文本，返回 {tag: text} 。"""
+    fields = {}
+    for child in node:
+        fields[child.tag] = child.text
+    return fields
+
+
+def _get_field(fields, parent_tag, tag):
+    try:
+        text = fields[tag]
+    except KeyError:
+        raise RuntimeError("parse xml: " + tag + " could not be found under " + parent_tag)
+
+    if text is None:
+        return ''
+
+    return to_string(text)
+
+
+def _get_field_with_default(fields, tag, default_value):
+    if tag not in fields:
+        return default_value
+
+    text = fields[tag]
+    if text is None:
+        return ''
+
+    return to_string(text)
+
+
+def _get_bool_field(fields, parent_tag, tag):
+    text = _get_field(fields, parent_tag, tag)
+    if text == 'true':
+        return True
+    elif text == 'false':
+        return False
+    else:
+        raise RuntimeError("parse xml: value of " + tag + " is not a boolean under " + parent_tag)
+
+
+def _get_time_field(fields, parent_tag, tag, cache):
+    # 同一页中的文件往往是批量写入的，LastModified大量重复，缓存解析结果
+    text = _get_field(fields, parent_tag, tag)
+    try:
+        return cache[text]
+    except KeyError:
+        value = cache[text] = iso8601_to_unixtime(text)
+        return value
+
+
+def _parse_owner(owner_node):
+    if owner_node is None:
+        raise RuntimeError("parse xml: Owner could not be found")
+
+    fields = _node_fields(owner_node)
+    return Owner(_get_field(fields, 'Owner', 'DisplayName'), _get_field(fields, 'Owner', 'ID'))
+
+
+_LIST_OBJECTS_TAGS = frozenset(['Contents', 'CommonPrefixes', 'EncodingType'])
+
+
+def _parse_list_objects_body(result, body, fetch_owner, table):
+    """解析Contents和CommonPrefixes，返回 (根节点, 是否url编码) 。"""
+    url_encoded = False
+    time_cache = {}
+
+    # EncodingType通常位于Contents之前；万一在之后才出现，需要把之前的key补做解码
+    objects_begin = len(result.object_list)
+    prefixes_begin = len(result.prefix_list)
+    table_begin = len(table) if table is not None else 0
+
+    root = None
+    for node in _iter_list_nodes(body, _LIST_OBJECTS_TAGS):
+        tag = node.tag
+        if tag == 'Contents':
+            fields = _node_fields(node)
+            key = _get_field(fields, tag, 'Key')
+
+            if table is not None:
+                table.append(urlunquote(key) if url_encoded else key,
+                             _get_time_field(fields, tag, 'LastModified', time_cache),
+                             _get_field(fields, tag, 'ETag').strip('"'),
+                             _get_field(fields, tag, 'Type'),
+                             int(_get_field(fields, tag, 'Size')),
+                             _get_field(fields, tag, 'StorageClass'))
+                continue
+
+            owner = None
+            if fetch_owner and 'Owner' in fields:
+                owner = _parse_owner(node.find('Owner'))
+
+            result.object_list.append(SimplifiedObjectInfo(
+                urlunquote(key) if url_encoded else key,
+                _get_time_field(fields, tag, 'LastModified', time_cache),
+                _get_field(fields, tag, 'ETag').strip('"'),
+                _get_field(fields, tag, 'Type'),
+                int(_get_field(fields, tag, 'Size')),
+                _get_field(fields, tag, 'StorageClass'),
+                owner,
+                _get_field_with_default(fields, 'RestoreInfo', None)
+            ))
+        elif tag == 'CommonPrefixes':
+            result.prefix_list.append(_find_object(node, 'Prefix', url_encoded))
+        elif tag == 'EncodingType':
+            if to_string(node.text) == 'url' and not url_encoded:
+                url_encoded = True
+                for info in result.object_list[objects_begin:]:
+                    info.key = urlunquote(info.key)
+                result.prefix_list[prefixes_begin:] = [urlunquote(p) for p in result.prefix_list[prefixes_begin:]]
+                if table is not None:
+                    table.keys[table_begin:] = [urlunquote(k) for k in table.keys[table_begin:]]
+        else:
+            root = node
+
+    return root, url_encoded
+
+
+def parse_list_objects(result, body, fetch_owner=True, table=None):
+    """解析ListObjects的响应。
+
+    :param body: 响应内容。可以是bytes，也可以是HTTP响应等file-like对象，后者会边读边解析
+    :param bool fetch_owner: 是否解析Owner节点。为False时跳过Owner，SimplifiedObjectInfo.owner为None
+    :param table: 若不为None，文件直接追加到该 :class:`ObjectListingTable <oss2.models.ObjectListingTable>` ，
+        而不是 `result.object_list`
+    """
+    root, url_encoded = _parse_list_objects_body(result, body, fetch_owner, table)
     result.is_truncated = _find_bool(root, 'IsTruncated')
     if result.is_truncated:
         result.next_marker = _find_object(root, 'NextMarker', url_encoded)
 
-    for contents_node in root.findall('Contents'):
-        owner = None
-        if contents_node.find("Owner") is not None:
-            owner = Owner(_find_tag(contents_node, 'Owner/DisplayName'), _find_tag(contents_node, 'Owner/ID'))
-        result.object_list.append(SimplifiedObjectInfo(
-            _find_object(contents_node, 'Key', url_encoded),
-            iso8601_to_unixtime(_find_tag(contents_node, 'LastModified')),
-            _find_tag(contents_node, 'ETag').strip('"'),
-            _find_tag(contents_node, 'Type'),
-            int(_find_tag(contents_node, 'Size')),
-            _find_tag(contents_node, 'StorageClass'),
-            owner,
-            _find_tag_with_default(contents_node, 'RestoreInfo', None)
-        ))
-
-    for prefix_node in root.findall('CommonPrefixes'):
-        result.prefix_list.append(_find_object(prefix_node, 'Prefix', url_encoded))
-
     return result
 
 
-def parse_list_objects_v2(result, body):
-    root = ElementTree.fromstring(body)
-    url_encoded = _is_url_encoding(root)
+def parse_list_objects_v2(result, body, fetch_owner=True, table=None):
+    """解析ListObjectsV2的响应，参数同 :func:`parse_list_objects` 。"""
+    root, url_encoded = _parse_list_objects_body(result, body, fetch_owner, table)
     result.is_truncated = _find_bool(root, 'IsTruncated')
     if result.is_truncated:
         result.next_continuation_token = _find_object(root, 'NextContinuationToken', url_encoded)
 
-    for contents_node in root.findall('Contents'):
-        owner = None
-        if contents_node.find("Owner") is not None:
-            owner = Owner(_find_tag(contents_node, 'Owner/DisplayName'), _find_tag(contents_node, 'Owner/ID'))
-        result.object_list.append(SimplifiedObjectInfo(
-            _find_object(contents_node, 'Key', url_encoded),
-            iso8601_to_unixtime(_find_tag(contents_node, 'LastModified')),
-            _find_tag(contents_node, 'ETag').strip('"'),
-            _find_tag(contents_node, 'Type'),
-            int(_find_tag(contents_node, 'Size')),
-            _find_tag(contents_node, 'StorageClass'),
-            owner,
-            _find_tag_with_default(contents_node, 'RestoreInfo', None)
-        ))
-
-    for prefix_node in root.findall('CommonPrefixes'):
-        result.prefix_list.append(_find_object(prefix_node, 'Prefix', url_encoded))
-
     return result
 
 
@@ -1352,9 +1462,53 @@ def parse_get_bucket_encryption(result, body):
 
     return result
 
-def parse_list_object_versions(result, body):
-    root = ElementTree.fromstring(body)
-    url_encoded = _is_url_encoding(root)
+_LIST_OBJECT_VERSIONS_TAGS = frozenset(['Version', 'DeleteMarker', 'CommonPrefixes', 'EncodingType'])
+
+
+def parse_list_object_versions(result, body, fetch_owner=True):
+    """解析ListObjectVersions的响应，参数同 :func:`parse_list_objects` 。fetch_owner为False时owner的各字段保持为空串。"""
+    url_encoded = False
+    time_cache = {}
+
+    begin = (len(result.delete_marker), len(result.versions), len(result.common_prefix))
+
+    root = None
+    for node in _iter_list_nodes(body, _LIST_OBJECT_VERSIONS_TAGS):
+        tag = node.tag
+        if tag == 'Version' or tag == 'DeleteMarker':
+            fields = _node_fields(node)
+            if tag == 'Version':
+                info = ObjectVersionInfo()
+                info.type = _get_field(fields, tag, "Type")
+                info.storage_class = _get_field(fields, tag, "StorageClass")
+                info.size = int(_get_field(fields, tag, "Size"))
+                info.etag = _get_field(fields, tag, "ETag").strip('"')
+                info.restore_info = _get_field_with_default(fields, 'RestoreInfo', None)
+                result.versions.append(info)
+            else:
+                info = DeleteMarkerInfo()
+                result.delete_marker.append(info)
+
+            key = _get_field(fields, tag, "Key")
+            info.key = urlunquote(key) if url_encoded else key
+            info.versionid = _get_field(fields, tag, "VersionId")
+            info.is_latest = _get_bool_field(fields, tag, "IsLatest")
+            info.last_modified = _get_time_field(fields, tag, "LastModified", time_cache)
+            if fetch_owner:
+                owner = _parse_owner(node.find("Owner"))
+                info.owner.id = owner.id
+                info.owner.display_name = owner.display_name
+        elif tag == 'CommonPrefixes':
+            result.common_prefix.append(_find_object(node, "Prefix", url_encoded))
+        elif tag == 'EncodingType':
+            if to_string(node.text) == 'url' and not url_encoded:
+                url_encoded = True
+                for info in result.delete_marker[begin[0]:] + result.versions[begin[1]:]:
+                    info.key = urlunquote(info.key)
+                result.common_prefix[begin[2]:] = [urlunquote(p) for p in result.common_prefix[begin[2]:]]
+        else:
+            root = node
+
     result.is_truncated = _find_bool(root, 'IsTruncated')
     if result.is_truncated:
         result.next_key_marker = _find_object(root, 'NextKeyMarker', url_encoded)
@@ -1367,35 +1521,6 @@ def parse_list_object_versions(result, body):
     result.max_keys = _find_int(root, "MaxKeys")
     result.delimiter = _find_object(root, "Delimiter", url_encoded)
 
-    for delete_marker in root.findall("DeleteMarker"):
-        deleteInfo = DeleteMarkerInfo()
-        deleteInfo.key = _find_object(delete_marker, "Key", url_encoded)
-        deleteInfo.versionid = _find_tag(delete_marker, "VersionId")
-        deleteInfo.is_latest = _find_bool(delete_marker, "IsLatest")
-        deleteInfo.last_modified = iso8601_to_unixtime(_find_tag(delete_marker, "LastModified"))
-        deleteInfo.owner.id = _find_tag(delete_marker, "Owner/ID")
-        deleteInfo.owner.display_name = _find_tag(delete_marker, "Owner/DisplayName")
-        result.delete_marker.append(deleteInfo)
-
-    for version in root.findall("Version"):
-        versionInfo = ObjectVersionInfo()
-        versionInfo.key = _find_object(version, "Key", url_encoded)
-        versionInfo.versionid = _find_tag(version, "VersionId")
-        versionInfo.is_latest = _find_bool(version, "IsLatest")
-        versionInfo.last_modified = iso8601_to_unixtime(_find_tag(version, "LastModified"))
-        versionInfo.owner.id = _find_tag(version, "Owner/ID")
-        versionInfo.owner.display_name = _find_tag(version, "Owner/DisplayName")
-        versionInfo.type = _find_tag(version, "Type")
-        versionInfo.storage_class = _find_tag(version, "StorageClass")
-        versionInfo.size = _find_int(version, "Size")
-        versionInfo.etag = _find_tag(version, "ETag").strip('"')
-        versionInfo.restore_info = _find_tag_with_default(version, 'RestoreInfo', None)
-
-        result.versions.append(versionInfo)
-
-    for common_prefix in root.findall("CommonPrefixes"):
-        result.common_prefix.append(_find_object(common_prefix, "Prefix", url_encoded))
-
     return result
 
 def to_put_bucket_versioning(bucket_version_config):
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+import io
+import sys
+import unittest
+
+import oss2
+
+from unittests.common import *
+
+
+class FakeResponse(object):
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.__body = body
+        self.__offset = 0
+
+    async def read(self, amt=None):
+        if amt is None:
+            amt = len(self.__body) - self.__offset
+        content = self.__body[self.__offset:self.__offset + amt]
+        self.__offset += len(content)
+        return content
+
+    async def close(self):
+        pass
+
+
+class FakeTransport(oss2.AsyncTransport):
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.bodies = []
+
+    async def send(self, req, timeout):
+        self.requests.append(req)
+
+        data = req.data
+        if hasattr(data, '__aiter__'):
+            chunks = []
+            async for chunk in data:
+                chunks.append(chunk)
+            data = b''.join(chunks)
+        elif hasattr(data, 'read'):
+            data = data.read()
+        self.bodies.append(data)
+
+        status, headers, body = self.responses.pop(0)
+        headers = dict(headers)
+        headers.setdefault('x-oss-request-id', REQUEST_ID)
+        return FakeResponse(status, headers, body)
+
+
+def run(coro):
+    import asyncio
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def async_bucket(transport):
+    return oss2.AsyncBucket(oss2.Auth('fake-access-key-id', 'fake-access-key-secret'),
+                            'http://oss-cn-hangzhou.aliyuncs.com', BUCKET_NAME,
+                            session=oss2.AsyncSession(transport=transport))
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'asyncio API requires python 3.5+')
+class TestAsyncApi(OssTestCase):
+    def test_put_object(self):
+        content = random_bytes(1024)
+        crc = oss2.utils.Crc64()
+        crc.update(content)
+
+        transport = FakeTransport([(200, {'ETag': RAW_ETAG, 'x-oss-hash-crc64ecma': str(crc.crc)}, b'')])
+        result = run(async_bucket(transport).put_object('fake-key', content))
+
+        self.assertEqual(result.status, 200)
+        self.assertEqual(result.etag, ETAG)
+        self.assertEqual(result.request_id, REQUEST_ID)
+        self.assertEqual(transport.bodies[0], content)
+        self.assertEqual(transport.requests[0].method, 'PUT')
+        self.assertTrue(transport.requests[0].headers['authorization'].startswith('OSS '))
+
+    def test_put_object_async_iterable(self):
+        content = random_bytes(1024)
+        crc = oss2.utils.Crc64()
+        crc.update(content)
+
+        async def gen():
+            yield content[:100]
+            yield content[100:]
+
+        transport = FakeTransport([(200, {'ETag': RAW_ETAG, 'x-oss-hash-crc64ecma': str(crc.crc)}, b'')])
+        result = run(async_bucket(transport).put_object('fake-key', gen()))
+
+        self.assertEqual(result.status, 200)
+        self.assertEqual(transport.bodies[0], content)
+
+    def test_make_async_body(self):
+        async def drain(data):
+            chunks = []
+            async for chunk in data:
+                chunks.append(chunk)
+            return chunks
+
+        content = random_bytes(20000)
+
+        headers = oss2.CaseInsensitiveDict()
+        body = oss2.async_http._make_async_body(io.BytesIO(content), headers)
+        self.assertEqual(content, b''.join(run(drain(body))))
+        self.assertEqual(str(len(content)), headers['Content-Length'])
+
+        body = oss2.async_http._make_async_body(iter([b'ab', 'cd']), oss2.CaseInsensitiveDict())
+        self.assertEqual([b'ab', b'cd'], run(drain(body)))
+
+    def test_put_object_crc_mismatch(self):
+        transport = FakeTransport([(200, {'ETag': RAW_ETAG, 'x-oss-hash-crc64ecma': '1'}, b'')])
+        self.assertRaises(oss2.exceptions.InconsistentError, run,
+                          async_bucket(transport).put_object('fake-key', b'123'))
+
+    def test_get_object(self):
+        content = random_bytes(3 * CHUNK_SIZE + 7)
+        crc = oss2.utils.Crc64()
+        crc.update(content)
+
+        transport = FakeTransport([(200, {'Content-Length': str(len(content)),
+                                          'x-oss-hash-crc64ecma': str(crc.crc)}, content)])
+        consumed = []
+
+        async def get():
+            result = await async_bucket(transport).get_object(
+                'fake-key', progress_callback=lambda x, y: consumed.append(x))
+            chunks = []
+            async for chunk in result:
+                chunks.append(chunk)
+            return result, b''.join(chunks)
+
+        result, got = run(get())
+        self.assertEqual(got, content)
+        self.assertEqual(result.client_crc, crc.crc)
+        self.assertEqual(result.content_length, len(content))
+        self.assertEqual(consumed[-1], len(content))
+
+    def test_get_object_crc_mismatch(self):
+        transport = FakeTransport([(200, {'Content-Length': '3', 'x-oss-hash-crc64ecma': '1'}, b'123')])
+
+        async def get():
+            result = await async_bucket(transport).get_object('fake-key')
+            while await result.read(2):
+                pass
+
+        self.assertRaises(oss2.exceptions.InconsistentError, run, get())
+
+    def test_get_object_crc_checked_at_content_length(self):
+        transport = FakeTransport([(200, {'Content-Length': '3', 'x-oss-hash-crc64ecma': '1'}, b'123')])
+
+        # 恰好读完Content-Length个字节、不再多读时也要校验
+        async def get():
+            result = await async_bucket(transport).get_object('fake-key')
+            await result.read(1)
+            await result.read(2)
+
+        self.assertRaises(oss2.exceptions.InconsistentError, run, get())
+
+        content = b'123'
+        crc = oss2.utils.Crc64()
+        crc.update(content)
+        transport = FakeTransport([(200, {'Content-Length': '3', 'x-oss-hash-crc64ecma': str(crc.crc)}, content)])
+
+        async def get_all():
+            result = await async_bucket(transport).get_object('fake-key')
+            return await result.read(3), await result.read(3)
+
+        self.assertEqual((content, b''), run(get_all()))
+
+    def test_get_object_not_found(self):
+        body = b'''<?xml version="1.0" encoding="UTF-8"?>
+        <Error>
+          <Code>NoSuchKey</Code>
+          <Message>The specified key does not exist.</Message>
+          <RequestId>566AB62EB06147681C283D73</RequestId>
+        </Error>'''
+        transport = FakeTransport([(404, {'Content-Length': str(len(body))}, body)])
+
+        try:
+            run(async_bucket(transport).get_object('fake-key'))
+        except oss2.exceptions.NoSuchKey as e:
+            self.assertEqual(e.status, 404)
+            self.assertEqual(e.request_id, REQUEST_ID)
+        else:
+            self.fail('NoSuchKey not raised')
+
+    def test_object_exists(self):
+        transport = FakeTransport([(404, {'Content-Length': '0'}, b''), (200, {'Content-Length': '0'}, b'')])
+        bucket = async_bucket(transport)
+
+        self.assertFalse(run(bucket.object_exists('fake-key')))
+        self.assertTrue(run(bucket.object_exists('fake-key')))
+
+    def test_list_objects(self):
+        body = b'''<?xml version="1.0" encoding="UTF-8"?>
+        <ListBucketResult>
+          <Name>ming-oss-share</Name>
+          <Prefix>a%2F</Prefix>
+          <Marker></Marker>
+          <MaxKeys>100</MaxKeys>
+          <Delimiter>%2F</Delimiter>
+          <EncodingType>url</EncodingType>
+          <IsTruncated>false</IsTruncated>
+          <Contents>
+            <Key>a%2Fb.txt</Key>
+            <LastModified>2015-12-11T13:01:41.000Z</LastModified>
+            <ETag>"7AE1A589ED6B161CAD94ACDB98206DA6"</ETag>
+            <Type>Normal</Type>
+            <Size>10</Size>
+            <StorageClass>Standard</StorageClass>
+          </Contents>
+          <CommonPrefixes>
+            <Prefix>a%2Fc%2F</Prefix>
+          </CommonPrefixes>
+        </ListBucketResult>'''
+        transport = FakeTransport([(200, {'Content-Length': str(len(body))}, body)])
+
+        result = run(async_bucket(transport).list_objects(prefix='a/', delimiter='/'))
+
+        self.assertEqual(transport.requests[0].params['prefix'], 'a/')
+        self.assertEqual(result.is_truncated, False)
+        self.assertEqual(result.object_list[0].key, 'a/b.txt')
+        self.assertEqual(result.object_list[0].size, 10)
+        self.assertEqual(result.object_list[0].last_modified, MTIME)
+        self.assertEqual(result.prefix_list, ['a/c/'])
+
+    def test_complete_multipart_upload(self):
+        crc = oss2.utils.Crc64()
+        crc.update(b'123')
+        part = oss2.models.PartInfo(1, ETAG, size=3, part_crc=crc.crc)
+
+        transport = FakeTransport([(200, {'ETag': RAW_ETAG, 'x-oss-hash-crc64ecma': str(crc.crc)}, b'')])
+        result = run(async_bucket(transport).complete_multipart_upload('fake-key', 'fake-upload-id', [part]))
+
+        self.assertEqual(result.etag, ETAG)
+        self.assertEqual(transport.requests[0].params['uploadId'], 'fake-upload-id')
+        self.assertTrue(b'<PartNumber>1</PartNumber>' in transport.bodies[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import copy
+import pickle
 import unittest
 import oss2
+
+from mock import patch
 from oss2.auth import *
 from oss2.credentials import *
 
@@ -39,5 +43,89 @@ class TestAuth(unittest.TestCase):
         stsauth = StsAuth('ak', 'sk', 'token')
         self.assertEqual('v1', stsauth.auth_version())
 
+    def test_v4_signing_key_cache(self):
+        class RotatingProvider(CredentialsProvider):
+            def __init__(self):
+                self.credentials = Credentials('ak', 'sk1')
+
+            def get_credentials(self):
+                return self.credentials
+
+        def sign(auth, region='cn-hangzhou'):
+            req = oss2.http.Request('GET', 'http://bucket.oss-cn-hangzhou.aliyuncs.com/key',
+                                    params={'acl': ''}, region=region, product='oss')
+            auth._sign_request(req, 'bucket', 'key')
+            return req.headers['authorization']
+
+        provider = RotatingProvider()
+        auth = ProviderAuthV4(provider)
+
+        now = datetime(2023, 5, 1, 8, 0, 0)
+        with patch('oss2.auth.datetime') as mock_datetime:
+            mock_datetime.utcnow.return_value = now
+
+            self.assertEqual(sign(auth), sign(AuthV4('ak', 'sk1')))
+            self.assertEqual(sign(auth), sign(AuthV4('ak', 'sk1')))
+            self.assertEqual(sign(auth, 'cn-beijing'), sign(AuthV4('ak', 'sk1'), 'cn-beijing'))
+
+            provider.credentials = Credentials('ak', 'sk2')
+            self.assertEqual(sign(auth), sign(AuthV4('ak', 'sk2')))
+            self.assertNotEqual(sign(auth), sign(AuthV4('ak', 'sk1')))
+
+    def test_pickle_v4(self):
+        def sign(auth):
+            req = oss2.http.Request('GET', 'http://bucket.oss-cn-hangzhou.aliyuncs.com/key',
+                                    region='cn-hangzhou', product='oss')
+            auth._sign_request(req, 'bucket', 'key')
+            return req.headers['authorization']
+
+        now = datetime(2023, 5, 1, 8, 0, 0)
+        with patch('oss2.auth.datetime') as mock_datetime:
+            mock_datetime.utcnow.return_value = now
+
+            auth = AuthV4('ak', 'sk')
+            expected = sign(auth)
+
+            b = pickle.loads(pickle.dumps(oss2.Bucket(auth, 'http://oss-cn-hangzhou.aliyuncs.com', 'bucket',
+                                                      region='cn-hangzhou')))
+            self.assertEqual(expected, sign(b.auth))
+            self.assertEqual(expected, sign(copy.deepcopy(auth)))
+
+    def test_v4_uri_encode(self):
+        self.assertEqual(oss2.auth._v4_uri_encode('/bucket/a b/c~d_e-f.g', True), '/bucket/a%20b/c~d_e-f.g')
+        self.assertEqual(oss2.auth._v4_uri_encode('a/b+c=d&e', False), 'a%2Fb%2Bc%3Dd%26e')
+        self.assertEqual(oss2.auth._v4_uri_encode(u'中', False), '%E4%B8%AD')
+
+    def test_lru_cache(self):
+        cache = oss2.utils._LruCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+
+        cache.put('c', 3)
+        self.assertEqual(cache.get('b'), None)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_v2_uri_encode(self):
+        self.assertEqual(v2_uri_encode('/bucket/a b/c~d_e-f.g'), '%2Fbucket%2Fa%20b%2Fc~d_e-f.g')
+        self.assertEqual(v2_uri_encode(u'中'), '%E4%B8%AD')
+
+    def test_v1_string_to_sign(self):
+        auth = Auth('ak', 'sk')
+        req = oss2.http.Request('PUT', 'http://bucket.oss-cn-hangzhou.aliyuncs.com/key',
+                                params={'uploadId': 'id', 'partNumber': '1', 'unsigned': 'x', 'acl': ''},
+                                headers={'Content-Type': 'text/plain', 'X-OSS-Meta-B': '2', 'x-oss-meta-a': '1'})
+
+        with patch('oss2.utils.http_date', return_value='Mon, 01 May 2023 08:00:00 GMT'):
+            auth._sign_request(req, 'bucket', 'key')
+
+        string_to_sign = 'PUT\n\ntext/plain\nMon, 01 May 2023 08:00:00 GMT\nx-oss-meta-a:1\nx-oss-meta-b:2\n' \
+                         '/bucket/key?acl&partNumber=1&uploadId=id'
+        signature = utils.b64encode_as_string(hmac.new(b'sk', to_bytes(string_to_sign), hashlib.sha1).digest())
+        self.assertEqual(req.headers['authorization'], 'OSS ak:' + signature)
+
+
 if __name__ == '__main__':
     unittest.main()
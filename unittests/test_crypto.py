@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import signal
+import time
+
+from mock import patch
+from Crypto.PublicKey import RSA
+
+from unittests.common import *
+
+
+_PRIVATE_KEY = RSA.generate(1024)
+_KEY_PAIR = {'private_key': _PRIVATE_KEY.exportKey(), 'public_key': _PRIVATE_KEY.publickey().exportKey()}
+
+
+class CountingRsaProvider(oss2.RsaProvider):
+    def __init__(self, *args, **kwargs):
+        super(CountingRsaProvider, self).__init__(*args, **kwargs)
+        self.unwraps = 0
+
+    def decrypt_encrypted_key(self, encrypted_key):
+        self.unwraps += 1
+        return super(CountingRsaProvider, self).decrypt_encrypted_key(encrypted_key)
+
+    def decrypt_encrypted_iv(self, encrypted_iv):
+        self.unwraps += 1
+        return super(CountingRsaProvider, self).decrypt_encrypted_iv(encrypted_iv)
+
+
+class TestDataKeyCache(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = oss2.DataKeyCache()
+        self.assertTrue(cache.get('a') is None)
+        cache.put('a', b'key-a')
+        self.assertEqual(b'key-a', cache.get('a'))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_lru(self):
+        cache = oss2.DataKeyCache(max_size=2)
+        cache.put('a', b'1')
+        cache.put('b', b'2')
+        cache.get('a')
+        cache.put('c', b'3')
+
+        self.assertEqual(2, len(cache))
+        self.assertTrue(cache.get('b') is None)
+        self.assertEqual(b'1', cache.get('a'))
+        self.assertEqual(b'3', cache.get('c'))
+
+    def test_ttl(self):
+        cache = oss2.DataKeyCache(ttl=0.05)
+        cache.put('a', b'1')
+        self.assertEqual(b'1', cache.get('a'))
+        time.sleep(0.1)
+        self.assertTrue(cache.get('a') is None)
+        self.assertEqual(0, len(cache))
+
+    def test_zeroise(self):
+        cache = oss2.DataKeyCache(max_size=1, zeroise=True)
+        cache.put('a', b'secret')
+        value = cache.get('a')
+        self.assertEqual(b'secret', value)
+        self.assertTrue(isinstance(value, bytes))
+
+        buffer = cache._DataKeyCache__entries['a'][1]
+        cache.put('b', b'other')
+        self.assertEqual(bytearray(6), buffer)
+        self.assertEqual(b'secret', value)
+
+        buffer = cache._DataKeyCache__entries['b'][1]
+        cache.clear()
+        self.assertEqual(bytearray(5), buffer)
+        self.assertEqual(0, len(cache))
+
+
+class TestCtrCipherAdapter(unittest.TestCase):
+    def setUp(self):
+        self.key = oss2.utils.random_key(32)
+        self.iv = oss2.utils.random_iv()
+        self.content = random_bytes(3 * 1024 * 1024 + 7)
+        self.encrypted = self.cipher().encrypt(self.content)
+
+    def cipher(self, offset=0):
+        cipher = oss2.utils.AESCTRCipher()
+        cipher.initialize(self.key, self.iv, offset)
+        return cipher
+
+    def assertEncrypted(self, data):
+        adapter = oss2.utils.make_ctr_cipher_adapter(data, self.cipher())
+        chunks = []
+        while True:
+            chunk = adapter.read(8192)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        self.assertEqual(self.encrypted, b''.join(chunks))
+
+    def test_sources(self):
+        self.assertEncrypted(self.content)
+        self.assertEncrypted(io.BytesIO(self.content))
+        self.assertEncrypted(self.content[i:i + 1000] for i in range(0, len(self.content), 1000))
+
+        self.assertEqual(len(self.content), oss2.utils.make_ctr_cipher_adapter(self.content, self.cipher()).len)
+        self.assertFalse(hasattr(oss2.utils.make_ctr_cipher_adapter(iter([self.content]), self.cipher()), 'len'))
+
+    def test_parallel(self):
+        num_threads, part_size = oss2.defaults.cipher_num_threads, oss2.defaults.cipher_parallel_part_size
+        oss2.defaults.cipher_num_threads = 4
+        oss2.defaults.cipher_parallel_part_size = 1000
+        try:
+            self.assertEncrypted(self.content)
+            self.assertEncrypted(io.BytesIO(self.content))
+        finally:
+            oss2.defaults.cipher_num_threads, oss2.defaults.cipher_parallel_part_size = num_threads, part_size
+
+    @unittest.skipIf(not hasattr(os, 'fork'), 'requires os.fork')
+    def test_parallel_after_fork(self):
+        num_threads, part_size = oss2.defaults.cipher_num_threads, oss2.defaults.cipher_parallel_part_size
+        oss2.defaults.cipher_num_threads = 4
+        oss2.defaults.cipher_parallel_part_size = 1000
+        try:
+            self.assertEncrypted(self.content)
+
+            # 子进程中继承来的线程池没有工作线程，不能再用；超时则由SIGALRM结束子进程
+            pid = os.fork()
+            if pid == 0:
+                status = 1
+                try:
+                    signal.alarm(30)
+                    self.assertEncrypted(self.content)
+                    status = 0
+                finally:
+                    os._exit(status)
+
+            self.assertEqual(0, os.waitpid(pid, 0)[1])
+        finally:
+            oss2.defaults.cipher_num_threads, oss2.defaults.cipher_parallel_part_size = num_threads, part_size
+
+    def test_cipher_pool_pid(self):
+        pool = oss2.utils._get_cipher_pool()
+        self.assertTrue(pool is oss2.utils._get_cipher_pool())
+
+        # 没有register_at_fork时靠进程号发现fork
+        oss2.utils._cipher_pool_pid = -1
+        self.assertFalse(pool is oss2.utils._get_cipher_pool())
+        pool.terminate()
+
+    def test_decrypt_range(self):
+        # 从第37个字节开始的范围下载：从对齐的第32个字节开始解密，丢弃前5个字节
+        adapter = oss2.utils.make_ctr_cipher_adapter(iter([self.encrypted[32:]]), self.cipher(2), discard=5)
+        self.assertEqual(self.content[37:], adapter.read())
+        self.assertEqual(b'', adapter.read(10))
+
+
+class TestCryptoBucket(unittest.TestCase):
+    @patch('oss2.Session.do_request')
+    def test_upload_part_unwraps_once(self, do_request):
+        provider = CountingRsaProvider(_KEY_PAIR)
+        b = bucket(provider)
+
+        context = oss2.models.MultipartUploadCryptoContext(data_size=1024 * 1024, part_size=100 * 1024,
+                                                           content_crypto_material=provider.create_content_material())
+
+        for part_number in range(1, 6):
+            do_request.return_value = r4put()
+            b.upload_part('key', 'upload-id', part_number, random_bytes(100), upload_context=context)
+
+        self.assertEqual(2, provider.unwraps)
+        self.assertEqual(8, provider.data_key_cache.hits)
+
+    @patch('oss2.Session.do_request')
+    def test_upload_part_without_cache(self, do_request):
+        provider = CountingRsaProvider(_KEY_PAIR)
+        provider.data_key_cache = None
+        b = bucket(provider)
+
+        context = oss2.models.MultipartUploadCryptoContext(data_size=1024 * 1024, part_size=100 * 1024,
+                                                           content_crypto_material=provider.create_content_material())
+
+        for part_number in range(1, 4):
+            do_request.return_value = r4put()
+            b.upload_part('key', 'upload-id', part_number, random_bytes(100), upload_context=context)
+
+        self.assertEqual(6, provider.unwraps)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import io
+import pickle
+import threading
+import time
+import unittest
+
+import oss2
+from oss2 import http
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        self.server.num_connections += 1
+        BaseHTTPRequestHandler.setup(self)
+
+    def do_GET(self):
+        body = b'hello'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class KeepAliveServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    num_connections = 0
+
+
+class BodyHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b''.join(b'%06d' % i for i in range(10000))
+        self.send_response(200)
+        if self.path == '/gzip':
+            f = io.BytesIO()
+            with gzip.GzipFile(fileobj=f, mode='wb') as g:
+                g.write(body)
+            body = f.getvalue()
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSession(unittest.TestCase):
+    def setUp(self):
+        self.server = KeepAliveServer(('127.0.0.1', 0), KeepAliveHandler)
+        t = threading.Thread(target=self.server.serve_forever)
+        t.daemon = True
+        t.start()
+
+        self.url = 'http://127.0.0.1:{0}/'.format(self.server.server_address[1])
+        self.pool_key = 'http://127.0.0.1:{0}'.format(self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def assertConnections(self, expected):
+        # 服务端在另一个线程里accept，稍等片刻
+        for i in range(50):
+            if self.server.num_connections >= expected:
+                break
+            time.sleep(0.02)
+        self.assertEqual(expected, self.server.num_connections)
+
+    def get(self, session):
+        resp = session.do_request(http.Request('GET', self.url), timeout=5)
+        self.assertEqual(b'hello', resp.read())
+
+    def test_prewarm_and_stats(self):
+        session = http.Session()
+        self.assertEqual(3, session.prewarm(self.url, 3))
+        self.assertConnections(3)
+        self.assertEqual({'in_use': 0, 'idle': 3, 'created': 3, 'discarded': 0, 'maxsize': 10},
+                         session.pool_stats()[self.pool_key])
+
+        # 请求复用预热的连接
+        self.get(session)
+        self.get(session)
+        self.assertConnections(3)
+
+        resp = session.do_request(http.Request('GET', self.url), timeout=5)
+        self.assertEqual(1, session.pool_stats()[self.pool_key]['in_use'])
+        resp.read()
+        self.assertEqual(0, session.pool_stats()[self.pool_key]['in_use'])
+
+    def test_idle_timeout(self):
+        session = http.Session(idle_timeout=0.2)
+        self.get(session)
+        self.get(session)
+        self.assertConnections(1)
+
+        time.sleep(0.4)
+        self.get(session)
+        self.assertConnections(2)
+        self.assertEqual(1, session.pool_stats()[self.pool_key]['discarded'])
+
+    def test_pool_internals_missing(self):
+        # urllib3的内部实现变化时，跳过扩容和统计，不影响请求
+        session = http.Session()
+        self.get(session)
+        adapter = session.session.get_adapter(self.url)
+
+        pool = list(adapter.poolmanager.pools._container.values())[0]
+        pool.pool = object()
+        session.ensure_pool_size(16)
+        self.assertEqual(16, session.pool_size)
+        self.assertEqual(0, session.pool_stats()[self.pool_key]['idle'])
+        self.assertEqual(0, session.pool_stats()[self.pool_key]['maxsize'])
+
+        session = http.Session()
+        self.get(session)
+        adapter = session.session.get_adapter(self.url)
+        adapter.poolmanager.pools = object()
+        adapter.poolmanager.connection_pool_kw = None
+        session.ensure_pool_size(16)
+        self.assertEqual(16, session.pool_size)
+        self.assertEqual({}, session.pool_stats())
+
+    def test_ensure_pool_size(self):
+        session = http.Session()
+        self.get(session)
+
+        session.ensure_pool_size(4)
+        self.assertEqual(10, session.pool_size)
+
+        session.ensure_pool_size(32)
+        self.assertEqual(32, session.pool_size)
+        self.assertEqual(32, session.pool_stats()[self.pool_key]['maxsize'])
+
+        # 扩容后超过原大小的连接也能放回池中
+        self.assertEqual(20, session.prewarm(self.url, 20))
+        self.assertEqual(20, session.pool_stats()[self.pool_key]['idle'])
+        self.assertEqual(0, session.pool_stats()[self.pool_key]['discarded'])
+
+        session = http.Session(pool_size=2)
+        session.ensure_pool_size(32)
+        self.assertEqual(2, session.pool_size)
+
+    def test_pickle_adapter(self):
+        adapter = pickle.loads(pickle.dumps(http._PoolAdapter(10, 30)))
+        self.assertEqual(30, adapter.idle_timeout)
+
+        session = http.Session()
+        session.session.mount('http://', adapter)
+        self.get(session)
+        self.assertEqual(30, list(adapter.poolmanager.pools._container.values())[0].idle_timeout)
+
+    def test_concurrent_api_grows_pool(self):
+        b = oss2.Bucket(oss2.AnonymousAuth(), 'http://oss-cn-hangzhou.aliyuncs.com', 'ming-oss-share')
+        result = b.bulk_delete([], concurrency=16)
+        self.assertEqual(0, result.deleted_count)
+        self.assertEqual(16, b.session.pool_size)
+
+
+class TestResponse(unittest.TestCase):
+    def setUp(self):
+        self.server = KeepAliveServer(('127.0.0.1', 0), BodyHandler)
+        t = threading.Thread(target=self.server.serve_forever)
+        t.daemon = True
+        t.start()
+
+        self.url = 'http://127.0.0.1:{0}/'.format(self.server.server_address[1])
+        self.body = b''.join(b'%06d' % i for i in range(10000))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def get(self, session=None, path=''):
+        return (session or http.Session()).do_request(http.Request('GET', self.url + path), timeout=5)
+
+    def test_read(self):
+        resp = self.get()
+        self.assertEqual(b'', resp.read(0))
+        self.assertEqual(self.body[:100], resp.read(100))
+        self.assertEqual(self.body[100:], resp.read())
+        self.assertEqual(b'', resp.read(100))
+        self.assertEqual(b'', resp.read())
+
+    def test_gzip(self):
+        # 压缩的响应体读几个字节时，解压器可能还没有输出，不能当成已经读完
+        for amt in (1, 7, 100):
+            resp = self.get(path='gzip')
+            chunks = []
+            while True:
+                chunk = resp.read(amt)
+                if not chunk:
+                    break
+                self.assertTrue(len(chunk) <= amt)
+                chunks.append(chunk)
+            self.assertEqual(self.body, b''.join(chunks))
+
+        resp = self.get(path='gzip')
+        buf = bytearray(7)
+        content = []
+        while True:
+            n = resp.readinto(buf)
+            if not n:
+                break
+            content.append(bytes(buf[:n]))
+        self.assertEqual(self.body, b''.join(content))
+
+        resp = self.get(path='gzip')
+        resp.chunk_size = 7
+        self.assertEqual(self.body, b''.join(resp))
+
+    def test_readinto(self):
+        resp = self.get()
+        buf = bytearray(50000)
+        self.assertEqual(50000, resp.readinto(buf))
+        self.assertEqual(self.body[:50000], bytes(buf))
+        self.assertEqual(10000, resp.readinto(buf))
+        self.assertEqual(self.body[50000:], bytes(buf[:10000]))
+        self.assertEqual(0, resp.readinto(buf))
+
+    def test_chunk_size(self):
+        resp = self.get()
+        resp.chunk_size = 25000
+        self.assertEqual([25000, 25000, 10000], [len(chunk) for chunk in resp])
+
+        resp = self.get()
+        views = list(resp.iter_views(16 * 1024))
+        self.assertTrue(all(isinstance(view, memoryview) for view in views))
+        self.assertEqual(4, len(views))
+
+        resp = self.get()
+        self.assertEqual(self.body, b''.join(bytes(view) for view in resp.iter_views()))
+
+
+if __name__ == '__main__':
+    unittest.main()
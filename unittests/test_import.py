@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import os
+import subprocess
+import sys
+import unittest
+
+import oss2
+
+
+def loaded_modules(statement):
+    code = statement + '; import sys; print(" ".join(sorted(sys.modules)))'
+    output = subprocess.check_output([sys.executable, '-c', code])
+    return set(output.decode('utf-8').split())
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'module __getattr__ requires python 3.7')
+class TestLazyImport(unittest.TestCase):
+    def test_import_is_light(self):
+        modules = loaded_modules('import oss2')
+        for name in ('requests', 'Crypto', 'crcmod', 'aliyunsdkcore', 'oss2.models', 'oss2.xml_utils', 'oss2.api',
+                     'oss2.crypto'):
+            self.assertFalse(name in modules, name)
+
+    def test_bucket_does_not_load_crypto(self):
+        modules = loaded_modules('import oss2; oss2.Bucket; oss2.resumable_upload')
+        self.assertTrue('oss2.api' in modules)
+        for name in ('Crypto.Cipher', 'aliyunsdkcore', 'oss2.crypto', 'oss2.crypto_bucket'):
+            self.assertFalse(name in modules, name)
+
+    def test_public_names(self):
+        for name in oss2.__all__:
+            self.assertTrue(getattr(oss2, name) is not None, name)
+            self.assertTrue(name in dir(oss2), name)
+
+        self.assertTrue(oss2.CryptoBucket is oss2.crypto_bucket.CryptoBucket)
+        self.assertTrue(oss2.xml_utils is sys.modules['oss2.xml_utils'])
+        self.assertRaises(AttributeError, getattr, oss2, 'NoSuchName')
+
+    def test_star_import(self):
+        namespace = {}
+        exec('from oss2 import *', namespace)
+        self.assertTrue(namespace['Bucket'] is oss2.Bucket)
+        self.assertTrue(namespace['models'] is oss2.models)
+
+
+
+class TestAsyncSyntax(unittest.TestCase):
+    def test_no_async_generators(self):
+        # Python 3.5也会导入async_api、async_http，而3.5不支持异步生成器
+        for name in ('async_api', 'async_http'):
+            path = os.path.join(os.path.dirname(oss2.__file__), name + '.py')
+            with open(path, 'rb') as f:
+                tree = ast.parse(f.read())
+
+            for node in ast.walk(tree):
+                if type(node).__name__ == 'AsyncFunctionDef':
+                    for child in ast.walk(node):
+                        self.assertFalse(isinstance(child, (ast.Yield, ast.YieldFrom)),
+                                         '{0}.{1}'.format(name, node.name))
+
+
+if __name__ == '__main__':
+    unittest.main()
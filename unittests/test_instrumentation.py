@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest
+
+import oss2
+from oss2 import instrumentation
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+
+class ObjectHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def send(self, status, body=b'', length=None):
+        self.send_response(status)
+        self.send_header('x-oss-request-id', 'req-' + self.command)
+        self.send_header('Content-Length', str(len(body) if length is None else length))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.send(200)
+
+    def do_GET(self):
+        if self.path.endswith('/missing.txt'):
+            self.send(404, b'<?xml version="1.0" encoding="UTF-8"?><Error><Code>NoSuchKey</Code></Error>')
+        else:
+            self.send(200, b'x' * 100000)
+
+    def do_HEAD(self):
+        self.send(200, length=100000)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.server = Server(('127.0.0.1', 0), ObjectHandler)
+        t = threading.Thread(target=self.server.serve_forever)
+        t.daemon = True
+        t.start()
+
+        self.metrics = []
+        self.collector = oss2.HistogramCollector()
+
+        class Recorder(oss2.Instrumentation):
+            def on_request_end(s, metrics):
+                self.metrics.append(metrics)
+                self.collector.on_request_end(metrics)
+
+        session = oss2.Session(instrumentation=Recorder())
+        self.bucket = oss2.Bucket(oss2.AnonymousAuth(), 'http://127.0.0.1:{0}'.format(self.server.server_address[1]),
+                                  'ming-oss-share', session=session)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_put_and_get(self):
+        self.bucket.put_object('a.txt', b'hello')
+        self.assertEqual(1, len(self.metrics))
+
+        m = self.metrics[0]
+        self.assertEqual('put_object', m.operation)
+        self.assertEqual('PUT', m.method)
+        self.assertEqual(200, m.status)
+        self.assertEqual('req-PUT', m.request_id)
+        self.assertEqual(5, m.bytes_sent)
+        self.assertEqual(0, m.bytes_received)
+        self.assertTrue(m.sign_time >= 0)
+        self.assertTrue(0 <= m.ttfb <= m.total_time)
+        self.assertTrue(m.error is None)
+
+        # 流式下载在读完响应体时才结束统计
+        result = self.bucket.get_object('a.txt')
+        self.assertEqual(1, len(self.metrics))
+        result.read(1000)
+        self.assertEqual(1, len(self.metrics))
+        result.read()
+
+        self.assertEqual(2, len(self.metrics))
+        m = self.metrics[1]
+        self.assertEqual('get_object', m.operation)
+        self.assertEqual(100000, m.bytes_received)
+        self.assertTrue(m.transfer_time is not None)
+
+        self.bucket.head_object('a.txt')
+        self.assertEqual('head_object', self.metrics[2].operation)
+        self.assertEqual(0, self.metrics[2].bytes_received)
+
+        self.assertEqual(['get_object', 'head_object', 'put_object'], sorted(self.collector.operations()))
+        summary = self.collector.summary()['get_object']
+        self.assertEqual(1, summary['count'])
+        self.assertEqual(100000, summary['bytes_received'])
+        self.assertTrue(summary['p50'] >= m.total_time)
+        self.assertTrue(summary['p50'] <= m.total_time * 1.05 + 1e-5)
+
+    def test_operation_through_wrappers(self):
+        # 操作名由Bucket的方法显式给出，与调用栈上的包装函数无关
+        def upload(key):
+            return self.bucket.put_object(key, b'hello')
+
+        upload('a.txt')
+        list(map(lambda key: self.bucket.get_object(key).read(), ['a.txt']))
+        self.bucket._get_bucket_config(oss2.Bucket.ACL).read()
+
+        self.assertEqual(['put_object', 'get_object', 'get_bucket_config'], [m.operation for m in self.metrics])
+
+    def test_readinto_and_iter(self):
+        result = self.bucket.get_object('a.txt')
+        buf = bytearray(30000)
+        while result.readinto(buf):
+            pass
+
+        result = self.bucket.get_object('a.txt')
+        result.chunk_size = 30000
+        self.assertEqual([30000, 30000, 30000, 10000], [len(chunk) for chunk in result])
+
+        self.assertEqual(2, len(self.metrics))
+        self.assertEqual([100000, 100000], [m.bytes_received for m in self.metrics])
+
+    def test_error(self):
+        self.assertRaises(oss2.exceptions.NoSuchKey, self.bucket.get_object, 'missing.txt')
+        self.assertEqual(1, len(self.metrics))
+
+        m = self.metrics[0]
+        self.assertEqual(404, m.status)
+        self.assertEqual('req-GET', m.request_id)
+        self.assertTrue(isinstance(m.error, oss2.exceptions.NoSuchKey))
+        self.assertEqual('NoSuchKey', m.as_dict()['error'])
+        self.assertEqual(1, self.collector.summary()['get_object']['errors'])
+
+    def test_callback(self):
+        exported = []
+        self.bucket.session.instrumentation = oss2.CallbackInstrumentation(exported.append)
+        self.bucket.put_object('a.txt', b'hello')
+
+        self.assertEqual(1, len(exported))
+        self.assertEqual('put_object', exported[0]['operation'])
+        self.assertEqual(200, exported[0]['status'])
+
+    def test_failing_instrumentation(self):
+        def fail(d):
+            raise ValueError('broken exporter')
+
+        self.bucket.session.instrumentation = oss2.CallbackInstrumentation(fail)
+        self.bucket.put_object('a.txt', b'hello')
+
+    def test_event_sink(self):
+        events = []
+        oss2.set_event_sink(lambda event, fields: events.append((event, fields)))
+        try:
+            self.bucket.put_object('a.txt', b'hello')
+        finally:
+            oss2.set_event_sink(None)
+
+        self.assertEqual(['send_request', 'response_headers'], [event for event, fields in events])
+        self.assertEqual('PUT', events[0][1]['method'])
+        self.assertEqual(oss2.http.USER_AGENT, events[0][1]['headers']['User-Agent'])
+        self.assertEqual('req-PUT', events[1][1]['request_id'])
+        self.assertEqual(200, events[1][1]['status'])
+
+        self.bucket.put_object('a.txt', b'hello')
+        self.assertEqual(2, len(events))
+
+
+class TestHistogram(unittest.TestCase):
+    def test_percentile(self):
+        h = instrumentation._Histogram()
+        self.assertTrue(h.percentile(50) is None)
+
+        for i in range(1, 1001):
+            h.add(i / 1000.0)
+
+        for q in (50, 99):
+            expected = q / 100.0
+            self.assertTrue(expected <= h.percentile(q) <= expected * 1.05 + 1e-9)
+
+        h.add(0)
+        h.add(1e6)
+        self.assertTrue(h.percentile(100) >= 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import shutil
+import tempfile
+import threading
+import time
+
 from mock import patch
 from unittests.common import *
 
 from oss2.models import SimplifiedBucketInfo, SimplifiedObjectInfo, Owner
-from oss2 import to_string
+from oss2 import to_string, to_bytes
 
 
 class TestIterator(OssTestCase):
@@ -283,6 +288,107 @@ class TestIterator(OssTestCase):
         self.assertEqual(req_info.req.params.get('marker', ''), '')
         self.assertEqual(req_info.req.params.get('encoding-type'), 'url')
 
+    @patch('oss2.Session.do_request')
+    def test_object_iterator_v2_pages(self, do_request):
+        server = FakeListServer(LIST_KEYS)
+        do_request.auto_spec = True
+        do_request.side_effect = server
+
+        expected = sorted(key for key in LIST_KEYS if '/' not in key) + ['a/', 'b/', 'd/']
+        expected.sort()
+
+        it = oss2.ObjectIteratorV2(bucket(), delimiter='/', max_keys=3)
+        self.assertEqual(expected[0], next(it).key)
+
+        pages = list(it.pages())
+        self.assertEqual([2, 3, 1], [len(page) for page in pages])
+        self.assertEqual(expected[1:], [entry.key for page in pages for entry in page])
+        self.assertEqual(['a/', 'a0'], [entry.key for entry in pages[0]])
+        self.assertTrue(pages[0][0].is_prefix())
+        self.assertEqual(3, server.requests)
+
+        self.assertEqual([], list(it.pages()))
+        self.assertRaises(StopIteration, next, it)
+
+    @patch('oss2.Session.do_request')
+    def test_object_iterator_v2_prefetch(self, do_request):
+        server = FakeListServer(LIST_KEYS)
+        do_request.auto_spec = True
+        do_request.side_effect = server
+
+        got = [obj.key for obj in oss2.ObjectIteratorV2(bucket(), max_keys=5, prefetch=2)]
+        self.assertEqual(sorted(LIST_KEYS), got)
+
+        # 消费方不取数据时，后台最多取回prefetch页再加上正在等待入队的一页
+        server.requests = 0
+        it = oss2.ObjectIteratorV2(bucket(), max_keys=5, prefetch=2)
+        self.assertEqual('a.txt', next(it).key)
+        self.assertTrue(server.wait_for_requests(4, 30))
+        self.assertFalse(server.wait_for_requests(5, 0.2))
+        it.close()
+
+        pages = list(oss2.ObjectIteratorV2(bucket(), max_keys=5, prefetch=1).pages())
+        self.assertEqual(sorted(LIST_KEYS), [obj.key for page in pages for obj in page])
+        self.assertEqual(5, len(pages[0]))
+
+    @patch('oss2.Session.do_request')
+    def test_object_iterator_v2_prefetch_error(self, do_request):
+        server = FakeListServer(LIST_KEYS)
+        counter = [0]
+
+        def do_request_with_error(req, timeout):
+            counter[0] += 1
+            if counter[0] == 3:
+                raise oss2.exceptions.RequestError('fake network error')
+            return server(req, timeout)
+
+        do_request.auto_spec = True
+        do_request.side_effect = do_request_with_error
+
+        it = oss2.ObjectIteratorV2(bucket(), max_keys=5, prefetch=2)
+        got = []
+        try:
+            for obj in it:
+                got.append(obj.key)
+        except oss2.exceptions.RequestError:
+            pass
+        else:
+            self.fail('RequestError expected')
+
+        # 出错前的两页正常返回，之后每次都抛出同样的错误
+        self.assertEqual(sorted(LIST_KEYS)[:10], got)
+        self.assertRaises(oss2.exceptions.RequestError, next, it)
+
+    @patch('oss2.Session.do_request')
+    def test_object_iterator_v2_fill_table(self, do_request):
+        server = FakeListServer(LIST_KEYS)
+        do_request.auto_spec = True
+        do_request.side_effect = server
+
+        # 先迭代一部分，剩下的再填入table
+        it = oss2.ObjectIteratorV2(bucket(), delimiter='/', max_keys=2)
+        first = next(it)
+        table = it.fill_table()
+
+        expected = sorted(key for key in LIST_KEYS if '/' not in key)
+        self.assertEqual([first.key] + table.prefix_list + table.keys,
+                         ['a.txt'] + ['a/', 'b/', 'd/'] + ['a0', 'c', 'z'])
+        self.assertEqual(len(expected) - 1, len(table))
+        self.assertEqual(list(table.sizes), [1, 1, 1])
+        self.assertEqual(table.etags[0], ETAG)
+        self.assertTrue(table.storage_classes[0] is table.storage_classes[2])
+
+        info = table[1]
+        self.assertTrue(isinstance(info, SimplifiedObjectInfo))
+        self.assertEqual('c', info.key)
+        self.assertEqual(1449838901, info.last_modified)
+        self.assertEqual('Normal', info.type)
+        self.assertEqual(['a0', 'c', 'z'], [obj.key for obj in table])
+
+        table = oss2.ObjectIteratorV2(bucket(), prefix='b/', max_keys=5).fill_table(table)
+        self.assertEqual(len(expected) - 1 + 22, len(table))
+        self.assertEqual(sorted(key for key in LIST_KEYS if key.startswith('b/')), table.keys[3:])
+
     @patch('oss2.Session.do_request')
     def test_object_iterator_truncated(self, do_request):
         body_list = [b'''<?xml version="1.0" encoding="UTF-8"?>
@@ -565,5 +671,143 @@ class TestIterator(OssTestCase):
 
 
 
+class FakeListServer(object):
+    def __init__(self, keys, fail_prefix=None):
+        self.keys = sorted(keys)
+        self.fail_prefix = fail_prefix
+        self.__served = threading.Condition()
+        self.requests = 0
+
+    def wait_for_requests(self, count, timeout):
+        # 等待收到count个请求，返回是否在timeout秒内等到
+        deadline = time.time() + timeout
+        with self.__served:
+            while self.requests < count:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self.__served.wait(remaining)
+            return True
+
+    def __call__(self, req, timeout):
+        prefix = req.params.get('prefix', '')
+        delimiter = req.params.get('delimiter', '')
+        marker = req.params.get('continuation-token') or req.params.get('start-after', '')
+        max_keys = int(req.params['max-keys'])
+
+        with self.__served:
+            self.requests += 1
+            self.__served.notify_all()
+
+        if prefix == self.fail_prefix:
+            raise oss2.exceptions.RequestError('fake network error')
+
+        entries = []
+        for key in self.keys:
+            if not key.startswith(prefix) or key <= marker:
+                continue
+
+            i = key.find(delimiter, len(prefix)) if delimiter else -1
+            if i >= 0:
+                common_prefix = key[:i + len(delimiter)]
+                if common_prefix <= marker or (entries and entries[-1] == (common_prefix, True)):
+                    continue
+                entries.append((common_prefix, True))
+            else:
+                entries.append((key, False))
+
+            if len(entries) > max_keys:
+                break
+
+        truncated = len(entries) > max_keys
+        entries = entries[:max_keys]
+
+        body = '<?xml version="1.0" encoding="UTF-8"?><ListBucketResult>'
+        body += '<IsTruncated>{0}</IsTruncated>'.format('true' if truncated else 'false')
+        if truncated:
+            body += '<NextContinuationToken>{0}</NextContinuationToken>'.format(entries[-1][0])
+        for name, is_prefix in entries:
+            if is_prefix:
+                body += '<CommonPrefixes><Prefix>{0}</Prefix></CommonPrefixes>'.format(name)
+            else:
+                body += ('<Contents><Key>{0}</Key><LastModified>2015-12-11T13:01:41.000Z</LastModified>'
+                         '<ETag>"{1}"</ETag><Type>Normal</Type><Size>1</Size><StorageClass>Standard</StorageClass>'
+                         '</Contents>').format(name, ETAG)
+        body += '</ListBucketResult>'
+
+        return r4get(to_bytes(body))
+
+
+LIST_KEYS = ['a.txt', 'a0', 'c', 'z'] + ['{0}/{1:03d}'.format(d, i) for d in 'abd' for i in range(17)] + \
+            ['b/sub/{0}'.format(i) for i in range(5)]
+
+
+class TestParallelObjectLister(OssTestCase):
+    @patch('oss2.Session.do_request')
+    def test_list_ordered(self, do_request):
+        do_request.side_effect = FakeListServer(LIST_KEYS)
+
+        got = [obj.key for obj in oss2.ParallelObjectLister(bucket(), max_keys=3, concurrency=3)]
+        self.assertEqual(got, sorted(LIST_KEYS))
+
+    @patch('oss2.Session.do_request')
+    def test_list_unordered(self, do_request):
+        do_request.side_effect = FakeListServer(LIST_KEYS)
+
+        got = [obj.key for obj in oss2.ParallelObjectLister(bucket(), max_keys=3, concurrency=4, ordered=False)]
+        self.assertEqual(sorted(got), sorted(LIST_KEYS))
+
+    @patch('oss2.Session.do_request')
+    def test_list_with_prefix(self, do_request):
+        do_request.side_effect = FakeListServer(LIST_KEYS)
+
+        got = [obj.key for obj in oss2.ParallelObjectLister(bucket(), prefix='b/', max_keys=4, concurrency=1)]
+        self.assertEqual(got, sorted(k for k in LIST_KEYS if k.startswith('b/')))
+
+    @patch('oss2.Session.do_request')
+    def test_list_by_pivots(self, do_request):
+        do_request.side_effect = FakeListServer(LIST_KEYS)
+
+        lister = oss2.ParallelObjectLister(bucket(), pivots=['b/005', 'a/003', 'c'], max_keys=4, concurrency=2)
+        got = [obj.key for obj in lister]
+
+        self.assertEqual(got, sorted(LIST_KEYS))
+        self.assertEqual([s['end'] for s in lister.shards], ['a/003', 'b/005', 'c', None])
+
+    @patch('oss2.Session.do_request')
+    def test_list_resume(self, do_request):
+        do_request.side_effect = FakeListServer(LIST_KEYS)
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            store = oss2.ResumableStore(tmp_dir)
+
+            lister = oss2.ParallelObjectLister(bucket(), max_keys=3, concurrency=2, store=store)
+            it = iter(lister)
+            first = [next(it).key for i in range(20)]
+            it.close()
+
+            record = store.get(lister.store_key)
+            self.assertTrue(record is not None)
+            self.assertTrue(any(s['done'] or s['start_after'] for s in record['shards']))
+
+            lister = oss2.ParallelObjectLister(bucket(), max_keys=3, concurrency=2, store=store)
+            rest = [obj.key for obj in lister]
+
+            self.assertEqual(sorted(set(first + rest)), sorted(LIST_KEYS))
+            self.assertTrue(len(rest) < len(LIST_KEYS))
+            self.assertEqual(store.get(lister.store_key), None)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    @patch('oss2.Session.do_request')
+    def test_list_error(self, do_request):
+        do_request.side_effect = FakeListServer(LIST_KEYS, fail_prefix='d/')
+
+        for ordered in [True, False]:
+            lister = oss2.ParallelObjectLister(bucket(), max_keys=3, concurrency=2, ordered=ordered)
+            self.assertRaises(oss2.exceptions.RequestError, list, lister)
+
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
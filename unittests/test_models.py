@@ -14,3 +14,36 @@ class TestModels(unittest.TestCase):
         range_data = get_obj_result._parse_range_str(content_range)
         self.assertEqual(range_data[0], 0)
         self.assertEqual(range_data[1], 128)
+
+    def test_listing_models_slots(self):
+        for obj in [SimplifiedObjectInfo('a', 1, 'etag', 'Normal', 1, 'Standard'), ObjectVersionInfo(),
+                    DeleteMarkerInfo(), PartInfo(1, 'etag')]:
+            self.assertFalse(hasattr(obj, '__dict__'))
+            self.assertRaises(AttributeError, setattr, obj, 'no_such_attr', 1)
+
+    def test_object_listing_table(self):
+        table = ObjectListingTable()
+        table.extend([SimplifiedObjectInfo('a', 1449838901, '7AE1A589ED6B161CAD94ACDB98206DA6', 'Normal', 10, 'Standard'),
+                      SimplifiedObjectInfo('b/', None, None, None, None, None),
+                      SimplifiedObjectInfo('c', 1449838902, '333D74B47CB1B0E275D2AB3CDDA02665-26', 'Multipart',
+                                           5 * 1024 ** 4, 'IA')])
+        table.append('d', 1449838903, '7ae1a589ed6b161cad94acdb98206da6', 'Normal', 0, ''.join(['Stan', 'dard']))
+
+        self.assertEqual(3, len(table))
+        self.assertEqual(['a', 'c', 'd'], table.keys)
+        self.assertEqual(['b/'], table.prefix_list)
+        self.assertEqual([10, 5 * 1024 ** 4, 0], list(table.sizes))
+        self.assertTrue(table.storage_classes[0] is table.storage_classes[2])
+        self.assertEqual(['7AE1A589ED6B161CAD94ACDB98206DA6', '333D74B47CB1B0E275D2AB3CDDA02665-26',
+                          '7ae1a589ed6b161cad94acdb98206da6'], list(table.etags))
+        self.assertEqual('7ae1a589ed6b161cad94acdb98206da6', table.etags[-1])
+        self.assertRaises(IndexError, table.etags.__getitem__, 3)
+
+        info = table[1]
+        self.assertEqual('c', info.key)
+        self.assertEqual(1449838902, info.last_modified)
+        self.assertEqual('333D74B47CB1B0E275D2AB3CDDA02665-26', info.etag)
+        self.assertEqual('Multipart', info.type)
+        self.assertEqual(5 * 1024 ** 4, info.size)
+        self.assertEqual('IA', info.storage_class)
+        self.assertEqual(['a', 'c', 'd'], [obj.key for obj in table])
@@ -247,6 +247,39 @@ x-oss-err: PD94bWwgdmVyc2lvbj0iMS4wIiBlbmNvZGluZz0iVVRGLTgiPz4NCjxFcnJvcj4NCiAgP
         self.assertEqual(result.etag, 'D80CF0E5BE2436514894D64B2BCFB2AE')
         self.assertEqual(result.last_modified, 1449880553)
 
+    @patch('oss2.Session.do_request')
+    def test_get_readinto(self, do_request):
+        content = random_bytes(1023)
+
+        request_text, response_text = make_get_object(content)
+        mock_response(do_request, response_text)
+
+        result = bucket().get_object('sjbhlsgsbecvlpbf')
+
+        buf = bytearray(1000)
+        self.assertEqual(1000, result.readinto(buf))
+        self.assertEqual(content[:1000], bytes(buf))
+        self.assertEqual(23, result.readinto(memoryview(buf)[100:200]))
+        self.assertEqual(content[1000:], bytes(buf[100:123]))
+        self.assertEqual(0, result.readinto(buf))
+
+    @patch('oss2.Session.do_request')
+    def test_get_iter_views(self, do_request):
+        content = random_bytes(1023)
+
+        request_text, response_text = make_get_object(content)
+        mock_response(do_request, response_text)
+
+        result = bucket().get_object('sjbhlsgsbecvlpbf', progress_callback=self.progress_callback)
+        views = [bytes(view) for view in result.iter_views(100)]
+        self.assertEqual(11, len(views))
+        self.assertEqual(content, b''.join(views))
+
+        mock_response(do_request, response_text)
+        result = bucket().get_object('sjbhlsgsbecvlpbf')
+        result.chunk_size = 500
+        self.assertEqual([500, 500, 23], [len(chunk) for chunk in result])
+
     @patch('oss2.Session.do_request')
     def test_get_with_query_parameter(self, do_request):
         request_text = '''GET /sjbhlsgsbecvlpbf?response-content-type=override-content-type HTTP/1.1
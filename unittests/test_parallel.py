@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+
+import array
+import re
+import threading
+import xml.etree.ElementTree as ElementTree
+
+import oss2
+
+from oss2 import to_bytes
+
+from mock import patch
+
+from unittests.common import *
+
+
+class FakeRangeServer(object):
+    def __init__(self, content, server_crc=None, fail_start=None):
+        self.content = content
+        self.fail_start = fail_start
+        self.ranges = []
+        self.if_match = []
+        self.__lock = threading.Lock()
+
+        if server_crc is None:
+            crc = oss2.utils.Crc64()
+            crc.update(content)
+            server_crc = crc.crc
+        self.server_crc = server_crc
+
+    def __call__(self, req, timeout):
+        if req.method == 'HEAD':
+            return r4head(len(self.content), in_headers={'x-oss-hash-crc64ecma': str(self.server_crc)})
+
+        if req.method == 'GET':
+            m = re.match(r'bytes=(\d+)-(\d+)', req.headers['range'])
+            start, end = int(m.group(1)), int(m.group(2)) + 1
+            if start == self.fail_start:
+                raise oss2.exceptions.RequestError('fake network error')
+
+            with self.__lock:
+                self.ranges.append(start)
+                self.if_match.append(req.headers['If-Match'])
+
+            return r4get(self.content[start:end], in_status=206,
+                         in_headers={'Content-Range': 'bytes {0}-{1}/{2}'.format(start, end - 1, len(self.content))})
+
+        raise AssertionError('unexpected request: {0} {1}'.format(req.method, req.params))
+
+
+class TestGetObjectParallel(OssTestCase):
+    @patch('oss2.Session.do_request')
+    def test_get_to_buffer(self, do_request):
+        content = random_bytes(1000 * 1024 + 1)
+        server = FakeRangeServer(content)
+        do_request.side_effect = server
+
+        consumed = []
+        result = bucket().get_object_parallel('fake-key', part_size=100 * 1024, num_threads=4,
+                                              progress_callback=lambda x, y: consumed.append(x))
+
+        self.assertEqual(bytes(result.buffer), content)
+        self.assertEqual(result.client_crc, server.server_crc)
+        self.assertEqual(result.content_length, len(content))
+        self.assertEqual(sorted(server.ranges), [i * 100 * 1024 for i in range(11)])
+        self.assertEqual(set(server.if_match), set([ETAG]))
+        self.assertEqual(max(consumed), len(content))
+
+    @patch('oss2.Session.do_request')
+    def test_get_to_user_buffer(self, do_request):
+        content = random_bytes(300 * 1024)
+        do_request.side_effect = FakeRangeServer(content)
+
+        buf = bytearray(len(content) + 10)
+        result = bucket().get_object_parallel('fake-key', buffer=buf, part_size=100 * 1024, num_threads=2)
+
+        self.assertTrue(result.buffer is buf)
+        self.assertEqual(bytes(buf[:len(content)]), content)
+
+        self.assertRaises(oss2.exceptions.ClientError, bucket().get_object_parallel, 'fake-key',
+                          buffer=bytearray(10))
+
+    @patch('oss2.Session.do_request')
+    def test_get_to_typed_buffer(self, do_request):
+        # 按字节而不是按元素计算缓冲区大小
+        content = random_bytes(300 * 1024)
+        do_request.side_effect = FakeRangeServer(content)
+
+        buf = array.array('d', bytes(len(content)))
+        self.assertEqual(len(content) // 8, len(buf))
+        result = bucket().get_object_parallel('fake-key', buffer=buf, part_size=100 * 1024 + 3, num_threads=2)
+
+        self.assertTrue(result.buffer is buf)
+        self.assertEqual(content, buf.tobytes())
+
+    @patch('oss2.Session.do_request')
+    def test_get_crc_mismatch(self, do_request):
+        do_request.side_effect = FakeRangeServer(random_bytes(300 * 1024), server_crc=1)
+
+        self.assertRaises(oss2.exceptions.InconsistentError, bucket().get_object_parallel, 'fake-key',
+                          part_size=100 * 1024)
+
+    @patch('oss2.Session.do_request')
+    def test_get_part_error(self, do_request):
+        do_request.side_effect = FakeRangeServer(random_bytes(300 * 1024), fail_start=100 * 1024)
+
+        self.assertRaises(oss2.exceptions.RequestError, bucket().get_object_parallel, 'fake-key',
+                          part_size=100 * 1024)
+
+    @patch('oss2.Session.do_request')
+    def test_get_empty_object(self, do_request):
+        do_request.side_effect = FakeRangeServer(b'')
+
+        result = bucket().get_object_parallel('fake-key')
+        self.assertEqual(bytes(result.buffer), b'')
+
+        with bucket().get_object_parallel('fake-key', stream=True) as stream:
+            self.assertEqual(stream.read(), b'')
+
+    @patch('oss2.Session.do_request')
+    def test_stream(self, do_request):
+        content = random_bytes(1000 * 1024 + 1)
+        server = FakeRangeServer(content)
+        do_request.side_effect = server
+
+        with bucket().get_object_parallel('fake-key', part_size=100 * 1024, num_threads=4, stream=True,
+                                          max_buffered_parts=4) as stream:
+            chunks = [stream.read(1000), stream.read(150 * 1024)]
+            for chunk in stream:
+                chunks.append(chunk)
+
+        self.assertEqual(b''.join(chunks), content)
+        self.assertEqual(stream.client_crc, server.server_crc)
+        self.assertEqual(len(server.ranges), 11)
+
+    @patch('oss2.Session.do_request')
+    def test_stream_crc_mismatch(self, do_request):
+        do_request.side_effect = FakeRangeServer(random_bytes(300 * 1024), server_crc=1)
+
+        stream = bucket().get_object_parallel('fake-key', part_size=100 * 1024, stream=True)
+        self.assertRaises(oss2.exceptions.InconsistentError, stream.read)
+
+    @patch('oss2.Session.do_request')
+    def test_stream_part_error(self, do_request):
+        do_request.side_effect = FakeRangeServer(random_bytes(300 * 1024), fail_start=200 * 1024)
+
+        with bucket().get_object_parallel('fake-key', part_size=100 * 1024, stream=True) as stream:
+            self.assertRaises(oss2.exceptions.RequestError, stream.read)
+
+    @patch('oss2.Session.do_request')
+    def test_stream_close_early(self, do_request):
+        content = random_bytes(1000 * 1024)
+        server = FakeRangeServer(content)
+        do_request.side_effect = server
+
+        stream = bucket().get_object_parallel('fake-key', part_size=100 * 1024, num_threads=2, stream=True,
+                                              max_buffered_parts=2)
+        self.assertEqual(stream.read(10), content[:10])
+        stream.close()
+
+        self.assertRaises(oss2.exceptions.ClientError, stream.read)
+        self.assertTrue(len(server.ranges) <= 4)
+
+
+class FakeDeleteServer(object):
+    def __init__(self, keys, versions=None, undeletable=None, fail_key=None):
+        self.keys = set(keys)
+        self.versions = versions or []
+        self.undeletable = set(undeletable or [])
+        self.fail_key = fail_key
+        self.batches = []
+        self.__lock = threading.Lock()
+
+    def __call__(self, req, timeout):
+        if req.method == 'POST' and 'delete' in req.params:
+            return self.__delete(req)
+
+        if req.method == 'GET' and req.params.get('list-type') == '2':
+            return self.__list(req)
+
+        if req.method == 'GET' and 'versions' in req.params:
+            return self.__list_versions(req)
+
+        raise AssertionError('unexpected request: {0} {1}'.format(req.method, req.params))
+
+    def __delete(self, req):
+        root = ElementTree.fromstring(req.data)
+        objects = [(node.find('Key').text, node.find('VersionId').text if node.find('VersionId') is not None else None)
+                   for node in root.findall('Object')]
+
+        with self.__lock:
+            self.batches.append(objects)
+
+        if any(key == self.fail_key for key, versionid in objects):
+            raise oss2.exceptions.RequestError('fake network error')
+
+        body = '<?xml version="1.0" encoding="UTF-8"?><DeleteResult>'
+        for key, versionid in objects:
+            if key in self.undeletable:
+                continue
+            with self.__lock:
+                self.keys.discard(key)
+            body += '<Deleted><Key>{0}</Key>'.format(key)
+            if versionid:
+                body += '<VersionId>{0}</VersionId>'.format(versionid)
+            body += '</Deleted>'
+        body += '</DeleteResult>'
+
+        return r4get(to_bytes(body))
+
+    def __list(self, req):
+        prefix = req.params.get('prefix', '')
+        marker = req.params.get('continuation-token', '')
+        max_keys = int(req.params['max-keys'])
+
+        with self.__lock:
+            keys = sorted(k for k in self.keys if k.startswith(prefix) and k > marker)
+
+        body = '<?xml version="1.0" encoding="UTF-8"?><ListBucketResult>'
+        body += '<IsTruncated>{0}</IsTruncated>'.format('true' if len(keys) > max_keys else 'false')
+        if len(keys) > max_keys:
+            body += '<NextContinuationToken>{0}</NextContinuationToken>'.format(keys[max_keys - 1])
+        for key in keys[:max_keys]:
+            body += ('<Contents><Key>{0}</Key><LastModified>2015-12-11T13:01:41.000Z</LastModified>'
+                     '<ETag>"{1}"</ETag><Type>Normal</Type><Size>1</Size><StorageClass>Standard</StorageClass>'
+                     '</Contents>').format(key, ETAG)
+        body += '</ListBucketResult>'
+
+        return r4get(to_bytes(body))
+
+    def __list_versions(self, req):
+        body = '<?xml version="1.0" encoding="UTF-8"?><ListVersionsResult><Name>{0}</Name>' \
+               '<Prefix></Prefix><KeyMarker></KeyMarker><VersionIdMarker></VersionIdMarker><MaxKeys>1000</MaxKeys>' \
+               '<Delimiter></Delimiter><IsTruncated>false</IsTruncated>'.format(BUCKET_NAME)
+        for key, versionid in self.versions:
+            body += ('<Version><Key>{0}</Key><VersionId>{1}</VersionId><IsLatest>false</IsLatest>'
+                     '<LastModified>2015-12-11T13:01:41.000Z</LastModified><ETag>"{2}"</ETag><Type>Normal</Type>'
+                     '<Size>1</Size><StorageClass>Standard</StorageClass>'
+                     '<Owner><ID>1</ID><DisplayName>1</DisplayName></Owner></Version>').format(key, versionid, ETAG)
+        body += '</ListVersionsResult>'
+
+        return r4get(to_bytes(body))
+
+
+class TestBulkDelete(OssTestCase):
+    @patch('oss2.Session.do_request')
+    def test_bulk_delete(self, do_request):
+        keys = ['key-{0:05d}'.format(i) for i in range(2500)]
+        server = FakeDeleteServer(keys)
+        do_request.side_effect = server
+
+        processed = []
+        result = bucket().bulk_delete(iter(keys), concurrency=3, progress_callback=lambda x, y: processed.append(x))
+
+        self.assertEqual(result.deleted_count, 2500)
+        self.assertEqual(result.failed, [])
+        self.assertEqual(result.batch_count, 3)
+        self.assertEqual(sorted(len(b) for b in server.batches), [500, 1000, 1000])
+        self.assertEqual(server.keys, set())
+        self.assertEqual(max(processed), 2500)
+
+    @patch('oss2.Session.do_request')
+    def test_bulk_delete_failures(self, do_request):
+        keys = ['key-{0:03d}'.format(i) for i in range(100)]
+        do_request.side_effect = FakeDeleteServer(keys, undeletable=['key-001'], fail_key='key-050')
+
+        result = bucket().bulk_delete(keys, batch_size=10)
+
+        self.assertEqual(result.deleted_count, 89)
+        self.assertEqual(len(result.failed), 11)
+        self.assertTrue(('key-001', None, None) in result.failed)
+
+        errors = [e for key, versionid, e in result.failed if key.startswith('key-05')]
+        self.assertEqual(len(errors), 10)
+        self.assertTrue(all(isinstance(e, oss2.exceptions.RequestError) for e in errors))
+
+    @patch('oss2.Session.do_request')
+    def test_bulk_delete_versions(self, do_request):
+        server = FakeDeleteServer([])
+        do_request.side_effect = server
+
+        items = [oss2.models.BatchDeleteObjectVersion('a', 'v1'), oss2.models.BatchDeleteObjectVersion('b', 'v2')]
+        result = bucket().bulk_delete(items)
+
+        self.assertEqual(result.deleted_count, 2)
+        self.assertEqual(server.batches, [[('a', 'v1'), ('b', 'v2')]])
+
+    @patch('oss2.Session.do_request')
+    def test_delete_prefix(self, do_request):
+        keys = ['a/{0:04d}'.format(i) for i in range(2100)] + ['b/1', 'b/2']
+        server = FakeDeleteServer(keys)
+        do_request.side_effect = server
+
+        result = bucket().delete_prefix('a/', concurrency=2)
+
+        self.assertEqual(result.deleted_count, 2100)
+        self.assertEqual(server.keys, set(['b/1', 'b/2']))
+
+        self.assertRaises(oss2.exceptions.ClientError, bucket().delete_prefix, '')
+
+    @patch('oss2.Session.do_request')
+    def test_delete_prefix_versions(self, do_request):
+        server = FakeDeleteServer([], versions=[('a/1', 'v1'), ('a/1', 'v2'), ('a/2', 'v3')])
+        do_request.side_effect = server
+
+        result = bucket().delete_prefix('a/', include_versions=True)
+
+        self.assertEqual(result.deleted_count, 3)
+        self.assertEqual(server.batches, [[('a/1', 'v1'), ('a/1', 'v2'), ('a/2', 'v3')]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,16 @@
 import unittest
 import oss2
 import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+from mock import patch
+
+from unittests.common import *
+from unittests.test_crypto import _KEY_PAIR
 
 
 class TestResumable(unittest.TestCase):
@@ -36,5 +46,424 @@ class TestResumable(unittest.TestCase):
         os.rmdir(path)
 
 
+class FakeCopyServer(object):
+    """按照请求类型模拟HeadObject、InitiateMultipartUpload、ListParts、UploadPartCopy及CompleteMultipartUpload。"""
+
+    def __init__(self, content, fail_part=None):
+        self.content = content
+        self.fail_part = fail_part
+        self.parts = {}
+        self.copied = []
+
+    def __call__(self, req, timeout):
+        if req.method == 'HEAD':
+            return r4head(len(self.content), in_headers={'x-oss-hash-crc64ecma': str(self.__crc(self.content)),
+                                                         'x-oss-meta-color': 'red'})
+
+        if req.method == 'POST' and 'uploads' in req.params:
+            body = '<InitiateMultipartUploadResult><UploadId>fake-upload-id</UploadId></InitiateMultipartUploadResult>'
+            return MockResponse(200, {'Content-Length': str(len(body)), 'x-oss-request-id': REQUEST_ID}, body)
+
+        if req.method == 'GET' and 'uploadId' in req.params:
+            body = '<ListPartsResult><IsTruncated>false</IsTruncated><NextPartNumberMarker>0</NextPartNumberMarker>'
+            for number, (size, etag) in sorted(self.parts.items()):
+                body += '<Part><PartNumber>{0}</PartNumber><LastModified>2015-12-12T00:36:29.000Z</LastModified>' \
+                        '<ETag>"{1}"</ETag><Size>{2}</Size></Part>'.format(number, etag, size)
+            body += '</ListPartsResult>'
+            return MockResponse(200, {'Content-Length': str(len(body)), 'x-oss-request-id': REQUEST_ID}, body)
+
+        if req.method == 'PUT' and 'partNumber' in req.params:
+            part_number = int(req.params['partNumber'])
+            if part_number == self.fail_part:
+                raise oss2.exceptions.RequestError('fake network error')
+
+            m = re.match(r'bytes=(\d+)-(\d+)', req.headers[oss2.headers.OSS_COPY_OBJECT_SOURCE_RANGE])
+            data = self.content[int(m.group(1)):int(m.group(2)) + 1]
+            self.parts[part_number] = (len(data), ETAG)
+            self.copied.append(part_number)
+            return r4put(in_headers={'ETag': RAW_ETAG, 'x-oss-hash-crc64ecma': str(self.__crc(data))})
+
+        if req.method == 'POST' and 'uploadId' in req.params:
+            return r4put(in_headers={'ETag': RAW_ETAG, 'x-oss-hash-crc64ecma': str(self.__crc(self.content))})
+
+        raise AssertionError('unexpected request: {0} {1}'.format(req.method, req.params))
+
+    @staticmethod
+    def __crc(data):
+        crc = oss2.utils.Crc64()
+        crc.update(data)
+        return crc.crc
+
+
+class TestResumableCopy(unittest.TestCase):
+    def setUp(self):
+        self.store_root = tempfile.mkdtemp()
+        self.store = oss2.ResumableStore(self.store_root)
+
+    def tearDown(self):
+        shutil.rmtree(self.store_root)
+
+    @patch('oss2.Session.do_request')
+    def test_resumable_copy(self, do_request):
+        content = random_bytes(1000 * 1024)
+        server = FakeCopyServer(content)
+        do_request.side_effect = server
+
+        progress = []
+        result = oss2.resumable_copy(bucket(), 'src-key', bucket(), 'dst-key',
+                                     store=self.store, multipart_threshold=100 * 1024, part_size=100 * 1024,
+                                     num_threads=3, progress_callback=lambda x, y: progress.append((x, y)))
+
+        self.assertEqual(result.etag, ETAG)
+        self.assertEqual(sorted(server.copied), list(range(1, 11)))
+        self.assertEqual(progress[-1], (len(content), len(content)))
+        self.assertEqual(os.listdir(self.store.dir), [])
+
+    @patch('oss2.Session.do_request')
+    def test_resumable_copy_resume(self, do_request):
+        content = random_bytes(1000 * 1024)
+        server = FakeCopyServer(content, fail_part=5)
+        do_request.side_effect = server
+
+        self.assertRaises(oss2.exceptions.RequestError, oss2.resumable_copy, bucket(), 'src-key', bucket(),
+                          'dst-key', store=self.store, multipart_threshold=100 * 1024, part_size=100 * 1024)
+        self.assertEqual(server.copied, [1, 2, 3, 4])
+
+        server.fail_part = None
+        server.copied = []
+        oss2.resumable_copy(bucket(), 'src-key', bucket(), 'dst-key',
+                            store=self.store, multipart_threshold=100 * 1024, part_size=100 * 1024)
+        self.assertEqual(server.copied, list(range(5, 11)))
+
+    @patch('oss2.Session.do_request')
+    def test_resumable_copy_crc_mismatch(self, do_request):
+        content = random_bytes(300 * 1024)
+        server = FakeCopyServer(content)
+        do_request.side_effect = server
+
+        copier = oss2.resumable._ResumableCopier(bucket(), 'src-key', bucket(), 'dst-key',
+                                                 oss2.resumable._ObjectInfo.make(bucket().head_object('src-key')),
+                                                 store=self.store, part_size=100 * 1024)
+        self.assertRaises(oss2.exceptions.InconsistentError, copier.copy, 12345)
+
+    @patch('oss2.Session.do_request')
+    def test_small_object_uses_copy_object(self, do_request):
+        content = random_bytes(1024)
+        server = FakeCopyServer(content)
+        copies = []
+
+        def do(req, timeout):
+            if req.method == 'PUT':
+                copies.append(req.headers[oss2.headers.OSS_COPY_OBJECT_SOURCE])
+                return r4copy()
+            return server(req, timeout)
+
+        do_request.side_effect = do
+
+        oss2.resumable_copy(bucket(), 'src-key', bucket(), 'dst-key', store=self.store)
+        self.assertEqual(copies, ['/' + BUCKET_NAME + '/src-key'])
+
+
+class FakeUploadServer(object):
+    """模拟PutObject、InitiateMultipartUpload、UploadPart、CompleteMultipartUpload及AbortMultipartUpload。"""
+
+    def __init__(self, fail_part=None):
+        self.fail_part = fail_part
+        self.parts = {}
+        self.objects = {}
+        self.aborted = False
+        self.init_headers = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, req, timeout):
+        if req.method == 'POST' and 'uploads' in req.params:
+            self.init_headers = req.headers
+            body = '<InitiateMultipartUploadResult><UploadId>fake-upload-id</UploadId></InitiateMultipartUploadResult>'
+            return MockResponse(200, {'Content-Length': str(len(body)), 'x-oss-request-id': REQUEST_ID}, body)
+
+        if req.method == 'PUT':
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                data = read_file(req.data)
+                time.sleep(0.01)
+            finally:
+                with self.lock:
+                    self.in_flight -= 1
+
+            if 'partNumber' in req.params:
+                part_number = int(req.params['partNumber'])
+                if part_number == self.fail_part:
+                    raise oss2.exceptions.RequestError('fake network error')
+                self.parts[part_number] = data
+            else:
+                self.objects[req.url] = data
+            return r4put(in_headers={'ETag': RAW_ETAG, 'x-oss-hash-crc64ecma': str(self.crc(data))})
+
+        if req.method == 'POST' and 'uploadId' in req.params:
+            content = b''.join(self.parts[n] for n in sorted(self.parts))
+            return r4put(in_headers={'ETag': RAW_ETAG, 'x-oss-hash-crc64ecma': str(self.crc(content))})
+
+        if req.method == 'DELETE' and 'uploadId' in req.params:
+            self.aborted = True
+            return r4delete()
+
+        if req.method == 'GET' and 'uploadId' in req.params:
+            body = '<ListPartsResult><IsTruncated>false</IsTruncated><NextPartNumberMarker>0</NextPartNumberMarker>'
+            for number, data in sorted(self.parts.items()):
+                body += '<Part><PartNumber>{0}</PartNumber><LastModified>2015-12-12T00:36:29.000Z</LastModified>' \
+                        '<ETag>"{1}"</ETag><Size>{2}</Size></Part>'.format(number, ETAG, len(data))
+            body += '</ListPartsResult>'
+            return MockResponse(200, {'Content-Length': str(len(body)), 'x-oss-request-id': REQUEST_ID}, body)
+
+        raise AssertionError('unexpected request: {0} {1}'.format(req.method, req.params))
+
+    @staticmethod
+    def crc(data):
+        crc = oss2.utils.Crc64()
+        crc.update(data)
+        return crc.crc
+
+
+def _chunks(content, size):
+    for i in range(0, len(content), size):
+        yield content[i:i + size]
+
+
+class TestStreamingMultipartUploader(unittest.TestCase):
+    @patch('oss2.Session.do_request')
+    def test_upload_iterator(self, do_request):
+        content = random_bytes(1050 * 1024)
+        server = FakeUploadServer()
+        do_request.side_effect = server
+
+        uploader = oss2.StreamingMultipartUploader(bucket(), 'fake-key', part_size=100 * 1024, num_threads=3)
+        result = uploader.upload(_chunks(content, 7777))
+
+        self.assertEqual(result.etag, ETAG)
+        self.assertEqual(len(server.parts), 11)
+        self.assertEqual(b''.join(server.parts[n] for n in sorted(server.parts)), content)
+        self.assertEqual(uploader.crc, server.crc(content))
+        self.assertTrue(server.max_in_flight <= 3)
+
+    @patch('oss2.Session.do_request')
+    def test_upload_file_like(self, do_request):
+        content = random_bytes(200 * 1024)
+        server = FakeUploadServer()
+        do_request.side_effect = server
+
+        progress = []
+        uploader = oss2.StreamingMultipartUploader(bucket(), 'fake-key', part_size=100 * 1024, num_threads=2,
+                                                   progress_callback=lambda x, y: progress.append(x))
+        uploader.upload(NonSeekableFile(content, 1000))
+
+        self.assertEqual(sorted(server.parts), [1, 2])
+        self.assertEqual(b''.join(server.parts[n] for n in sorted(server.parts)), content)
+        self.assertEqual(max(progress), len(content))
+
+    @patch('oss2.Session.do_request')
+    def test_small_stream_put_object(self, do_request):
+        content = random_bytes(1024)
+        server = FakeUploadServer()
+        do_request.side_effect = server
+
+        oss2.StreamingMultipartUploader(bucket(), 'fake-key', part_size=100 * 1024).upload(iter([content]))
+
+        self.assertEqual(server.parts, {})
+        self.assertEqual(list(server.objects.values()), [content])
+
+    @patch('oss2.Session.do_request')
+    def test_abort_on_error(self, do_request):
+        content = random_bytes(500 * 1024)
+        server = FakeUploadServer(fail_part=3)
+        do_request.side_effect = server
+
+        uploader = oss2.StreamingMultipartUploader(bucket(), 'fake-key', part_size=100 * 1024, num_threads=2)
+        self.assertRaises(oss2.exceptions.RequestError, uploader.upload, _chunks(content, 4096))
+        self.assertTrue(server.aborted)
+
+
+class TestResumableUpload(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.store = oss2.ResumableStore(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    @patch('oss2.Session.do_request')
+    def test_upload_parts_share_file(self, do_request):
+        content = random_bytes(1000 * 1024 + 1)
+        filename = os.path.join(self.tmp_dir, 'upload.bin')
+        with open(filename, 'wb') as f:
+            f.write(content)
+
+        server = FakeUploadServer()
+        do_request.side_effect = server
+
+        oss2.resumable_upload(bucket(), 'fake-key', filename, store=self.store, multipart_threshold=100 * 1024,
+                              part_size=100 * 1024, num_threads=4)
+
+        self.assertEqual(len(server.parts), 11)
+        self.assertEqual(b''.join(server.parts[n] for n in sorted(server.parts)), content)
+
+    @patch('oss2.Session.do_request')
+    def test_upload_resume(self, do_request):
+        content = random_bytes(500 * 1024)
+        filename = os.path.join(self.tmp_dir, 'upload.bin')
+        with open(filename, 'wb') as f:
+            f.write(content)
+
+        server = FakeUploadServer(fail_part=3)
+        do_request.side_effect = server
+
+        self.assertRaises(oss2.exceptions.RequestError, oss2.resumable_upload, bucket(), 'fake-key', filename,
+                          store=self.store, multipart_threshold=100 * 1024, part_size=100 * 1024)
+        self.assertEqual(sorted(server.parts), [1, 2])
+
+        server.fail_part = None
+        oss2.resumable_upload(bucket(), 'fake-key', filename, store=self.store, multipart_threshold=100 * 1024,
+                              part_size=100 * 1024)
+        self.assertEqual(b''.join(server.parts[n] for n in sorted(server.parts)), content)
+
+
+class FakeDownloadServer(object):
+    def __init__(self, content, fail_start=None, headers=None):
+        self.content = content
+        self.fail_start = fail_start
+        self.headers = headers or {}
+        self.ranges = []
+
+    def __call__(self, req, timeout):
+        crc = oss2.utils.Crc64()
+        crc.update(self.content)
+
+        if req.method == 'HEAD':
+            headers = dict(self.headers)
+            headers['x-oss-hash-crc64ecma'] = str(crc.crc)
+            return r4head(len(self.content), in_headers=headers)
+
+        if req.method == 'GET':
+            m = re.match(r'bytes=(\d+)-(\d+)', req.headers['range'])
+            start, end = int(m.group(1)), int(m.group(2)) + 1
+            if start == self.fail_start:
+                raise oss2.exceptions.RequestError('fake network error')
+            self.ranges.append(start)
+            headers = dict(self.headers)
+            headers['Content-Range'] = 'bytes {0}-{1}/{2}'.format(start, end - 1, len(self.content))
+            return r4get(self.content[start:end], in_status=206, in_headers=headers)
+
+        raise AssertionError('unexpected request: {0} {1}'.format(req.method, req.params))
+
+
+class TestResumableDownload(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.store = oss2.ResumableDownloadStore(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    @patch('oss2.Session.do_request')
+    def test_download(self, do_request):
+        content = random_bytes(1000 * 1024 + 1)
+        server = FakeDownloadServer(content)
+        do_request.side_effect = server
+
+        filename = os.path.join(self.tmp_dir, 'download.bin')
+        oss2.resumable_download(bucket(), 'fake-key', filename, store=self.store, multiget_threshold=100 * 1024,
+                                part_size=100 * 1024, num_threads=4)
+
+        with open(filename, 'rb') as f:
+            self.assertEqual(f.read(), content)
+        self.assertEqual(len(server.ranges), 11)
+
+    @patch('oss2.Session.do_request')
+    def test_download_resume(self, do_request):
+        content = random_bytes(500 * 1024)
+        server = FakeDownloadServer(content, fail_start=300 * 1024)
+        do_request.side_effect = server
+
+        filename = os.path.join(self.tmp_dir, 'download.bin')
+        self.assertRaises(oss2.exceptions.RequestError, oss2.resumable_download, bucket(), 'fake-key', filename,
+                          store=self.store, multiget_threshold=100 * 1024, part_size=100 * 1024, num_threads=1)
+        self.assertFalse(os.path.exists(filename))
+
+        server.fail_start = None
+        server.ranges = []
+        oss2.resumable_download(bucket(), 'fake-key', filename, store=self.store, multiget_threshold=100 * 1024,
+                                part_size=100 * 1024, num_threads=1)
+
+        with open(filename, 'rb') as f:
+            self.assertEqual(f.read(), content)
+        self.assertEqual(server.ranges, [300 * 1024, 400 * 1024])
+
+
+class TestCryptoResumable(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.provider = oss2.RsaProvider(_KEY_PAIR)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def upload(self, server, filename):
+        with patch('oss2.Session.do_request', side_effect=server):
+            oss2.resumable_upload(bucket(self.provider), 'fake-key', filename, store=oss2.ResumableStore(self.tmp_dir),
+                                  multipart_threshold=100 * 1024, part_size=100001, num_threads=4)
+
+    def download(self, server, filename):
+        with patch('oss2.Session.do_request', side_effect=server):
+            oss2.resumable_download(bucket(self.provider), 'fake-key', filename,
+                                    store=oss2.ResumableDownloadStore(self.tmp_dir),
+                                    multiget_threshold=100 * 1024, part_size=100001, num_threads=4)
+
+    def test_upload_and_download(self):
+        content = random_bytes(1000 * 1024 + 1)
+        filename = os.path.join(self.tmp_dir, 'upload.bin')
+        with open(filename, 'wb') as f:
+            f.write(content)
+
+        # 100001不足最小分片大小，翻倍后再向上对齐到加密块，每个分片独立加密
+        upload_server = FakeUploadServer(fail_part=3)
+        self.assertRaises(oss2.exceptions.RequestError, self.upload, upload_server, filename)
+        headers = upload_server.init_headers
+
+        # 续传沿用断点信息中的数据密钥
+        upload_server.fail_part = None
+        self.upload(upload_server, filename)
+        self.assertEqual(str(200016), headers[oss2.headers.OSS_CLIENT_SIDE_ENCRYPTION_PART_SIZE])
+        self.assertTrue(all(len(upload_server.parts[n]) == 200016 for n in range(1, len(upload_server.parts))))
+
+        encrypted = b''.join(upload_server.parts[n] for n in sorted(upload_server.parts))
+        self.assertEqual(len(content), len(encrypted))
+        self.assertNotEqual(content, encrypted)
+
+        meta = dict((k, v) for k, v in headers.items() if k.startswith('x-oss-meta-client-side-encryption'))
+        download_server = FakeDownloadServer(encrypted, headers=meta)
+        filename = os.path.join(self.tmp_dir, 'download.bin')
+        self.download(download_server, filename)
+
+        with open(filename, 'rb') as f:
+            self.assertEqual(f.read(), content)
+        self.assertEqual(sorted(download_server.ranges), list(range(0, len(content), 200016)))
+
+
+class NonSeekableFile(object):
+    def __init__(self, content, max_read):
+        self.content = content
+        self.max_read = max_read
+        self.offset = 0
+
+    def read(self, amt=None):
+        amt = min(amt or self.max_read, self.max_read)
+        data = self.content[self.offset:self.offset + amt]
+        self.offset += len(data)
+        return data
+
+
 if __name__ == '__main__':
     unittest.main()
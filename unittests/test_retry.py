@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+import io
+import pickle
+
+import requests
+import oss2
+
+from mock import patch
+
+from unittests.common import *
+
+
+def retry_bucket(**kwargs):
+    return oss2.Bucket(oss2.Auth('fake-access-key-id', 'fake-access-key-secret'),
+                       'http://oss-cn-hangzhou.aliyuncs.com', BUCKET_NAME,
+                       retry_policy=oss2.RetryPolicy(**kwargs))
+
+
+def r4error(status=503, code='ServiceUnavailable', in_headers=None):
+    body = '''<?xml version="1.0" encoding="UTF-8"?>
+    <Error>
+      <Code>{0}</Code>
+      <Message>Please reduce your request rate.</Message>
+      <RequestId>{1}</RequestId>
+    </Error>'''.format(code, REQUEST_ID)
+
+    headers = {'Content-Length': str(len(body)), 'x-oss-request-id': REQUEST_ID}
+    merge_headers(headers, in_headers)
+    return MockResponse(status, headers, body)
+
+
+class ScriptedSession(object):
+    def __init__(self, results):
+        self.results = list(results)
+        self.bodies = []
+
+    def __call__(self, req, timeout):
+        if req.data is None or isinstance(req.data, bytes):
+            self.bodies.append(req.data)
+        elif hasattr(req.data, 'read'):
+            self.bodies.append(read_file(req.data))
+        else:
+            self.bodies.append(b''.join(req.data))
+
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestRetry(OssTestCase):
+    @patch('time.sleep')
+    @patch('oss2.Session.do_request')
+    def test_retry_server_error(self, do_request, sleep):
+        do_request.side_effect = ScriptedSession([r4error(), r4error(500, 'InternalError'), r4get(b'hello')])
+
+        result = retry_bucket().get_object('fake-key')
+
+        self.assertEqual(result.read(), b'hello')
+        self.assertEqual(do_request.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    @patch('time.sleep')
+    @patch('oss2.Session.do_request')
+    def test_retry_request_error(self, do_request, sleep):
+        do_request.side_effect = ScriptedSession([oss2.exceptions.RequestError(requests.exceptions.ConnectionError()),
+                                                  r4put(in_headers={'ETag': RAW_ETAG})])
+
+        result = retry_bucket().put_object('fake-key', b'123')
+        self.assertEqual(result.etag, ETAG)
+        self.assertEqual(do_request.call_count, 2)
+
+    @patch('time.sleep')
+    @patch('oss2.Session.do_request')
+    def test_max_retries(self, do_request, sleep):
+        do_request.side_effect = ScriptedSession([r4error()] * 3)
+
+        self.assertRaises(oss2.exceptions.ServerError, retry_bucket(max_retries=2).get_object, 'fake-key')
+        self.assertEqual(do_request.call_count, 3)
+
+    @patch('time.sleep')
+    @patch('oss2.Session.do_request')
+    def test_no_retry_client_error(self, do_request, sleep):
+        do_request.side_effect = ScriptedSession([r4error(404, 'NoSuchKey')])
+
+        self.assertRaises(oss2.exceptions.NoSuchKey, retry_bucket().get_object, 'fake-key')
+        self.assertEqual(do_request.call_count, 1)
+        self.assertEqual(sleep.call_count, 0)
+
+    @patch('time.sleep')
+    @patch('oss2.Session.do_request')
+    def test_no_retry_without_policy(self, do_request, sleep):
+        do_request.side_effect = ScriptedSession([r4error()])
+
+        self.assertRaises(oss2.exceptions.ServerError, bucket().get_object, 'fake-key')
+        self.assertEqual(do_request.call_count, 1)
+
+    @patch('time.sleep')
+    @patch('oss2.Session.do_request')
+    def test_no_retry_non_idempotent(self, do_request, sleep):
+        do_request.side_effect = ScriptedSession([r4error(), r4put()])
+
+        self.assertRaises(oss2.exceptions.ServerError, retry_bucket().append_object, 'fake-key', 0, b'123')
+        self.assertEqual(do_request.call_count, 1)
+
+    @patch('time.sleep')
+    @patch('oss2.Session.do_request')
+    def test_retry_after(self, do_request, sleep):
+        do_request.side_effect = ScriptedSession([r4error(in_headers={'Retry-After': '3'}), r4get(b'hello')])
+
+        retry_bucket(base_delay=0.01, max_delay=10).get_object('fake-key')
+        self.assertEqual(sleep.call_args[0][0], 3.0)
+
+    @patch('time.sleep')
+    @patch('oss2.Session.do_request')
+    def test_rewind_file_body(self, do_request, sleep):
+        content = random_bytes(1024)
+        scripted = ScriptedSession([r4error(), r4put(in_headers={'ETag': RAW_ETAG})])
+        do_request.side_effect = scripted
+
+        bucket = retry_bucket()
+        bucket.enable_crc = False
+        fileobj = io.BytesIO(b'xx' + content)
+        fileobj.read(2)
+
+        bucket.put_object('fake-key', fileobj)
+        self.assertEqual(scripted.bodies, [content, content])
+
+    @patch('time.sleep')
+    @patch('oss2.Session.do_request')
+    def test_rewind_resets_crc(self, do_request, sleep):
+        content = random_bytes(1024)
+        crc = oss2.utils.Crc64()
+        crc.update(content)
+
+        scripted = ScriptedSession([r4error(), r4put(in_headers={'ETag': RAW_ETAG,
+                                                                 'x-oss-hash-crc64ecma': str(crc.crc)})])
+        do_request.side_effect = scripted
+
+        retry_bucket().put_object('fake-key', io.BytesIO(content))
+        self.assertEqual(scripted.bodies, [content, content])
+
+    @patch('time.sleep')
+    @patch('oss2.Session.do_request')
+    def test_no_retry_iterable_body(self, do_request, sleep):
+        do_request.side_effect = ScriptedSession([r4error(), r4put()])
+
+        self.assertRaises(oss2.exceptions.ServerError, retry_bucket().put_object, 'fake-key', iter([b'1', b'2']))
+        self.assertEqual(do_request.call_count, 1)
+
+    @patch('time.sleep')
+    @patch('oss2.Session.do_request')
+    def test_retry_budget(self, do_request, sleep):
+        do_request.side_effect = ScriptedSession([r4error(), r4error(), r4error()])
+
+        budget = oss2.RetryBudget(capacity=10, retry_cost=5)
+        bucket = retry_bucket(budget=budget)
+
+        self.assertRaises(oss2.exceptions.ServerError, bucket.get_object, 'fake-key')
+        self.assertEqual(do_request.call_count, 3)
+        self.assertEqual(budget.available, 0)
+
+    def test_retry_budget_refund(self):
+        budget = oss2.RetryBudget(capacity=10, retry_cost=5, success_refund=1)
+
+        self.assertTrue(budget.acquire())
+        self.assertTrue(budget.acquire())
+        self.assertFalse(budget.acquire())
+
+        budget.release()
+        self.assertEqual(budget.available, 1)
+
+        for i in range(20):
+            budget.release()
+        self.assertEqual(budget.available, 10)
+
+    def test_pickle_bucket(self):
+        # Bucket需要能传给multiprocessing的子进程
+        b = bucket()
+        b.session.retry_budget.acquire()
+
+        b = pickle.loads(pickle.dumps(b))
+        self.assertEqual(495, b.session.retry_budget.available)
+        self.assertTrue(b.session.retry_budget.acquire())
+        b.session.retry_budget.release()
+        b.session.ensure_pool_size(20)
+        self.assertEqual(20, b.session.pool_size)
+
+    def test_compute_delay(self):
+        policy = oss2.RetryPolicy(base_delay=0.1, max_delay=2.0)
+        e = oss2.exceptions.RequestError(requests.exceptions.ConnectionError())
+
+        delay = None
+        for i in range(100):
+            delay = policy.compute_delay(e, delay)
+            self.assertTrue(0.1 <= delay <= 2.0)
+
+    def test_is_idempotent(self):
+        policy = oss2.RetryPolicy()
+
+        self.assertTrue(policy.is_idempotent(oss2.http.Request('GET', 'http://fake')))
+        self.assertTrue(policy.is_idempotent(oss2.http.Request('PUT', 'http://fake')))
+        self.assertTrue(policy.is_idempotent(oss2.http.Request('POST', 'http://fake', params={'delete': ''})))
+        self.assertFalse(policy.is_idempotent(oss2.http.Request('POST', 'http://fake', params={'append': ''})))
+        self.assertFalse(policy.is_idempotent(oss2.http.Request('POST', 'http://fake', params={'uploadId': '1'})))
+
+
+if __name__ == '__main__':
+    unittest.main()
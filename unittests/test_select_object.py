@@ -277,6 +277,24 @@ class TestSelectObject(OssTestCase):
         
         self.assertEqual(content, resp_content)
 
+    @patch('oss2.Session.do_request')
+    def test_select_csv_readinto(self, do_request):
+        sql = "select * from ossobject limit 10"
+        resp_content = b'a,b,c,d,e,f,,n,g,l,o,p'
+        req, resp = make_select_object(sql, resp_content)
+
+        req_info = mock_response(do_request, resp)
+
+        result = bucket().select_object('select-test.txt', sql, None)
+
+        buf = bytearray(5)
+        self.assertEqual(5, result.readinto(buf))
+        self.assertEqual(resp_content[:5], bytes(buf))
+
+        # readinto没有读完的部分由下一次迭代返回
+        self.assertEqual(resp_content[5:], next(iter(result)))
+        self.assertEqual(0, result.readinto(buf))
+
     @patch('oss2.Session.do_request')
     def test_select_csv_read(self, do_request):
         helper = SelectCaseHelper()
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import io
+import os
 import unittest
 import oss2
 from oss2.utils import *
@@ -45,6 +47,213 @@ class TestUtils(unittest.TestCase):
         oss2.defaults.part_size = 1024*1024 - 1
         self.assertEqual(cipher.determine_part_size(1024 * 1024 * 1000), 1024 * 1024)
 
+    def test_file_part(self):
+        import tempfile
+        import threading
+
+        content = oss2.to_bytes(''.join(str(i % 10) for i in range(100000)))
+        fd, filename = tempfile.mkstemp()
+        os.write(fd, content)
+        os.close(fd)
+
+        try:
+            with oss2.utils._SharedFile(filename) as f:
+                part = oss2.utils._FilePart(f, 1000, 5000)
+                self.assertEqual(part.len, 5000)
+                self.assertEqual(part.read(10), content[1000:1010])
+                self.assertEqual(part.tell(), 10)
+                self.assertEqual(part.len, 4990)
+                self.assertEqual(part.read(), content[1010:6000])
+                self.assertEqual(part.read(), b'')
+
+                part.seek(0)
+                self.assertEqual(part.read(100000), content[1000:6000])
+                self.assertEqual(part.seek(0, os.SEEK_END), 5000)
+
+                results = {}
+
+                def read_part(i):
+                    p = oss2.utils._FilePart(f, i * 10000, 10000)
+                    results[i] = b''.join(iter(lambda: p.read(777), b''))
+
+                threads = [threading.Thread(target=read_part, args=(i,)) for i in range(10)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+
+                self.assertEqual(b''.join(results[i] for i in range(10)), content)
+        finally:
+            os.remove(filename)
+
+    def test_shared_file_pwrite(self):
+        import tempfile
+        import threading
+
+        fd, filename = tempfile.mkstemp()
+        os.close(fd)
+
+        content = oss2.to_bytes(''.join(str(i % 10) for i in range(100000)))
+        try:
+            with oss2.utils._SharedFile(filename, writable=True) as f:
+                f.preallocate(len(content))
+                self.assertEqual(os.path.getsize(filename), len(content))
+
+                def write_part(i):
+                    buf = bytearray(content[i * 10000:(i + 1) * 10000])
+                    oss2.utils._copy_to_shared_file(io.BytesIO(bytes(buf)), f, i * 10000, 10000, bytearray(3333))
+
+                threads = [threading.Thread(target=write_part, args=(i,)) for i in range(10)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+
+                self.assertRaises(InconsistentError, oss2.utils._copy_to_shared_file,
+                                  io.BytesIO(b'123'), f, 0, 4, bytearray(10))
+
+            with open(filename, 'rb') as f:
+                self.assertEqual(f.read(), b'123' + content[3:])
+        finally:
+            os.remove(filename)
+
+
+    def test_crc64_combine(self):
+        content = os.urandom(100000)
+
+        for split in [0, 1, 7, 8, 4096, 65536, 99999, 100000]:
+            crc1 = Crc64()
+            crc1.update(content[:split])
+            crc2 = Crc64()
+            crc2.update(content[split:])
+            whole = Crc64()
+            whole.update(content)
+
+            self.assertEqual(whole.combine(crc1.crc, crc2.crc, len(content) - split), whole.crc)
+
+    def test_calc_obj_crc_from_parts(self):
+        part = os.urandom(1000)
+        crc = Crc64()
+        crc.update(part)
+
+        parts = [oss2.models.PartInfo(i + 1, 'etag', size=len(part), part_crc=crc.crc) for i in range(300)]
+
+        whole = Crc64()
+        whole.update(part * 300)
+        self.assertEqual(calc_obj_crc_from_parts(parts), whole.crc)
+
+        parts.append(oss2.models.PartInfo(301, 'etag', size=0, part_crc=0))
+        self.assertEqual(calc_obj_crc_from_parts(parts), None)
+
+    def test_crc64_slicing8(self):
+        crcfun = oss2.utils._make_crc64_slicing8(Crc64._get_template().table, Crc64._XOROUT)
+
+        for size in [0, 1, 7, 8, 9, 100, 65536 + 13, 200001]:
+            content = os.urandom(size)
+            crc = Crc64(12345)
+            crc.update(content)
+            self.assertEqual(crcfun(content, 12345), crc.crc)
+
+
+
+def _crc(data):
+    crc = Crc64()
+    crc.update(data)
+    return crc.crc
+
+
+def _ctr_cipher(key, iv, offset=0):
+    cipher = AESCTRCipher()
+    cipher.initialize(key, iv, offset)
+    return cipher
+
+
+def _read_all(adapter):
+    chunks = []
+    while True:
+        chunk = adapter.read(8192)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+class _Body(object):
+    # 只支持read、长度未知的响应体
+    def __init__(self, content):
+        self.file = io.BytesIO(content)
+
+    def read(self, amt=None):
+        return self.file.read(amt)
+
+
+class TestStreamAdapter(unittest.TestCase):
+    def setUp(self):
+        self.content = os.urandom(3 * 1024 * 1024 + 7)
+        self.key = random_key(32)
+        self.iv = random_iv()
+        self.encrypted = _ctr_cipher(self.key, self.iv).encrypt(self.content)
+
+    def test_merge(self):
+        progress = []
+        adapter = make_progress_adapter(self.content, lambda consumed, total: progress.append((consumed, total)))
+        self.assertTrue(make_crc_adapter(adapter) is adapter)
+        self.assertEqual(len(self.content), adapter.len)
+
+        self.assertEqual(self.content, _read_all(adapter))
+        self.assertEqual(_crc(self.content), adapter.crc)
+        self.assertEqual((len(self.content), len(self.content)), progress[-1])
+
+        # 已经开始读取的适配器不再合并，而是包一层
+        self.assertFalse(make_crc_adapter(adapter) is adapter)
+
+    def test_unsized(self):
+        adapter = make_crc_adapter(iter([self.content[:100], self.content[100:]]))
+        self.assertFalse(hasattr(adapter, 'len'))
+        self.assertEqual(self.content, b''.join(adapter))
+        self.assertEqual(_crc(self.content), adapter.crc)
+
+    def test_readinto(self):
+        for size in (1000, 2 * 1024 * 1024):
+            adapter = make_crc_adapter(_Body(self.encrypted))
+            adapter = make_ctr_cipher_adapter(adapter, _ctr_cipher(self.key, self.iv))
+
+            buf = bytearray(size)
+            chunks = []
+            while True:
+                n = adapter.readinto(buf)
+                if not n:
+                    break
+                chunks.append(bytes(buf[:n]))
+
+            self.assertEqual(self.content, b''.join(chunks))
+            self.assertEqual(_crc(self.encrypted), adapter.crc)
+
+    def test_crc_of_transferred_data(self):
+        # 上传：先加密再计算CRC
+        adapter = make_ctr_cipher_adapter(self.content, _ctr_cipher(self.key, self.iv))
+        adapter = make_progress_adapter(adapter, None)
+        adapter = make_crc_adapter(adapter)
+        self.assertEqual(self.encrypted, _read_all(adapter))
+        self.assertEqual(_crc(self.encrypted), adapter.crc)
+
+        # 下载：先计算CRC再解密；从第37个字节开始的范围下载需要从第32个字节开始解密，丢弃前5个字节
+        adapter = make_progress_adapter(_Body(self.encrypted[32:]), None, len(self.encrypted) - 32)
+        adapter = make_crc_adapter(adapter, discard=5)
+        adapter = make_ctr_cipher_adapter(adapter, _ctr_cipher(self.key, self.iv, 2), discard=5)
+        self.assertEqual(self.content[37:], _read_all(adapter))
+        self.assertEqual(_crc(self.encrypted[37:]), adapter.crc)
+
+    def test_rewind_encrypted(self):
+        adapter = make_crc_adapter(make_ctr_cipher_adapter(io.BytesIO(self.content), _ctr_cipher(self.key, self.iv)))
+        rewind = oss2.utils._make_rewinder(adapter)
+        self.assertTrue(rewind is not None)
+
+        adapter.read(12345)
+        rewind()
+        self.assertEqual(self.encrypted, _read_all(adapter))
+        self.assertEqual(_crc(self.encrypted), adapter.crc)
+
 
 if __name__ == '__main__':
     unittest.main()
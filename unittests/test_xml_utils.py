@@ -3,9 +3,12 @@
 import unittest
 import xml.etree.ElementTree as ElementTree
 import oss2
-from oss2.models import ReplicationRule
+from oss2.models import ReplicationRule, ListObjectsResult, ListObjectsV2Result, ListObjectVersionsResult
 from oss2.xml_utils import _find_tag, _find_bool
 from oss2.xml_utils import (parse_get_bucket_info,
+                            parse_list_objects,
+                            parse_list_objects_v2,
+                            parse_list_object_versions,
                             parse_get_bucket_replication_result,
                             parse_get_bucket_replication_location_result,
                             parse_get_bucket_replication_progress_result)
@@ -298,6 +301,150 @@ class TestXmlUtils(unittest.TestCase):
         self.assertEqual('Enabled', rule.sse_kms_encrypted_objects_status)
 
 
+    def test_parse_list_objects_stream(self):
+        # EncodingType故意放在Contents之后，且按很小的块喂给解析器
+        body = b'''<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult>
+  <Name>ming-oss-share</Name>
+  <Prefix>dir%2F</Prefix>
+  <Marker></Marker>
+  <MaxKeys>2</MaxKeys>
+  <Delimiter>%2F</Delimiter>
+  <IsTruncated>true</IsTruncated>
+  <NextMarker>dir%2Fb%20c.txt</NextMarker>
+  <Contents>
+    <Key>dir%2Fa%2Bb.txt</Key>
+    <LastModified>2015-09-21T04:21:50.000Z</LastModified>
+    <ETag>"5B3C1A2E053D763E1B002CC607C5A0FE"</ETag>
+    <Type>Normal</Type>
+    <Size>344606</Size>
+    <StorageClass>Standard</StorageClass>
+    <Owner>
+      <ID>1047205513514293</ID>
+      <DisplayName>ming</DisplayName>
+    </Owner>
+  </Contents>
+  <Contents>
+    <Key>dir%2Fb%20c.txt</Key>
+    <LastModified>2015-09-21T04:21:50.000Z</LastModified>
+    <ETag>"A5B3C1A2E053D763E1B002CC607C5A0F"</ETag>
+    <Type>Appendable</Type>
+    <Size>0</Size>
+    <StorageClass>IA</StorageClass>
+    <RestoreInfo>ongoing-request="true"</RestoreInfo>
+  </Contents>
+  <CommonPrefixes>
+    <Prefix>dir%2Fsub%20dir%2F</Prefix>
+  </CommonPrefixes>
+  <EncodingType>url</EncodingType>
+</ListBucketResult>'''
+
+        class ChunkedReader(object):
+            def __init__(self, data):
+                self.data = data
+                self.offset = 0
+
+            def read(self, amt=None):
+                chunk = self.data[self.offset:self.offset + 7]
+                self.offset += len(chunk)
+                return chunk
+
+        result = parse_list_objects(ListObjectsResult(MockResponse(200, {}, '')), ChunkedReader(body))
+        self.assertTrue(result.is_truncated)
+        self.assertEqual('dir/b c.txt', result.next_marker)
+        self.assertEqual(['dir/a+b.txt', 'dir/b c.txt'], [o.key for o in result.object_list])
+        self.assertEqual(['dir/sub dir/'], result.prefix_list)
+
+        first, second = result.object_list
+        self.assertEqual(1442809310, first.last_modified)
+        self.assertEqual(first.last_modified, second.last_modified)
+        self.assertEqual('5B3C1A2E053D763E1B002CC607C5A0FE', first.etag)
+        self.assertEqual(344606, first.size)
+        self.assertEqual('ming', first.owner.display_name)
+        self.assertEqual('1047205513514293', first.owner.id)
+        self.assertEqual(None, first.restore_info)
+        self.assertEqual('Appendable', second.type)
+        self.assertEqual('IA', second.storage_class)
+        self.assertEqual(None, second.owner)
+        self.assertEqual('ongoing-request="true"', second.restore_info)
+
+        result = parse_list_objects_v2(ListObjectsV2Result(MockResponse(200, {}, '')),
+                                       body.replace(b'NextMarker', b'NextContinuationToken'), fetch_owner=False)
+        self.assertEqual('dir/b c.txt', result.next_continuation_token)
+        self.assertEqual(['dir/a+b.txt', 'dir/b c.txt'], [o.key for o in result.object_list])
+        self.assertEqual(None, result.object_list[0].owner)
+
+        body = b'''<ListBucketResult>
+  <IsTruncated>false</IsTruncated>
+  <Contents>
+    <LastModified>2015-09-21T04:21:50.000Z</LastModified>
+  </Contents>
+</ListBucketResult>'''
+        self.assertRaises(RuntimeError, parse_list_objects, ListObjectsResult(MockResponse(200, {}, '')), body)
+
+    def test_parse_list_object_versions(self):
+        body = b'''<?xml version="1.0" encoding="UTF-8"?>
+<ListVersionsResult>
+  <Name>oss-example</Name>
+  <Prefix></Prefix>
+  <KeyMarker>example</KeyMarker>
+  <VersionIdMarker>CAEQMxiBgICbof2D0BYiIGRhZjgwMzJiMjA3MjQ0ODE5MWYxZDYwMzJlZjU1****</VersionIdMarker>
+  <MaxKeys>100</MaxKeys>
+  <Delimiter></Delimiter>
+  <EncodingType>url</EncodingType>
+  <IsTruncated>false</IsTruncated>
+  <DeleteMarker>
+    <Key>a%2Fexample</Key>
+    <VersionId>CAEQMxiBgICAof2D0BYiIDJhMGE3N2M1YTI1NDQzOGY5NTkyNTI3MGYyMzJm****</VersionId>
+    <IsLatest>false</IsLatest>
+    <LastModified>2019-04-09T07:27:28.000Z</LastModified>
+    <Owner>
+      <ID>1234512528586****</ID>
+      <DisplayName>12345125285864390</DisplayName>
+    </Owner>
+  </DeleteMarker>
+  <Version>
+    <Key>a%2Fexample</Key>
+    <VersionId>CAEQMxiBgMDNoP2D0BYiIDE3MWUxNzgxZDQxNTRiODI5OGYwZGMwNGY3MzZjN****</VersionId>
+    <IsLatest>true</IsLatest>
+    <LastModified>2019-04-09T07:27:28.000Z</LastModified>
+    <ETag>"250F8A0AE989679A22926A875F0A2****"</ETag>
+    <Type>Normal</Type>
+    <Size>93731</Size>
+    <StorageClass>Standard</StorageClass>
+    <Owner>
+      <ID>1234512528586****</ID>
+      <DisplayName>12345125285864390</DisplayName>
+    </Owner>
+  </Version>
+  <CommonPrefixes>
+    <Prefix>b%2F</Prefix>
+  </CommonPrefixes>
+</ListVersionsResult>'''
+
+        result = parse_list_object_versions(ListObjectVersionsResult(MockResponse(200, {}, '')), body)
+        self.assertFalse(result.is_truncated)
+        self.assertEqual('oss-example', result.name)
+        self.assertEqual('example', result.key_marker)
+        self.assertEqual(100, result.max_keys)
+        self.assertEqual(['b/'], result.common_prefix)
+        self.assertEqual('a/example', result.delete_marker[0].key)
+        self.assertFalse(result.delete_marker[0].is_latest)
+        self.assertEqual('1234512528586****', result.delete_marker[0].owner.id)
+        version = result.versions[0]
+        self.assertEqual('a/example', version.key)
+        self.assertTrue(version.is_latest)
+        self.assertEqual(1554794848, version.last_modified)
+        self.assertEqual('250F8A0AE989679A22926A875F0A2****', version.etag)
+        self.assertEqual(93731, version.size)
+        self.assertEqual('12345125285864390', version.owner.display_name)
+
+        result = parse_list_object_versions(ListObjectVersionsResult(MockResponse(200, {}, '')), body,
+                                            fetch_owner=False)
+        self.assertEqual('', result.versions[0].owner.id)
+        self.assertEqual('', result.delete_marker[0].owner.display_name)
+
+
 if __name__ == '__main__':
     unittest.main()
 